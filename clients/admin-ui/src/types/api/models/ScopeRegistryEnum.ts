@@ -101,6 +101,7 @@ export enum ScopeRegistryEnum {
   PRIVACY_NOTICE_CREATE = "privacy-notice:create",
   PRIVACY_NOTICE_READ = "privacy-notice:read",
   PRIVACY_NOTICE_UPDATE = "privacy-notice:update",
+  PRIVACY_PREFERENCE_HISTORY_CREATE = "privacy-preference-history:create",
   PRIVACY_PREFERENCE_HISTORY_READ = "privacy-preference-history:read",
   PRIVACY_REQUEST_NOTIFICATIONS_CREATE_OR_UPDATE = "privacy-request-notifications:create_or_update",
   PRIVACY_REQUEST_NOTIFICATIONS_READ = "privacy-request-notifications:read",
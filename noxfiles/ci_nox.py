@@ -7,6 +7,7 @@ from nox.command import CommandFailed
 
 from constants_nox import (
     CONTAINER_NAME,
+    EXEC,
     IMAGE_NAME,
     LOGIN,
     RUN_NO_DEPS,
@@ -262,6 +263,30 @@ def load_tests(session: nox.Session) -> None:
     )
 
 
+@nox.session()
+def consent_load_tests(session: nox.Session) -> None:
+    """
+    Benchmark the public consent endpoints against seeded notices, systems and TCF vendors,
+    reporting p50/p99 latency and requests/sec per endpoint.
+
+    Any arguments are passed along to the benchmark, e.g. to fail on regressions against a
+    previous run: `nox -s consent_load_tests -- --baseline consent_benchmark.json`
+    """
+    session.notify("teardown")
+    session.run(*START_APP, external=True, silent=True)
+    benchmark = ("python", "scripts/benchmark_consent_endpoints.py")
+    session.run(*EXEC, *benchmark, "seed", external=True)
+    session.run(
+        *EXEC,
+        *benchmark,
+        "run",
+        "--base-url",
+        "http://localhost:8080",
+        *session.posargs,
+        external=True,
+    )
+
+
 ############
 ## Pytest ##
 ############
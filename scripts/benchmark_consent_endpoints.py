@@ -0,0 +1,452 @@
+"""
+Benchmarks the public consent endpoints: the Privacy Experience list, saving privacy preferences
+against notices and TCF components, and recording notices served.
+
+Reports p50/p99 latency and requests/sec per endpoint, and can compare a run against a previously
+saved run to catch regressions before release.
+
+The steps to run the script are as follows:
+1. In a terminal, run `nox -s teardown -- volumes ; nox -s dev` to get the server running.
+   Raise FIDES__SECURITY__PUBLIC_REQUEST_RATE_LIMIT first, as every request is sent from one IP address.
+2. In a separate terminal, run `nox -s shell`, and then seed the data map, privacy notices, and
+   TCF vendors with `python scripts/benchmark_consent_endpoints.py seed`
+3. Run the load with `python scripts/benchmark_consent_endpoints.py run --output results.json`
+
+`nox -s consent_load_tests` runs all of the above against the dockerized server.
+You can run `python scripts/benchmark_consent_endpoints.py -h` to see every option.
+"""
+import argparse
+import json
+import math
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import requests
+from fideslang.gvl import MAPPED_PURPOSES
+from sqlalchemy import orm
+
+from fides.api.db.session import get_db_session
+from fides.api.models.privacy_experience import (
+    ComponentType,
+    PrivacyExperience,
+    upsert_privacy_experiences_after_notice_update,
+)
+from fides.api.models.privacy_notice import (
+    ConsentMechanism,
+    EnforcementLevel,
+    PrivacyNotice,
+    PrivacyNoticeRegion,
+)
+from fides.api.models.sql_models import (  # type: ignore[attr-defined]
+    PrivacyDeclaration,
+    System,
+)
+from fides.api.util.tcf.tcf_experience_contents import load_gvl
+from fides.common.api.v1 import urn_registry as urls
+from fides.config import CONFIG
+
+BENCHMARK_KEY_PREFIX = "consent_benchmark"
+NOTICE_REGION = PrivacyNoticeRegion.us_ca
+TCF_REGION = PrivacyNoticeRegion.fr
+NOTICE_DATA_USES = [
+    "marketing.advertising",
+    "analytics.reporting",
+    "functional.service.improve",
+    "personalize",
+    "third_party_sharing",
+]
+
+
+def _create_system(
+    db: orm.Session,
+    fides_key: str,
+    data_uses: List[str],
+    vendor_id: Optional[str] = None,
+) -> None:
+    """Creates a System with one privacy declaration per data use, unless it already exists"""
+    if System.get_by(db, field="fides_key", value=fides_key):
+        return
+
+    system = System.create(
+        db=db,
+        data={
+            "fides_key": fides_key,
+            "vendor_id": vendor_id,
+            "name": fides_key,
+            "description": "Created by the consent benchmark",
+            "organization_fides_key": "default_organization",
+            "system_type": "Service",
+            "data_responsibility_title": "Processor",
+        },
+    )
+    for data_use in data_uses:
+        PrivacyDeclaration.create(
+            db=db,
+            data={
+                "name": f"{data_use} for {fides_key}",
+                "system_id": system.id,
+                "data_categories": ["user.device.cookie_id"],
+                "data_use": data_use,
+                "data_subjects": ["customer"],
+                "legal_basis_for_processing": "Consent",
+            },
+        )
+
+
+def seed_consent_benchmark_data(
+    db: orm.Session, notices: int, systems: int, vendors: int
+) -> None:
+    """
+    Seeds privacy notices for the notice region, systems sharing their data uses, and systems for
+    the first `vendors` GVL vendors declaring the data uses mapped to their GVL purposes, along with
+    the overlay and TCF overlay Privacy Experiences.
+
+    Records are keyed off of BENCHMARK_KEY_PREFIX, so the script can be rerun to top up the data.
+    """
+    print(f"> Seeding {notices} privacy notices")
+    for i in range(notices):
+        notice_key = f"{BENCHMARK_KEY_PREFIX}_notice_{i}"
+        if PrivacyNotice.get_by(db, field="notice_key", value=notice_key):
+            continue
+        PrivacyNotice.create(
+            db=db,
+            data={
+                "name": f"Consent benchmark notice {i}",
+                "notice_key": notice_key,
+                "description": "Created by the consent benchmark",
+                "regions": [NOTICE_REGION],
+                "consent_mechanism": ConsentMechanism.opt_in
+                if i % 2
+                else ConsentMechanism.opt_out,
+                "data_uses": [NOTICE_DATA_USES[i % len(NOTICE_DATA_USES)]],
+                "enforcement_level": EnforcementLevel.system_wide,
+                "displayed_in_overlay": True,
+                "displayed_in_privacy_center": True,
+                "displayed_in_api": True,
+            },
+        )
+    upsert_privacy_experiences_after_notice_update(db, [NOTICE_REGION])
+
+    print(f"> Seeding {systems} systems")
+    for i in range(systems):
+        _create_system(
+            db,
+            f"{BENCHMARK_KEY_PREFIX}_system_{i}",
+            data_uses=[NOTICE_DATA_USES[i % len(NOTICE_DATA_USES)]],
+        )
+
+    gvl_vendors: List[Dict] = list(load_gvl()["vendors"].values())[:vendors]
+    print(f"> Seeding {len(gvl_vendors)} TCF vendors")
+    for vendor in gvl_vendors:
+        _create_system(
+            db,
+            f"{BENCHMARK_KEY_PREFIX}_vendor_{vendor['id']}",
+            data_uses=sorted(
+                {
+                    data_use
+                    for purpose_id in vendor["purposes"]
+                    for data_use in MAPPED_PURPOSES[purpose_id].data_uses
+                }
+            ),
+            vendor_id=f"gvl.{vendor['id']}",
+        )
+
+    if not PrivacyExperience.get_experience_by_region_and_component(
+        db, TCF_REGION.value, ComponentType.tcf_overlay
+    ):
+        PrivacyExperience.create_default_experience_for_region(
+            db, TCF_REGION, ComponentType.tcf_overlay
+        )
+    print("> Seeding complete!")
+
+
+class EndpointStats:
+    """Latencies and errors recorded while benchmarking one endpoint"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.elapsed = 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Nearest-rank percentile of the recorded latencies, in milliseconds"""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+        return ordered[rank] * 1000
+
+    @property
+    def requests_per_second(self) -> float:
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "requests": len(self.latencies),
+            "errors": self.errors,
+            "p50_ms": round(self.percentile(50), 2),
+            "p99_ms": round(self.percentile(99), 2),
+            "requests_per_second": round(self.requests_per_second, 2),
+        }
+
+
+class ConsentBenchmark:
+    """
+    Load driver for the consent endpoints. Each scenario is sent `requests` times from `concurrency`
+    threads, each request on behalf of a new fides user device id, as it would be for new visitors.
+
+    The payloads are built from the Privacy Experiences the server returns for the seeded regions,
+    so the notices and TCF components saved and served are the ones users would actually see.
+    """
+
+    def __init__(self, base_url: str, concurrency: int, requests: int) -> None:
+        self.base_url = base_url.rstrip("/") + urls.V1_URL_PREFIX
+        self.concurrency = concurrency
+        self.requests = requests
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """One HTTP session per thread, so connections are reused"""
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def get_experience(self, region: PrivacyNoticeRegion, **params: Any) -> Dict:
+        response = self.session.get(
+            self.base_url + urls.PRIVACY_EXPERIENCE,
+            params={"region": region.value, **params},
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def scenarios(self) -> Dict[str, Callable[[], requests.Response]]:
+        """The requests to benchmark, by name"""
+        notice_experience: Dict = self.get_experience(
+            NOTICE_REGION, component=ComponentType.overlay.value
+        )["items"][0]
+        # Only returned when the server has TCF enabled
+        tcf_experience: Optional[Dict] = next(
+            (
+                experience
+                for experience in self.get_experience(
+                    TCF_REGION, component=ComponentType.overlay.value
+                )["items"]
+                if experience["component"] == ComponentType.tcf_overlay.value
+            ),
+            None,
+        )
+
+        notice_history_ids: List[str] = [
+            notice["privacy_notice_history_id"]
+            for notice in notice_experience["privacy_notices"]
+        ]
+
+        def get_experience_list(region: PrivacyNoticeRegion, **params: Any) -> Callable:
+            return lambda: self.session.get(
+                self.base_url + urls.PRIVACY_EXPERIENCE,
+                params={
+                    "region": region.value,
+                    "component": ComponentType.overlay.value,
+                    "fides_user_device_id": str(uuid4()),
+                    **params,
+                },
+            )
+
+        def save_privacy_preferences() -> requests.Response:
+            return self.session.patch(
+                self.base_url + urls.PRIVACY_PREFERENCES,
+                json={
+                    "browser_identity": {"fides_user_device_id": str(uuid4())},
+                    "preferences": [
+                        {
+                            "privacy_notice_history_id": history_id,
+                            "preference": "opt_in",
+                        }
+                        for history_id in notice_history_ids
+                    ],
+                    "privacy_experience_id": notice_experience["id"],
+                    "user_geography": NOTICE_REGION.value,
+                },
+            )
+
+        def save_notices_served() -> requests.Response:
+            return self.session.patch(
+                self.base_url + urls.NOTICES_SERVED,
+                json={
+                    "browser_identity": {"fides_user_device_id": str(uuid4())},
+                    "privacy_notice_history_ids": notice_history_ids,
+                    "privacy_experience_id": notice_experience["id"],
+                    "user_geography": NOTICE_REGION.value,
+                    "serving_component": "banner",
+                },
+            )
+
+        scenarios: Dict[str, Callable[[], requests.Response]] = {
+            "privacy_experience_list": get_experience_list(NOTICE_REGION),
+            "save_privacy_preferences": save_privacy_preferences,
+            "save_notices_served": save_notices_served,
+        }
+        if not tcf_experience:
+            print("> TCF is not enabled, skipping the TCF endpoints")
+            return scenarios
+
+        purpose_ids: List[int] = [
+            purpose["id"] for purpose in tcf_experience["tcf_purpose_consents"]
+        ]
+        # The request body allows at most 200 preferences per section
+        vendor_ids: List[str] = [
+            vendor["id"] for vendor in tcf_experience["tcf_vendor_consents"]
+        ][:200]
+
+        def persist_tcf_preferences() -> requests.Response:
+            return self.session.patch(
+                self.base_url + urls.PRIVACY_PREFERENCES,
+                json={
+                    "browser_identity": {"fides_user_device_id": str(uuid4())},
+                    "purpose_consent_preferences": [
+                        {"id": purpose_id, "preference": "opt_in"}
+                        for purpose_id in purpose_ids
+                    ],
+                    "vendor_consent_preferences": [
+                        {"id": vendor_id, "preference": "opt_out"}
+                        for vendor_id in vendor_ids
+                    ],
+                    "privacy_experience_id": tcf_experience["id"],
+                    "user_geography": TCF_REGION.value,
+                },
+            )
+
+        scenarios["privacy_experience_list_tcf"] = get_experience_list(
+            TCF_REGION, include_meta=True
+        )
+        scenarios["persist_tcf_preferences"] = persist_tcf_preferences
+        return scenarios
+
+    def run_scenario(
+        self, name: str, send: Callable[[], requests.Response]
+    ) -> EndpointStats:
+        stats = EndpointStats(name)
+        lock = threading.Lock()
+
+        def timed_request(_: int) -> None:
+            started = perf_counter()
+            try:
+                ok = send().ok
+            except requests.RequestException:
+                ok = False
+            latency = perf_counter() - started
+            with lock:
+                if ok:
+                    stats.latencies.append(latency)
+                else:
+                    stats.errors += 1
+
+        started = perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(timed_request, range(self.requests)))
+        stats.elapsed = perf_counter() - started
+        return stats
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        results: Dict[str, Dict[str, Any]] = {}
+        for name, send in self.scenarios().items():
+            print(f"> Benchmarking {name}")
+            results[name] = self.run_scenario(name, send).summary()
+        return results
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    max_regression: float,
+) -> List[Tuple[str, str, float, float]]:
+    """Returns the (endpoint, metric, baseline, current) latencies that are more than
+    `max_regression` (a fraction) slower than the baseline"""
+    regressions = []
+    for name, summary in results.items():
+        for metric in ("p50_ms", "p99_ms"):
+            previous = baseline.get(name, {}).get(metric)
+            if previous and summary[metric] > previous * (1 + max_regression):
+                regressions.append((name, metric, previous, summary[metric]))
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    print(
+        f"{'endpoint':<30}{'requests':>10}{'errors':>8}{'p50 (ms)':>12}{'p99 (ms)':>12}{'req/s':>10}"
+    )
+    for name, summary in results.items():
+        print(
+            f"{name:<30}{summary['requests']:>10}{summary['errors']:>8}"
+            f"{summary['p50_ms']:>12}{summary['p99_ms']:>12}{summary['requests_per_second']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the public consent endpoints"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = subparsers.add_parser(
+        "seed", help="seed notices, systems, and TCF vendors into the database"
+    )
+    seed_parser.add_argument("--notices", type=int, default=25)
+    seed_parser.add_argument("--systems", type=int, default=50)
+    seed_parser.add_argument(
+        "--vendors", type=int, default=100, help="number of GVL vendors to seed"
+    )
+
+    run_parser = subparsers.add_parser(
+        "run", help="benchmark the endpoints of a running server"
+    )
+    run_parser.add_argument("--base-url", default=CONFIG.cli.server_url)
+    run_parser.add_argument("--concurrency", type=int, default=10)
+    run_parser.add_argument(
+        "--requests", type=int, default=100, help="requests sent per endpoint"
+    )
+    run_parser.add_argument("--output", help="file to save the results to, as JSON")
+    run_parser.add_argument(
+        "--baseline", help="results of a previous run to compare latencies against"
+    )
+    run_parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="fraction by which latencies may exceed the baseline before failing",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        session_local = get_db_session(CONFIG)
+        with session_local() as session:
+            seed_consent_benchmark_data(
+                session, args.notices, args.systems, args.vendors
+            )
+        sys.exit(0)
+
+    benchmark_results = ConsentBenchmark(
+        args.base_url, args.concurrency, args.requests
+    ).run()
+    print_results(benchmark_results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(benchmark_results, output_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+            found_regressions = find_regressions(
+                benchmark_results, json.load(baseline_file), args.max_regression
+            )
+        for endpoint, metric, previous, current in found_regressions:
+            print(f"> {endpoint} {metric} regressed from {previous} to {current}")
+        if found_regressions:
+            sys.exit(1)
@@ -0,0 +1,275 @@
+"""
+Benchmarks filtering access request results down to a policy's data categories, comparing the
+compiled projection plans used by `filter_data_categories` against the original approach of
+calling `select_and_save_field` for every target FieldPath followed by `remove_empty_containers`.
+
+Two synthetic collections are filtered:
+  * nested Mongo-style documents, with objects nested --depth levels deep and arrays of
+    --array-length sub-documents at every level
+  * wide SQL-style rows with --columns scalar columns
+
+Every field is assigned one of --categories data categories, and each run filters the rows for
+one rule per category, the way results are filtered for each rule when they are uploaded.
+
+Run with `python scripts/benchmark_filter_results.py`, or
+`python scripts/benchmark_filter_results.py -h` to see every option.
+"""
+import argparse
+import itertools
+import json
+import random
+from collections import defaultdict
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from fides.api.graph.config import CollectionAddress, FieldPath
+from fides.api.task.filter_results import (
+    filter_data_categories,
+    remove_empty_containers,
+    select_and_save_field,
+)
+
+MONGO_ADDRESS = CollectionAddress("mongo_test", "customer_details")
+SQL_ADDRESS = CollectionAddress("postgres_example", "customer")
+
+
+def generate_document(
+    depth: int, fields_per_level: int, array_length: int, rnd: random.Random
+) -> Tuple[Dict[str, Any], List[FieldPath]]:
+    """Generate a nested document along with the FieldPaths to each of its scalar fields"""
+
+    def build(level: int, prefix: Tuple[str, ...]) -> Dict[str, Any]:
+        document: Dict[str, Any] = {}
+        for i in range(fields_per_level):
+            document[f"field_{i}"] = rnd.choice([rnd.random(), f"value_{i}", None])
+            field_paths.append(FieldPath(*prefix, f"field_{i}"))
+        if level < depth:
+            document["nested"] = build(level + 1, (*prefix, "nested"))
+            document["items"] = [
+                build(level + 1, (*prefix, "items")) for _ in range(array_length)
+            ]
+        return document
+
+    field_paths: List[FieldPath] = []
+    return build(1, ()), field_paths
+
+
+def generate_results(
+    rows: int,
+    columns: int,
+    depth: int,
+    fields_per_level: int,
+    array_length: int,
+    categories: int,
+    seed: int,
+) -> Tuple[
+    Dict[str, List[Dict[str, Any]]],
+    Dict[CollectionAddress, Dict[str, List[FieldPath]]],
+]:
+    """Generate access results for a nested and a wide collection, along with their fields by data category"""
+    rnd = random.Random(seed)
+    documents: List[Dict[str, Any]] = []
+    document_field_paths: Set[FieldPath] = set()
+    for _ in range(rows):
+        document, field_paths = generate_document(
+            depth, fields_per_level, array_length, rnd
+        )
+        documents.append(document)
+        document_field_paths.update(field_paths)
+
+    sql_rows: List[Dict[str, Any]] = [
+        {
+            f"column_{i}": rnd.choice([rnd.random(), f"value_{i}", None])
+            for i in range(columns)
+        }
+        for _ in range(rows)
+    ]
+
+    def by_category(field_paths: List[FieldPath]) -> Dict[str, List[FieldPath]]:
+        fields: Dict[str, List[FieldPath]] = defaultdict(list)
+        for field_path in field_paths:
+            fields[f"user.category_{rnd.randrange(categories)}"].append(field_path)
+        return fields
+
+    return {
+        MONGO_ADDRESS.value: documents,
+        SQL_ADDRESS.value: sql_rows,
+    }, {
+        MONGO_ADDRESS: by_category(sorted(document_field_paths)),
+        SQL_ADDRESS: by_category([FieldPath(f"column_{i}") for i in range(columns)]),
+    }
+
+
+def filter_unplanned(
+    access_request_results: Dict[str, List[Dict[str, Any]]],
+    target_categories: Set[str],
+    data_category_fields: Dict[CollectionAddress, Dict[str, List[FieldPath]]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """The original filtering, walking each row once per target FieldPath"""
+    filtered_access_results: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for node_address, results in access_request_results.items():
+        target_field_paths: Set[FieldPath] = set(
+            itertools.chain(
+                *[
+                    field_paths
+                    for cat, field_paths in data_category_fields[
+                        CollectionAddress.from_string(node_address)
+                    ].items()
+                    if any(cat.startswith(tar) for tar in target_categories)
+                ]
+            )
+        )
+        if not target_field_paths:
+            continue
+
+        for row in results:
+            filtered_results: Dict[str, Any] = {}
+            for field_path in target_field_paths:
+                select_and_save_field(filtered_results, row, field_path)
+            remove_empty_containers(filtered_results)
+            filtered_access_results[node_address].append(filtered_results)
+    return filtered_access_results
+
+
+def time_filter(
+    access_request_results: Dict[str, List[Dict[str, Any]]],
+    data_category_fields: Dict[CollectionAddress, Dict[str, List[FieldPath]]],
+    categories: int,
+    planned: bool,
+) -> Tuple[float, List[Dict[str, List[Dict[str, Any]]]]]:
+    """Time filtering the results for one rule per data category"""
+    outputs: List[Dict[str, List[Dict[str, Any]]]] = []
+    start = perf_counter()
+    for category in range(categories):
+        target_categories = {f"user.category_{category}"}
+        if planned:
+            outputs.append(
+                filter_data_categories(
+                    access_request_results, target_categories, data_category_fields
+                )
+            )
+        else:
+            outputs.append(
+                filter_unplanned(
+                    access_request_results, target_categories, data_category_fields
+                )
+            )
+    return perf_counter() - start, outputs
+
+
+def run_benchmark(
+    rows: List[int],
+    columns: int,
+    depth: int,
+    fields_per_level: int,
+    array_length: int,
+    categories: int,
+    seed: int,
+) -> List[Dict[str, Optional[float]]]:
+    """Benchmark both filters for each number of rows, one collection at a time"""
+    results: List[Dict[str, Optional[float]]] = []
+    for num_rows in rows:
+        access_request_results, data_category_fields = generate_results(
+            num_rows, columns, depth, fields_per_level, array_length, categories, seed
+        )
+        for address in [MONGO_ADDRESS, SQL_ADDRESS]:
+            collection_results = {address.value: access_request_results[address.value]}
+            collection_fields = {address: data_category_fields[address]}
+
+            unplanned_seconds, unplanned = time_filter(
+                collection_results, collection_fields, categories, planned=False
+            )
+            planned_seconds, planned = time_filter(
+                collection_results, collection_fields, categories, planned=True
+            )
+            if planned != unplanned:
+                raise AssertionError(
+                    f"Filtered results for {address} with {num_rows} rows differ"
+                )
+
+            results.append(
+                {
+                    "collection": address.value,
+                    "rows": num_rows,
+                    "fields": sum(
+                        len(field_paths)
+                        for field_paths in data_category_fields[address].values()
+                    ),
+                    "unplanned_seconds": unplanned_seconds,
+                    "planned_seconds": planned_seconds,
+                }
+            )
+    return results
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    """Print the benchmark results as a table"""
+    print(
+        f"{'collection':>30} {'rows':>8} {'fields':>7} {'unplanned (s)':>14} "
+        f"{'planned (s)':>12} {'speedup':>8}"
+    )
+    for result in results:
+        print(
+            f"{result['collection']:>30} {result['rows']:>8} {result['fields']:>7} "
+            f"{result['unplanned_seconds']:>14.3f} {result['planned_seconds']:>12.3f} "
+            f"{result['unplanned_seconds'] / result['planned_seconds']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark filtering access results by data category"
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help="numbers of rows to generate for each collection",
+    )
+    parser.add_argument(
+        "--columns", type=int, default=100, help="number of columns in the wide rows"
+    )
+    parser.add_argument(
+        "--depth", type=int, default=3, help="levels of nesting in the documents"
+    )
+    parser.add_argument(
+        "--fields-per-level",
+        type=int,
+        default=5,
+        help="scalar fields at each level of the documents",
+    )
+    parser.add_argument(
+        "--array-length",
+        type=int,
+        default=3,
+        help="sub-documents in the array at each level of the documents",
+    )
+    parser.add_argument(
+        "--categories",
+        type=int,
+        default=4,
+        help="data categories to spread the fields across, with one rule per category",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to save the results to, as JSON")
+    args = parser.parse_args()
+
+    # filter_data_categories logs every call
+    logger.remove()
+
+    benchmark_results = run_benchmark(
+        args.rows,
+        args.columns,
+        args.depth,
+        args.fields_per_level,
+        args.array_length,
+        args.categories,
+        args.seed,
+    )
+    print_results(benchmark_results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(benchmark_results, output_file, indent=2)
@@ -0,0 +1,219 @@
+"""
+Benchmarks encoding and decoding TC strings for vendor sets drawn from the full Global Vendor
+List, comparing the bit-level `BitWriter`/`BitReader` codec used by `build_tc_string` and
+`decode_core_string` against the original approach of concatenating a string of "0"s and "1"s
+(checking `i in vendor_ids` for every bit) and decoding with `iab_tcf.decode_v2`.
+
+Each run builds --strings TC models, consenting to a random --density fraction of every GVL
+vendor, and times encoding and then decoding all of them with each approach. Range encoding
+is used whenever it's shorter, so the encoded strings are checked to never be longer than the
+original bitfield-only strings, and to decode to the same vendors with both decoders.
+
+Run with `python scripts/benchmark_tc_string.py`, or
+`python scripts/benchmark_tc_string.py -h` to see every option.
+"""
+import argparse
+import base64
+import json
+import random
+from time import perf_counter
+from typing import Any, Dict, List, Set, Tuple
+
+from iab_tcf import decode_v2  # type: ignore[import]
+
+from fides.api.util.tcf.tc_model import TCModel, gvl
+from fides.api.util.tcf.tc_string import (
+    PURPOSE_CONSENTS_BITS,
+    build_tc_string,
+    decode_core_string,
+)
+
+GVL_VENDOR_IDS: List[int] = sorted(int(vendor_id) for vendor_id in gvl["vendors"])
+
+
+def legacy_vendor_bits(vendor_ids: List[int]) -> str:
+    """The original vendor section: MaxVendorId, IsRangeEncoding and a bitfield, as a bitstring"""
+    max_vendor_id = max(vendor_ids, default=0)
+    bits = format(max_vendor_id, "016b") + "0"
+    for i in range(1, max_vendor_id + 1):
+        bits += "1" if i in vendor_ids else "0"
+    return bits
+
+
+def legacy_segment(bits: str) -> str:
+    """The original padding and base64 encoding of a bitstring"""
+    bits += "0" * (24 - len(bits) % 24)
+    return base64.urlsafe_b64encode(
+        int(bits, 2).to_bytes(len(bits) // 8, byteorder="big")
+    ).decode()
+
+
+def legacy_build_tc_string(model: TCModel) -> str:
+    """The original TC string encoding, building up each segment as a string of 0's and 1's"""
+
+    def bitfield(ids: List[int], num_bits: int) -> str:
+        bits = ""
+        for i in range(1, num_bits + 1):
+            bits += "1" if i in ids else "0"
+        return bits
+
+    def letters(value: str) -> str:
+        return "".join(format(ord(char) - ord("A"), "06b") for char in value)
+
+    core_bits = (
+        format(model.version, "06b")
+        + format(model.created, "036b")
+        + format(model.last_updated, "036b")
+        + format(model.cmp_id, "012b")
+        + format(model.cmp_version, "012b")
+        + format(model.consent_screen, "06b")
+        + letters(model.consent_language)
+        + format(model.vendor_list_version, "012b")
+        + format(model.policy_version, "06b")
+        + format(int(model.is_service_specific), "01b")
+        + format(int(model.use_non_standard_texts), "01b")
+        + bitfield(model.special_feature_optins, 12)
+        + bitfield(model.purpose_consents, PURPOSE_CONSENTS_BITS)
+        + bitfield(model.purpose_legitimate_interests, 24)
+        + format(int(model.purpose_one_treatment), "01b")
+        + letters(model.publisher_country_code)
+        + legacy_vendor_bits(model.vendor_consents)
+        + legacy_vendor_bits(model.vendor_legitimate_interests)
+        + format(model.num_pub_restrictions, "012b")
+    )
+    disclosed_bits = "001" + legacy_vendor_bits(model.vendors_disclosed)
+    return legacy_segment(core_bits) + "." + legacy_segment(disclosed_bits)
+
+
+def legacy_decode_vendor_consents(tc_string: str) -> Set[int]:
+    """Decode the vendor consents with iab_tcf, the way TC strings were originally decoded"""
+    decoded = decode_v2(tc_string)
+    if decoded.is_consent_range_encoding:
+        return {
+            vendor_id
+            for start, end in decoded.consented_vendors_range
+            for vendor_id in range(start, end + 1)
+        }
+    return {
+        vendor_id
+        for vendor_id, consented in decoded.consented_vendors.items()
+        if consented
+    }
+
+
+def generate_models(num_strings: int, density: float, seed: int) -> List[TCModel]:
+    """Generate TC models consenting to a random fraction of the GVL vendors"""
+    rnd = random.Random(seed)
+    models: List[TCModel] = []
+    for _ in range(num_strings):
+        vendor_ids = sorted(
+            vendor_id for vendor_id in GVL_VENDOR_IDS if rnd.random() < density
+        )
+        models.append(
+            TCModel(
+                created=16966584400,
+                last_updated=16966584400,
+                cmp_id=407,
+                vendor_list_version=gvl["vendorListVersion"],
+                purpose_consents=[1, 2, 3, 4, 7, 9, 10],
+                special_feature_optins=[1],
+                vendor_consents=vendor_ids,
+                vendors_disclosed=vendor_ids,
+            )
+        )
+    return models
+
+
+def time_encoding(models: List[TCModel], legacy: bool) -> Tuple[float, List[str]]:
+    start = perf_counter()
+    tc_strings = [
+        legacy_build_tc_string(model) if legacy else build_tc_string(model)
+        for model in models
+    ]
+    return perf_counter() - start, tc_strings
+
+
+def time_decoding(tc_strings: List[str], legacy: bool) -> Tuple[float, List[Set[int]]]:
+    start = perf_counter()
+    vendor_consents = [
+        legacy_decode_vendor_consents(tc_string)
+        if legacy
+        else decode_core_string(tc_string).vendor_consents
+        for tc_string in tc_strings
+    ]
+    return perf_counter() - start, vendor_consents
+
+
+def run_benchmark(
+    densities: List[float], num_strings: int, seed: int
+) -> List[Dict[str, Any]]:
+    """Benchmark both codecs for each vendor density"""
+    results: List[Dict[str, Any]] = []
+    for density in densities:
+        models = generate_models(num_strings, density, seed)
+
+        legacy_encode_seconds, legacy_strings = time_encoding(models, legacy=True)
+        encode_seconds, tc_strings = time_encoding(models, legacy=False)
+        legacy_decode_seconds, legacy_vendors = time_decoding(tc_strings, legacy=True)
+        decode_seconds, vendors = time_decoding(tc_strings, legacy=False)
+
+        expected_vendors = [set(model.vendor_consents) for model in models]
+        if vendors != expected_vendors or legacy_vendors != expected_vendors:
+            raise AssertionError(f"Decoded vendors at density {density} differ")
+        for legacy_string, tc_string in zip(legacy_strings, tc_strings):
+            if len(tc_string) > len(legacy_string):
+                raise AssertionError(f"TC string at density {density} got longer")
+
+        results.append(
+            {
+                "density": density,
+                "strings": num_strings,
+                "legacy_length": sum(map(len, legacy_strings)) / num_strings,
+                "length": sum(map(len, tc_strings)) / num_strings,
+                "legacy_encode_seconds": legacy_encode_seconds,
+                "encode_seconds": encode_seconds,
+                "legacy_decode_seconds": legacy_decode_seconds,
+                "decode_seconds": decode_seconds,
+            }
+        )
+    return results
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    """Print the benchmark results as a table"""
+    print(
+        f"{'density':>8} {'strings':>8} {'length':>13} {'encode (s)':>17} "
+        f"{'speedup':>8} {'decode (s)':>17} {'speedup':>8}"
+    )
+    for result in results:
+        print(
+            f"{result['density']:>8.3f} {result['strings']:>8} "
+            f"{result['legacy_length']:>6.0f} {result['length']:>6.0f} "
+            f"{result['legacy_encode_seconds']:>8.3f} {result['encode_seconds']:>8.3f} "
+            f"{result['legacy_encode_seconds'] / result['encode_seconds']:>7.1f}x "
+            f"{result['legacy_decode_seconds']:>8.3f} {result['decode_seconds']:>8.3f} "
+            f"{result['legacy_decode_seconds'] / result['decode_seconds']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark encoding TC strings")
+    parser.add_argument(
+        "--densities",
+        type=float,
+        nargs="+",
+        default=[0.01, 0.1, 0.5, 1.0],
+        help="fractions of the GVL vendors each string consents to",
+    )
+    parser.add_argument(
+        "--strings", type=int, default=200, help="number of TC strings per density"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to save the results to, as JSON")
+    args = parser.parse_args()
+
+    benchmark_results = run_benchmark(args.densities, args.strings, args.seed)
+    print_results(benchmark_results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(benchmark_results, output_file, indent=2)
@@ -0,0 +1,251 @@
+"""
+Benchmarks graph traversal over synthetic dataset graphs of increasing size, comparing the
+indexed `Traversal.traverse` against the original, unindexed traversal kept in
+tests/ops/graph/unindexed_traversal.py.
+
+Each synthetic graph is made up of datasets of --collections-per-dataset collections. The first
+collection of every dataset holds the email identity, every other collection references a
+collection earlier in its dataset, and some collections also reference a collection in another
+dataset or must run after one of their siblings.
+
+The original traversal rescans every finished node and remaining edge for each node it runs, so
+it is only run for graphs up to --max-unindexed collections.
+
+Run from the repository root with `PYTHONPATH=. python scripts/benchmark_traversal.py`, or add
+`-h` to see every option.
+"""
+import argparse
+import json
+import random
+from collections import Counter
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from fides.api.graph.config import (
+    Collection,
+    CollectionAddress,
+    FieldAddress,
+    GraphDataset,
+    ScalarField,
+)
+from fides.api.graph.graph import DatasetGraph
+from fides.api.graph.traversal import Traversal, TraversalNode
+from tests.ops.graph.unindexed_traversal import traverse_unindexed
+
+
+def generate_datasets(
+    num_collections: int,
+    collections_per_dataset: int,
+    cross_reference_rate: float,
+    after_rate: float,
+    seed: int,
+) -> List[GraphDataset]:
+    """Generate the datasets for a synthetic graph with the given number of collections"""
+    rnd = random.Random(seed)
+    num_datasets = max(num_collections // collections_per_dataset, 1)
+    datasets: List[GraphDataset] = []
+
+    for dataset_index in range(num_datasets):
+        dataset_name = f"dataset_{dataset_index}"
+        collections: List[Collection] = []
+        for collection_index in range(collections_per_dataset):
+            fields = [ScalarField(name="id", primary_key=True)]
+            after = set()
+            if not collection_index:
+                fields.append(ScalarField(name="email", identity="email"))
+            else:
+                parent_index = rnd.randrange(collection_index)
+                fields.append(
+                    ScalarField(
+                        name="parent_id",
+                        references=[
+                            (
+                                FieldAddress(
+                                    dataset_name, f"collection_{parent_index}", "id"
+                                ),
+                                "from",
+                            )
+                        ],
+                    )
+                )
+                if rnd.random() < after_rate:
+                    after.add(
+                        CollectionAddress(
+                            dataset_name,
+                            f"collection_{rnd.randrange(collection_index)}",
+                        )
+                    )
+            if dataset_index and rnd.random() < cross_reference_rate:
+                fields.append(
+                    ScalarField(
+                        name="link_id",
+                        references=[
+                            (
+                                FieldAddress(
+                                    f"dataset_{rnd.randrange(dataset_index)}",
+                                    f"collection_{rnd.randrange(collections_per_dataset)}",
+                                    "id",
+                                ),
+                                None,
+                            )
+                        ],
+                    )
+                )
+            collections.append(
+                Collection(
+                    name=f"collection_{collection_index}", fields=fields, after=after
+                )
+            )
+
+        datasets.append(
+            GraphDataset(
+                name=dataset_name,
+                collections=collections,
+                connection_key=f"connection_{dataset_index}",
+            )
+        )
+    return datasets
+
+
+def time_traversal(
+    graph: DatasetGraph, traverse: Callable[..., List[CollectionAddress]]
+) -> Dict[str, Any]:
+    """Time a single traversal of the graph using the given traversal function"""
+    traversal = Traversal(graph, {"email": "test@example.com"})
+    runs: Counter = Counter()
+
+    def count_runs(tn: TraversalNode, _: Dict[CollectionAddress, Any]) -> None:
+        runs[tn.address] += 1
+
+    start = perf_counter()
+    end_nodes = traverse(traversal, {}, count_runs)
+    return {
+        "seconds": perf_counter() - start,
+        "runs": runs,
+        "end_nodes": set(end_nodes),
+    }
+
+
+def run_benchmark(
+    sizes: List[int],
+    max_unindexed: int,
+    collections_per_dataset: int,
+    cross_reference_rate: float,
+    after_rate: float,
+    seed: int,
+) -> List[Dict[str, Optional[float]]]:
+    """Benchmark both traversals for each graph size"""
+    results: List[Dict[str, Optional[float]]] = []
+    for size in sizes:
+        start = perf_counter()
+        graph = DatasetGraph(
+            *generate_datasets(
+                size, collections_per_dataset, cross_reference_rate, after_rate, seed
+            )
+        )
+        build_seconds = perf_counter() - start
+
+        # Verify the graph up front so the timed traversals don't include the verification
+        start = perf_counter()
+        Traversal(graph, {"email": "test@example.com"})
+        verify_seconds = perf_counter() - start
+
+        indexed = time_traversal(graph, Traversal.traverse)
+        unindexed: Optional[Dict[str, Any]] = None
+        if size <= max_unindexed:
+            unindexed = time_traversal(graph, traverse_unindexed)
+            if (
+                indexed["runs"] != unindexed["runs"]
+                or indexed["end_nodes"] != unindexed["end_nodes"]
+            ):
+                raise AssertionError(
+                    f"Traversals of the graph with {size} collections differ"
+                )
+
+        results.append(
+            {
+                "collections": len(graph.nodes),
+                "edges": len(graph.edges),
+                "build_seconds": build_seconds,
+                "verify_seconds": verify_seconds,
+                "traverse_seconds": indexed["seconds"],
+                "traverse_unindexed_seconds": unindexed["seconds"]
+                if unindexed
+                else None,
+            }
+        )
+    return results
+
+
+def print_results(results: List[Dict[str, Optional[float]]]) -> None:
+    """Print the benchmark results as a table"""
+    print(
+        f"{'collections':>12} {'edges':>8} {'build (s)':>10} {'verify (s)':>11} "
+        f"{'traverse (s)':>13} {'unindexed (s)':>14} {'speedup':>8}"
+    )
+    for result in results:
+        unindexed = result["traverse_unindexed_seconds"]
+        speedup = (
+            f"{unindexed / result['traverse_seconds']:.1f}x"  # type: ignore[operator]
+            if unindexed
+            else "-"
+        )
+        print(
+            f"{result['collections']:>12} {result['edges']:>8} "
+            f"{result['build_seconds']:>10.3f} {result['verify_seconds']:>11.3f} "
+            f"{result['traverse_seconds']:>13.3f} "
+            f"{f'{unindexed:.3f}' if unindexed else '-':>14} {speedup:>8}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark graph traversal over synthetic dataset graphs"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[250, 1000, 2000, 5000, 10000, 20000],
+        help="numbers of collections to generate graphs with",
+    )
+    parser.add_argument(
+        "--max-unindexed",
+        type=int,
+        default=250,
+        help="largest graph to run the original, unindexed traversal on",
+    )
+    parser.add_argument("--collections-per-dataset", type=int, default=20)
+    parser.add_argument(
+        "--cross-reference-rate",
+        type=float,
+        default=0.2,
+        help="share of collections that also reference a collection in another dataset",
+    )
+    parser.add_argument(
+        "--after-rate",
+        type=float,
+        default=0.05,
+        help="share of collections that must run after a sibling collection",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="file to save the results to, as JSON")
+    args = parser.parse_args()
+
+    # The traversals log every node they run
+    logger.remove()
+
+    benchmark_results = run_benchmark(
+        args.sizes,
+        args.max_unindexed,
+        args.collections_per_dataset,
+        args.cross_reference_rate,
+        args.after_rate,
+        args.seed,
+    )
+    print_results(benchmark_results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(benchmark_results, output_file, indent=2)
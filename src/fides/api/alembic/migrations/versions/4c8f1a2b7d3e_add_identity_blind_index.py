@@ -0,0 +1,158 @@
+"""add identity blind index
+
+Adds a keyed HMAC-SHA256 blind index to providedidentity and custom_privacy_request_field,
+replacing the bcrypt hashed_value for exact match searches, and backfills it for existing rows.
+The hashed identities saved on privacy preference and served notice history records are
+switched from the bcrypt hash to the blind index as well.
+
+Revision ID: 4c8f1a2b7d3e
+Revises: ddec29f24945
+Create Date: 2023-10-30 10:12:45.318112
+
+"""
+from typing import Any, Callable, Dict, List, Optional
+
+import sqlalchemy as sa
+from alembic import op
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy_utils.types.encrypted.encrypted_type import (
+    AesGcmEngine,
+    StringEncryptedType,
+)
+
+from fides.api.cryptography.cryptographic_util import hash_with_hmac, hash_with_salt
+from fides.api.db.base_class import JSONTypeOverride
+from fides.config import CONFIG
+
+# revision identifiers, used by Alembic.
+revision = "4c8f1a2b7d3e"
+down_revision = "ddec29f24945"
+branch_labels = None
+depends_on = None
+
+TABLES = ["providedidentity", "custom_privacy_request_field"]
+HISTORY_TABLES = ["privacypreferencehistory", "servednoticehistory"]
+# Hashed identity columns on the history tables, and the encrypted columns they're hashed from
+HISTORY_HASHED_COLUMNS = {
+    "hashed_email": "email",
+    "hashed_fides_user_device": "fides_user_device",
+    "hashed_phone_number": "phone_number",
+}
+BATCH_SIZE = 1000
+# The fixed salt ProvidedIdentity.hash_value uses
+LEGACY_SALT = "$2b$12$UErimNtlsE6qgYf2BrI1Du"
+# Legacy hashes are the hex of the bcrypt hash, which starts with the salt
+LEGACY_HASH_PREFIX = LEGACY_SALT.encode().hex()
+
+
+def get_encryptor(type_in: Any = JSONTypeOverride) -> StringEncryptedType:
+    return StringEncryptedType(
+        type_in,
+        CONFIG.security.app_encryption_key,
+        AesGcmEngine,
+        "pkcs5",
+    )
+
+
+def get_identity_value(encrypted_value: Dict[str, Any]) -> Any:
+    return (encrypted_value or {}).get("value")
+
+
+def backfill(
+    table: str,
+    column: str,
+    where: str,
+    compute: Callable[[str], str],
+    source: str = "encrypted_value",
+    encryptor: Optional[StringEncryptedType] = None,
+    get_value: Callable[[Any], Any] = get_identity_value,
+) -> None:
+    """Sets `column` to the value computed from each row's decrypted `source` value, walking the
+    matching rows by id in batches so large tables aren't loaded into memory at once"""
+    bind = op.get_bind()
+    encryptor = encryptor or get_encryptor()
+    last_id = ""
+    backfilled = 0
+    while True:
+        rows = bind.execute(
+            text(
+                f"SELECT id, {source} FROM {table} "
+                f"WHERE id > :last_id AND {source} IS NOT NULL AND {where} "
+                "ORDER BY id LIMIT :batch_size"
+            ),
+            {"last_id": last_id, "batch_size": BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+
+        updates: List[Dict[str, str]] = []
+        for row in rows:
+            value: Any = get_value(
+                encryptor.process_result_value(row[source], bind.dialect)
+            )
+            if value is not None:
+                updates.append({"id": row["id"], "computed": compute(str(value))})
+        if updates:
+            bind.execute(
+                text(f"UPDATE {table} SET {column} = :computed WHERE id = :id"),
+                updates,
+            )
+        backfilled += len(updates)
+        last_id = rows[-1]["id"]
+    logger.info("Backfilled {}.{} for {} rows", table, column, backfilled)
+
+
+def backfill_history(
+    hashed_value_condition: str, compute: Callable[[str], str]
+) -> None:
+    """Recomputes the hashed identity columns on the history tables whose current hashed value
+    matches the condition, from the encrypted identity saved on the same record"""
+    encryptor = get_encryptor(sa.String())
+    for table in HISTORY_TABLES:
+        for column, source in HISTORY_HASHED_COLUMNS.items():
+            backfill(
+                table,
+                column,
+                f"{column} {hashed_value_condition}",
+                compute,
+                source=source,
+                encryptor=encryptor,
+                get_value=lambda value: value,
+            )
+
+
+def upgrade():
+    encoding: str = CONFIG.security.encoding
+
+    def blind_index(value: str) -> str:
+        return hash_with_hmac(
+            value.encode(encoding),
+            CONFIG.security.identity_blind_index_key.encode(encoding),
+        )
+
+    for table in TABLES:
+        op.add_column(table, sa.Column("blind_index", sa.String(), nullable=True))
+        op.create_index(
+            op.f(f"ix_{table}_blind_index"), table, ["blind_index"], unique=False
+        )
+        backfill(table, "blind_index", "blind_index IS NULL", blind_index)
+
+    backfill_history(f"LIKE '{LEGACY_HASH_PREFIX}%'", blind_index)
+
+
+def downgrade():
+    # Identities saved since the upgrade may only have a blind index, so restore the bcrypt
+    # hashed_value that earlier versions search provided identities by, and the bcrypt hashes
+    # earlier versions save on history records
+    encoding: str = CONFIG.security.encoding
+
+    def legacy_hash(value: str) -> str:
+        return hash_with_salt(value.encode(encoding), LEGACY_SALT.encode(encoding))
+
+    backfill("providedidentity", "hashed_value", "hashed_value IS NULL", legacy_hash)
+    backfill_history(f"NOT LIKE '{LEGACY_HASH_PREFIX}%'", legacy_hash)
+
+    for table in TABLES:
+        op.drop_index(op.f(f"ix_{table}_blind_index"), table_name=table)
+        op.drop_column(table, "blind_index")
@@ -0,0 +1,52 @@
+"""add consent report keyset indexes
+
+Adds composite indexes for keyset pagination of the consent reports, on
+privacypreferencehistory (created_at, id) and currentprivacypreference (updated_at, id).
+The indexes are created and dropped concurrently.
+
+Revision ID: 9b3d5e7f1a2c
+Revises: 4c8f1a2b7d3e
+Create Date: 2023-11-02 14:05:37.482913
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b3d5e7f1a2c"
+down_revision = "4c8f1a2b7d3e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Built concurrently, outside of the migration's transaction, so writes to these
+    # large tables aren't blocked while the indexes are built
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_privacypreferencehistory_created_at_id",
+            "privacypreferencehistory",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_currentprivacypreference_updated_at_id",
+            "currentprivacypreference",
+            ["updated_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_currentprivacypreference_updated_at_id",
+            table_name="currentprivacypreference",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_privacypreferencehistory_created_at_id",
+            table_name="privacypreferencehistory",
+            postgresql_concurrently=True,
+        )
@@ -2,6 +2,7 @@ from fides.api.api.v1.endpoints import (
     config_endpoints,
     connection_endpoints,
     connection_type_endpoints,
+    consent_reporting_endpoints,
     consent_request_endpoints,
     dataset_endpoints,
     drp_endpoints,
@@ -43,6 +44,7 @@ api_router.include_router(privacy_experience_endpoints.router)
 api_router.include_router(privacy_experience_config_endpoints.router)
 api_router.include_router(privacy_notice_endpoints.router)
 api_router.include_router(privacy_preference_endpoints.router)
+api_router.include_router(consent_reporting_endpoints.router)
 api_router.include_router(privacy_request_endpoints.router)
 api_router.include_router(identity_verification_endpoints.router)
 api_router.include_router(storage_endpoints.router)
@@ -29,6 +29,7 @@ from fides.api.schemas.connection_configuration.connection_secrets import (
 )
 from fides.api.schemas.connection_configuration.enums.system_type import SystemType
 from fides.api.schemas.connection_configuration.enums.test_status import TestStatus
+from fides.api.service.connectors.sql_engine_registry import sql_engine_registry
 from fides.api.util.api_router import APIRouter
 from fides.api.util.connection_util import (
     connection_status,
@@ -223,6 +224,7 @@ def put_connection_config_secrets(
     # Save validated secrets, regardless of whether they've been verified.
     logger.info("Updating connection config secrets for '{}'", connection_key)
     connection_config.save(db=db)
+    sql_engine_registry.invalidate(connection_key)
 
     msg = f"Secrets updated for ConnectionConfig with key: {connection_key}."
     if verify:
@@ -0,0 +1,325 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Depends
+from fastapi.params import Query as FastAPIQuery
+from fastapi.params import Security
+from fastapi_pagination import Page, Params
+from fastapi_pagination.bases import AbstractPage
+from fastapi_pagination.cursor import CursorPage, CursorParams
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy import literal
+from sqlalchemy.orm import Query, Session
+from starlette.responses import StreamingResponse
+from starlette.status import HTTP_200_OK
+
+from fides.api.api.deps import get_db
+from fides.api.models.fides_user import FidesUser
+from fides.api.models.privacy_preference import (
+    CurrentPrivacyPreference,
+    PrivacyPreferenceHistory,
+)
+from fides.api.models.privacy_request import PrivacyRequest
+from fides.api.oauth.utils import verify_oauth_client
+from fides.api.schemas.privacy_preference import (
+    ConsentReportingSchema,
+    CurrentPrivacyPreferenceReportingSchema,
+)
+from fides.api.util.api_router import APIRouter
+from fides.api.util.endpoint_utils import validate_start_and_end_filters
+from fides.api.util.enums import ColumnSort, ReportExportFormat
+from fides.api.util.keyset_pagination import keyset_paginate, stream_report_export
+from fides.common.api.scope_registry import (
+    CURRENT_PRIVACY_PREFERENCE_READ,
+    PRIVACY_PREFERENCE_HISTORY_READ,
+)
+from fides.common.api.v1.urn_registry import (
+    CURRENT_PRIVACY_PREFERENCES_REPORT,
+    CURRENT_PRIVACY_PREFERENCES_REPORT_CURSOR,
+    CURRENT_PRIVACY_PREFERENCES_REPORT_EXPORT,
+    HISTORICAL_PRIVACY_PREFERENCES_REPORT,
+    HISTORICAL_PRIVACY_PREFERENCES_REPORT_CURSOR,
+    HISTORICAL_PRIVACY_PREFERENCES_REPORT_EXPORT,
+    V1_URL_PREFIX,
+)
+
+router = APIRouter(tags=["Privacy Preference"], prefix=V1_URL_PREFIX)
+
+
+def _current_privacy_preferences_report_query(
+    db: Session, updated_lt: Optional[datetime], updated_gt: Optional[datetime]
+) -> Query:
+    """Query for the current privacy preferences report, before it is sorted"""
+    validate_start_and_end_filters([(updated_lt, updated_gt, "updated")])
+
+    query: Query[CurrentPrivacyPreference] = db.query(CurrentPrivacyPreference)
+
+    if updated_lt:
+        query = query.filter(CurrentPrivacyPreference.updated_at < updated_lt)
+    if updated_gt:
+        query = query.filter(CurrentPrivacyPreference.updated_at > updated_gt)
+
+    return query
+
+
+@router.get(
+    CURRENT_PRIVACY_PREFERENCES_REPORT,
+    status_code=HTTP_200_OK,
+    dependencies=[
+        Security(verify_oauth_client, scopes=[CURRENT_PRIVACY_PREFERENCE_READ])
+    ],
+    response_model=Page[CurrentPrivacyPreferenceReportingSchema],
+)
+def get_current_privacy_preferences_report(
+    *,
+    params: Params = Depends(),
+    db: Session = Depends(get_db),
+    updated_lt: Optional[datetime] = None,
+    updated_gt: Optional[datetime] = None,
+) -> AbstractPage[CurrentPrivacyPreference]:
+    """Returns the most recently saved privacy preferences for a particular consent item"""
+    query = _current_privacy_preferences_report_query(db, updated_lt, updated_gt)
+
+    query = query.order_by(CurrentPrivacyPreference.updated_at.desc())
+
+    return paginate(query, params)
+
+
+@router.get(
+    CURRENT_PRIVACY_PREFERENCES_REPORT_CURSOR,
+    status_code=HTTP_200_OK,
+    dependencies=[
+        Security(verify_oauth_client, scopes=[CURRENT_PRIVACY_PREFERENCE_READ])
+    ],
+    response_model=CursorPage[CurrentPrivacyPreferenceReportingSchema],
+)
+def get_current_privacy_preferences_report_by_cursor(
+    *,
+    params: CursorParams = Depends(),
+    db: Session = Depends(get_db),
+    updated_lt: Optional[datetime] = None,
+    updated_gt: Optional[datetime] = None,
+    sort_direction: ColumnSort = ColumnSort.DESC,
+) -> CursorPage[CurrentPrivacyPreference]:
+    """Returns the most recently saved privacy preferences, paginated by a cursor on
+    (updated_at, id) so deep pages are as fast as the first one.
+
+    Pass the `next_page` of a response as the `cursor` to get the following page.
+    """
+    query = _current_privacy_preferences_report_query(db, updated_lt, updated_gt)
+
+    return keyset_paginate(
+        query,
+        params,
+        CurrentPrivacyPreference.updated_at,
+        CurrentPrivacyPreference.id,
+        "updated_at",
+        sort_direction,
+    )
+
+
+@router.get(
+    CURRENT_PRIVACY_PREFERENCES_REPORT_EXPORT,
+    status_code=HTTP_200_OK,
+    dependencies=[
+        Security(verify_oauth_client, scopes=[CURRENT_PRIVACY_PREFERENCE_READ])
+    ],
+)
+def export_current_privacy_preferences_report(
+    *,
+    db: Session = Depends(get_db),
+    updated_lt: Optional[datetime] = None,
+    updated_gt: Optional[datetime] = None,
+    sort_direction: ColumnSort = ColumnSort.DESC,
+    export_format: ReportExportFormat = FastAPIQuery(
+        default=ReportExportFormat.ndjson, alias="format"
+    ),  # type:ignore
+) -> StreamingResponse:
+    """Streams every current privacy preference as NDJSON or CSV, for bulk exports of the report"""
+    query = _current_privacy_preferences_report_query(db, updated_lt, updated_gt)
+
+    return stream_report_export(
+        query,
+        CurrentPrivacyPreferenceReportingSchema,
+        CurrentPrivacyPreference.updated_at,
+        CurrentPrivacyPreference.id,
+        "updated_at",
+        sort_direction,
+        export_format,
+        "current_privacy_preferences",
+    )
+
+
+def _historical_consent_report_query(
+    db: Session,
+    request_timestamp_lt: Optional[datetime],
+    request_timestamp_gt: Optional[datetime],
+) -> Query:
+    """Query for the historical consent report, before it is sorted"""
+    validate_start_and_end_filters(
+        [(request_timestamp_lt, request_timestamp_gt, "request_timestamp")]
+    )
+
+    query: Query[PrivacyPreferenceHistory] = (
+        db.query(
+            PrivacyPreferenceHistory.id,
+            PrivacyRequest.id.label("privacy_request_id"),
+            PrivacyPreferenceHistory.email.label("email"),
+            PrivacyPreferenceHistory.phone_number.label("phone_number"),
+            PrivacyPreferenceHistory.fides_user_device.label("fides_user_device_id"),
+            PrivacyPreferenceHistory.secondary_user_ids,
+            PrivacyPreferenceHistory.created_at.label("request_timestamp"),
+            PrivacyPreferenceHistory.request_origin.label("request_origin"),
+            PrivacyRequest.status.label("request_status"),
+            literal("consent").label(
+                "request_type"
+            ),  # Right now, we know this is consent, so hardcoding to avoid the Policy/Rule join
+            FidesUser.username.label("approver_id"),
+            PrivacyPreferenceHistory.privacy_notice_history_id.label(
+                "privacy_notice_history_id"
+            ),
+            PrivacyPreferenceHistory.preference.label("preference"),
+            PrivacyPreferenceHistory.user_geography.label("user_geography"),
+            PrivacyPreferenceHistory.relevant_systems.label("relevant_systems"),
+            PrivacyPreferenceHistory.affected_system_status.label(
+                "affected_system_status"
+            ),
+            PrivacyPreferenceHistory.url_recorded.label("url_recorded"),
+            PrivacyPreferenceHistory.user_agent.label("user_agent"),
+            PrivacyPreferenceHistory.privacy_experience_id.label(
+                "privacy_experience_id"
+            ),
+            PrivacyPreferenceHistory.privacy_experience_config_history_id.label(
+                "experience_config_history_id"
+            ),
+            PrivacyPreferenceHistory.anonymized_ip_address.label(
+                "truncated_ip_address"
+            ),
+            PrivacyPreferenceHistory.method.label("method"),
+            PrivacyPreferenceHistory.served_notice_history_id.label(
+                "served_notice_history_id"
+            ),
+            PrivacyPreferenceHistory.purpose_consent.label("purpose_consent"),
+            PrivacyPreferenceHistory.purpose_legitimate_interests.label(
+                "purpose_legitimate_interests"
+            ),
+            PrivacyPreferenceHistory.special_purpose.label("special_purpose"),
+            PrivacyPreferenceHistory.vendor_consent.label("vendor_consent"),
+            PrivacyPreferenceHistory.vendor_legitimate_interests.label(
+                "vendor_legitimate_interests"
+            ),
+            PrivacyPreferenceHistory.system_consent.label("system_consent"),
+            PrivacyPreferenceHistory.system_legitimate_interests.label(
+                "system_legitimate_interests"
+            ),
+            PrivacyPreferenceHistory.feature.label("feature"),
+            PrivacyPreferenceHistory.special_feature.label("special_feature"),
+            PrivacyPreferenceHistory.tcf_version.label("tcf_version"),
+        )
+        .outerjoin(
+            PrivacyRequest,
+            PrivacyRequest.id == PrivacyPreferenceHistory.privacy_request_id,
+        )
+        .outerjoin(FidesUser, PrivacyRequest.reviewed_by == FidesUser.id)
+    )
+
+    if request_timestamp_lt:
+        query = query.filter(PrivacyPreferenceHistory.created_at < request_timestamp_lt)
+    if request_timestamp_gt:
+        query = query.filter(PrivacyPreferenceHistory.created_at > request_timestamp_gt)
+
+    return query
+
+
+@router.get(
+    HISTORICAL_PRIVACY_PREFERENCES_REPORT,
+    status_code=HTTP_200_OK,
+    dependencies=[
+        Security(verify_oauth_client, scopes=[PRIVACY_PREFERENCE_HISTORY_READ])
+    ],
+    response_model=Page[ConsentReportingSchema],
+)
+def get_historical_consent_report(
+    *,
+    params: Params = Depends(),
+    db: Session = Depends(get_db),
+    request_timestamp_gt: Optional[datetime] = None,
+    request_timestamp_lt: Optional[datetime] = None,
+) -> AbstractPage[PrivacyPreferenceHistory]:
+    """Endpoint to return a historical record of all privacy preferences saved for consent reporting"""
+    query = _historical_consent_report_query(
+        db, request_timestamp_lt, request_timestamp_gt
+    )
+
+    query = query.order_by(PrivacyPreferenceHistory.created_at.desc())
+
+    return paginate(query, params)
+
+
+@router.get(
+    HISTORICAL_PRIVACY_PREFERENCES_REPORT_CURSOR,
+    status_code=HTTP_200_OK,
+    dependencies=[
+        Security(verify_oauth_client, scopes=[PRIVACY_PREFERENCE_HISTORY_READ])
+    ],
+    response_model=CursorPage[ConsentReportingSchema],
+)
+def get_historical_consent_report_by_cursor(
+    *,
+    params: CursorParams = Depends(),
+    db: Session = Depends(get_db),
+    request_timestamp_gt: Optional[datetime] = None,
+    request_timestamp_lt: Optional[datetime] = None,
+    sort_direction: ColumnSort = ColumnSort.DESC,
+) -> CursorPage[PrivacyPreferenceHistory]:
+    """Returns the historical record of privacy preferences, paginated by a cursor on
+    (created_at, id) so deep pages are as fast as the first one.
+
+    Pass the `next_page` of a response as the `cursor` to get the following page.
+    """
+    query = _historical_consent_report_query(
+        db, request_timestamp_lt, request_timestamp_gt
+    )
+
+    return keyset_paginate(
+        query,
+        params,
+        PrivacyPreferenceHistory.created_at,
+        PrivacyPreferenceHistory.id,
+        "request_timestamp",
+        sort_direction,
+    )
+
+
+@router.get(
+    HISTORICAL_PRIVACY_PREFERENCES_REPORT_EXPORT,
+    status_code=HTTP_200_OK,
+    dependencies=[
+        Security(verify_oauth_client, scopes=[PRIVACY_PREFERENCE_HISTORY_READ])
+    ],
+)
+def export_historical_consent_report(
+    *,
+    db: Session = Depends(get_db),
+    request_timestamp_gt: Optional[datetime] = None,
+    request_timestamp_lt: Optional[datetime] = None,
+    sort_direction: ColumnSort = ColumnSort.DESC,
+    export_format: ReportExportFormat = FastAPIQuery(
+        default=ReportExportFormat.ndjson, alias="format"
+    ),  # type:ignore
+) -> StreamingResponse:
+    """Streams the historical record of every privacy preference as NDJSON or CSV, for bulk exports of the report"""
+    query = _historical_consent_report_query(
+        db, request_timestamp_lt, request_timestamp_gt
+    )
+
+    return stream_report_export(
+        query,
+        ConsentReportingSchema,
+        PrivacyPreferenceHistory.created_at,
+        PrivacyPreferenceHistory.id,
+        "request_timestamp",
+        sort_direction,
+        export_format,
+        "historical_privacy_preferences",
+    )
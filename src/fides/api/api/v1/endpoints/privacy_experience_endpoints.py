@@ -1,7 +1,6 @@
-import asyncio
 import uuid
 from html import escape, unescape
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from fastapi import Depends, HTTPException
 from fastapi import Query as FastAPIQuery
@@ -10,7 +9,7 @@ from fastapi_pagination import Page, Params
 from fastapi_pagination import paginate as fastapi_paginate
 from fastapi_pagination.bases import AbstractPage
 from loguru import logger
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, selectinload
 from starlette.status import (
     HTTP_200_OK,
     HTTP_404_NOT_FOUND,
@@ -22,8 +21,11 @@ from fides.api.models.privacy_experience import (
     ComponentType,
     PrivacyExperience,
     PrivacyExperienceConfig,
+    SavedConsentRecords,
+    get_privacy_notices_by_regions,
+    get_system_data_uses,
 )
-from fides.api.models.privacy_notice import PrivacyNotice
+from fides.api.models.privacy_notice import PrivacyNotice, PrivacyNoticeRegion
 from fides.api.models.privacy_request import ProvidedIdentity
 from fides.api.schemas.privacy_experience import (
     PrivacyExperienceMetaResponse,
@@ -38,6 +40,7 @@ from fides.api.util.consent_util import (
 )
 from fides.api.util.endpoint_utils import fides_limiter, transform_fields
 from fides.api.util.tcf.experience_meta import build_experience_tcf_meta
+from fides.api.util.tcf.tcf_contents_cache import get_tcf_contents_version
 from fides.api.util.tcf.tcf_experience_contents import (
     TCF_SECTION_MAPPING,
     TCFExperienceContents,
@@ -103,27 +106,34 @@ def _filter_experiences_by_region_or_country(
     cleaned_region: str = escape(region).replace("-", "_").lower()
     country: str = cleaned_region.split("_")[0]
 
-    overlay: Optional[
-        PrivacyExperience
-    ] = PrivacyExperience.get_experience_by_region_and_component(
-        db, cleaned_region, ComponentType.overlay
-    ) or PrivacyExperience.get_experience_by_region_and_component(
-        db, country, ComponentType.overlay
-    )
-    privacy_center: Optional[
-        PrivacyExperience
-    ] = PrivacyExperience.get_experience_by_region_and_component(
-        db, cleaned_region, ComponentType.privacy_center
-    ) or PrivacyExperience.get_experience_by_region_and_component(
-        db, country, ComponentType.privacy_center
-    )
-    tcf_overlay: Optional[
-        PrivacyExperience
-    ] = PrivacyExperience.get_experience_by_region_and_component(
-        db, cleaned_region, ComponentType.tcf_overlay
-    ) or PrivacyExperience.get_experience_by_region_and_component(
-        db, country, ComponentType.tcf_overlay
+    # Load the candidate experiences for both the region and its country in one query
+    candidates: Dict[Tuple[str, ComponentType], PrivacyExperience] = {
+        (
+            PrivacyNoticeRegion(experience.region).value,
+            ComponentType(experience.component),
+        ): experience
+        for experience in db.query(PrivacyExperience).filter(
+            PrivacyExperience.region.in_({cleaned_region, country}),
+            PrivacyExperience.component.in_(
+                [
+                    ComponentType.overlay,
+                    ComponentType.privacy_center,
+                    ComponentType.tcf_overlay,
+                ]
+            ),
+        )
+    }
+
+    def get_experience(component: ComponentType) -> Optional[PrivacyExperience]:
+        return candidates.get((cleaned_region, component)) or candidates.get(
+            (country, component)
+        )
+
+    overlay: Optional[PrivacyExperience] = get_experience(ComponentType.overlay)
+    privacy_center: Optional[PrivacyExperience] = get_experience(
+        ComponentType.privacy_center
     )
+    tcf_overlay: Optional[PrivacyExperience] = get_experience(ComponentType.tcf_overlay)
 
     experience_ids: List[str] = []
 
@@ -147,7 +157,7 @@ def _filter_experiences_by_region_or_country(
     response_model=Page[PrivacyExperienceMetaResponse],
 )
 @fides_limiter.limit(CONFIG.security.public_request_rate_limit)
-async def get_privacy_experience_meta(
+def get_privacy_experience_meta(
     *,
     db: Session = Depends(deps.get_db),
     params: Params = Depends(),
@@ -161,22 +171,21 @@ async def get_privacy_experience_meta(
 
     logger.info("Fetching meta info for Experiences '{}'", params)
 
-    await asyncio.sleep(delay=0.001)
     experience_query: Query = db.query(PrivacyExperience)
 
-    await asyncio.sleep(delay=0.001)
     if region is not None:
         experience_query = _filter_experiences_by_region_or_country(
             db=db, region=region, experience_query=experience_query
         )
 
-    await asyncio.sleep(delay=0.001)
     if component is not None:
         experience_query = _filter_experiences_by_component(component, experience_query)
 
-    await asyncio.sleep(delay=0.001)
     # TCF contents are the same across all EEA regions, so we can build this once.
-    base_tcf_contents: TCFExperienceContents = get_tcf_contents(db)
+    tcf_contents_version: str = get_tcf_contents_version(db)
+    base_tcf_contents: TCFExperienceContents = get_tcf_contents(
+        db, tcf_contents_version
+    )
 
     tcf_meta: Optional[Dict] = None
     for (
@@ -186,11 +195,15 @@ async def get_privacy_experience_meta(
         if getattr(base_tcf_contents, tcf_section_name):
             # TCF Experience meta is also the same across all EEA regions. Only build meta if there is TCF
             # content under at least one section.
-            tcf_meta = build_experience_tcf_meta(base_tcf_contents)
+            tcf_meta = build_experience_tcf_meta(
+                base_tcf_contents, tcf_contents_version
+            )
             break
 
     results: List[PrivacyExperience] = []
-    for experience in experience_query:
+    for experience in experience_query.options(
+        selectinload(PrivacyExperience.experience_config)
+    ):
         if experience.component == ComponentType.tcf_overlay:
             # Attach meta for TCF Experiences only.  We don't yet build meta info for non-TCF experiences.
             experience.meta = tcf_meta
@@ -205,7 +218,7 @@ async def get_privacy_experience_meta(
     response_model=Page[PrivacyExperienceResponse],
 )
 @fides_limiter.limit(CONFIG.security.public_request_rate_limit)
-async def privacy_experience_list(
+def privacy_experience_list(
     *,
     db: Session = Depends(deps.get_db),
     params: Params = Depends(),
@@ -257,7 +270,6 @@ async def privacy_experience_list(
             db=db, fides_user_device_id=fides_user_device_id
         )
 
-    await asyncio.sleep(delay=0.001)
     experience_query = db.query(PrivacyExperience)
 
     if show_disabled is False:
@@ -268,22 +280,18 @@ async def privacy_experience_list(
             PrivacyExperienceConfig.id == PrivacyExperience.experience_config_id,
         ).filter(PrivacyExperienceConfig.disabled.is_(False))
 
-    await asyncio.sleep(delay=0.001)
     if region is not None:
         experience_query = _filter_experiences_by_region_or_country(
             db=db, region=region, experience_query=experience_query
         )
 
-    await asyncio.sleep(delay=0.001)
     if component is not None:
         experience_query = _filter_experiences_by_component(component, experience_query)
 
-    await asyncio.sleep(delay=0.001)
     if has_config is True:
         experience_query = experience_query.filter(
             PrivacyExperience.experience_config_id.isnot(None)
         )
-    await asyncio.sleep(delay=0.001)
     if has_config is False:
         experience_query = experience_query.filter(
             PrivacyExperience.experience_config_id.is_(None)
@@ -293,14 +301,34 @@ async def privacy_experience_list(
     should_unescape: Optional[str] = request.headers.get(UNESCAPE_SAFESTR_HEADER)
 
     # Builds TCF Experience Contents once here, in case multiple TCF Experiences are requested
-    await asyncio.sleep(delay=0.001)
-    base_tcf_contents: TCFExperienceContents = get_tcf_contents(db)
+    tcf_contents_version: str = get_tcf_contents_version(db)
+    base_tcf_contents: TCFExperienceContents = get_tcf_contents(
+        db, tcf_contents_version
+    )
 
-    await asyncio.sleep(delay=0.001)
-    for privacy_experience in experience_query.order_by(
-        PrivacyExperience.created_at.desc()
-    ):
-        await asyncio.sleep(delay=0.001)
+    experiences: List[PrivacyExperience] = (
+        experience_query.options(selectinload(PrivacyExperience.experience_config))
+        .order_by(PrivacyExperience.created_at.desc())
+        .all()
+    )
+
+    # Load everything the experiences are supplemented with up front, rather than querying
+    # for each experience, notice, and TCF record
+    privacy_notices: List[PrivacyNotice] = get_privacy_notices_by_regions(
+        db,
+        regions=[experience.region for experience in experiences],  # type: ignore[misc]
+        show_disabled=show_disabled,
+    )
+    data_uses: Optional[Set[str]] = (
+        get_system_data_uses(db) if systems_applicable else None
+    )
+    saved_consent_records: Optional[SavedConsentRecords] = (
+        SavedConsentRecords.load(db, fides_user_provided_identity)
+        if fides_user_provided_identity
+        else None
+    )
+
+    for privacy_experience in experiences:
         content_exists: bool = embed_experience_details(
             db,
             privacy_experience=privacy_experience,
@@ -311,15 +339,18 @@ async def privacy_experience_list(
             include_gvl=include_gvl,
             include_meta=include_meta,
             base_tcf_contents=base_tcf_contents,
+            tcf_contents_version=tcf_contents_version,
+            privacy_notices=privacy_notices,
+            data_uses=data_uses,
+            saved_consent_records=saved_consent_records,
         )
 
         if content_required and not content_exists:
             continue
 
         # Temporarily save "show_banner" on the privacy experience object
-        await asyncio.sleep(delay=0.001)
         privacy_experience.show_banner = privacy_experience.get_should_show_banner(
-            db, show_disabled
+            db, show_disabled, privacy_notices=privacy_notices
         )
 
         if should_unescape:
@@ -345,10 +376,18 @@ def embed_experience_details(
     include_gvl: Optional[bool],
     include_meta: Optional[bool],
     base_tcf_contents: TCFExperienceContents,
+    tcf_contents_version: Optional[str] = None,
+    privacy_notices: Optional[List[PrivacyNotice]] = None,
+    data_uses: Optional[Set[str]] = None,
+    saved_consent_records: Optional[SavedConsentRecords] = None,
 ) -> bool:
     """
     Embed the contents of the PrivacyExperience at runtime. Adds Privacy Notices or TCF contents if applicable.
 
+    Candidate privacy_notices, system data_uses, and the user's saved_consent_records may be
+    loaded once by the caller and shared across experiences. TCF meta is cached under the
+    tcf_contents_version, if supplied.
+
     The PrivacyExperience is updated in-place, and this method returns whether there is content
     on this experience.
     """
@@ -362,31 +401,42 @@ def embed_experience_details(
     # Updates Privacy Experience in-place with TCF Contents if applicable, and then returns
     # if TCF contents exist
     has_tcf_contents: bool = privacy_experience.update_with_tcf_contents(
-        db, base_tcf_contents, fides_user_provided_identity
+        db,
+        base_tcf_contents,
+        fides_user_provided_identity,
+        saved_consent_records=saved_consent_records,
     )
 
     if has_tcf_contents:
         if include_meta:
-            privacy_experience.meta = build_experience_tcf_meta(base_tcf_contents)
+            privacy_experience.meta = build_experience_tcf_meta(
+                base_tcf_contents, tcf_contents_version
+            )
         if include_gvl:
             privacy_experience.gvl = load_gvl()
 
-    privacy_notices: List[
+    related_notices: List[
         PrivacyNotice
     ] = privacy_experience.get_related_privacy_notices(
-        db, show_disabled, systems_applicable, fides_user_provided_identity
+        db,
+        show_disabled,
+        systems_applicable,
+        fides_user_provided_identity,
+        privacy_notices=privacy_notices,
+        data_uses=data_uses,
+        saved_consent_records=saved_consent_records,
     )
 
     if should_unescape:
-        privacy_notices = [
+        related_notices = [
             transform_fields(
                 transformation=unescape,
                 model=notice,
                 fields=PRIVACY_NOTICE_ESCAPE_FIELDS,
             )
-            for notice in privacy_notices
+            for notice in related_notices
         ]
     # Add Privacy Notices to the Experience if applicable
-    privacy_experience.privacy_notices = privacy_notices
+    privacy_experience.privacy_notices = related_notices
 
-    return bool(privacy_notices) or has_tcf_contents
+    return bool(related_notices) or has_tcf_contents
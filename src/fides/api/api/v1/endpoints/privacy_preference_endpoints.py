@@ -1,5 +1,4 @@
 import ipaddress
-from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Type, Union
 
 from fastapi import Depends, HTTPException, Request, Response
@@ -8,10 +7,10 @@ from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
 from fastapi_pagination.ext.sqlalchemy import paginate
 from loguru import logger
-from sqlalchemy import literal
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Session
 from starlette.status import (
     HTTP_200_OK,
+    HTTP_201_CREATED,
     HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
     HTTP_422_UNPROCESSABLE_ENTITY,
@@ -25,6 +24,7 @@ from fides.api.api.v1.endpoints.privacy_request_endpoints import (
     create_privacy_request_func,
 )
 from fides.api.common_exceptions import (
+    ConsentHistorySaveError,
     DecodeFidesStringError,
     IdentityNotFoundException,
     PrivacyNoticeHistoryNotFound,
@@ -32,7 +32,6 @@ from fides.api.common_exceptions import (
 )
 from fides.api.custom_types import SafeStr
 from fides.api.db.seed import DEFAULT_CONSENT_POLICY
-from fides.api.models.fides_user import FidesUser
 from fides.api.models.privacy_experience import PrivacyExperience
 from fides.api.models.privacy_notice import (
     EnforcementLevel,
@@ -47,16 +46,15 @@ from fides.api.models.privacy_preference import (
 )
 from fides.api.models.privacy_request import (
     ConsentRequest,
-    PrivacyRequest,
     ProvidedIdentity,
     ProvidedIdentityType,
 )
 from fides.api.oauth.utils import verify_oauth_client
 from fides.api.schemas.privacy_preference import (
     TCF_PREFERENCES_FIELD_MAPPING,
+    BulkPrivacyPreferencesImport,
+    BulkPrivacyPreferencesImportResponse,
     ConsentOptionCreate,
-    ConsentReportingSchema,
-    CurrentPrivacyPreferenceReportingSchema,
     CurrentPrivacyPreferenceSchema,
     FidesStringFidesPreferences,
     PrivacyPreferencesCreate,
@@ -80,27 +78,26 @@ from fides.api.schemas.tcf import (
 )
 from fides.api.util.api_router import APIRouter
 from fides.api.util.consent_util import (
+    get_or_create_fides_user_device_id_provided_identities,
     get_or_create_fides_user_device_id_provided_identity,
 )
-from fides.api.util.endpoint_utils import fides_limiter, validate_start_and_end_filters
-from fides.api.util.tcf.ac_string import decode_ac_string_to_preferences
-from fides.api.util.tcf.fides_string import split_fides_string
+from fides.api.util.endpoint_utils import fides_limiter
+from fides.api.util.tcf.fides_string import (
+    decode_fides_string_to_preferences,
+    split_fides_string,
+)
 from fides.api.util.tcf.tc_mobile_data import convert_fides_str_to_mobile_data
-from fides.api.util.tcf.tc_string import decode_tc_string_to_preferences
+from fides.api.util.tcf.tcf_contents_cache import get_tcf_contents_version
 from fides.api.util.tcf.tcf_experience_contents import (
     TCFExperienceContents,
     get_tcf_contents,
 )
-from fides.common.api.scope_registry import (
-    CURRENT_PRIVACY_PREFERENCE_READ,
-    PRIVACY_PREFERENCE_HISTORY_READ,
-)
+from fides.common.api.scope_registry import PRIVACY_PREFERENCE_HISTORY_CREATE
 from fides.common.api.v1.urn_registry import (
     CONSENT_REQUEST_PRIVACY_PREFERENCES_VERIFY,
     CONSENT_REQUEST_PRIVACY_PREFERENCES_WITH_ID,
-    CURRENT_PRIVACY_PREFERENCES_REPORT,
-    HISTORICAL_PRIVACY_PREFERENCES_REPORT,
     PRIVACY_PREFERENCES,
+    PRIVACY_PREFERENCES_BULK,
     V1_URL_PREFIX,
 )
 from fides.config import CONFIG
@@ -153,7 +150,7 @@ def consent_request_verify_for_privacy_preferences(
         verification_code=data.code,
     )
 
-    if not provided_identity.hashed_value:
+    if not provided_identity.blind_index:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND, detail="Provided identity missing"
         )
@@ -215,13 +212,17 @@ def verify_privacy_notice_and_historical_records(
 def extract_identity_from_provided_identity(
     identity: Optional[ProvidedIdentity], identity_type: ProvidedIdentityType
 ) -> Tuple[Optional[str], Optional[str]]:
-    """Pull the identity data off of the ProvidedIdentity given that it's the correct type"""
+    """Pull the identity data and its blind index off of the ProvidedIdentity given that it's the correct type
+
+    The blind index is only set when the identity is flushed, so it's computed here for identities
+    that haven't been saved yet.
+    """
     value: Optional[str] = None
     hashed_value: Optional[str] = None
 
     if identity and identity.encrypted_value and identity.field_name == identity_type:
         value = identity.encrypted_value["value"]
-        hashed_value = identity.hashed_value
+        hashed_value = identity.blind_index or ProvidedIdentity.blind_index_value(value)  # type: ignore[arg-type]
 
     return value, hashed_value
 
@@ -389,52 +390,21 @@ def save_privacy_preferences_with_verified_identity(
         raise HTTPException(status_code=400, detail=exc.args[0])
 
 
-def persist_tcf_preferences(
-    db: Session,
+def get_tcf_preferences_to_save(
     user_data: Dict[str, str],
     request_data: PrivacyPreferencesRequest,
-    saved_preferences_response: SavePrivacyPreferencesResponse,
-) -> None:
-    """Save TCF preferences with respect to individual TCF components if applicable.
+) -> List[Tuple[str, Dict]]:
+    """Build the data for saving TCF preferences with respect to individual TCF components if applicable.
+
+    Returns the section of the response each preference is returned under, alongside the data to save.
 
     All TCF Preferences have frontend-only enforcement at the moment, so no Privacy Requests
-    are created to propagate consent. The "upserted_current_preferences" list is updated in place.
+    are created to propagate consent.
     """
     if not CONFIG.consent.tcf_enabled:
-        return
-
-    def save_tcf_preference(
-        component_type: str,
-        preference_request: Union[
-            TCFPurposeSave,
-            TCFSpecialPurposeSave,
-            TCFVendorSave,
-            TCFFeatureSave,
-            TCFSpecialFeatureSave,
-        ],
-    ) -> CurrentPrivacyPreference:
-        """Internal helper method for dynamically saving a preference against a specific TCF component
-        in the database where applicable
-
-        Currently, we don't attempt to propagate these preferences to third party systems.
-        """
-        (
-            _,
-            current_preference,
-        ) = PrivacyPreferenceHistory.create_history_and_upsert_current_preference(
-            db=db,
-            data={
-                **user_data,
-                **{
-                    "preference": preference_request.preference,
-                    component_type: preference_request.id,
-                    "served_notice_history_id": preference_request.served_notice_history_id,
-                },
-            },
-            check_name=False,
-        )
-        return current_preference
+        return []
 
+    tcf_preferences_to_save: List[Tuple[str, Dict]] = []
     # If applicable, loop through all the lists of TCF components and save each preference individually: with respect
     # to purposes, special purposes, vendors, features, special features, and/or systems.
     for tcf_preference_field, field_name in TCF_PREFERENCES_FIELD_MAPPING.items():
@@ -451,15 +421,20 @@ def persist_tcf_preferences(
         ] = getattr(request_data, tcf_preference_field)
 
         for preference in saved_preferences:
-            saved_section: List = getattr(
-                saved_preferences_response, tcf_preference_field
-            )
-            saved_section.append(
-                save_tcf_preference(
-                    preference_request=preference,
-                    component_type=field_name,
+            tcf_preferences_to_save.append(
+                (
+                    tcf_preference_field,
+                    {
+                        **user_data,
+                        **{
+                            "preference": preference.preference,
+                            field_name: preference.id,
+                            "served_notice_history_id": preference.served_notice_history_id,
+                        },
+                    },
                 )
             )
+    return tcf_preferences_to_save
 
 
 def update_request_body_for_consent_served_or_saved(
@@ -550,38 +525,47 @@ def save_privacy_preferences_for_identities(
     )
     common_user_data["method"] = original_request_data.method
 
-    # Persists preferences with respect to individual TCF attributes first if applicable
-    persist_tcf_preferences(
-        db=db,
+    # Preferences with respect to individual TCF attributes are saved first if applicable,
+    # then preferences with respect to Privacy Notices.
+    preferences_to_save: List[Tuple[str, Dict]] = get_tcf_preferences_to_save(
         user_data=common_user_data,
         request_data=original_request_data,
-        saved_preferences_response=saved_preferences_response,
     )
-
-    # Separately persist preferences with respect to Privacy Notices where applicable.
-    # Create a privacy request to propagate third party preferences if needed.
-    needs_server_side_propagation: bool = False
     for privacy_preference in original_request_data.preferences:
-        (
-            historical_preference,
-            current_preference,
-        ) = PrivacyPreferenceHistory.create_history_and_upsert_current_preference(
-            db=db,
-            data={
-                **common_user_data,
-                **{
-                    "preference": privacy_preference.preference,
-                    "privacy_notice_history_id": privacy_preference.privacy_notice_history_id,
-                    "served_notice_history_id": privacy_preference.served_notice_history_id,
+        preferences_to_save.append(
+            (
+                "preferences",
+                {
+                    **common_user_data,
+                    **{
+                        "preference": privacy_preference.preference,
+                        "privacy_notice_history_id": privacy_preference.privacy_notice_history_id,
+                        "served_notice_history_id": privacy_preference.served_notice_history_id,
+                    },
                 },
-            },
-            check_name=False,
-        )
-        created_historical_preferences.append(historical_preference)
-        saved_preferences_response.preferences.append(
-            current_preference  # type:ignore[arg-type]
+            )
         )
 
+    # Write all the historical records and upsert the current preferences together
+    (
+        historical_preferences,
+        current_preferences,
+    ) = PrivacyPreferenceHistory.bulk_create_history_and_upsert_current_preferences(
+        db=db,
+        data=[preference_data for _, preference_data in preferences_to_save],
+    )
+
+    # Create a privacy request to propagate third party preferences if needed.
+    needs_server_side_propagation: bool = False
+    for (section, _), historical_preference, current_preference in zip(
+        preferences_to_save, historical_preferences, current_preferences
+    ):
+        saved_section: List = getattr(saved_preferences_response, section)
+        saved_section.append(current_preference)
+        if section != "preferences":
+            continue
+
+        created_historical_preferences.append(historical_preference)
         if (
             historical_preference.privacy_notice_history
             and historical_preference.privacy_notice_history.enforcement_level
@@ -707,9 +691,8 @@ def update_request_with_decoded_fides_string_fields(
 ) -> PrivacyPreferencesRequest:
     """Update the request body with the decoded values of the TC string and AC strings if applicable"""
     if request_body.fides_string:
-        tcf_contents: TCFExperienceContents = get_tcf_contents(
-            db
-        )  # TODO cache this so we're not building each time privacy preference is saved
+        tcf_contents_version: str = get_tcf_contents_version(db)
+        tcf_contents: TCFExperienceContents = get_tcf_contents(db, tcf_contents_version)
         try:
             tc_str, ac_str = split_fides_string(request_body.fides_string)
             if tc_str and not CONFIG.consent.tcf_enabled:
@@ -719,15 +702,9 @@ def update_request_with_decoded_fides_string_fields(
                 raise DecodeFidesStringError("AC must be enabled to decode AC String")
 
             decoded_tc_str_request_body: FidesStringFidesPreferences = (
-                decode_tc_string_to_preferences(tc_str, tcf_contents)
-            )
-            decoded_ac_str_request_body: FidesStringFidesPreferences = (
-                decode_ac_string_to_preferences(ac_str, tcf_contents)
-            )
-            # We combine Vendor Consent Preferences from the TC String and AC String if applicable
-            decoded_tc_str_request_body.vendor_consent_preferences = (
-                decoded_tc_str_request_body.vendor_consent_preferences
-                + decoded_ac_str_request_body.vendor_consent_preferences
+                decode_fides_string_to_preferences(
+                    tc_str, ac_str, tcf_contents, tcf_contents_version
+                )
             )
         except DecodeFidesStringError as exc:
             raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=exc.args[0])
@@ -810,129 +787,64 @@ def save_privacy_preferences(
         raise HTTPException(status_code=400, detail=exc.args[0])
 
 
-@router.get(
-    CURRENT_PRIVACY_PREFERENCES_REPORT,
-    status_code=HTTP_200_OK,
-    dependencies=[
-        Security(verify_oauth_client, scopes=[CURRENT_PRIVACY_PREFERENCE_READ])
-    ],
-    response_model=Page[CurrentPrivacyPreferenceReportingSchema],
-)
-def get_current_privacy_preferences_report(
-    *,
-    params: Params = Depends(),
-    db: Session = Depends(get_db),
-    updated_lt: Optional[datetime] = None,
-    updated_gt: Optional[datetime] = None,
-) -> AbstractPage[CurrentPrivacyPreference]:
-    """Returns the most recently saved privacy preferences for a particular consent item"""
-
-    validate_start_and_end_filters([(updated_lt, updated_gt, "updated")])
-
-    query: Query[CurrentPrivacyPreference] = db.query(CurrentPrivacyPreference)
-
-    if updated_lt:
-        query = query.filter(CurrentPrivacyPreference.updated_at < updated_lt)
-    if updated_gt:
-        query = query.filter(CurrentPrivacyPreference.updated_at > updated_gt)
-
-    query = query.order_by(CurrentPrivacyPreference.updated_at.desc())
-
-    return paginate(query, params)
-
-
-@router.get(
-    HISTORICAL_PRIVACY_PREFERENCES_REPORT,
-    status_code=HTTP_200_OK,
+@router.post(
+    PRIVACY_PREFERENCES_BULK,
+    status_code=HTTP_201_CREATED,
     dependencies=[
-        Security(verify_oauth_client, scopes=[PRIVACY_PREFERENCE_HISTORY_READ])
+        Security(verify_oauth_client, scopes=[PRIVACY_PREFERENCE_HISTORY_CREATE])
     ],
-    response_model=Page[ConsentReportingSchema],
+    response_model=BulkPrivacyPreferencesImportResponse,
 )
-def get_historical_consent_report(
+def bulk_import_privacy_preferences(
     *,
-    params: Params = Depends(),
     db: Session = Depends(get_db),
-    request_timestamp_gt: Optional[datetime] = None,
-    request_timestamp_lt: Optional[datetime] = None,
-) -> AbstractPage[PrivacyPreferenceHistory]:
-    """Endpoint to return a historical record of all privacy preferences saved for consent reporting"""
+    data: BulkPrivacyPreferencesImport,
+) -> BulkPrivacyPreferencesImportResponse:
+    """Imports previously saved privacy preferences in bulk with respect to fides user device ids.
 
-    validate_start_and_end_filters(
-        [(request_timestamp_lt, request_timestamp_gt, "request_timestamp")]
+    Creates historical records for these preferences for record keeping, and also updates current preferences,
+    in a single transaction. Imported preferences are not propagated to third party systems.
+    """
+    fides_user_provided_identities: Dict[
+        str, ProvidedIdentity
+    ] = get_or_create_fides_user_device_id_provided_identities(
+        db, [preference.fides_user_device_id for preference in data.preferences]
     )
 
-    query: Query[PrivacyPreferenceHistory] = (
-        db.query(
-            PrivacyPreferenceHistory.id,
-            PrivacyRequest.id.label("privacy_request_id"),
-            PrivacyPreferenceHistory.email.label("email"),
-            PrivacyPreferenceHistory.phone_number.label("phone_number"),
-            PrivacyPreferenceHistory.fides_user_device.label("fides_user_device_id"),
-            PrivacyPreferenceHistory.secondary_user_ids,
-            PrivacyPreferenceHistory.created_at.label("request_timestamp"),
-            PrivacyPreferenceHistory.request_origin.label("request_origin"),
-            PrivacyRequest.status.label("request_status"),
-            literal("consent").label(
-                "request_type"
-            ),  # Right now, we know this is consent, so hardcoding to avoid the Policy/Rule join
-            FidesUser.username.label("approver_id"),
-            PrivacyPreferenceHistory.privacy_notice_history_id.label(
-                "privacy_notice_history_id"
-            ),
-            PrivacyPreferenceHistory.preference.label("preference"),
-            PrivacyPreferenceHistory.user_geography.label("user_geography"),
-            PrivacyPreferenceHistory.relevant_systems.label("relevant_systems"),
-            PrivacyPreferenceHistory.affected_system_status.label(
-                "affected_system_status"
-            ),
-            PrivacyPreferenceHistory.url_recorded.label("url_recorded"),
-            PrivacyPreferenceHistory.user_agent.label("user_agent"),
-            PrivacyPreferenceHistory.privacy_experience_id.label(
-                "privacy_experience_id"
-            ),
-            PrivacyPreferenceHistory.privacy_experience_config_history_id.label(
-                "experience_config_history_id"
-            ),
-            PrivacyPreferenceHistory.anonymized_ip_address.label(
-                "truncated_ip_address"
-            ),
-            PrivacyPreferenceHistory.method.label("method"),
-            PrivacyPreferenceHistory.served_notice_history_id.label(
-                "served_notice_history_id"
-            ),
-            PrivacyPreferenceHistory.purpose_consent.label("purpose_consent"),
-            PrivacyPreferenceHistory.purpose_legitimate_interests.label(
-                "purpose_legitimate_interests"
-            ),
-            PrivacyPreferenceHistory.special_purpose.label("special_purpose"),
-            PrivacyPreferenceHistory.vendor_consent.label("vendor_consent"),
-            PrivacyPreferenceHistory.vendor_legitimate_interests.label(
-                "vendor_legitimate_interests"
-            ),
-            PrivacyPreferenceHistory.system_consent.label("system_consent"),
-            PrivacyPreferenceHistory.system_legitimate_interests.label(
-                "system_legitimate_interests"
-            ),
-            PrivacyPreferenceHistory.feature.label("feature"),
-            PrivacyPreferenceHistory.special_feature.label("special_feature"),
-            PrivacyPreferenceHistory.tcf_version.label("tcf_version"),
-        )
-        .outerjoin(
-            PrivacyRequest,
-            PrivacyRequest.id == PrivacyPreferenceHistory.privacy_request_id,
+    preferences_to_save: List[Dict] = []
+    for preference in data.preferences:
+        fides_user_provided_identity = fides_user_provided_identities[
+            preference.fides_user_device_id
+        ]
+        preferences_to_save.append(
+            {
+                **preference.dict(exclude={"fides_user_device_id"}),
+                "fides_user_device": preference.fides_user_device_id,
+                "fides_user_device_provided_identity_id": fides_user_provided_identity.id,
+                "hashed_fides_user_device": fides_user_provided_identity.blind_index
+                or ProvidedIdentity.blind_index_value(preference.fides_user_device_id),
+            }
         )
-        .outerjoin(FidesUser, PrivacyRequest.reviewed_by == FidesUser.id)
-    )
 
-    if request_timestamp_lt:
-        query = query.filter(PrivacyPreferenceHistory.created_at < request_timestamp_lt)
-    if request_timestamp_gt:
-        query = query.filter(PrivacyPreferenceHistory.created_at > request_timestamp_gt)
+    logger.info("Importing {} privacy preferences", len(preferences_to_save))
 
-    query = query.order_by(PrivacyPreferenceHistory.created_at.desc())
+    try:
+        (
+            historical_preferences,
+            _,
+        ) = PrivacyPreferenceHistory.bulk_create_history_and_upsert_current_preferences(
+            db=db, data=preferences_to_save
+        )
+    except (
+        IdentityNotFoundException,
+        PrivacyNoticeHistoryNotFound,
+        SystemNotFound,
+        ConsentHistorySaveError,
+    ) as exc:
+        db.rollback()
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=exc.args[0])
 
-    return paginate(query, params)
+    return BulkPrivacyPreferencesImportResponse(imported=len(historical_preferences))
 
 
 def classify_identity_type_for_privacy_center_consent_reporting(
@@ -945,7 +857,7 @@ def classify_identity_type_for_privacy_center_consent_reporting(
     We want to classify the "provided_identity" as an identifier saved against an email or phone,
     and the "fides_user_provided_identity" as an identifier saved against the fides user device id.
     """
-    if not provided_identity.hashed_value:
+    if not provided_identity.blind_index:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND, detail="Provided identity missing"
         )
@@ -4,7 +4,18 @@ import csv
 import io
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Callable, DefaultDict, Dict, List, Literal, Optional, Set, Union
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Union,
+)
 
 import sqlalchemy
 from fastapi import Body, Depends, HTTPException, Security
@@ -15,8 +26,8 @@ from fastapi_pagination.ext.sqlalchemy import paginate
 from loguru import logger
 from pydantic import ValidationError as PydanticValidationError
 from pydantic import conlist
-from sqlalchemy import cast, column, null
-from sqlalchemy.orm import Query, Session
+from sqlalchemy import and_, cast, column, null, or_
+from sqlalchemy.orm import Query, Session, selectinload
 from sqlalchemy.sql.expression import nullslast
 from starlette.responses import StreamingResponse
 from starlette.status import (
@@ -95,6 +106,9 @@ from fides.api.service.messaging.message_dispatch_service import (
     check_and_dispatch_error_notifications,
     dispatch_message_task,
 )
+from fides.api.service.privacy_request.dataset_graph_cache import (
+    get_compiled_dataset_graph,
+)
 from fides.api.service.privacy_request.request_runner_service import (
     queue_privacy_request,
 )
@@ -149,6 +163,7 @@ from fides.config.config_proxy import ConfigProxy
 router = APIRouter(tags=["Privacy Requests"], prefix=V1_URL_PREFIX)
 
 EMBEDDED_EXECUTION_LOG_LIMIT = 50
+CSV_DOWNLOAD_BATCH_SIZE = 1000
 
 
 def get_privacy_request_or_error(
@@ -245,58 +260,138 @@ def _send_privacy_request_receipt_message_to_user(
     )
 
 
-def privacy_request_csv_download(
-    db: Session, privacy_request_query: Query
-) -> StreamingResponse:
-    """Download privacy requests as CSV for Admin UI"""
-    f = io.StringIO()
-    csv_file = csv.writer(f)
+def _privacy_request_csv_batches(
+    privacy_request_query: Query,
+    sort_field: str,
+    sort_direction: ColumnSort,
+    batch_size: int,
+) -> Iterator[List[PrivacyRequest]]:
+    """
+    Yields the privacy requests matching the query in batches, using keyset pagination
+    on the sort field with the request id as a tiebreaker, so each batch is an indexed
+    range scan instead of an ever-growing offset.
 
-    csv_file.writerow(
-        [
-            "Status",
-            "Request Type",
-            "Subject Identity",
-            "Custom Privacy Request Fields",
-            "Time Received",
-            "Reviewed By",
-            "Request ID",
-            "Time Approved/Denied",
-            "Denial Reason",
-        ]
-    )
-    privacy_request_ids: List[str] = [r.id for r in privacy_request_query]
-    denial_audit_log_query: Query = db.query(AuditLog).filter(
-        AuditLog.action == AuditLogAction.denied,
-        AuditLog.privacy_request_id.in_(privacy_request_ids),
+    The policy and its rules, the identities, and the custom fields are loaded alongside
+    each batch so writing a row doesn't issue further queries.
+    """
+    sort_column = getattr(PrivacyRequest, sort_field)
+    descending = sort_direction == ColumnSort.DESC
+    # Replace the existing sort so the id tiebreaker can be added to it
+    ordered_query = (
+        privacy_request_query.options(
+            selectinload(PrivacyRequest.policy).selectinload(Policy.rules),  # type: ignore[attr-defined]
+            selectinload(PrivacyRequest.provided_identities),  # type: ignore[attr-defined]
+            selectinload(PrivacyRequest.custom_fields),  # type: ignore[attr-defined]
+        )
+        .order_by(None)
+        .order_by(
+            nullslast(sort_column.desc() if descending else sort_column.asc()),
+            PrivacyRequest.id.desc() if descending else PrivacyRequest.id.asc(),
+        )
     )
-    denial_audit_logs: Dict[str, str] = {
-        r.privacy_request_id: r.message for r in denial_audit_log_query
-    }
 
-    for pr in privacy_request_query:
-        denial_reason = (
-            denial_audit_logs[pr.id]
-            if pr.status == PrivacyRequestStatus.denied and pr.id in denial_audit_logs
-            else None
+    def after(last_value: Any, last_id: str) -> Any:
+        """Filters to the rows ordered after the last row of the previous batch"""
+        id_after = (
+            PrivacyRequest.id < last_id if descending else PrivacyRequest.id > last_id
+        )
+        if last_value is None:
+            # Nulls are sorted last, so only the remaining nulls are left
+            return and_(sort_column.is_(None), id_after)
+        value_after = (
+            sort_column < last_value if descending else sort_column > last_value
+        )
+        return or_(
+            value_after,
+            and_(sort_column == last_value, id_after),
+            sort_column.is_(None),
         )
 
+    batch: List[PrivacyRequest] = ordered_query.limit(batch_size).all()
+    while batch:
+        yield batch
+        if len(batch) < batch_size:
+            return
+        last = batch[-1]
+        batch = (
+            ordered_query.filter(after(getattr(last, sort_field), last.id))
+            .limit(batch_size)
+            .all()
+        )
+
+
+def privacy_request_csv_download(
+    db: Session,
+    privacy_request_query: Query,
+    sort_field: str = "created_at",
+    sort_direction: ColumnSort = ColumnSort.DESC,
+) -> StreamingResponse:
+    """Download privacy requests as CSV for Admin UI
+
+    The CSV is streamed as it is written, one batch of privacy requests at a time.
+    """
+
+    def generate_csv() -> Iterator[str]:
+        f = io.StringIO()
+        csv_file = csv.writer(f)
+
         csv_file.writerow(
             [
-                pr.status.value if pr.status else None,
-                pr.policy.rules[0].action_type if len(pr.policy.rules) > 0 else None,
-                pr.get_persisted_identity().dict(),
-                pr.get_persisted_custom_privacy_request_fields(),
-                pr.created_at,
-                pr.reviewed_by,
-                pr.id,
-                pr.reviewed_at,
-                denial_reason,
+                "Status",
+                "Request Type",
+                "Subject Identity",
+                "Custom Privacy Request Fields",
+                "Time Received",
+                "Reviewed By",
+                "Request ID",
+                "Time Approved/Denied",
+                "Denial Reason",
             ]
         )
+        yield f.getvalue()
+
+        for privacy_requests in _privacy_request_csv_batches(
+            privacy_request_query,
+            sort_field,
+            sort_direction,
+            CSV_DOWNLOAD_BATCH_SIZE,
+        ):
+            f.seek(0)
+            f.truncate()
+
+            denied_ids: List[str] = [
+                pr.id
+                for pr in privacy_requests
+                if pr.status == PrivacyRequestStatus.denied
+            ]
+            denial_audit_logs: Dict[str, str] = {}
+            if denied_ids:
+                denial_audit_log_query: Query = db.query(AuditLog).filter(
+                    AuditLog.action == AuditLogAction.denied,
+                    AuditLog.privacy_request_id.in_(denied_ids),
+                )
+                denial_audit_logs = {
+                    r.privacy_request_id: r.message for r in denial_audit_log_query
+                }
+
+            for pr in privacy_requests:
+                rules: List[Rule] = pr.policy.rules  # type: ignore[attr-defined]
+                csv_file.writerow(
+                    [
+                        pr.status.value if pr.status else None,
+                        rules[0].action_type if len(rules) > 0 else None,
+                        pr.get_persisted_identity().dict(),
+                        pr.get_persisted_custom_privacy_request_fields(),
+                        pr.created_at,
+                        pr.reviewed_by,
+                        pr.id,
+                        pr.reviewed_at,
+                        denial_audit_logs.get(pr.id),
+                    ]
+                )
+            yield f.getvalue()
 
-    f.seek(0)
-    response = StreamingResponse(f, media_type="text/csv")
+    response = StreamingResponse(generate_csv(), media_type="text/csv")
     response.headers[
         "Content-Disposition"
     ] = f"attachment; filename=privacy_requests_download_{datetime.today().strftime('%Y-%m-%d')}.csv"
@@ -404,13 +499,12 @@ def _filter_privacy_request_queryset(
     )
 
     if identity:
-        hashed_identity = ProvidedIdentity.hash_value(value=identity)
         identities: Set[str] = {
             identity[0]
             for identity in ProvidedIdentity.filter(
                 db=db,
                 conditions=(
-                    (ProvidedIdentity.hashed_value == hashed_identity)
+                    (ProvidedIdentity.matches_value(identity))
                     & (ProvidedIdentity.privacy_request_id.isnot(None))
                 ),
             ).values(column("privacy_request_id"))
@@ -593,7 +687,7 @@ def get_request_status(
     if download_csv:
         # Returning here if download_csv param was specified
         logger.info("Downloading privacy requests as csv")
-        return privacy_request_csv_download(db, query)
+        return privacy_request_csv_download(db, query, sort_field, sort_direction)
 
     # Conditionally embed execution log details in the response.
     if verbose:
@@ -917,9 +1011,7 @@ def resume_privacy_request_with_manual_input(
             f"'{PRIVACY_REQUEST_MANUAL_ERASURE if paused_step == CurrentStep.erasure else PRIVACY_REQUEST_MANUAL_INPUT}' to resume.",
         )
 
-    datasets = DatasetConfig.all(db=db)
-    dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
-    dataset_graph = DatasetGraph(*dataset_graphs)
+    dataset_graph: DatasetGraph = get_compiled_dataset_graph(db).graph
 
     if not paused_collection:
         raise HTTPException(
@@ -1475,7 +1567,7 @@ def privacy_request_data_transfer(
         )
 
     value_dict: Dict[str, Optional[List[Row]]] = cache.get_encoded_objects_by_prefix(
-        f"{privacy_request_id}__access_request"
+        f"{privacy_request_id}__access_request", privacy_request_id
     )
 
     if not value_dict:
@@ -1492,13 +1584,7 @@ def privacy_request_data_transfer(
             detail=f"No datasets found for privacy request {privacy_request_id}",
         )
 
-    dataset_graphs = [dataset_config.get_graph() for dataset_config in datasets]
-    if not dataset_graphs:
-        raise HTTPException(
-            status_code=HTTP_404_NOT_FOUND,
-            detail=f"No dataset graphs found for privacy request {privacy_request_id}",
-        )
-    dataset_graph = DatasetGraph(*dataset_graphs)
+    dataset_graph: DatasetGraph = get_compiled_dataset_graph(db).graph
     target_categories = {target.data_category for target in rule.targets}
     filtered_results: Optional[Dict[str, Optional[List[Row]]]] = filter_data_categories(
         access_result,  # type: ignore
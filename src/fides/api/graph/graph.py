@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from fideslang.validation import FidesKey
 from loguru import logger
@@ -228,6 +228,10 @@ class DatasetGraph:
             for field_path, seed_address in node.collection.identities().items()
         }
 
+        # The sets of seed keys a Traversal of this graph has been verified for,
+        # so graphs that are reused across requests are only verified once per set
+        self.verified_seed_keys: Set[FrozenSet[SeedAddress]] = set()
+
     @property
     def data_category_field_mapping(
         self,
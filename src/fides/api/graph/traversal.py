@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Set, Tuple, cast
+import heapq
+from collections import Counter, defaultdict
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-import pydash.collections
 from loguru import logger
 
 from fides.api.common_exceptions import TraversalError
@@ -17,7 +19,6 @@ from fides.api.graph.config import (
 )
 from fides.api.graph.graph import DatasetGraph, Edge, Node
 from fides.api.util.collection_util import Row, append
-from fides.api.util.matching_queue import MatchingQueue
 
 Datastore = Dict[CollectionAddress, List[Row]]
 """A type expressing retrieved rows of data from a specified collection"""
@@ -176,6 +177,104 @@ def artificial_traversal_node(address: CollectionAddress) -> TraversalNode:
     return TraversalNode(node)
 
 
+class TraversalReadyQueue:
+    """
+    The queue of traversal nodes waiting to run during a traversal.
+
+    `pop` returns the first node, in the order nodes were pushed, that can run given the nodes
+    that haven't run yet, just like popping a MatchingQueue with `TraversalNode.can_run_given`.
+    Rather than re-checking every queued node on each pop, nodes held back by their `after`
+    constraints wait on the collections and datasets they are waiting for, and are only
+    re-checked once one of those has run. As nodes never become blocked again once they can
+    run, the nodes that can run are kept in a heap ordered by when they were pushed.
+    """
+
+    def __init__(
+        self, remaining_node_keys: Set[CollectionAddress], *values: TraversalNode
+    ):
+        self.remaining_node_keys = remaining_node_keys
+        self._remaining_by_dataset: Counter = Counter(
+            address.dataset for address in remaining_node_keys
+        )
+        self._sequence = count()
+        self._queued: Dict[CollectionAddress, Tuple[int, TraversalNode]] = {}
+        self._ready: List[Tuple[int, CollectionAddress]] = []
+        self._waiting: Set[CollectionAddress] = set()
+        # the nodes waiting on each collection address or dataset name that has yet to run
+        self._waiting_on: Dict[
+            Union[CollectionAddress, str], Set[CollectionAddress]
+        ] = defaultdict(set)
+        for value in values:
+            self.push_if_new(value)
+
+    @property
+    def data(self) -> List[TraversalNode]:
+        """The queued nodes, in the order they were pushed"""
+        return [node for _, node in sorted(self._queued.values(), key=lambda x: x[0])]
+
+    def _blocked_by(
+        self, traversal_node: TraversalNode
+    ) -> Tuple[Set[CollectionAddress], Set[str]]:
+        """The collections and datasets that have yet to run that the node must run after"""
+        return (
+            traversal_node.node.collection.after.intersection(self.remaining_node_keys),
+            {
+                dataset
+                for dataset in traversal_node.node.dataset.after
+                if self._remaining_by_dataset[dataset]
+            },
+        )
+
+    def push_if_new(self, traversal_node: TraversalNode) -> None:
+        """Add the node to the end of the queue if it is not already queued"""
+        address = traversal_node.address
+        if address in self._queued:
+            return
+
+        sequence = next(self._sequence)
+        self._queued[address] = (sequence, traversal_node)
+        collections, datasets = self._blocked_by(traversal_node)
+        if not collections and not datasets:
+            heapq.heappush(self._ready, (sequence, address))
+            return
+
+        self._waiting.add(address)
+        blockers: Set[Union[CollectionAddress, str]] = {*collections, *datasets}
+        for blocker in blockers:
+            self._waiting_on[blocker].add(address)
+
+    def pop(self) -> Optional[TraversalNode]:
+        """Remove and return the first queued node that can run, or None if no queued node can run"""
+        if not self._ready:
+            return None
+        _, address = heapq.heappop(self._ready)
+        return self._queued.pop(address)[1]
+
+    def finish(self, address: CollectionAddress) -> None:
+        """Record that the node at the given address has run, releasing the nodes waiting on it"""
+        if address not in self.remaining_node_keys:
+            return
+        self.remaining_node_keys.difference_update({address})
+        self._remaining_by_dataset[address.dataset] -= 1
+
+        released: Set[CollectionAddress] = self._waiting_on.pop(address, set())
+        if not self._remaining_by_dataset[address.dataset]:
+            released |= self._waiting_on.pop(address.dataset, set())
+
+        for waiting_address in released:
+            if waiting_address not in self._waiting:
+                continue
+            sequence, traversal_node = self._queued[waiting_address]
+            collections, datasets = self._blocked_by(traversal_node)
+            if not collections and not datasets:
+                self._waiting.remove(waiting_address)
+                heapq.heappush(self._ready, (sequence, waiting_address))
+
+    def is_empty(self) -> bool:
+        """Is the queue empty?"""
+        return not self._queued
+
+
 class Traversal:
     """Handling for a single reified traversal of a graph based on input (seed) data."""
 
@@ -197,10 +296,11 @@ class Traversal:
         self.traversal_node_dict = {k: TraversalNode(v) for k, v in graph.nodes.items()}
         self.edges: Set[Edge] = graph.edges.copy()
         self.root_node = artificial_traversal_node(ROOT_COLLECTION_ADDRESS)
+        seed_field_addresses = self.extract_seed_field_addresses()
         for (
             start_field_address,
             seed_key,
-        ) in self.extract_seed_field_addresses().items():
+        ) in seed_field_addresses.items():
             self.edges.add(
                 Edge(
                     FieldAddress(
@@ -212,7 +312,11 @@ class Traversal:
                 )
             )
 
-        self.__verify_traversal()
+        # Whether a valid traversal exists only depends on the graph and which seed keys are present
+        seed_keys = frozenset(seed_field_addresses.values())
+        if seed_keys not in graph.verified_seed_keys:
+            self.__verify_traversal()
+            graph.verified_seed_keys.add(seed_keys)
 
     def __verify_traversal(self) -> None:
         """Verify that a valid traversal exists. This method simply assembles a traversal
@@ -246,6 +350,41 @@ class Traversal:
 
         return {str(k): v for k, v in db.items()}, traversal_ends
 
+    @staticmethod
+    def _complete_edges(
+        traversal_node: TraversalNode,
+        node_edges: List[Edge],
+        finished_nodes: Dict[CollectionAddress, TraversalNode],
+        finished_node_positions: Dict[CollectionAddress, int],
+        remaining_edges: Set[Edge],
+    ) -> None:
+        """Delete the remaining edges between the traversal_node that's just run and any finished
+        nodes, adding the traversal_node as a child of the finished nodes they lead from.
+
+        Finished nodes are visited in the order they first finished in."""
+        address = traversal_node.address
+        edges_from_finished_nodes: Dict[CollectionAddress, List[Edge]] = {}
+        for edge in node_edges:
+            other_address = (
+                edge.f2.collection_address()
+                if edge.f1.collection_address() == address
+                else edge.f1.collection_address()
+            )
+            if other_address in finished_nodes and edge.spans(other_address, address):
+                append(edges_from_finished_nodes, other_address, edge)
+
+        for finished_node_address in sorted(
+            edges_from_finished_nodes, key=finished_node_positions.__getitem__
+        ):
+            finished_node = finished_nodes[finished_node_address]
+            completed_edges = set(edges_from_finished_nodes[finished_node_address])
+            remaining_edges.difference_update(completed_edges)
+            # append edges that end in this traversal_node
+            for edge in completed_edges:
+                if edge.ends_with_collection(address):
+                    # note, this will not work for self-reference
+                    finished_node.add_child(traversal_node, edge)
+
     def traverse(  # pylint: disable=R0914
         self,
         environment: Dict[CollectionAddress, Any],
@@ -278,6 +417,9 @@ class Traversal:
         We also raise a TraversalError if the queue is empty but some nodes have not been visited. In
         that case they are unreachable.
 
+        Edges are indexed by the collections at their ends and the queue tracks which nodes are free
+        to run, so each step only looks at the edges of the node that just ran instead of every finished
+        node and remaining edge.
         """
         if environment:
             logger.info(
@@ -287,58 +429,64 @@ class Traversal:
             self.traversal_node_dict.keys()
         )
         finished_nodes: dict[CollectionAddress, TraversalNode] = {}
-        running_node_queue: MatchingQueue[TraversalNode] = MatchingQueue(self.root_node)
+        # the order nodes first finished in, which is the order finished_nodes iterates in
+        finished_node_positions: Dict[CollectionAddress, int] = {}
+        running_node_queue = TraversalReadyQueue(remaining_node_keys, self.root_node)
         remaining_edges: Set[Edge] = self.edges.copy()
+
+        # Edges indexed by the collections at both of their ends, in the order
+        # remaining_edges iterates in when the traversal starts
+        edges_by_address: Dict[CollectionAddress, List[Edge]] = defaultdict(list)
+        for edge in remaining_edges:
+            edges_by_address[edge.f1.collection_address()].append(edge)
+            edges_by_address[edge.f2.collection_address()].append(edge)
+
         while not running_node_queue.is_empty():
             # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
-            n = running_node_queue.pop_first_match(
-                lambda x: x.can_run_given(remaining_node_keys)
-            )
+            n = running_node_queue.pop()
 
             if n:
                 node_run_fn(n, environment)
-                # delete all edges between the traversal_node that's just run and any completed nodes
-                for finished_node_address, finished_node in finished_nodes.items():
-                    completed_edges = Edge.delete_edges(
-                        remaining_edges,
-                        finished_node_address,
-                        cast(TraversalNode, n).address,  # type: ignore[redundant-cast]
-                    )
-                    # append edges that end in this traversal_node
-                    for edge in filter(
-                        lambda _edge: _edge.ends_with_collection(
-                            cast(TraversalNode, n).address  # type: ignore[redundant-cast]
-                        ),
-                        completed_edges,
-                    ):
-                        # note, this will not work for self-reference
-                        finished_node.add_child(n, edge)
-                # next edges = take all edges including n that are _not_ in edges_from_completed_nodes
-                # in the form (field_address_this, field_address_foreign)
+                node_edges: List[Edge] = [
+                    edge
+                    for edge in edges_by_address[n.address]
+                    if edge in remaining_edges
+                ]
 
-                edges_to_children = pydash.collections.filter_(
-                    [
-                        e.split_by_address(cast(TraversalNode, n).address)  # type: ignore[redundant-cast]
-                        for e in remaining_edges
-                        if e.contains(n.address)
-                    ]
+                # delete all edges between the traversal_node that's just run and any completed nodes
+                self._complete_edges(
+                    n,
+                    node_edges,
+                    finished_nodes,
+                    finished_node_positions,
+                    remaining_edges,
                 )
-                if not edges_to_children:
-                    n.is_terminal_node = True
 
-                # child traversal_node addresses are the address portion of the above
-                child_node_addresses = {
-                    a[1].collection_address() for a in edges_to_children if a
+                # child traversal_node addresses are the far ends of the remaining edges
+                # in the form (field_address_this, field_address_foreign)
+                child_node_addresses: Set[CollectionAddress] = {
+                    addresses[1].collection_address()
+                    for addresses in (
+                        edge.split_by_address(n.address)
+                        for edge in node_edges
+                        if edge in remaining_edges
+                    )
+                    if addresses
                 }
+                if not child_node_addresses:
+                    n.is_terminal_node = True
+
                 for nxt_address in child_node_addresses:
                     # only add the next traversal_node to the queue if it is not already there (no duplicates)
                     running_node_queue.push_if_new(
                         self.traversal_node_dict[nxt_address]
                     )
                 finished_nodes[n.address] = n
-                remaining_node_keys.difference_update({n.address})
+                finished_node_positions.setdefault(
+                    n.address, len(finished_node_positions)
+                )
+                running_node_queue.finish(n.address)
             else:
-                # traversal traversal_node dict diff finished nodes
                 logger.error(
                     "Node could not be reached given specified ordering [{}]",
                     ",".join([str(tn.address) for tn in running_node_queue.data]),
@@ -15,6 +15,7 @@ from fideslog.sdk.python.event import AnalyticsEvent
 from loguru import logger
 from pyinstrument import Profiler
 from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 from uvicorn import Config, Server
 
 import fides
@@ -40,6 +41,7 @@ from fides.api.ui import (
     match_route,
     path_is_in_ui_directory,
 )
+from fides.api.util.audit_log_writer import audit_log_resource_writer
 from fides.api.util.endpoint_utils import API_PREFIX
 from fides.api.util.logger import _log_exception
 from fides.cli.utils import FIDES_ASCII_ART
@@ -288,6 +290,12 @@ async def setup_server() -> None:
     logger.info("Server setup completed in {} seconds", startup_time)
 
 
+@app.on_event("shutdown")
+async def flush_audit_log_resources() -> None:
+    """Write any audit log resource records still queued before the server stops."""
+    await run_in_threadpool(audit_log_resource_writer.stop)
+
+
 def start_webserver(port: int = 8080) -> None:
     """Run the webserver."""
     check_required_webserver_config_values(config=CONFIG)
@@ -2,14 +2,15 @@ import json
 from typing import Any, Dict, List
 
 from fastapi import Request
-from loguru import logger
-from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from starlette.types import Message
 
 from fides.api.api import deps
-from fides.api.models.sql_models import AuditLogResource  # type: ignore[attr-defined]
 from fides.api.oauth.utils import extract_token_and_load_client
+from fides.api.util.audit_log_writer import (
+    audit_log_resource_writer,
+    write_audit_log_resource_records,
+)
 
 
 async def handle_audit_log_resource(request: Request) -> None:
@@ -33,23 +34,23 @@ async def handle_audit_log_resource(request: Request) -> None:
         "fides_keys": None,
         "extra_data": None,
     }
-    db: Session = deps.get_api_session()
 
     # get the user id associated with the request
     token = request.headers.get("authorization")
     if token:
-        client = await get_client_user_id(db, token)
-        audit_log_resource_data["user_id"] = client
+        db: Session = deps.get_api_session()
+        try:
+            audit_log_resource_data["user_id"] = await get_client_user_id(db, token)
+        finally:
+            db.close()
 
     # Access request body to check for fides_keys
-    await set_body(request, await request.body())
-
     body = await get_body(request)
     fides_keys = await extract_data_from_body(body)
     audit_log_resource_data["fides_keys"] = fides_keys
 
-    # write record to server
-    await write_audit_log_resource_record(db, audit_log_resource_data)
+    # queue the record to be written to the server in the background
+    await audit_log_resource_writer.enqueue(audit_log_resource_data)
 
 
 async def write_audit_log_resource_record(
@@ -58,10 +59,7 @@ async def write_audit_log_resource_record(
     """
     Writes a record to the audit log resource table
     """
-    try:
-        AuditLogResource.create(db=db, data=audit_log_resource_data)
-    except SQLAlchemyError as err:
-        logger.debug(err)
+    write_audit_log_resource_records(db, [audit_log_resource_data])
 
 
 async def get_client_user_id(db: Session, auth_token: str) -> str:
@@ -80,7 +78,8 @@ async def extract_data_from_body(body: bytes) -> List:
     """
 
     fides_keys = []
-    if body:
+    # Skip parsing bodies that can't contain any fides_keys
+    if body and b"fides_key" in body:
         body = json.loads(body)
         if isinstance(body, dict):
             fides_key = body.get("fides_key")
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from copy import copy
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 from sqlalchemy import Boolean, Column
 from sqlalchemy import Enum as EnumColumn
 from sqlalchemy import Float, ForeignKey, String, UniqueConstraint, and_, or_
-from sqlalchemy.orm import Query, Session, relationship
+from sqlalchemy.orm import Query, Session, relationship, selectinload
 from sqlalchemy.util import hybridproperty
 
 from fides.api.db.base_class import Base
@@ -243,11 +243,15 @@ class PrivacyExperience(Base):
     show_banner: bool
 
     def get_should_show_banner(
-        self, db: Session, show_disabled: Optional[bool] = True
+        self,
+        db: Session,
+        show_disabled: Optional[bool] = True,
+        privacy_notices: Optional[List[PrivacyNotice]] = None,
     ) -> bool:
         """Returns True if this Experience should be delivered by a banner
 
-        Relevant privacy notices are queried at runtime.
+        Relevant privacy notices are queried at runtime, unless candidate privacy_notices
+        already loaded with `get_privacy_notices_by_regions` are supplied.
         """
         if self.component == ComponentType.tcf_overlay:
             # For now, just returning that the TCF Overlay should always show a banner,
@@ -264,6 +268,14 @@ class PrivacyExperience(Base):
             if self.experience_config.banner_enabled == BannerEnabled.always_enabled:
                 return True
 
+        if privacy_notices is not None:
+            return any(
+                notice.consent_mechanism in BANNER_CONSENT_MECHANISMS
+                for notice in filter_privacy_notices_by_region_and_component(
+                    privacy_notices, self.region, self.component, show_disabled  # type: ignore[arg-type]
+                )
+            )
+
         privacy_notice_query = get_privacy_notices_by_region_and_component(
             db, self.region, self.component  # type: ignore[arg-type]
         )
@@ -284,6 +296,9 @@ class PrivacyExperience(Base):
         show_disabled: Optional[bool] = True,
         systems_applicable: Optional[bool] = False,
         fides_user_provided_identity: Optional[ProvidedIdentity] = None,
+        privacy_notices: Optional[List[PrivacyNotice]] = None,
+        data_uses: Optional[Set[str]] = None,
+        saved_consent_records: Optional[SavedConsentRecords] = None,
     ) -> List[PrivacyNotice]:
         """Return privacy notices that overlap on at least one region
         and match on ComponentType
@@ -291,9 +306,35 @@ class PrivacyExperience(Base):
         If show_disabled=False, only return enabled notices.
         If fides user provided identity supplied, additionally lookup any saved
         preferences for that user id and attach if they exist.
+
+        To avoid querying once per experience, callers building several experiences can pass
+        in the candidate privacy_notices, the data uses of the systems and the user's
+        saved_consent_records, loaded once up front.
         """
         if self.component == ComponentType.tcf_overlay:
             return []
+
+        if privacy_notices is not None:
+            if systems_applicable and data_uses is None:
+                data_uses = get_system_data_uses(db)
+            matching_notices: List[PrivacyNotice] = [
+                notice
+                for notice in filter_privacy_notices_by_region_and_component(
+                    privacy_notices, self.region, self.component, show_disabled  # type: ignore[arg-type]
+                )
+                if not systems_applicable
+                or data_uses.intersection(notice.data_uses or [])  # type: ignore[union-attr]
+            ]
+            for notice in matching_notices:
+                cache_saved_and_served_on_consent_record(
+                    db=db,
+                    consent_record=notice,
+                    fides_user_provided_identity=fides_user_provided_identity,
+                    record_type=ConsentRecordType.privacy_notice_id,
+                    saved_consent_records=saved_consent_records,
+                )
+            return matching_notices
+
         privacy_notice_query = get_privacy_notices_by_region_and_component(
             db, self.region, self.component  # type: ignore[arg-type]
         )
@@ -303,10 +344,7 @@ class PrivacyExperience(Base):
             )
 
         if systems_applicable:
-            data_uses: set[str] = System.get_data_uses(
-                System.all(db), include_parents=True
-            )
-            privacy_notice_query = privacy_notice_query.filter(PrivacyNotice.data_uses.overlap(data_uses))  # type: ignore
+            privacy_notice_query = privacy_notice_query.filter(PrivacyNotice.data_uses.overlap(get_system_data_uses(db)))  # type: ignore
 
         if not fides_user_provided_identity:
             return privacy_notice_query.order_by(PrivacyNotice.created_at.desc()).all()
@@ -328,6 +366,7 @@ class PrivacyExperience(Base):
         db: Session,
         base_tcf_contents: TCFExperienceContents,
         fides_user_provided_identity: Optional[ProvidedIdentity],
+        saved_consent_records: Optional[SavedConsentRecords] = None,
     ) -> bool:
         """
         Supplements the given TCF experience in-place with TCF contents at runtime, and returns whether
@@ -354,6 +393,7 @@ class PrivacyExperience(Base):
                         record,
                         fides_user_provided_identity=fides_user_provided_identity,
                         record_type=corresponding_db_field_name,
+                        saved_consent_records=saved_consent_records,
                     )
                 # Now supplement the TCF Experience with this new section
                 setattr(self, tcf_section_name, tcf_section)
@@ -481,6 +521,132 @@ def get_privacy_notices_by_region_and_component(
     )
 
 
+def get_privacy_notices_by_regions(
+    db: Session,
+    regions: Iterable[PrivacyNoticeRegion],
+    show_disabled: Optional[bool] = True,
+) -> List[PrivacyNotice]:
+    """
+    Return the privacy notices that could be displayed in any of the given regions, most recently
+    created first, so that the notices for several experiences can be loaded in one query.
+
+    Narrow these down per experience with `filter_privacy_notices_by_region_and_component`.
+    """
+    unique_regions: List[PrivacyNoticeRegion] = sorted(
+        set(regions), key=lambda region: region.value
+    )
+    if not unique_regions:
+        return []
+
+    query: Query = db.query(PrivacyNotice).filter(
+        PrivacyNotice.regions.overlap(unique_regions)  # type: ignore[attr-defined]
+    )
+    if show_disabled is False:
+        query = query.filter(PrivacyNotice.disabled.is_(False))
+    return query.order_by(PrivacyNotice.created_at.desc()).all()
+
+
+def filter_privacy_notices_by_region_and_component(
+    privacy_notices: List[PrivacyNotice],
+    region: PrivacyNoticeRegion,
+    component: ComponentType,
+    show_disabled: Optional[bool] = True,
+) -> List[PrivacyNotice]:
+    """
+    In-memory equivalent of `get_privacy_notices_by_region_and_component`, for privacy notices
+    already loaded with `get_privacy_notices_by_regions`
+    """
+    if component == ComponentType.overlay:
+        display_field = "displayed_in_overlay"
+    elif component == ComponentType.privacy_center:
+        display_field = "displayed_in_privacy_center"
+    else:
+        return []
+
+    return [
+        notice
+        for notice in privacy_notices
+        if region in (notice.regions or [])
+        and getattr(notice, display_field)
+        and not (show_disabled is False and notice.disabled)
+    ]
+
+
+def get_system_data_uses(db: Session) -> Set[str]:
+    """Returns the data uses, including parent data uses, of every system in the data map"""
+    systems: List[System] = (
+        db.query(System).options(selectinload(System.privacy_declarations)).all()
+    )
+    return System.get_data_uses(systems, include_parents=True)
+
+
+class SavedConsentRecords:
+    """
+    The preferences a fides user device has saved and the consent items it has been served,
+    indexed by record type and value.
+
+    Loading these once per request lets `cache_saved_and_served_on_consent_record` supplement
+    every privacy notice and TCF record without querying for each one.
+    """
+
+    def __init__(
+        self,
+        preferences: Dict[Tuple[ConsentRecordType, Any], CurrentPrivacyPreference],
+        served: Dict[Tuple[ConsentRecordType, Any], LastServedNotice],
+    ):
+        self.preferences = preferences
+        self.served = served
+
+    @classmethod
+    def load(
+        cls, db: Session, fides_user_provided_identity: ProvidedIdentity
+    ) -> SavedConsentRecords:
+        """Load the saved preferences and served records for the given fides user device"""
+        preferences: Dict[Tuple[ConsentRecordType, Any], CurrentPrivacyPreference] = {}
+        for preference in (
+            db.query(CurrentPrivacyPreference)
+            .options(selectinload(CurrentPrivacyPreference.privacy_notice))
+            .filter_by(
+                fides_user_device_provided_identity_id=fides_user_provided_identity.id
+            )
+        ):
+            cls._index(preferences, preference)
+
+        served: Dict[Tuple[ConsentRecordType, Any], LastServedNotice] = {}
+        for served_record in (
+            db.query(LastServedNotice)
+            .options(selectinload(LastServedNotice.privacy_notice))
+            .filter_by(
+                fides_user_device_provided_identity_id=fides_user_provided_identity.id
+            )
+        ):
+            cls._index(served, served_record)
+
+        return cls(preferences, served)
+
+    @staticmethod
+    def _index(
+        index: Dict[Tuple[ConsentRecordType, Any], Any],
+        record: Union[CurrentPrivacyPreference, LastServedNotice],
+    ) -> None:
+        for record_type in ConsentRecordType:
+            value = getattr(record, record_type.value, None)
+            if value is not None:
+                index.setdefault((record_type, value), record)
+
+    def get_preference(
+        self, record_type: ConsentRecordType, value: Union[str, int]
+    ) -> Optional[CurrentPrivacyPreference]:
+        """Returns the preference saved against the given consent item, if any"""
+        return self.preferences.get((record_type, value))
+
+    def get_served(
+        self, record_type: ConsentRecordType, value: Union[str, int]
+    ) -> Optional[LastServedNotice]:
+        """Returns the record of the given consent item being served, if any"""
+        return self.served.get((record_type, value))
+
+
 def upsert_privacy_experiences_after_notice_update(
     db: Session, affected_regions: List[PrivacyNoticeRegion]
 ) -> List[PrivacyExperience]:
@@ -629,10 +795,13 @@ def cache_saved_and_served_on_consent_record(
     ],
     fides_user_provided_identity: Optional[ProvidedIdentity],
     record_type: Optional[ConsentRecordType],
+    saved_consent_records: Optional[SavedConsentRecords] = None,
 ) -> None:
     """For display purposes, look up whether the resource was served to the given user and/or the user has saved
     preferences for that resource and add this to the consent_record
 
+    If the user's saved_consent_records were already loaded, they are used instead of querying.
+
     Updates the consent_record in place.
     """
     if not fides_user_provided_identity:
@@ -650,8 +819,10 @@ def cache_saved_and_served_on_consent_record(
     consent_record.outdated_served = None
 
     # Check if we have any previously saved preferences for this user
-    saved_preference = (
-        CurrentPrivacyPreference.get_preference_by_type_and_fides_user_device(
+    saved_preference: Optional[CurrentPrivacyPreference] = (
+        saved_consent_records.get_preference(record_type, consent_record.id)
+        if saved_consent_records
+        else CurrentPrivacyPreference.get_preference_by_type_and_fides_user_device(
             db=db,
             fides_user_provided_identity=fides_user_provided_identity,
             preference_type=record_type,
@@ -665,13 +836,15 @@ def cache_saved_and_served_on_consent_record(
             consent_record.outdated_preference = saved_preference.preference
 
     # Check if we have previously served this record to this user
-    served_record: Optional[
-        LastServedNotice
-    ] = LastServedNotice.get_last_served_for_record_type_and_fides_user_device(
-        db=db,
-        fides_user_provided_identity=fides_user_provided_identity,
-        record_type=record_type,
-        preference_value=consent_record.id,
+    served_record: Optional[LastServedNotice] = (
+        saved_consent_records.get_served(record_type, consent_record.id)
+        if saved_consent_records
+        else LastServedNotice.get_last_served_for_record_type_and_fides_user_device(
+            db=db,
+            fides_user_provided_identity=fides_user_provided_identity,
+            record_type=record_type,
+            preference_value=consent_record.id,
+        )
     )
 
     if served_record:
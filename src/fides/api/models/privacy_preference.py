@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
+from uuid import uuid4
 
 from fideslang.validation import FidesKey
 from sqlalchemy import ARRAY, Boolean, Column, DateTime
 from sqlalchemy import Enum as EnumColumn
-from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    delete,
+    func,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import Session, relationship
+from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
 from sqlalchemy_utils import StringEncryptedType
 from sqlalchemy_utils.types.encrypted.encrypted_type import AesGcmEngine
 
@@ -42,6 +56,13 @@ from fides.api.util.tcf.tcf_experience_contents import (
 from fides.config import CONFIG
 
 CURRENT_TCF_VERSION = "2.2"
+# Rows written per multi-row INSERT when saving preferences in bulk
+BULK_INSERT_BATCH_SIZE = 500
+
+
+def generate_id(table_name: str) -> str:
+    """Generates a record id the same way FidesBase.generate_uuid does, for rows inserted without the ORM"""
+    return f"{table_name[:3]}_{uuid4()}"
 
 
 class RequestOrigin(Enum):
@@ -98,11 +119,11 @@ class ConsentReportingMixin:
     def fides_user_device_provided_identity_id(cls) -> Column:
         return Column(String, ForeignKey(ProvidedIdentity.id), index=True)
 
-    # Hashed email, for searching
+    # Blind index of the email, for searching
     hashed_email = Column(String, index=True)
-    # Hashed fides user device id, for searching
+    # Blind index of the fides user device id, for searching
     hashed_fides_user_device = Column(String, index=True)
-    # Hashed phone number, for searching
+    # Blind index of the phone number, for searching
     hashed_phone_number = Column(String, index=True)
     # Encrypted phone number, for reporting
     phone_number = Column(
@@ -209,6 +230,26 @@ class ConsentReportingMixin:
             ProvidedIdentity, foreign_keys=[cls.fides_user_device_provided_identity_id]
         )
 
+    @classmethod
+    def matches_hashed_identity(
+        cls, hashed_column: Column, value: str
+    ) -> BinaryExpression | BooleanClauseList:
+        """
+        Returns a condition matching records whose hashed identity column, like hashed_email,
+        holds the given value's blind index.
+
+        If CONFIG.security.identity_legacy_hash is enabled, records saved with the legacy
+        bcrypt hash are matched as well.
+        """
+        condition: BinaryExpression | BooleanClauseList = (
+            hashed_column == ProvidedIdentity.blind_index_value(value)
+        )
+        if CONFIG.security.identity_legacy_hash:
+            condition = or_(
+                condition, hashed_column == ProvidedIdentity.hash_value(value)
+            )
+        return condition
+
     @property
     def consent_record_type(self) -> ConsentRecordType:
         """Determine the type of record for which a preference was saved
@@ -413,6 +454,12 @@ class PrivacyPreferenceHistory(ConsentReportingMixin, Base):
     every time consent preferences are saved for reporting purposes.
     """
 
+    __table_args__ = (
+        Index(
+            "ix_privacypreferencehistory_created_at_id", "created_at", "id"
+        ),  # For keyset pagination of the consent report
+    )
+
     # Systems capable of propagating their consent, and their status.  If the preference is
     # not relevant for the system, or we couldn't propagate a preference, the status is skipped
     affected_system_status = Column(
@@ -591,6 +638,120 @@ class PrivacyPreferenceHistory(ConsentReportingMixin, Base):
 
         return created_privacy_preference_history, current_preference
 
+    @classmethod
+    def bulk_create_history_and_upsert_current_preferences(
+        cls: Type[PrivacyPreferenceHistory],
+        db: Session,
+        *,
+        data: List[dict[str, Any]],
+    ) -> Tuple[List[PrivacyPreferenceHistory], List[CurrentPrivacyPreference]]:
+        """Batched version of create_history_and_upsert_current_preference for saving many preferences at once.
+
+        Every record is validated up front, then the PrivacyPreferenceHistory records are written with
+        multi-row INSERTs and the CurrentPrivacyPreferences are upserted with INSERT ... ON CONFLICT,
+        all in a single transaction.
+
+        Returns the created historical records and the upserted current preference for each item in data, in order.
+        """
+        if not data:
+            return [], []
+
+        relevant_systems: Dict[
+            Tuple[Optional[str], Optional[str], Union[Optional[str], Optional[int]]],
+            List[FidesKey],
+        ] = {}
+        history_rows: List[Dict[str, Any]] = []
+        current_rows: List[Dict[str, Any]] = []
+        for preference_data in data:
+            history_row: Dict[str, Any] = dict(preference_data)
+            (
+                privacy_notice_history,
+                tcf_field,
+                tcf_val,
+            ) = _validate_before_saving_consent_history(db, history_row)
+
+            # Relevant systems only depend on the consent attribute, so look them up once per attribute
+            relevant_systems_key = (
+                privacy_notice_history.id if privacy_notice_history else None,
+                tcf_field,
+                tcf_val,
+            )
+            if relevant_systems_key not in relevant_systems:
+                relevant_systems[
+                    relevant_systems_key
+                ] = PrivacyPreferenceHistory.determine_relevant_systems(
+                    db,
+                    privacy_notice_history=privacy_notice_history,
+                    tcf_field=tcf_field,
+                    tcf_value=tcf_val,
+                )
+            history_row["relevant_systems"] = relevant_systems[relevant_systems_key]
+            history_row["id"] = generate_id(cls.__tablename__)
+            if tcf_field:
+                history_row["tcf_version"] = CURRENT_TCF_VERSION
+            if history_row.get("created_at") is None:
+                # Not an imported preference with its original saved time, so it was saved now
+                history_row["created_at"] = func.now()
+            history_rows.append(history_row)
+
+            current_row: Dict[str, Any] = {
+                "preference": history_row["preference"],
+                "created_at": history_row["created_at"],
+                "updated_at": history_row["created_at"],
+                "provided_identity_id": history_row.get("provided_identity_id"),
+                "privacy_preference_history_id": history_row["id"],
+                "fides_user_device_provided_identity_id": history_row.get(
+                    "fides_user_device_provided_identity_id"
+                ),
+            }
+            if privacy_notice_history:
+                current_row[
+                    "privacy_notice_id"
+                ] = privacy_notice_history.privacy_notice_id
+                current_row["privacy_notice_history_id"] = privacy_notice_history.id
+            elif tcf_field:
+                current_row[tcf_field] = tcf_val
+                current_row["tcf_version"] = CURRENT_TCF_VERSION
+            current_rows.append(current_row)
+
+        # Every row of a multi-row INSERT needs the same columns
+        columns = set().union(*history_rows)
+        for history_row in history_rows:
+            for column in columns:
+                history_row.setdefault(column, None)
+
+        try:
+            for start in range(0, len(history_rows), BULK_INSERT_BATCH_SIZE):
+                db.execute(
+                    insert(cls.__table__).values(  # type: ignore[attr-defined]
+                        history_rows[start : start + BULK_INSERT_BATCH_SIZE]
+                    )
+                )
+            current_preference_ids = bulk_upsert_current_privacy_preferences(
+                db, current_rows
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        histories: Dict[str, PrivacyPreferenceHistory] = {
+            history.id: history
+            for history in db.query(cls)
+            .filter(cls.id.in_([history_row["id"] for history_row in history_rows]))
+            .populate_existing()
+        }
+        current_preferences: Dict[str, CurrentPrivacyPreference] = {
+            current_preference.id: current_preference
+            for current_preference in db.query(CurrentPrivacyPreference)
+            .filter(CurrentPrivacyPreference.id.in_(set(current_preference_ids)))
+            .populate_existing()
+        }
+        return [histories[history_row["id"]] for history_row in history_rows], [
+            current_preferences[current_preference_id]
+            for current_preference_id in current_preference_ids
+        ]
+
 
 class LastSavedMixin:
     """Stores common fields for the last saved preference or last served notice"""
@@ -705,6 +866,9 @@ class CurrentPrivacyPreference(LastSavedMixin, Base):
     )
 
     __table_args__ = (
+        Index(
+            "ix_currentprivacypreference_updated_at_id", "updated_at", "id"
+        ),  # For keyset pagination of the current preferences report
         UniqueConstraint(
             "provided_identity_id", "privacy_notice_id", name="identity_privacy_notice"
         ),
@@ -1038,3 +1202,211 @@ def upsert_last_saved_record(
         )
 
     return current_record
+
+
+def _current_preference_record_type(row: Dict[str, Any]) -> str:
+    """The column holding the notice or TCF attribute the current preference was saved for"""
+    return next(
+        field
+        for field in (
+            ConsentRecordType.privacy_notice_id.value,
+            *TCFComponentType.__members__,
+        )
+        if row.get(field) is not None
+    )
+
+
+def _get_existing_current_preferences_for_both_identities(
+    db: Session, current_rows: List[Dict[str, Any]]
+) -> Tuple[Dict[Tuple[str, str, Any], str], Dict[Tuple[str, str, Any], str]]:
+    """
+    Look up the existing CurrentPrivacyPreferences for the rows saved against both a provided
+    identity and a fides user device id, to decide how to consolidate them.
+
+    Returns the ids of the existing records, keyed by (provided identity id, record type, value)
+    and by (fides user device provided identity id, record type, value) respectively.
+    """
+    table = CurrentPrivacyPreference.__table__  # type: ignore[attr-defined]
+    existing_for_provided_identity: Dict[Tuple[str, str, Any], str] = {}
+    existing_for_fides_user_device: Dict[Tuple[str, str, Any], str] = {}
+    rows_with_both_identities = [
+        row
+        for row in current_rows
+        if row.get("provided_identity_id")
+        and row.get("fides_user_device_provided_identity_id")
+    ]
+    if not rows_with_both_identities:
+        return existing_for_provided_identity, existing_for_fides_user_device
+
+    record_type_columns = [
+        table.c[ConsentRecordType.privacy_notice_id.value],
+        *[table.c[field] for field in TCFComponentType.__members__],
+    ]
+    for existing in db.execute(
+        select(
+            [
+                table.c.id,
+                table.c.provided_identity_id,
+                table.c.fides_user_device_provided_identity_id,
+                *record_type_columns,
+            ]
+        ).where(
+            or_(
+                table.c.provided_identity_id.in_(
+                    {row["provided_identity_id"] for row in rows_with_both_identities}
+                ),
+                table.c.fides_user_device_provided_identity_id.in_(
+                    {
+                        row["fides_user_device_provided_identity_id"]
+                        for row in rows_with_both_identities
+                    }
+                ),
+            )
+        )
+    ):
+        existing_row = dict(existing._mapping)  # pylint: disable=W0212
+        field = _current_preference_record_type(existing_row)
+        if existing_row["provided_identity_id"]:
+            existing_for_provided_identity[
+                (existing_row["provided_identity_id"], field, existing_row[field])
+            ] = existing_row["id"]
+        if existing_row["fides_user_device_provided_identity_id"]:
+            existing_for_fides_user_device[
+                (
+                    existing_row["fides_user_device_provided_identity_id"],
+                    field,
+                    existing_row[field],
+                )
+            ] = existing_row["id"]
+
+    return existing_for_provided_identity, existing_for_fides_user_device
+
+
+def _saved_before(row: Dict[str, Any], other_row: Dict[str, Any]) -> bool:
+    """Whether row was saved before other_row. Rows saved now, rather than imported with
+    their original saved time, are the most recent."""
+    if not isinstance(row["updated_at"], datetime):
+        return False
+    if not isinstance(other_row["updated_at"], datetime):
+        return True
+    return row["updated_at"] < other_row["updated_at"]
+
+
+def _get_not_updated_current_preference_ids(
+    db: Session, identity_column: str, field: str, keys: List[Tuple[str, Any]]
+) -> Dict[Tuple[str, str, str, Any], str]:
+    """Looks up the ids of the existing CurrentPrivacyPreferences for the given identities and
+    notices or TCF attributes, keyed like those returned by the upsert"""
+    if not keys:
+        return {}
+    table = CurrentPrivacyPreference.__table__  # type: ignore[attr-defined]
+    return {
+        (identity_column, field, record[1], record[2]): record.id
+        for record in db.execute(
+            select([table.c.id, table.c[identity_column], table.c[field]]).where(
+                tuple_(table.c[identity_column], table.c[field]).in_(keys)
+            )
+        )
+    }
+
+
+def bulk_upsert_current_privacy_preferences(
+    db: Session, current_rows: List[Dict[str, Any]]
+) -> List[str]:
+    """
+    Upserts many CurrentPrivacyPreferences at once with INSERT ... ON CONFLICT, following the same
+    rules as upsert_last_saved_record, and returns the id of the current preference for each row.
+
+    Rows are grouped by the unique constraint they conflict on - the identity they're saved against
+    and the notice or TCF attribute - and each group is upserted with a single statement. If a row
+    has both a verified provided identity and a fides user device id, it's saved against the existing
+    record for the provided identity where there is one, consolidating any separate record for the
+    fides user device id into it.
+
+    Does not commit.
+    """
+    table = CurrentPrivacyPreference.__table__  # type: ignore[attr-defined]
+
+    (
+        existing_for_provided_identity,
+        existing_for_fides_user_device,
+    ) = _get_existing_current_preferences_for_both_identities(db, current_rows)
+
+    # Group the rows by the unique constraint they're upserted against. The most recently saved row
+    # for the same identity and attribute wins, regardless of where it is in current_rows.
+    groups: Dict[Tuple[str, str], Dict[Tuple[str, Any], Dict[str, Any]]] = {}
+    conflict_keys: List[Tuple[str, str, str, Any]] = []
+    ids_to_delete: Set[str] = set()
+    for row in current_rows:
+        field = _current_preference_record_type(row)
+        identity_column = (
+            "provided_identity_id"
+            if row.get("provided_identity_id")
+            else "fides_user_device_provided_identity_id"
+        )
+        if row.get("provided_identity_id") and row.get(
+            "fides_user_device_provided_identity_id"
+        ):
+            record_for_provided_identity = existing_for_provided_identity.get(
+                (row["provided_identity_id"], field, row[field])
+            )
+            record_for_fides_user_device = existing_for_fides_user_device.get(
+                (row["fides_user_device_provided_identity_id"], field, row[field])
+            )
+            if record_for_provided_identity and record_for_fides_user_device:
+                if record_for_provided_identity != record_for_fides_user_device:
+                    # Both were saved separately, consolidate into the provided identity's record
+                    ids_to_delete.add(record_for_fides_user_device)
+            elif record_for_fides_user_device:
+                identity_column = "fides_user_device_provided_identity_id"
+
+        group = groups.setdefault((identity_column, field), {})
+        group_key = (row[identity_column], row[field])
+        if group_key not in group or not _saved_before(row, group[group_key]):
+            group[group_key] = row
+        conflict_keys.append((identity_column, field, row[identity_column], row[field]))
+
+    if ids_to_delete:
+        db.execute(delete(table).where(table.c.id.in_(ids_to_delete)))
+
+    current_preference_ids: Dict[Tuple[str, str, str, Any], str] = {}
+    for (identity_column, field), rows in groups.items():
+        rows_to_upsert = list(rows.values())
+        for start in range(0, len(rows_to_upsert), BULK_INSERT_BATCH_SIZE):
+            statement = insert(table).values(
+                [
+                    {"id": generate_id(table.name), **row}
+                    for row in rows_to_upsert[start : start + BULK_INSERT_BATCH_SIZE]
+                ]
+            )
+            # Imported preferences can be older than the existing record, in which case it's left as is
+            statement = statement.on_conflict_do_update(
+                index_elements=[identity_column, field],
+                set_={
+                    column: statement.excluded[column]
+                    for column in rows_to_upsert[0]
+                    if column != "created_at"
+                },
+                where=table.c.updated_at <= statement.excluded.updated_at,
+            ).returning(table.c.id, table.c[identity_column], table.c[field])
+            for upserted in db.execute(statement):
+                current_preference_ids[
+                    (identity_column, field, upserted[1], upserted[2])
+                ] = upserted.id
+
+    # Records that weren't updated aren't returned by the upsert, so look them up separately
+    for (identity_column, field), rows in groups.items():
+        current_preference_ids.update(
+            _get_not_updated_current_preference_ids(
+                db,
+                identity_column,
+                field,
+                [
+                    key
+                    for key in rows
+                    if (identity_column, field, *key) not in current_preference_ids
+                ],
+            )
+        )
+
+    return [current_preference_ids[conflict_key] for conflict_key in conflict_keys]
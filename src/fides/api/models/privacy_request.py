@@ -18,11 +18,16 @@ from sqlalchemy import (
     Integer,
     String,
     UniqueConstraint,
+    and_,
+    event,
+    or_,
 )
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.ext.mutable import MutableDict, MutableList
-from sqlalchemy.orm import Session, backref, relationship
+from sqlalchemy.orm import Mapper, Session, backref, relationship
+from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
 from sqlalchemy_utils.types.encrypted.encrypted_type import (
     AesGcmEngine,
     StringEncryptedType,
@@ -34,7 +39,11 @@ from fides.api.common_exceptions import (
     NoCachedManualWebhookEntry,
     PrivacyRequestPaused,
 )
-from fides.api.cryptography.cryptographic_util import generate_salt, hash_with_salt
+from fides.api.cryptography.cryptographic_util import (
+    generate_salt,
+    hash_with_hmac,
+    hash_with_salt,
+)
 from fides.api.db.base_class import Base  # type: ignore[attr-defined]
 from fides.api.db.base_class import JSONTypeOverride
 from fides.api.db.util import EnumColumn
@@ -64,7 +73,6 @@ from fides.api.schemas.redis_cache import Identity, IdentityBase
 from fides.api.tasks import celery_app
 from fides.api.util.cache import (
     FidesopsRedis,
-    get_all_cache_keys_for_privacy_request,
     get_async_task_tracking_cache_key,
     get_cache,
     get_custom_privacy_request_field_cache_key,
@@ -323,9 +331,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         deleting this object from the database
         """
         cache: FidesopsRedis = get_cache()
-        all_keys = get_all_cache_keys_for_privacy_request(privacy_request_id=self.id)
-        for key in all_keys:
-            cache.delete(key)
+        cache.delete_privacy_request_keys(self.id)
 
         for provided_identity in self.provided_identities:  # type: ignore[attr-defined]
             provided_identity.delete(db=db)
@@ -340,6 +346,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                 cache.set_with_autoexpire(
                     get_identity_cache_key(self.id, key),
                     value,
+                    privacy_request_id=self.id,
                 )
 
     def cache_custom_privacy_request_fields(
@@ -362,6 +369,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                     cache.set_with_autoexpire(
                         get_custom_privacy_request_field_cache_key(self.id, key),
                         item.value,
+                        privacy_request_id=self.id,
                     )
         else:
             logger.info(
@@ -377,15 +385,15 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         identity_dict: Dict[str, Any] = dict(identity)
         for key, value in identity_dict.items():
             if value:
-                hashed_value = ProvidedIdentity.hash_value(value)
                 ProvidedIdentity.create(
                     db=db,
                     data={
                         "privacy_request_id": self.id,
                         "field_name": key,
-                        # We don't need to manually encrypt this field, it's done at the ORM level
+                        # We don't need to manually encrypt this field, it's done at the ORM level,
+                        # and the blind index is computed from it when the record is saved
                         "encrypted_value": {"value": value},
-                        "hashed_value": hashed_value,
+                        "hashed_value": ProvidedIdentity.legacy_hash_value(value),
                     },
                 )
 
@@ -400,7 +408,6 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         if CONFIG.execution.allow_custom_privacy_request_field_collection:
             for key, item in custom_privacy_request_fields.items():
                 if item.value:
-                    hashed_value = CustomPrivacyRequestField.hash_value(item.value)
                     CustomPrivacyRequestField.create(
                         db=db,
                         data={
@@ -408,7 +415,6 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                             "field_name": key,
                             "field_label": item.label,
                             "encrypted_value": {"value": item.value},
-                            "hashed_value": hashed_value,
                         },
                     )
         else:
@@ -462,6 +468,9 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
             get_async_task_tracking_cache_key(self.id),
             task_id,
         )
+        cache.add_privacy_request_keys(
+            self.id, [get_async_task_tracking_cache_key(self.id)]
+        )
 
     def get_cached_task_id(self) -> Optional[str]:
         """Gets the cached task ID for this privacy request."""
@@ -486,11 +495,13 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                     cache.set_with_autoexpire(
                         get_drp_request_body_cache_key(self.id, key),
                         repr(value),
+                        privacy_request_id=self.id,
                     )
                 else:
                     cache.set_with_autoexpire(
                         get_drp_request_body_cache_key(self.id, key),
                         value,
+                        privacy_request_id=self.id,
                     )
 
     def cache_encryption(self, encryption_key: Optional[str] = None) -> None:
@@ -502,6 +513,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_with_autoexpire(
             get_encryption_cache_key(self.id, "key"),
             encryption_key,
+            privacy_request_id=self.id,
         )
 
     def cache_masking_secret(self, masking_secret: MaskingSecretCache) -> None:
@@ -516,27 +528,28 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
                 secret_type=masking_secret.secret_type,
             ),
             FidesopsRedis.encode_obj(masking_secret.secret),
+            privacy_request_id=self.id,
         )
 
     def get_cached_identity_data(self) -> Dict[str, Any]:
         """Retrieves any identity data pertaining to this request from the cache"""
-        prefix = f"id-{self.id}-identity-*"
+        prefix = f"id-{self.id}-identity-"
         cache: FidesopsRedis = get_cache()
-        keys = cache.keys(prefix)
+        keys = cache.get_privacy_request_keys(self.id, prefix)
         return {key.split("-")[-1]: cache.get(key) for key in keys}
 
     def get_cached_custom_privacy_request_fields(self) -> Dict[str, Any]:
         """Retrieves any custom fields pertaining to this request from the cache"""
-        prefix = f"id-{self.id}-custom-privacy-request-field-*"
+        prefix = f"id-{self.id}-custom-privacy-request-field-"
         cache: FidesopsRedis = get_cache()
-        keys = cache.keys(prefix)
+        keys = cache.get_privacy_request_keys(self.id, prefix)
         return {key.split("-")[-1]: cache.get(key) for key in keys}
 
     def get_results(self) -> Dict[str, Any]:
         """Retrieves all cached identity data associated with this Privacy Request"""
         cache: FidesopsRedis = get_cache()
-        result_prefix = f"{self.id}__*"
-        return cache.get_encoded_objects_by_prefix(result_prefix)
+        result_prefix = f"{self.id}__"
+        return cache.get_encoded_objects_by_prefix(result_prefix, self.id)
 
     def cache_email_connector_template_contents(
         self,
@@ -548,6 +561,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         on their end for the given collection"""
         cache_action_required(
             cache_key=f"EMAIL_INFORMATION__{self.id}__{step.value}__{collection.dataset}__{collection.collection}",
+            privacy_request_id=self.id,
             step=step,
             collection=collection,
             action_needed=action_needed,
@@ -559,7 +573,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         """Retrieve the raw details to populate an email template for collections on a given dataset."""
         cache: FidesopsRedis = get_cache()
         email_contents: Dict[str, Optional[Any]] = cache.get_encoded_objects_by_prefix(
-            f"EMAIL_INFORMATION__{self.id}__{step.value}__{dataset}"
+            f"EMAIL_INFORMATION__{self.id}__{step.value}__{dataset}", self.id
         )
 
         actions: List[CheckpointActionRequired] = []
@@ -581,6 +595,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         """
         cache_action_required(
             cache_key=f"PAUSED_LOCATION__{self.id}",
+            privacy_request_id=self.id,
             step=step,
             collection=collection,
             action_needed=action_needed,
@@ -610,6 +625,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         """
         cache_action_required(
             cache_key=f"FAILED_LOCATION__{self.id}",
+            privacy_request_id=self.id,
             step=step,
             collection=collection,
             action_needed=None,
@@ -639,6 +655,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"WEBHOOK_MANUAL_ACCESS_INPUT__{self.id}__{manual_webhook.id}",
             parsed_data.dict(),
+            privacy_request_id=self.id,
         )
 
     def cache_manual_webhook_erasure_input(
@@ -655,6 +672,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"WEBHOOK_MANUAL_ERASURE_INPUT__{self.id}__{manual_webhook.id}",
             parsed_data.dict(),
+            privacy_request_id=self.id,
         )
 
     def get_manual_webhook_access_input_strict(
@@ -755,6 +773,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"MANUAL_INPUT__{self.id}__{collection.value}",
             manual_rows,
+            privacy_request_id=self.id,
         )
 
     def get_manual_access_input(
@@ -769,7 +788,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cached_results: Optional[
             Dict[str, Optional[List[Row]]]
         ] = cache.get_encoded_objects_by_prefix(
-            f"MANUAL_INPUT__{self.id}__{collection.value}"
+            f"MANUAL_INPUT__{self.id}__{collection.value}", self.id
         )
         return list(cached_results.values())[0] if cached_results else None
 
@@ -784,6 +803,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache.set_encoded_object(
             f"MANUAL_MASK__{self.id}__{collection.value}",
             count,
+            privacy_request_id=self.id,
         )
 
     def get_manual_erasure_count(self, collection: CollectionAddress) -> Optional[int]:
@@ -795,21 +815,23 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache: FidesopsRedis = get_cache()
         prefix = f"MANUAL_MASK__{self.id}__{collection.value}"
         value_dict: Optional[Dict[str, int]] = cache.get_encoded_objects_by_prefix(  # type: ignore
-            prefix
+            prefix, self.id
         )
         return list(value_dict.values())[0] if value_dict else None
 
     def cache_access_graph(self, value: GraphRepr) -> None:
         """Cache a representation of the graph built for the access request"""
         cache: FidesopsRedis = get_cache()
-        cache.set_encoded_object(f"ACCESS_GRAPH__{self.id}", value)
+        cache.set_encoded_object(
+            f"ACCESS_GRAPH__{self.id}", value, privacy_request_id=self.id
+        )
 
     def get_cached_access_graph(self) -> Optional[GraphRepr]:
         """Fetch the graph built for the access request"""
         cache: FidesopsRedis = get_cache()
         value_dict: Optional[
             Dict[str, Optional[GraphRepr]]
-        ] = cache.get_encoded_objects_by_prefix(f"ACCESS_GRAPH__{self.id}")
+        ] = cache.get_encoded_objects_by_prefix(f"ACCESS_GRAPH__{self.id}", self.id)
         return list(value_dict.values())[0] if value_dict else None
 
     def cache_data_use_map(self, value: Dict[str, Set[str]]) -> None:
@@ -818,7 +840,9 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         mapped to their associated data uses
         """
         cache: FidesopsRedis = get_cache()
-        cache.set_encoded_object(f"DATA_USE_MAP__{self.id}", value)
+        cache.set_encoded_object(
+            f"DATA_USE_MAP__{self.id}", value, privacy_request_id=self.id
+        )
 
     def get_cached_data_use_map(self) -> Optional[Dict[str, Set[str]]]:
         """
@@ -827,7 +851,7 @@ class PrivacyRequest(IdentityVerificationMixin, Base):  # pylint: disable=R0904
         cache: FidesopsRedis = get_cache()
         value_dict: Optional[
             Dict[str, Optional[Dict[str, Set[str]]]]
-        ] = cache.get_encoded_objects_by_prefix(f"DATA_USE_MAP__{self.id}")
+        ] = cache.get_encoded_objects_by_prefix(f"DATA_USE_MAP__{self.id}", self.id)
         return list(value_dict.values())[0] if value_dict else None
 
     def trigger_policy_webhook(
@@ -975,7 +999,8 @@ def _get_manual_access_input_from_cache(
     cached_results: Optional[
         Optional[Dict[str, Any]]
     ] = cache.get_encoded_objects_by_prefix(
-        f"WEBHOOK_MANUAL_ACCESS_INPUT__{privacy_request.id}__{manual_webhook.id}"
+        f"WEBHOOK_MANUAL_ACCESS_INPUT__{privacy_request.id}__{manual_webhook.id}",
+        privacy_request.id,
     )
     if cached_results:
         return list(cached_results.values())[0]
@@ -991,7 +1016,8 @@ def _get_manual_erasure_input_from_cache(
     cached_results: Optional[
         Optional[Dict[str, Any]]
     ] = cache.get_encoded_objects_by_prefix(
-        f"WEBHOOK_MANUAL_ERASURE_INPUT__{privacy_request.id}__{manual_webhook.id}"
+        f"WEBHOOK_MANUAL_ERASURE_INPUT__{privacy_request.id}__{manual_webhook.id}",
+        privacy_request.id,
     )
     if cached_results:
         return list(cached_results.values())[0]
@@ -1013,7 +1039,46 @@ class ProvidedIdentityType(EnumType):
     fides_user_device_id = "fides_user_device_id"
 
 
-class ProvidedIdentity(Base):  # pylint: disable=R0904
+class BlindIndexMixin:
+    """
+    Adds a blind index to models with an encrypted value, so they can be searched by exact
+    match without decrypting them. The blind index is a keyed HMAC-SHA256 of the value,
+    kept in sync with the encrypted value whenever the record is saved.
+    """
+
+    blind_index = Column(
+        String,
+        index=True,
+        unique=False,
+        nullable=True,
+    )
+
+    @classmethod
+    def blind_index_value(
+        cls,
+        value: str,
+        encoding: str = "UTF-8",
+    ) -> str:
+        """Computes the blind index of the value with CONFIG.security.identity_blind_index_key"""
+        return hash_with_hmac(
+            value.encode(encoding),
+            CONFIG.security.identity_blind_index_key.encode(encoding),  # type: ignore[union-attr]
+        )
+
+
+@event.listens_for(BlindIndexMixin, "before_insert", propagate=True)
+@event.listens_for(BlindIndexMixin, "before_update", propagate=True)
+def set_blind_index(
+    mapper: Mapper, connection: Connection, target: BlindIndexMixin
+) -> None:  # pylint: disable=unused-argument
+    """Computes the blind index from the encrypted value before it is saved"""
+    value: Any = (target.encrypted_value or {}).get("value")  # type: ignore[attr-defined]
+    target.blind_index = (  # type: ignore[assignment]
+        target.blind_index_value(str(value)) if value is not None else None
+    )
+
+
+class ProvidedIdentity(BlindIndexMixin, Base):  # pylint: disable=R0904
     """
     A table for storing identity fields and values provided at privacy request
     creation time.
@@ -1038,7 +1103,7 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         index=True,
         unique=False,
         nullable=True,
-    )  # This field is used as a blind index for exact match searches
+    )  # Legacy bcrypt blind index, superseded by blind_index
     encrypted_value = Column(
         MutableDict.as_mutable(
             StringEncryptedType(
@@ -1073,6 +1138,35 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         )
         return hashed_value
 
+    @classmethod
+    def legacy_hash_value(cls, value: str) -> Optional[str]:
+        """The legacy hashed_value to save alongside the blind index, only computed
+        if CONFIG.security.identity_legacy_hash is enabled"""
+        if not CONFIG.security.identity_legacy_hash:
+            return None
+        return cls.hash_value(value)
+
+    @classmethod
+    def matches_value(cls, value: str) -> BinaryExpression | BooleanClauseList:
+        """
+        Returns a condition matching provided identities with the given value by their blind index.
+
+        If CONFIG.security.identity_legacy_hash is enabled, identities saved without a blind index
+        are matched by their legacy hashed_value as well.
+        """
+        condition: BinaryExpression | BooleanClauseList = (
+            cls.blind_index == cls.blind_index_value(value)
+        )
+        if CONFIG.security.identity_legacy_hash:
+            condition = or_(
+                condition,
+                and_(
+                    cls.blind_index.is_(None),
+                    cls.hashed_value == cls.hash_value(value),
+                ),
+            )
+        return condition
+
     def as_identity_schema(self) -> Identity:
         """Creates an Identity schema from a ProvidedIdentity record in the application DB."""
         identity = Identity()
@@ -1092,7 +1186,7 @@ class ProvidedIdentity(Base):  # pylint: disable=R0904
         return identity
 
 
-class CustomPrivacyRequestField(Base):
+class CustomPrivacyRequestField(BlindIndexMixin, Base):
     @declared_attr
     def __tablename__(self) -> str:
         return "custom_privacy_request_field"
@@ -1120,7 +1214,7 @@ class CustomPrivacyRequestField(Base):
         index=True,
         unique=False,
         nullable=True,
-    )  # This field is used as a blind index for exact match searches
+    )  # Legacy bcrypt hash with a random salt, superseded by blind_index
     encrypted_value = Column(
         MutableDict.as_mutable(
             StringEncryptedType(
@@ -1205,9 +1299,9 @@ class ConsentRequest(IdentityVerificationMixin, Base):
 
     def get_cached_identity_data(self) -> Dict[str, Any]:
         """Retrieves any identity data pertaining to this request from the cache."""
-        prefix = f"id-{self.id}-identity-*"
+        prefix = f"id-{self.id}-identity-"
         cache: FidesopsRedis = get_cache()
-        keys = cache.keys(prefix)
+        keys = cache.get_privacy_request_keys(self.id, prefix)
         return {key.split("-")[-1]: cache.get(key) for key in keys}
 
     def verify_identity(
@@ -1233,6 +1327,7 @@ def cache_action_required(
     step: Optional[CurrentStep] = None,
     collection: Optional[CollectionAddress] = None,
     action_needed: Optional[List[ManualAction]] = None,
+    privacy_request_id: Optional[str] = None,
 ) -> None:
     """Generic method to cache information about additional action required for a collection.
 
@@ -1251,6 +1346,7 @@ def cache_action_required(
     cache.set_encoded_object(
         cache_key,
         action_required.dict() if action_required else None,
+        privacy_request_id=privacy_request_id,
     )
 
 
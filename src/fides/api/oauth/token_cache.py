@@ -0,0 +1,190 @@
+"""
+In-process cache of verified API tokens, so authorizing a request doesn't decrypt its
+token and load its client from the database every time.
+
+Tokens are cached under a generation kept in Redis, which is bumped whenever a client, user
+or user permissions change, so every process stops using the tokens it verified beforehand.
+"""
+import hashlib
+from datetime import datetime
+from itertools import chain
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import (  # type: ignore[attr-defined]
+    ORMExecuteState,
+    Session,
+    make_transient_to_detached,
+)
+
+from fides.api.common_exceptions import RedisConnectionError
+from fides.api.models.client import ClientDetail
+from fides.api.models.fides_user import FidesUser
+from fides.api.models.fides_user_permissions import FidesUserPermissions
+from fides.api.util.cache import get_cache
+from fides.api.util.lru_cache import LRUCache
+from fides.config import CONFIG
+
+OAUTH_CLIENTS_CHANGED = "oauth_clients_changed"
+OAUTH_CLIENTS_GENERATION_KEY = "oauth_clients_generation"
+
+OAUTH_CLIENT_MODELS = (ClientDetail, FidesUser, FidesUserPermissions)
+OAUTH_CLIENT_TABLES = {
+    model.__table__.name for model in OAUTH_CLIENT_MODELS  # type: ignore[attr-defined]
+}
+
+
+class VerifiedToken:
+    """The decrypted payload of a verified token, along with the client it belongs to"""
+
+    def __init__(
+        self,
+        token_data: Dict[str, Any],
+        issued_at: datetime,
+        client: ClientDetail,
+    ) -> None:
+        self.token_data = token_data
+        self.issued_at = issued_at
+        self.client_id: str = client.id
+        # The root client isn't saved in the database, so it's rebuilt from the config instead
+        self.client_columns: Optional[Dict[str, Any]] = (
+            None
+            if client.id == CONFIG.security.oauth_root_client_id
+            else {
+                column.key: getattr(client, column.key)
+                for column in ClientDetail.__table__.columns  # type: ignore[attr-defined]
+            }
+        )
+
+    def load_client(self, db: Session) -> Optional[ClientDetail]:
+        """
+        Returns the client, attached to the session without querying the database.
+
+        A detached copy of the cached columns is merged into the session, so that relationships
+        like the client's user can still be lazy loaded.
+        """
+        if self.client_columns is None:
+            return ClientDetail.get(
+                db,
+                object_id=self.client_id,
+                config=CONFIG,
+                scopes=CONFIG.security.root_user_scopes,
+                roles=CONFIG.security.root_user_roles,
+            )
+
+        client = ClientDetail(
+            **{
+                key: list(value) if isinstance(value, list) else value
+                for key, value in self.client_columns.items()
+            }
+        )
+        make_transient_to_detached(client)
+        return db.merge(client, load=False)
+
+
+class VerifiedTokenCache(LRUCache[str, Tuple[str, VerifiedToken]]):
+    """
+    A bounded, least-recently-used cache of verified tokens, keyed by a digest of the token.
+
+    Entries are kept for CONFIG.security.oauth_token_cache_ttl_seconds at most, and are only used
+    while the generation in Redis is the one they were verified under. Any process committing a
+    change to a client, user or user permissions bumps the generation. If Redis can't be reached,
+    the cache isn't used.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(
+            lambda: CONFIG.security.oauth_token_cache_size,
+            lambda: CONFIG.security.oauth_token_cache_ttl_seconds,
+        )
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode(CONFIG.security.encoding)).hexdigest()
+
+    @staticmethod
+    def generation() -> Optional[str]:
+        """
+        Returns the current generation of the verified tokens, or None if it can't be read.
+
+        Read this before verifying a token to cache, so that a change committed while the token
+        is verified also invalidates it.
+        """
+        try:
+            return str(get_cache().get(OAUTH_CLIENTS_GENERATION_KEY) or 0)
+        except (RedisConnectionError, RedisError):
+            logger.warning("Unable to connect to Redis to check cached API tokens")
+            return None
+
+    def get_verified_token(
+        self, token: str, generation: Optional[str]
+    ) -> Optional[VerifiedToken]:
+        """Returns the verified token if it's cached under the given generation and hasn't expired"""
+        if generation is None:
+            return None
+
+        key = self._key(token)
+        entry = self.get(key)
+        if not entry:
+            return None
+        entry_generation, verified_token = entry
+        if entry_generation != generation:
+            self.pop(key)
+            return None
+        return verified_token
+
+    def set_verified_token(
+        self, token: str, verified_token: VerifiedToken, generation: Optional[str]
+    ) -> None:
+        """Caches the verified token under the generation it was verified in"""
+        if generation is None:
+            return
+        self.set(self._key(token), (generation, verified_token))
+
+
+verified_token_cache = VerifiedTokenCache()
+
+
+@event.listens_for(Session, "after_flush")
+def flag_oauth_client_changes(session: Session, _: Any) -> None:
+    """Flag the session if a client, user or user permissions were updated or deleted"""
+    if any(
+        isinstance(instance, OAUTH_CLIENT_MODELS)
+        for instance in chain(session.dirty, session.deleted)
+    ):
+        session.info[OAUTH_CLIENTS_CHANGED] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def flag_bulk_oauth_client_changes(orm_execute_state: ORMExecuteState) -> None:
+    """Flag the session if clients, users or user permissions were updated or deleted in bulk,
+    such as with `query(...).update()` or `query(...).delete()`"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+
+    table_name = getattr(
+        getattr(orm_execute_state.statement, "table", None), "name", None
+    )
+    if table_name in OAUTH_CLIENT_TABLES:
+        orm_execute_state.session.info[OAUTH_CLIENTS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_verified_tokens(session: Session) -> None:
+    """Invalidate the verified tokens in every process once a flagged session is committed"""
+    if not session.info.pop(OAUTH_CLIENTS_CHANGED, False):
+        return
+
+    verified_token_cache.clear()
+    try:
+        get_cache().incr(OAUTH_CLIENTS_GENERATION_KEY)
+    except (RedisConnectionError, RedisError):
+        logger.warning("Unable to connect to Redis to invalidate cached API tokens")
+
+
+@event.listens_for(Session, "after_rollback")
+def clear_oauth_client_changes(session: Session) -> None:
+    """Writes that were rolled back don't affect the verified tokens"""
+    session.info.pop(OAUTH_CLIENTS_CHANGED, None)
@@ -4,7 +4,7 @@ import json
 from datetime import datetime
 from functools import update_wrapper
 from types import FunctionType
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import SecurityScopes
@@ -27,6 +27,7 @@ from fides.api.models.client import ClientDetail
 from fides.api.models.fides_user import FidesUser
 from fides.api.models.policy import PolicyPreWebhook
 from fides.api.oauth.roles import get_scopes_from_roles
+from fides.api.oauth.token_cache import VerifiedToken, verified_token_cache
 from fides.api.schemas.external_https import WebhookJWE
 from fides.api.schemas.oauth import OAuth2ClientCredentialsBearer
 from fides.common.api.v1.urn_registry import TOKEN, V1_URL_PREFIX
@@ -195,6 +196,23 @@ def extract_token_and_load_client(
         logger.debug("No authorization supplied.")
         raise AuthenticationError(detail="Authentication Failure")
 
+    generation: Optional[str] = verified_token_cache.generation()
+    verified_token: Optional[VerifiedToken] = verified_token_cache.get_verified_token(
+        authorization, generation
+    )
+    if verified_token:
+        if is_token_expired(
+            verified_token.issued_at,
+            CONFIG.security.oauth_access_token_expire_minutes,
+        ):
+            raise AuthorizationError(detail="Not Authorized for this action")
+
+        cached_client: Optional[ClientDetail] = verified_token.load_client(db)
+        if not cached_client:
+            logger.debug("Auth token belongs to an invalid client_id.")
+            raise AuthorizationError(detail="Not Authorized for this action")
+        return dict(verified_token.token_data), cached_client
+
     try:
         token_data = json.loads(
             extract_payload(authorization, CONFIG.security.app_encryption_key)
@@ -232,6 +250,12 @@ def extract_token_and_load_client(
         logger.debug("Auth token belongs to an invalid client_id.")
         raise AuthorizationError(detail="Not Authorized for this action")
 
+    # Later requests with this token skip decrypting it and loading the client
+    verified_token_cache.set_verified_token(
+        authorization,
+        VerifiedToken(dict(token_data), datetime.fromisoformat(issued_at), client),
+        generation,
+    )
     return token_data, client
 
 
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from fideslang.gvl import (
@@ -8,7 +8,7 @@ from fideslang.gvl import (
     MAPPED_SPECIAL_PURPOSES,
 )
 from fideslang.validation import FidesKey
-from pydantic import Field, conlist, root_validator
+from pydantic import Field, conlist, root_validator, validator
 
 from fides.api.custom_types import SafeStr
 from fides.api.models.privacy_notice import UserConsentPreference
@@ -172,6 +172,50 @@ class PrivacyPreferencesCreate(PrivacyPreferencesRequest):
     user_agent: Optional[SafeStr]
 
 
+class PrivacyPreferenceImport(TCFAttributes):
+    """A previously saved preference to import, such as one migrated from another consent management platform.
+
+    Preferences are imported against the user's fides user device id, for either a privacy notice
+    or a single TCF attribute.
+    """
+
+    fides_user_device_id: SafeStr
+    preference: UserConsentPreference
+    privacy_notice_history_id: Optional[SafeStr]
+    created_at: Optional[datetime] = Field(
+        title="When the preference was originally saved. Defaults to the time of the import, and is assumed to be in UTC if no timezone is given."
+    )
+    method: Optional[ConsentMethod]
+    request_origin: Optional[RequestOrigin]
+    url_recorded: Optional[SafeStr]
+    user_agent: Optional[SafeStr]
+    user_geography: Optional[SafeStr]
+
+    @validator("created_at")
+    @classmethod
+    def validate_created_at(cls, created_at: Optional[datetime]) -> Optional[datetime]:
+        """Assume UTC for times without a timezone, and reject times in the future"""
+        if created_at is None:
+            return created_at
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        if created_at > datetime.now(timezone.utc):
+            raise ValueError("Cannot import a preference saved in the future.")
+        return created_at
+
+
+class BulkPrivacyPreferencesImport(FidesSchema):
+    """Request body for importing privacy preferences in bulk"""
+
+    preferences: conlist(PrivacyPreferenceImport, min_items=1, max_items=1000)  # type: ignore
+
+
+class BulkPrivacyPreferencesImportResponse(FidesSchema):
+    """Response schema when importing privacy preferences in bulk"""
+
+    imported: int = Field(title="The number of privacy preferences imported")
+
+
 class MinimalPrivacyPreferenceHistorySchema(FidesSchema):
     """Minimal privacy preference history schema for building consent emails"""
 
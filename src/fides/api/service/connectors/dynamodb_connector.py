@@ -143,9 +143,11 @@ class DynamoDBConnector(BaseConnector[Any]):  # type: ignore
         query_config = self.query_config(node)
         collection_name = node.address.collection
         update_ct = 0
-        for row in rows:
+        for row, update_value_map in zip(
+            rows, query_config.update_value_maps(rows, policy, privacy_request)
+        ):
             update_items = query_config.generate_update_stmt(
-                row, policy, privacy_request
+                row, policy, privacy_request, update_value_map
             )
             if update_items is not None:
                 client = self.client()
@@ -1,8 +1,10 @@
 import time
 from enum import Enum
-from typing import List
+from typing import Any, Dict, List
+from uuid import uuid4
 
 from loguru import logger
+from redis.client import Script  # type: ignore
 
 from fides.api.common_exceptions import RedisConnectionError
 from fides.api.util.cache import FidesopsRedis, get_cache
@@ -50,80 +52,117 @@ class RateLimiterTimeoutException(Exception):
 class RateLimiter:
     """
     A rate limiter which interacts with Redis to provide a shared state between fidesops instances
+
+    Each rate limit is tracked as a sliding window log: a sorted set of the timestamps of the
+    calls made within the last period. Checking every limit and reserving a call against all
+    of them happens atomically in a single Lua script, so concurrent rate limiters can never
+    reserve more calls than a limit allows.
     """
 
-    EXPIRE_AFTER_PERIOD_SECONDS: int = 500
+    THROTTLE_METRICS_KEY: str = "rate_limiter:throttled"
+
+    # KEYS: one sorted set per rate limit request
+    # ARGV: a unique member for this call, followed by the rate limit and the
+    # period in milliseconds of each request
+    # Returns 0 if the call was reserved, otherwise the number of milliseconds to
+    # wait until every limit has room for another call
+    RESERVE_SCRIPT: str = """
+        local time = redis.call('TIME')
+        local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+        local wait = 0
+        for i, key in ipairs(KEYS) do
+            local rate_limit = tonumber(ARGV[2 * i])
+            local period = tonumber(ARGV[2 * i + 1])
+            redis.call('ZREMRANGEBYSCORE', key, '-inf', now - period)
+            local usage = redis.call('ZCARD', key)
+            if usage >= rate_limit then
+                local oldest = redis.call('ZRANGE', key, usage - rate_limit, usage - rate_limit, 'WITHSCORES')
+                wait = math.max(wait, tonumber(oldest[2]) + period - now)
+            end
+        end
+        if wait > 0 then
+            return wait
+        end
+        for i, key in ipairs(KEYS) do
+            redis.call('ZADD', key, now, ARGV[1])
+            redis.call('PEXPIRE', key, tonumber(ARGV[2 * i + 1]))
+        end
+        return 0
+    """
 
-    def build_redis_key(self, current_seconds: int, request: RateLimiterRequest) -> str:
+    def build_redis_key(self, request: RateLimiterRequest) -> str:
         """
         Builds the key to be used for the given request for rate limiting
         """
-        fixed_time_filter = (
-            int(current_seconds / request.period.factor) * request.period.factor
-        )
-        redis_key = f"{request.key}:{request.period.label}:{fixed_time_filter}"
-        return redis_key
+        return f"{request.key}:{request.period.label}:window"
 
-    def increment_usage(
-        self,
-        redis: FidesopsRedis,
-        current_seconds: int,
-        requests: List[RateLimiterRequest],
-    ) -> List[int]:
+    def reserve(
+        self, redis: FidesopsRedis, requests: List[RateLimiterRequest]
+    ) -> float:
         """
-        Increments the call count for the given requests for rate limitting.
+        Atomically reserves a call against all of the given requests.
 
-        Also sets an expire time on the redis key.
+        Returns 0 if the call was reserved, otherwise the number of seconds until
+        a call can be reserved against every request. Nothing is reserved if any
+        of the requests is breached.
         """
-        pipe = redis.pipeline()
+        script: Script = redis.register_script(self.RESERVE_SCRIPT)
+        args: List[Any] = [uuid4().hex]
         for request in requests:
-            redis_key = self.build_redis_key(
-                current_seconds=current_seconds, request=request
-            )
-            pipe.incrby(redis_key, 1)
-            pipe.expire(
-                redis_key, request.period.factor + self.EXPIRE_AFTER_PERIOD_SECONDS
-            )
-        response = pipe.execute()
+            args.extend([request.rate_limit, request.period.factor * 1000])
 
-        found_bucket_usages = []
-        for index, request in enumerate(requests):
-            # alternates between incr and expire responses
-            found_bucket_usages.append(response[index * 2])
-
-        return found_bucket_usages
+        wait_milliseconds = script(
+            keys=[self.build_redis_key(request) for request in requests], args=args
+        )
+        return int(wait_milliseconds) / 1000
 
-    def decrement_usage(
+    def record_throttled_time(
         self,
         redis: FidesopsRedis,
-        current_seconds: int,
         requests: List[RateLimiterRequest],
+        throttled_seconds: float,
     ) -> None:
         """
-        Decrements the call count for the given requests for rate limitting.
+        Adds the time spent waiting on the rate limiter to the throttle metrics
+        of each of the given request keys
         """
         pipe = redis.pipeline()
-        for request in requests:
-            redis_key = self.build_redis_key(
-                current_seconds=current_seconds, request=request
+        for key in {request.key for request in requests}:
+            pipe.hincrbyfloat(
+                self.THROTTLE_METRICS_KEY, f"{key}:seconds", throttled_seconds
             )
-            pipe.decrby(redis_key, 1)
+            pipe.hincrby(self.THROTTLE_METRICS_KEY, f"{key}:count", 1)
         pipe.execute()
 
+    def get_throttle_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the total number of seconds spent throttled and the number of
+        throttled calls for each rate limiter key, across all fidesops instances
+        """
+        metrics: Dict[str, Dict[str, float]] = {}
+        for field, value in get_cache().hgetall(self.THROTTLE_METRICS_KEY).items():
+            key, metric = field.rsplit(":", 1)
+            metrics.setdefault(key, {"seconds": 0.0, "count": 0})[metric] = (
+                float(value) if metric == "seconds" else int(value)
+            )
+        return metrics
+
     def limit(
         self, requests: List[RateLimiterRequest], timeout_seconds: int = 30
     ) -> None:
         """
-        Increments call count for the current time bucket and verifies that it is within the
-        rate limit provided. If limit is breached it will decrement the count and try again
-        until it can successfully reserve a call, or timeout. Because we rely on optimistic
-        locking for many keys at a time, it is possible that concurrent rate limiters could
-        make the wrong decision in between increment to decrement operations.
+        Reserves a call against each of the rate limits provided. If any limit is breached
+        it will sleep for exactly as long as it takes for every limit to have room for
+        another call and try again, until it can successfully reserve a call, or timeout.
+        Calls which would have to wait past the timeout fail immediately.
 
         If connection to the redis cluster fails then rate limiter will be skipped.
 
         Expiration is set on any keys which are stored in the cluster
         """
+        if not requests:
+            return
+
         try:
             redis: FidesopsRedis = get_cache()
         except RedisConnectionError as exc:
@@ -135,32 +174,27 @@ class RateLimiter:
             return
 
         start_time = time.time()
-        while time.time() - start_time < timeout_seconds:
-            current_seconds = int(time.time())
+        throttled = False
+        while True:
+            wait_seconds = self.reserve(redis=redis, requests=requests)
+            throttled_seconds = time.time() - start_time
+            if not wait_seconds:
+                if throttled:
+                    self.record_throttled_time(redis, requests, throttled_seconds)
+                return
 
-            bucket_usages = self.increment_usage(
-                redis=redis, current_seconds=current_seconds, requests=requests
-            )
+            if throttled_seconds + wait_seconds > timeout_seconds:
+                break
 
-            breached_requests = [
-                request
-                for index, request in enumerate(requests)
-                if bucket_usages[index] > request.rate_limit
-            ]
-
-            if breached_requests:
-                logger.debug(
-                    "Breached rate limits: {}. Decrementing usage and trying again.",
-                    ",".join(str(r) for r in breached_requests),
-                )
-                self.decrement_usage(
-                    redis=redis, current_seconds=current_seconds, requests=requests
-                )
-                time.sleep(0.1)
-            else:
-                # success
-                return
+            logger.debug(
+                "Breached rate limits: {}. Waiting {} seconds before trying again.",
+                ",".join(str(r) for r in requests),
+                wait_seconds,
+            )
+            time.sleep(wait_seconds)
+            throttled = True
 
-        error_message = f"Timeout waiting for rate limiter. Last breached requests: {','.join(str(r) for r in breached_requests)}"
+        self.record_throttled_time(redis, requests, time.time() - start_time)
+        error_message = f"Timeout waiting for rate limiter. Rate limited requests: {','.join(str(r) for r in requests)}"
         logger.error(error_message)
         raise RateLimiterTimeoutException(error_message)
@@ -88,9 +88,11 @@ class ManualConnector(BaseConnector[None]):
 
         query_config: ManualQueryConfig = self.query_config(node)
         action_needed: List[ManualAction] = []
-        for row in rows:
+        for row, update_value_map in zip(
+            rows, query_config.update_value_maps(rows, policy, privacy_request)
+        ):
             action: Optional[ManualAction] = query_config.generate_update_stmt(
-                row, policy, privacy_request
+                row, policy, privacy_request, update_value_map
             )
             if action:
                 action_needed.append(action)
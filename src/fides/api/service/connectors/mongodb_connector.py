@@ -126,9 +126,11 @@ class MongoDBConnector(BaseConnector[MongoClient]):
         collection_name = node.address.collection
         client = self.client()
         update_ct = 0
-        for row in rows:
+        for row, update_value_map in zip(
+            rows, query_config.update_value_maps(rows, policy, privacy_request)
+        ):
             update_stmt = query_config.generate_update_stmt(
-                row, policy, privacy_request
+                row, policy, privacy_request, update_value_map
             )
             if update_stmt is not None:
                 query, update = update_stmt
@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 import re
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
@@ -5,7 +6,7 @@ from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
 import pydash
 from boto3.dynamodb.types import TypeSerializer
 from loguru import logger
-from sqlalchemy import MetaData, Table, text
+from sqlalchemy import MetaData, Table, and_, or_, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.sql import Executable, Update  # type: ignore
 from sqlalchemy.sql.elements import ColumnElement, TextClause
@@ -123,7 +124,7 @@ class QueryConfig(Generic[T], ABC):
 
         return data
 
-    def update_value_map(  # pylint: disable=R0914
+    def update_value_map(
         self, row: Row, policy: Policy, request: PrivacyRequest
     ) -> Dict[str, Any]:
         """Map the relevant field (as strings) to be updated on the row with their masked values from Policy Rules
@@ -134,12 +135,24 @@ class QueryConfig(Generic[T], ABC):
         workplace_info.employer field, and the first element in 'children' for a given customer_id will be replaced
         with null values.
 
+        """
+        return self.update_value_maps([row], policy, request)[0]
+
+    def update_value_maps(  # pylint: disable=R0914
+        self, rows: List[Row], policy: Policy, request: PrivacyRequest
+    ) -> List[Dict[str, Any]]:
+        """Returns the update_value_map for each of the rows, masking the values of every row together.
+
+        Each rule's masking strategy is built once, and all the values targeted by a rule's field
+        across the rows are masked in a single strategy.mask call, so strategies that read their
+        secrets from the cache do so once per field rather than once per value.
         """
         rule_to_collection_field_paths: Dict[
             Rule, List[FieldPath]
         ] = self.build_rule_target_field_paths(policy)
+        field_map: Dict[FieldPath, Field] = self.field_map()
 
-        value_map: Dict[str, Any] = {}
+        value_maps: List[Dict[str, Any]] = [{} for _ in rows]
         for rule, field_paths in rule_to_collection_field_paths.items():
             strategy_config = rule.masking_strategy
             if not strategy_config:
@@ -147,14 +160,13 @@ class QueryConfig(Generic[T], ABC):
             strategy: MaskingStrategy = MaskingStrategy.get_strategy(
                 strategy_config["strategy"], strategy_config["configuration"]
             )
+            null_masking: bool = (
+                strategy_config.get("strategy") == NullMaskingStrategy.name
+            )
             for rule_field_path in field_paths:
-                masking_override: MaskingOverride = [
-                    MaskingOverride(field.data_type_converter, field.length)
-                    for field_path, field in self.field_map().items()
-                    if field_path == rule_field_path
-                ][0]
-                null_masking: bool = (
-                    strategy_config.get("strategy") == NullMaskingStrategy.name
+                field: Field = field_map[rule_field_path]
+                masking_override = MaskingOverride(
+                    field.data_type_converter, field.length
                 )
                 if not self._supported_data_type(
                     masking_override, null_masking, strategy
@@ -167,22 +179,32 @@ class QueryConfig(Generic[T], ABC):
                     )
                     continue
 
-                paths_to_mask: List[str] = [
-                    join_detailed_path(path)
+                # Gather the values to mask across all rows, remembering where each belongs
+                targets: List[Tuple[Dict[str, Any], str]] = []
+                values: List[Any] = []
+                for row, value_map in zip(rows, value_maps):
                     for path in build_refined_target_paths(
                         row, query_paths={rule_field_path: None}
-                    )
-                ]
-                for detailed_path in paths_to_mask:
-                    value_map[detailed_path] = self._generate_masked_value(
-                        request_id=request.id,
-                        strategy=strategy,
-                        val=pydash.objects.get(row, detailed_path),
-                        masking_override=masking_override,
-                        null_masking=null_masking,
-                        str_field_path=detailed_path,
-                    )
-        return value_map
+                    ):
+                        detailed_path: str = join_detailed_path(path)
+                        targets.append((value_map, detailed_path))
+                        values.append(pydash.objects.get(row, detailed_path))
+                if not values:
+                    continue
+
+                masked_values: List[Any] = self._generate_masked_values(
+                    request_id=request.id,
+                    strategy=strategy,
+                    vals=values,
+                    masking_override=masking_override,
+                    null_masking=null_masking,
+                    str_field_path=rule_field_path.string_path,
+                )
+                for (value_map, detailed_path), masked_val in zip(
+                    targets, masked_values
+                ):
+                    value_map[detailed_path] = masked_val
+        return value_maps
 
     @staticmethod
     def _supported_data_type(
@@ -200,26 +222,25 @@ class QueryConfig(Generic[T], ABC):
         return True
 
     @staticmethod
-    def _generate_masked_value(  # pylint: disable=R0913
+    def _generate_masked_values(  # pylint: disable=R0913
         request_id: str,
         strategy: MaskingStrategy,
-        val: Any,
+        vals: List[Any],
         masking_override: MaskingOverride,
         null_masking: bool,
         str_field_path: str,
-    ) -> T:
-        # masking API takes and returns lists, but here we are only leveraging single elements
-        masked_val = strategy.mask([val], request_id)[0]  # type: ignore
+    ) -> List[Any]:
+        masked_vals: List[Any] = strategy.mask(vals, request_id)  # type: ignore
 
         logger.debug(
-            "Generated the following masked val for field {}: {}",
+            "Generated {} masked values for field {}",
+            len(masked_vals),
             str_field_path,
-            masked_val,
         )
 
         # special case for null masking
         if null_masking:
-            return masked_val
+            return masked_vals
 
         if masking_override.length:
             logger.warning(
@@ -227,10 +248,13 @@ class QueryConfig(Generic[T], ABC):
                 str_field_path,
             )
             #  for strategies other than null masking we assume that masked data type is the same as specified data type
-            masked_val = masking_override.data_type_converter.truncate(  # type: ignore
-                masking_override.length, masked_val
-            )
-        return masked_val
+            masked_vals = [
+                masking_override.data_type_converter.truncate(  # type: ignore
+                    masking_override.length, masked_val
+                )
+                for masked_val in masked_vals
+            ]
+        return masked_vals
 
     @abstractmethod
     def generate_query(
@@ -250,11 +274,16 @@ class QueryConfig(Generic[T], ABC):
 
     @abstractmethod
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        update_value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[T]:
         """Generate an update statement. If there is no data to be updated
         (for example, if the policy identifies no fields to be updated)
-        returns None"""
+        returns None. The update_value_map is computed for the row if it's not passed in.
+        """
 
 
 class ManualQueryConfig(QueryConfig[Executable]):
@@ -306,10 +335,14 @@ class ManualQueryConfig(QueryConfig[Executable]):
         return manual_query
 
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        update_value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[ManualAction]:
         """Describe the details needed to manually mask data in the
-        current collection.
+        current collection. The update_value_map is computed for the row if it's not passed in.
 
         Example:
          {
@@ -330,7 +363,11 @@ class ManualQueryConfig(QueryConfig[Executable]):
                 for field_path, field in self.primary_key_field_paths.items()
             }
         )
-        update_stmt: Dict[str, Any] = self.update_value_map(row, policy, request)
+        update_stmt: Dict[str, Any] = (
+            self.update_value_map(row, policy, request)
+            if update_value_map is None
+            else update_value_map
+        )
 
         if update_stmt and locators:
             return ManualAction(locators=locators, get=None, update=update_stmt)
@@ -417,10 +454,69 @@ class SQLQueryConfig(QueryConfig[Executable]):
         return [f"{k} = :{k}" for k in fields]
 
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        update_value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[TextClause]:
         """Returns an update statement in generic SQL dialect."""
-        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
+        update = self.generate_update_query_and_params(
+            row, policy, request, update_value_map
+        )
+        if update is None:
+            return None
+
+        query_str, update_value_map = update
+        return text(query_str).params(update_value_map)
+
+    def generate_batched_update_stmts(
+        self,
+        rows: List[Row],
+        policy: Policy,
+        request: PrivacyRequest,
+        batch_size: int,
+    ) -> List[Tuple[TextClause, List[Dict[str, Any]]]]:
+        """Returns update statements for the given rows paired with the parameters for each row,
+        to be executed with executemany.
+
+        Rows that update the same set of columns share the same parameterised statement, so
+        they are grouped together and split into batches of at most `batch_size` rows.
+
+        Example:
+        [(<TextClause "UPDATE customer SET name = :name WHERE id = :id">, [{"name": None, "id": 1}, {"name": None, "id": 2}])]
+        """
+        params_by_query: Dict[str, List[Dict[str, Any]]] = {}
+        for row, update_value_map in zip(
+            rows, self.update_value_maps(rows, policy, request)
+        ):
+            update = self.generate_update_query_and_params(
+                row, policy, request, update_value_map
+            )
+            if update is None:
+                continue
+            query_str, update_value_map = update
+            params_by_query.setdefault(query_str, []).append(update_value_map)
+
+        batch_size = max(batch_size, 1)
+        return [
+            (text(query_str), params[i : i + batch_size])
+            for query_str, params in params_by_query.items()
+            for i in range(0, len(params), batch_size)
+        ]
+
+    def generate_update_query_and_params(
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        update_value_map: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Returns the parameterised update query string for the row along with the
+        masked values and primary keys to bind to it. The row's update_value_map is
+        computed if it's not passed in."""
+        if update_value_map is None:
+            update_value_map = self.update_value_map(row, policy, request)
         update_clauses: list[str] = self.format_key_map_for_update_stmt(
             list(update_value_map.keys())
         )
@@ -451,7 +547,7 @@ class SQLQueryConfig(QueryConfig[Executable]):
             pk_clauses,
         )
         logger.info("query = {}, params = {}", Pii(query_str), Pii(update_value_map))
-        return text(query_str).params(update_value_map)
+        return query_str, update_value_map
 
     def query_to_str(self, t: TextClause, input_data: Dict[str, List[Any]]) -> str:
         """string representation of a query for logging/dry-run"""
@@ -635,14 +731,108 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
         BigQuery reserved words."""
         return f'SELECT {field_list} FROM `{self.node.node.collection.name}` WHERE {" OR ".join(clauses)}'
 
-    def generate_update(
-        self, row: Row, policy: Policy, request: PrivacyRequest, client: Engine
+    def generate_update(  # pylint: disable=R0913
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        client: Engine,
+        update_value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[Update]:
         """
         Using TextClause to insert 'None' values into BigQuery throws an exception, so we use update clause instead.
         Returns a SQLAlchemy Update object. Does not actually execute the update object.
         """
-        update_value_map: Dict[str, Any] = self.update_value_map(row, policy, request)
+        update = self._generate_update_value_map_and_primary_keys(
+            row, policy, request, update_value_map
+        )
+        if update is None:
+            return None
+
+        update_value_map, non_empty_primary_keys = update
+        table = Table(
+            self.node.address.collection, MetaData(bind=client), autoload=True
+        )
+        pk_clauses: List[ColumnElement] = [
+            getattr(table.c, k) == v for k, v in non_empty_primary_keys.items()
+        ]
+        return table.update().where(*pk_clauses).values(**update_value_map)
+
+    def generate_batched_updates(
+        self,
+        rows: List[Row],
+        policy: Policy,
+        request: PrivacyRequest,
+        client: Engine,
+        batch_size: int,
+    ) -> List[Update]:
+        """
+        Returns Update objects for the given rows. Rows that are masked to exactly the same values
+        are combined into a single UPDATE, matching up to `batch_size` rows by primary key, which keeps
+        the number of DML statements run against BigQuery low. The table is only reflected once.
+        """
+        table = Table(
+            self.node.address.collection, MetaData(bind=client), autoload=True
+        )
+
+        def pk_clause(non_empty_primary_keys: Dict[str, Any]) -> ColumnElement:
+            return and_(
+                *[getattr(table.c, k) == v for k, v in non_empty_primary_keys.items()]
+            )
+
+        grouped: Dict[Any, Tuple[Dict[str, Any], List[Dict[str, Any]]]] = {}
+        updates: List[Update] = []
+        for row, row_update_value_map in zip(
+            rows, self.update_value_maps(rows, policy, request)
+        ):
+            update = self._generate_update_value_map_and_primary_keys(
+                row, policy, request, row_update_value_map
+            )
+            if update is None:
+                continue
+            update_value_map, non_empty_primary_keys = update
+            try:
+                group_key = tuple(sorted(update_value_map.items()))
+                hash(group_key)
+            except TypeError:
+                # Masked values that can't be compared are updated individually
+                updates.append(
+                    table.update()
+                    .where(pk_clause(non_empty_primary_keys))
+                    .values(**update_value_map)
+                )
+                continue
+            grouped.setdefault(group_key, (update_value_map, []))[1].append(
+                non_empty_primary_keys
+            )
+
+        batch_size = max(batch_size, 1)
+        for update_value_map, primary_keys in grouped.values():
+            for i in range(0, len(primary_keys), batch_size):
+                updates.append(
+                    table.update()
+                    .where(
+                        or_(
+                            *[
+                                pk_clause(pks)
+                                for pks in primary_keys[i : i + batch_size]
+                            ]
+                        )
+                    )
+                    .values(**update_value_map)
+                )
+        return updates
+
+    def _generate_update_value_map_and_primary_keys(
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        update_value_map: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Returns the masked values for the row along with the primary keys that identify it"""
+        if update_value_map is None:
+            update_value_map = self.update_value_map(row, policy, request)
         non_empty_primary_keys: Dict[str, Field] = filter_nonempty_values(
             {
                 fpath.string_path: fld.cast(row[fpath.string_path])
@@ -658,14 +848,7 @@ class BigQueryQueryConfig(QueryStringWithoutTuplesOverrideQueryConfig):
                 self.node.address,
             )
             return None
-
-        table = Table(
-            self.node.address.collection, MetaData(bind=client), autoload=True
-        )
-        pk_clauses: List[ColumnElement] = [
-            getattr(table.c, k) == v for k, v in non_empty_primary_keys.items()
-        ]
-        return table.update().where(*pk_clauses).values(**update_value_map)
+        return update_value_map, non_empty_primary_keys
 
 
 MongoStatement = Tuple[Dict[str, Any], Dict[str, Any]]
@@ -724,10 +907,18 @@ class MongoQueryConfig(QueryConfig[MongoStatement]):
         return None
 
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        update_value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[MongoStatement]:
         """Generate a SQL update statement in the form of Mongo update statement components"""
-        update_clauses = self.update_value_map(row, policy, request)
+        update_clauses = (
+            self.update_value_map(row, policy, request)
+            if update_value_map is None
+            else update_value_map
+        )
 
         pk_clauses: Dict[str, Any] = filter_nonempty_values(
             {
@@ -806,13 +997,21 @@ class DynamoDBQueryConfig(QueryConfig[DynamoDBStatement]):
         return query_param
 
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        update_value_map: Optional[Dict[str, Any]] = None,
     ) -> Optional[DynamoDBStatement]:
         """
         Generate a Dictionary that contains necessary items to
         run a PUT operation against DynamoDB
         """
-        update_clauses = self.update_value_map(row, policy, request)
+        update_clauses = (
+            self.update_value_map(row, policy, request)
+            if update_value_map is None
+            else update_value_map
+        )
 
         if update_clauses:
             serializer = TypeSerializer()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import email
 import re
+import socket
 import time
 from functools import wraps
 from time import sleep
@@ -10,6 +11,9 @@ from urllib.parse import urlparse
 
 from loguru import logger
 from requests import PreparedRequest, Request, Response, Session
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 from fides.api.common_exceptions import (
     ClientUnsuccessfulException,
@@ -21,7 +25,7 @@ from fides.api.service.connectors.limiter.rate_limiter import (
     RateLimiterPeriod,
     RateLimiterRequest,
 )
-from fides.api.util.saas_util import deny_unsafe_hosts
+from fides.api.util.saas_util import deny_unsafe_hosts, resolve_safe_host_ip
 from fides.config import CONFIG
 
 if TYPE_CHECKING:
@@ -31,6 +35,57 @@ if TYPE_CHECKING:
     from fides.api.schemas.saas.shared_schemas import SaaSRequestParams
 
 
+class SafeHostConnectionMixin:
+    """
+    Opens the socket to the IP address the host was verified to resolve to, rather than letting
+    the connection resolve the host again. Otherwise, a DNS record that changes between the check
+    and the connection could point the request at an unsafe address (DNS rebinding).
+
+    The host is only swapped for the IP address while the socket is opened, so the Host header,
+    TLS server name indication and certificate verification still use the host.
+    """
+
+    _dns_host: str
+
+    def _new_conn(self) -> socket.socket:
+        if CONFIG.dev_mode:
+            return super()._new_conn()  # type: ignore[misc]
+
+        host = self._dns_host
+        self._dns_host = resolve_safe_host_ip(host)
+        try:
+            return super()._new_conn()  # type: ignore[misc]
+        finally:
+            self._dns_host = host
+
+
+class SafeHTTPConnection(SafeHostConnectionMixin, HTTPConnection):
+    pass
+
+
+class SafeHTTPSConnection(SafeHostConnectionMixin, HTTPSConnection):
+    pass
+
+
+class SafeHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = SafeHTTPConnection
+
+
+class SafeHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = SafeHTTPSConnection
+
+
+class SafeHostAdapter(HTTPAdapter):
+    """Transport adapter whose connections are pinned to the verified IP address of their host"""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": SafeHTTPConnectionPool,
+            "https": SafeHTTPSConnectionPool,
+        }
+
+
 class AuthenticatedClient:
     """
     A helper class to build authenticated HTTP requests based on
@@ -43,8 +98,13 @@ class AuthenticatedClient:
         configuration: ConnectionConfig,
         client_config: ClientConfig,
         rate_limit_config: Optional[RateLimitConfig] = None,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
     ):
         self.session = Session()
+        # pool_maxsize caps the connections kept open to each host, which should be at
+        # least the number of threads sending requests through this client at once
+        self.session.mount("http://", SafeHostAdapter(pool_maxsize=pool_maxsize))
+        self.session.mount("https://", SafeHostAdapter(pool_maxsize=pool_maxsize))
         self.uri = uri
         self.configuration = configuration
         self.client_config = client_config
@@ -209,8 +269,12 @@ class AuthenticatedClient:
         if not prepared_request.url:
             raise ValueError("The URL for the prepared request is missing.")
 
-        # extract the hostname from the complete URL and verify its safety
-        deny_unsafe_hosts(urlparse(prepared_request.url).netloc)
+        # extract the hostname from the complete URL and verify its safety. The verified IP address
+        # is cached, and the connection for the request is opened to that same address.
+        hostname: Optional[str] = urlparse(prepared_request.url).hostname
+        if not hostname:
+            raise ValueError("The URL for the prepared request is missing a host.")
+        deny_unsafe_hosts(hostname)
 
         response = self.session.send(prepared_request)
 
@@ -1,9 +1,12 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from json import JSONDecodeError
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import pydash
 from loguru import logger
 from requests import Response
+from requests.adapters import DEFAULT_POOLSIZE
 from sqlalchemy.orm import Session
 
 from fides.api.common_exceptions import (
@@ -24,9 +27,15 @@ from fides.api.schemas.saas.saas_config import (
 )
 from fides.api.schemas.saas.shared_schemas import SaaSRequestParams
 from fides.api.service.connectors.base_connector import BaseConnector
-from fides.api.service.connectors.saas.authenticated_client import AuthenticatedClient
+from fides.api.service.connectors.saas.authenticated_client import (
+    AuthenticatedClient,
+    RequestFailureResponseException,
+)
 from fides.api.service.connectors.saas_query_config import SaaSQueryConfig
 from fides.api.service.pagination.pagination_strategy import PaginationStrategy
+from fides.api.service.pagination.pagination_strategy_offset import (
+    OffsetPaginationStrategy,
+)
 from fides.api.service.processors.post_processor_strategy.post_processor_strategy import (
     PostProcessorStrategy,
 )
@@ -144,15 +153,18 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         host = client_config.host
         return f"{client_config.protocol}://{assign_placeholders(host, self.secrets)}"
 
-    def create_client(self) -> AuthenticatedClient:
-        """Creates an authenticated request builder"""
+    def create_client(
+        self, pool_maxsize: int = DEFAULT_POOLSIZE
+    ) -> AuthenticatedClient:
+        """Creates an authenticated request builder, keeping up to `pool_maxsize`
+        connections open to the host for requests sent concurrently"""
         uri = self.build_uri()
         client_config = self.get_client_config()
         rate_limit_config = self.get_rate_limit_config()
 
         logger.info("Creating client to {}", uri)
         return AuthenticatedClient(
-            uri, self.configuration, client_config, rate_limit_config
+            uri, self.configuration, client_config, rate_limit_config, pool_maxsize
         )
 
     def retrieve_data(
@@ -200,7 +212,11 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         if custom_privacy_request_fields:
             input_data[CUSTOM_PRIVACY_REQUEST_FIELDS] = [custom_privacy_request_fields]
 
+        concurrent_requests = self.saas_config.concurrent_requests or 1
+        identity_data = privacy_request.get_cached_identity_data()
+
         rows: List[Row] = []
+        concurrent_reads: List[Tuple[SaaSRequest, SaaSRequestParams]] = []
         for read_request in read_requests:
             self.set_saas_request_state(read_request)
             # check all the values specified by param_values are provided in input_data
@@ -225,6 +241,14 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
                 input_data, policy, read_request
             )
 
+            if concurrent_requests > 1:
+                # defer execution until every read request has been prepared
+                concurrent_reads.extend(
+                    (read_request, prepared_request)
+                    for prepared_request in prepared_requests
+                )
+                continue
+
             # Iterates through initial list of prepared requests and through subsequent
             # requests generated by pagination. The results are added to the output
             # list of rows after each request.
@@ -232,13 +256,163 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
                 while next_request:
                     processed_rows, next_request = self.execute_prepared_request(  # type: ignore
                         next_request,
-                        privacy_request.get_cached_identity_data(),
+                        identity_data,
                         read_request,
                     )
                     rows.extend(processed_rows)
+
+        if concurrent_reads:
+            rows = self._execute_prepared_requests_concurrently(
+                concurrent_reads, identity_data, concurrent_requests
+            )
         self.unset_connector_state()
         return rows
 
+    def _execute_prepared_requests_concurrently(
+        self,
+        reads: List[Tuple[SaaSRequest, SaaSRequestParams]],
+        identity_data: Dict[str, Any],
+        concurrent_requests: int,
+    ) -> List[Row]:
+        """
+        Executes the prepared requests, and the requests for their subsequent pages, using up
+        to `concurrent_requests` threads. A single offset-paginated request has its pages
+        fetched concurrently instead.
+
+        Each request is sent through a client built from its own client and rate limit
+        configs, shared by the requests with the same configs, with a connection pool sized
+        for the number of concurrent requests. Rows are returned in the same order as they
+        would be if the requests were executed sequentially.
+        """
+        clients: List[AuthenticatedClient] = self._create_read_clients(
+            [read_request for read_request, _ in reads], concurrent_requests
+        )
+        with ExitStack() as stack, ThreadPoolExecutor(
+            max_workers=concurrent_requests
+        ) as executor:
+            for client in set(clients):
+                stack.enter_context(client.session)
+
+            if len(reads) == 1:
+                read_request, prepared_request = reads[0]
+                rows: List[Row] = self._execute_paginated_request(
+                    clients[0],
+                    read_request,
+                    prepared_request,
+                    identity_data,
+                    executor,
+                    concurrent_requests,
+                )
+            else:
+                results = executor.map(
+                    lambda client, read: self._execute_paginated_request(
+                        client, read[0], read[1], identity_data
+                    ),
+                    clients,
+                    reads,
+                )
+                rows = [row for processed_rows in results for row in processed_rows]
+        return rows
+
+    def _create_read_clients(
+        self, read_requests: List[SaaSRequest], pool_maxsize: int
+    ) -> List[AuthenticatedClient]:
+        """
+        Returns the client to send each read request through. Read requests can override the
+        client and rate limit configs, so one client is created for each distinct pair of
+        configs and shared by the read requests that resolve to it.
+        """
+        clients_by_config: Dict[Tuple[str, Optional[str]], AuthenticatedClient] = {}
+        clients: List[AuthenticatedClient] = []
+        for read_request in read_requests:
+            self.set_saas_request_state(read_request)
+            rate_limit_config: Optional[RateLimitConfig] = self.get_rate_limit_config()
+            config_key: Tuple[str, Optional[str]] = (
+                self.get_client_config().json(),
+                rate_limit_config.json() if rate_limit_config else None,
+            )
+            if config_key not in clients_by_config:
+                clients_by_config[config_key] = self.create_client(
+                    pool_maxsize=pool_maxsize
+                )
+            clients.append(clients_by_config[config_key])
+        return clients
+
+    def _execute_paginated_request(
+        self,
+        client: AuthenticatedClient,
+        saas_request: SaaSRequest,
+        prepared_request: SaaSRequestParams,
+        identity_data: Dict[str, Any],
+        executor: Optional[ThreadPoolExecutor] = None,
+        concurrent_requests: int = 1,
+    ) -> List[Row]:
+        """
+        Executes the prepared request and the requests for all of its subsequent pages.
+
+        If an executor is provided and the request uses offset pagination, the next
+        `concurrent_requests` pages are fetched at once. Pages fetched past the last
+        page are discarded. Many APIs respond with an error for an offset past the end
+        of the data, so a failed request for a page after a page with fewer records than
+        the ones before it is treated as the end of the data instead.
+        """
+        strategy: Optional[PaginationStrategy] = None
+        if executor and saas_request.pagination:
+            strategy = PaginationStrategy.get_strategy(
+                saas_request.pagination.strategy,
+                saas_request.pagination.configuration,
+            )
+
+        rows: List[Row] = []
+        page_size = 0
+        short_page = False
+        next_request: Optional[SaaSRequestParams] = prepared_request
+        while next_request:
+            if not isinstance(strategy, OffsetPaginationStrategy):
+                processed_rows, next_request = self.execute_prepared_request(
+                    next_request, identity_data, saas_request, client
+                )
+                rows.extend(processed_rows)
+                continue
+
+            page_requests = [
+                next_request,
+                *strategy.get_page_requests(
+                    next_request, self.secrets, concurrent_requests - 1
+                ),
+            ]
+            pages: List[Future] = [
+                executor.submit(  # type: ignore
+                    self._execute_page_request,
+                    page_request,
+                    identity_data,
+                    saas_request,
+                    client,
+                )
+                for page_request in page_requests
+            ]
+            for page in pages:
+                try:
+                    processed_rows, next_request, record_count = page.result()
+                except RequestFailureResponseException:
+                    if not short_page:
+                        raise
+                    logger.info(
+                        "Treating the failed request for the page after the last full page of '{}' as the end of the data.",
+                        self.current_collection_name,
+                    )
+                    next_request = None
+                    break
+                rows.extend(processed_rows)
+                if not next_request:
+                    break
+                short_page = record_count < page_size
+                page_size = max(page_size, record_count)
+
+            for page in pages:
+                page.cancel()
+        return rows
+
     def _missing_dataset_reference_values(
         self, input_data: Dict[str, Any], param_values: Optional[List[ParamValue]]
     ) -> List[str]:
@@ -277,16 +451,38 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
         prepared_request: SaaSRequestParams,
         identity_data: Dict[str, Any],
         saas_request: SaaSRequest,
+        client: Optional[AuthenticatedClient] = None,
     ) -> Tuple[List[Row], Optional[SaaSRequestParams]]:
         """
         Executes the prepared request and handles response postprocessing and pagination.
         Returns processed data and request_params for next page of data if available.
         """
+        rows, next_request, _ = self._execute_page_request(
+            prepared_request, identity_data, saas_request, client
+        )
+        return rows, next_request
 
-        client: AuthenticatedClient = self.create_client()
+    def _execute_page_request(
+        self,
+        prepared_request: SaaSRequestParams,
+        identity_data: Dict[str, Any],
+        saas_request: SaaSRequest,
+        client: Optional[AuthenticatedClient] = None,
+    ) -> Tuple[List[Row], Optional[SaaSRequestParams], int]:
+        """
+        Same as execute_prepared_request, also returning the number of records in the
+        response before postprocessing, to compare the size of each page
+        """
+
+        client = client or self.create_client()
         response: Response = client.send(prepared_request, saas_request.ignore_errors)
         response = self._handle_errored_response(saas_request, response)
         response_data = self._unwrap_response_data(saas_request, response)
+        record_count: int = (
+            len(response_data)
+            if isinstance(response_data, list)
+            else int(bool(response_data))
+        )
 
         # process response and add to rows
         rows = self.process_response_data(
@@ -319,7 +515,7 @@ class SaaSConnector(BaseConnector[AuthenticatedClient]):
                 self.current_collection_name,
             )
 
-        return rows, next_request
+        return rows, next_request, record_count
 
     def process_response_data(
         self,
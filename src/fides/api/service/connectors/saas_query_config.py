@@ -317,7 +317,11 @@ class SaaSQueryConfig(QueryConfig[SaaSRequestParams]):
         return saas_request_params
 
     def generate_update_stmt(
-        self, row: Row, policy: Policy, request: PrivacyRequest
+        self,
+        row: Row,
+        policy: Policy,
+        request: PrivacyRequest,
+        update_value_map: Optional[Dict[str, Any]] = None,
     ) -> SaaSRequestParams:
         """
         This returns the method, path, header, query, and body params needed to make an API call.
@@ -326,7 +330,7 @@ class SaaSQueryConfig(QueryConfig[SaaSRequestParams]):
         """
         current_request: SaaSRequest = self.get_masking_request()  # type: ignore
         param_values: Dict[str, Any] = self.generate_update_param_values(
-            row, policy, request, current_request
+            row, policy, request, current_request, update_value_map
         )
 
         return self.generate_update_request_params(param_values, current_request)
@@ -349,16 +353,18 @@ class SaaSQueryConfig(QueryConfig[SaaSRequestParams]):
 
         return self.generate_update_request_params(param_values, consent_request)
 
-    def generate_update_param_values(  # pylint: disable=R0914
+    def generate_update_param_values(  # pylint: disable=R0913, R0914
         self,
         row: Row,
         policy: Policy,
         privacy_request: PrivacyRequest,
         saas_request: SaaSRequest,
+        update_value_map: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         A utility that generates the update request param values
         based on the provided inputs for the given SaaSRequest.
+        The row's update_value_map is computed if it's not passed in.
 
         The update param values are returned as a `dict`. The
         `masked_object_fields` key maps to a JSON structure that holds
@@ -410,9 +416,8 @@ class SaaSQueryConfig(QueryConfig[SaaSRequestParams]):
                 pydash.unset(row, field_path.string_path)
 
         # mask row values
-        update_value_map: Dict[str, Any] = self.update_value_map(
-            row, policy, privacy_request
-        )
+        if update_value_map is None:
+            update_value_map = self.update_value_map(row, policy, privacy_request)
         masked_object: Dict[str, Any] = unflatten_dict(update_value_map)
 
         # map of all values including those not being masked/updated
@@ -51,6 +51,7 @@ from fides.api.service.connectors.query_config import (
     SnowflakeQueryConfig,
     SQLQueryConfig,
 )
+from fides.api.service.connectors.sql_engine_registry import sql_engine_registry
 from fides.api.util.collection_util import Row
 from fides.config import get_config
 
@@ -74,6 +75,7 @@ class SQLConnector(BaseConnector[Engine]):
                 "SQL Connectors must define their secrets schema class"
             )
         self.ssh_server: sshtunnel._ForwardServer = None
+        self.shared_engine = False
 
     @staticmethod
     def cursor_result_to_rows(results: CursorResult) -> List[Row]:
@@ -155,12 +157,17 @@ class SQLConnector(BaseConnector[Engine]):
         input_data: Dict[str, List[Any]],
     ) -> int:
         """Execute a masking request. Returns the number of records masked"""
+        if CONFIG.execution.masking_batch_size > 0:
+            return self.mask_data_in_batches(node, policy, privacy_request, rows)
+
         query_config = self.query_config(node)
         update_ct = 0
         client = self.client()
-        for row in rows:
+        for row, update_value_map in zip(
+            rows, query_config.update_value_maps(rows, policy, privacy_request)
+        ):
             update_stmt: Optional[TextClause] = query_config.generate_update_stmt(
-                row, policy, privacy_request
+                row, policy, privacy_request, update_value_map
             )
             if update_stmt is not None:
                 with client.connect() as connection:
@@ -169,14 +176,75 @@ class SQLConnector(BaseConnector[Engine]):
                     update_ct = update_ct + results.rowcount
         return update_ct
 
+    def mask_data_in_batches(
+        self,
+        node: TraversalNode,
+        policy: Policy,
+        privacy_request: PrivacyRequest,
+        rows: List[Row],
+    ) -> int:
+        """Execute a masking request, sending rows that update the same columns to the
+        database together with executemany, in batches of CONFIG.execution.masking_batch_size.
+        All batches for the collection are run on a single connection within one transaction.
+        Returns the number of records masked"""
+        query_config = self.query_config(node)
+        update_ct = 0
+        client = self.client()
+        batches = query_config.generate_batched_update_stmts(
+            rows, policy, privacy_request, CONFIG.execution.masking_batch_size
+        )
+        if not batches:
+            return update_ct
+
+        with client.begin() as connection:
+            self.set_schema(connection)
+            for update_stmt, params in batches:
+                results: LegacyCursorResult = connection.execute(update_stmt, params)
+                if len(params) == 1 or connection.dialect.supports_sane_multi_rowcount:
+                    update_ct = update_ct + results.rowcount
+                else:
+                    # Not every DBAPI reports the total row count for executemany
+                    logger.info(
+                        "Row count not reported for a batch of {} updates on {}, estimating one row masked per update",
+                        len(params),
+                        node.address,
+                    )
+                    update_ct = update_ct + len(params)
+        return update_ct
+
+    def client(self) -> Engine:
+        """Return the Engine for this connection, from the shared engine registry if
+        CONFIG.execution.reuse_sql_engines is enabled"""
+        if not self.db_client and CONFIG.execution.reuse_sql_engines:
+            self.db_client = sql_engine_registry.acquire(self)
+            self.shared_engine = True
+        return super().client()
+
     def close(self) -> None:
         """Close any held resources"""
+        if self.db_client and self.shared_engine:
+            # Shared engines stay open for the next privacy request
+            sql_engine_registry.release(self.db_client)
+            self.db_client = None
+            self.shared_engine = False
         if self.db_client:
             logger.debug(" disposing of {}", self.__class__)
             self.db_client.dispose()
         if self.ssh_server:
             self.ssh_server.stop()
 
+    def engine_pool_options(self) -> Dict[str, Any]:
+        """Connection pool options for create_engine. Engines that are shared across privacy
+        requests use the configured pool sizes and check connections before using them.
+        """
+        if not CONFIG.execution.reuse_sql_engines:
+            return {}
+        return {
+            "pool_size": CONFIG.execution.sql_engine_pool_size,
+            "max_overflow": CONFIG.execution.sql_engine_max_overflow,
+            "pool_pre_ping": True,
+        }
+
     def create_client(self) -> Engine:
         """Returns a SQLAlchemy Engine that can be used to interact with a database"""
         uri = (self.configuration.secrets or {}).get("url") or self.build_uri()
@@ -184,6 +252,7 @@ class SQLConnector(BaseConnector[Engine]):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.engine_pool_options(),
         )
 
     def set_schema(self, connection: Connection) -> None:
@@ -268,6 +337,7 @@ class PostgreSQLConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.engine_pool_options(),
         )
 
     def set_schema(self, connection: Connection) -> None:
@@ -336,6 +406,7 @@ class MySQLConnector(SQLConnector):
             uri,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.engine_pool_options(),
         )
 
     @staticmethod
@@ -424,6 +495,7 @@ class RedshiftConnector(SQLConnector):
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
             connect_args=connect_args,
+            **self.engine_pool_options(),
         )
 
     def set_schema(self, connection: Connection) -> None:
@@ -471,6 +543,7 @@ class BigQueryConnector(SQLConnector):
             credentials_info=credentials_info,
             hide_parameters=self.hide_parameters,
             echo=not self.hide_parameters,
+            **self.engine_pool_options(),
         )
 
     # Overrides SQLConnector.query_config
@@ -490,9 +563,25 @@ class BigQueryConnector(SQLConnector):
         query_config = self.query_config(node)
         update_ct = 0
         client = self.client()
-        for row in rows:
+        if CONFIG.execution.masking_batch_size > 0:
+            updates: List[Executable] = query_config.generate_batched_updates(
+                rows,
+                policy,
+                privacy_request,
+                client,
+                CONFIG.execution.masking_batch_size,
+            )
+            with client.connect() as connection:
+                for update in updates:
+                    batch_results: LegacyCursorResult = connection.execute(update)
+                    update_ct = update_ct + batch_results.rowcount
+            return update_ct
+
+        for row, update_value_map in zip(
+            rows, query_config.update_value_maps(rows, policy, privacy_request)
+        ):
             update_stmt: Optional[Executable] = query_config.generate_update(
-                row, policy, privacy_request, client
+                row, policy, privacy_request, client, update_value_map
             )
             if update_stmt is not None:
                 with client.connect() as connection:
@@ -0,0 +1,149 @@
+import hashlib
+import json
+from threading import RLock
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import sshtunnel  # type: ignore
+from loguru import logger
+from sqlalchemy.engine import Engine
+
+from fides.api.models.connectionconfig import ConnectionConfig
+from fides.config import CONFIG
+
+if TYPE_CHECKING:
+    from fides.api.service.connectors.sql_connector import SQLConnector
+
+
+class SQLEngineRegistryEntry:
+    """An engine, and the SSH tunnel it connects through if any, shared by every
+    connector built from the same ConnectionConfig and secrets"""
+
+    def __init__(
+        self,
+        connection_key: str,
+        engine: Engine,
+        ssh_server: Optional[sshtunnel.SSHTunnelForwarder],
+    ):
+        self.connection_key = connection_key
+        self.engine = engine
+        self.ssh_server = ssh_server
+        self.in_use = 0
+        self.last_used = monotonic()
+
+    def dispose(self) -> None:
+        """Close the pooled connections and the SSH tunnel"""
+        logger.debug("Disposing of shared engine for {}", self.connection_key)
+        self.engine.dispose()
+        if self.ssh_server:
+            self.ssh_server.stop()
+
+
+class SQLEngineRegistry:
+    """
+    Process-wide registry of SQLAlchemy engines for SQL connectors, so that the connection pool
+    and SSH tunnel for a database are reused across privacy requests instead of being rebuilt
+    for every request. Enabled with CONFIG.execution.reuse_sql_engines.
+
+    Entries are keyed by the ConnectionConfig key and a hash of its secrets, so updating the
+    secrets of a connection (in this process or any other) results in a new engine, and the
+    engines built with the previous secrets are disposed of once they are no longer in use.
+    Entries that have not been used for CONFIG.execution.sql_engine_idle_timeout seconds are
+    disposed of as well.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, SQLEngineRegistryEntry] = {}
+        # Invalidated entries that are still in use, disposed of once released
+        self._retired: List[SQLEngineRegistryEntry] = []
+        self._lock = RLock()
+
+    @staticmethod
+    def registry_key(configuration: ConnectionConfig) -> str:
+        """Returns the registry key for the given ConnectionConfig:
+        the ConnectionConfig key followed by a digest of its secrets"""
+        secrets_digest = hashlib.sha256(
+            json.dumps(configuration.secrets or {}, sort_keys=True, default=str).encode(
+                CONFIG.security.encoding
+            )
+        ).hexdigest()
+        return f"{configuration.key}:{secrets_digest}"
+
+    def acquire(self, connector: "SQLConnector") -> Engine:
+        """Return the shared engine for the connector's ConnectionConfig, creating it if needed.
+        Every call must be paired with a call to `release` once the connector is closed.
+        """
+        key = self.registry_key(connector.configuration)
+        with self._lock:
+            self.evict_idle()
+            entry = self._entries.get(key)
+            if not entry:
+                # Any engine for this connection built with different secrets is out of date
+                self.invalidate(connector.configuration.key)
+                logger.info(
+                    "Creating shared engine for {}", connector.configuration.key
+                )
+                engine = connector.create_client()
+                entry = SQLEngineRegistryEntry(
+                    connector.configuration.key, engine, connector.ssh_server
+                )
+                # The tunnel is now owned by the registry rather than the connector
+                connector.ssh_server = None
+                self._entries[key] = entry
+
+            entry.in_use += 1
+            entry.last_used = monotonic()
+            return entry.engine
+
+    def release(self, engine: Engine) -> None:
+        """Mark one use of the given engine as finished"""
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.engine is engine:
+                    entry.in_use = max(entry.in_use - 1, 0)
+                    entry.last_used = monotonic()
+                    return
+
+            for entry in self._retired:
+                if entry.engine is engine:
+                    entry.in_use = max(entry.in_use - 1, 0)
+                    if not entry.in_use:
+                        self._retired.remove(entry)
+                        entry.dispose()
+                    return
+
+    def invalidate(self, connection_key: str) -> None:
+        """Dispose of the engines built for the given ConnectionConfig key. Engines that
+        are still in use are disposed of as soon as they are released."""
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.connection_key != connection_key:
+                    continue
+                del self._entries[key]
+                if entry.in_use:
+                    self._retired.append(entry)
+                else:
+                    entry.dispose()
+
+    def evict_idle(self) -> None:
+        """Dispose of engines that have not been used within the idle timeout"""
+        now = monotonic()
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if (
+                    not entry.in_use
+                    and now - entry.last_used > CONFIG.execution.sql_engine_idle_timeout
+                ):
+                    del self._entries[key]
+                    entry.dispose()
+
+    def dispose_all(self) -> None:
+        """Dispose of every engine held by the registry"""
+        with self._lock:
+            for entry in [*self._entries.values(), *self._retired]:
+                entry.dispose()
+            self._entries.clear()
+            self._retired.clear()
+
+
+sql_engine_registry = SQLEngineRegistry()
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pydash
 from loguru import logger
@@ -43,19 +43,7 @@ class OffsetPaginationStrategy(PaginationStrategy):
             )
 
         # increment param value and return None if limit has been reached to indicate there are no more pages
-        limit: Optional[Union[int, ConnectorParamRef]] = self.limit
-        if isinstance(self.limit, ConnectorParamRef):
-            limit = connector_params.get(self.limit.connector_param)
-            if limit is None:
-                raise FidesopsException(
-                    f"Unable to find value for 'limit' with the connector_param reference '{self.limit.connector_param}'"
-                )
-            try:
-                limit = int(limit)
-            except ValueError:
-                raise FidesopsException(
-                    f"The value '{limit}' of the '{self.limit.connector_param}' connector_param could not be cast to an int"
-                )
+        limit = self.get_limit(connector_params)
         param_value += self.increment_by
         if limit and param_value > limit:
             logger.info("Pagination limit has been reached")
@@ -71,6 +59,60 @@ class OffsetPaginationStrategy(PaginationStrategy):
             body=request_params.body,
         )
 
+    def get_page_requests(
+        self,
+        request_params: SaaSRequestParams,
+        connector_params: Dict[str, Any],
+        count: int,
+    ) -> List[SaaSRequestParams]:
+        """
+        Build requests for up to `count` pages following the given request without waiting
+        for a response, so the pages can be fetched concurrently. Pages past the end of the
+        data are expected to come back empty.
+        """
+        param_value = request_params.query_params.get(self.incremental_param)
+        if param_value is None:
+            raise FidesopsException(
+                f"Unable to find query param named '{self.incremental_param}' in request"
+            )
+
+        limit = self.get_limit(connector_params)
+        page_requests: List[SaaSRequestParams] = []
+        for _ in range(count):
+            param_value += self.increment_by
+            if limit and param_value > limit:
+                break
+            page_requests.append(
+                SaaSRequestParams(
+                    method=request_params.method,
+                    headers=request_params.headers,
+                    path=request_params.path,
+                    query_params={
+                        **request_params.query_params,
+                        self.incremental_param: param_value,
+                    },
+                    body=request_params.body,
+                )
+            )
+        return page_requests
+
+    def get_limit(self, connector_params: Dict[str, Any]) -> Optional[int]:
+        """Returns the configured limit, resolving any connector param reference"""
+        limit: Optional[Union[int, ConnectorParamRef]] = self.limit
+        if isinstance(self.limit, ConnectorParamRef):
+            limit = connector_params.get(self.limit.connector_param)
+            if limit is None:
+                raise FidesopsException(
+                    f"Unable to find value for 'limit' with the connector_param reference '{self.limit.connector_param}'"
+                )
+            try:
+                limit = int(limit)
+            except ValueError:
+                raise FidesopsException(
+                    f"The value '{limit}' of the '{self.limit.connector_param}' connector_param could not be cast to an int"
+                )
+        return limit  # type: ignore
+
     def validate_request(self, request: Dict[str, Any]) -> None:
         """Ensures that the query param specified by 'incremental_param' exists in the request"""
         query_params = (
@@ -0,0 +1,153 @@
+import hashlib
+import json
+from itertools import chain
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from fides.api.common_exceptions import RedisConnectionError
+from fides.api.graph.config import GraphDataset
+from fides.api.graph.graph import DatasetGraph
+from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
+from fides.api.models.datasetconfig import DatasetConfig
+from fides.api.models.sql_models import Dataset as CtlDataset  # type: ignore
+from fides.api.util.cache import get_cache
+from fides.config import CONFIG
+
+DATASET_GRAPH_GENERATION_KEY = "dataset_graph_generation"
+DATASET_GRAPH_CHANGED = "dataset_graph_changed"
+
+
+class CompiledDatasetGraph:
+    """The access/erasure and consent graphs built from every DatasetConfig, for a given version"""
+
+    def __init__(
+        self, version: str, graph: DatasetGraph, consent_graph: DatasetGraph
+    ) -> None:
+        self.version = version
+        self.graph = graph
+        self.consent_graph = consent_graph
+
+
+# The compiled graph for the latest version, see get_compiled_dataset_graph
+_compiled_dataset_graph: Dict[str, CompiledDatasetGraph] = {}
+_compiled_dataset_graph_lock = Lock()
+
+
+def build_consent_dataset_graph(datasets: List[DatasetConfig]) -> DatasetGraph:
+    """
+    Build the starting DatasetGraph for consent requests.
+
+    Consent Graph has one node per dataset.  Nodes must be of saas type and have consent requests defined.
+    """
+    consent_datasets: List[GraphDataset] = []
+
+    for dataset_config in datasets:
+        connection_type: ConnectionType = (
+            dataset_config.connection_config.connection_type  # type: ignore
+        )
+        saas_config: Optional[Dict] = dataset_config.connection_config.saas_config
+        if (
+            connection_type == ConnectionType.saas
+            and saas_config
+            and saas_config.get("consent_requests")
+        ):
+            consent_datasets.append(
+                dataset_config.get_dataset_with_stubbed_collection()  # type: ignore[arg-type, assignment]
+            )
+
+    return DatasetGraph(*consent_datasets)
+
+
+def get_dataset_graph_version(db: Session) -> str:
+    """
+    Returns a version for the dataset graphs, derived from the dataset configs, ctl datasets
+    and connection configs they are built from. The version changes whenever any of these
+    are created, updated or deleted.
+    """
+    fingerprint = db.query(
+        db.query(func.count(DatasetConfig.id)).label("dataset_config_count"),
+        db.query(func.max(DatasetConfig.updated_at)).label("dataset_config_updated_at"),
+        db.query(func.count(CtlDataset.id)).label("ctl_dataset_count"),
+        db.query(func.max(CtlDataset.updated_at)).label("ctl_dataset_updated_at"),
+        db.query(func.count(ConnectionConfig.id)).label("connection_config_count"),
+        db.query(func.max(ConnectionConfig.updated_at)).label(
+            "connection_config_updated_at"
+        ),
+    ).one()
+
+    # Writes made through the ORM also bump a generation in Redis, so that every
+    # process picks up changes that don't move the fingerprint
+    generation: Optional[str] = None
+    try:
+        generation = get_cache().get(DATASET_GRAPH_GENERATION_KEY)
+    except RedisConnectionError:
+        pass
+
+    return hashlib.sha256(
+        json.dumps([*fingerprint, generation], default=str).encode(
+            CONFIG.security.encoding
+        )
+    ).hexdigest()
+
+
+def get_compiled_dataset_graph(db: Session) -> CompiledDatasetGraph:
+    """
+    Returns the access/erasure and consent graphs for the current dataset configs.
+
+    The graphs are compiled once per version and shared by every privacy request run by this
+    process, so requests don't rebuild every node, edge and identity key. The graphs also
+    remember which sets of identity keys they have already been verified against, see Traversal.
+    Callers must treat the graphs as read-only.
+    """
+    version: str = get_dataset_graph_version(db)
+    compiled: Optional[CompiledDatasetGraph] = _compiled_dataset_graph.get(version)
+    if compiled:
+        return compiled
+
+    logger.debug("Compiling dataset graph for version {}", version)
+    datasets: List[DatasetConfig] = DatasetConfig.all(db=db)
+    compiled = CompiledDatasetGraph(
+        version,
+        DatasetGraph(*[dataset_config.get_graph() for dataset_config in datasets]),
+        build_consent_dataset_graph(datasets),
+    )
+
+    # Only the latest version is kept in-process
+    with _compiled_dataset_graph_lock:
+        _compiled_dataset_graph.clear()
+        _compiled_dataset_graph[version] = compiled
+    return compiled
+
+
+@event.listens_for(Session, "after_flush")
+def flag_dataset_graph_changes(session: Session, _: Any) -> None:
+    """Flag the session if a dataset config, ctl dataset or connection config was written"""
+    if any(
+        isinstance(instance, (DatasetConfig, CtlDataset, ConnectionConfig))
+        for instance in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info[DATASET_GRAPH_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_dataset_graph(session: Session) -> None:
+    """Invalidate the compiled dataset graph once a flagged session is committed"""
+    if not session.info.pop(DATASET_GRAPH_CHANGED, False):
+        return
+
+    with _compiled_dataset_graph_lock:
+        _compiled_dataset_graph.clear()
+    try:
+        get_cache().incr(DATASET_GRAPH_GENERATION_KEY)
+    except RedisConnectionError:
+        logger.warning("Unable to connect to Redis to invalidate the dataset graph")
+
+
+@event.listens_for(Session, "after_rollback")
+def clear_dataset_graph_changes(session: Session) -> None:
+    """Writes that were rolled back don't affect the dataset graph"""
+    session.info.pop(DATASET_GRAPH_CHANGED, None)
@@ -1,6 +1,7 @@
 import itertools
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Set, Union
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Union
 
 from fideslang.validation import FidesKey
 from loguru import logger
@@ -70,16 +71,72 @@ def filter_data_categories(
         if not target_field_paths:
             continue
 
-        for row in results:
-            filtered_results: Dict[str, Any] = {}
-            for field_path in target_field_paths:
-                select_and_save_field(filtered_results, row, field_path)
-            remove_empty_containers(filtered_results)
-            filtered_access_results[node_address].append(filtered_results)
+        plan: ProjectionPlan = compile_projection_plan(frozenset(target_field_paths))
+        filtered_access_results[node_address].extend(
+            apply_projection_plan(plan, row) for row in results
+        )
 
     return filtered_access_results
 
 
+ProjectionPlan = Dict[Any, Any]
+"""A trie of the levels of the target FieldPaths, each level mapping to the plan for the levels below it"""
+
+
+@lru_cache(maxsize=1024)
+def compile_projection_plan(target_field_paths: FrozenSet[FieldPath]) -> ProjectionPlan:
+    """Compile the target FieldPaths into a trie of their levels, so rows can be filtered in a
+    single pass with `apply_projection_plan`.
+
+    Plans are cached for each set of FieldPaths, so a collection's plan is only compiled once
+    across the rules of a policy. The returned plan is shared and must not be modified.
+
+    :Example:
+    compile_projection_plan(frozenset([FieldPath("A"), FieldPath("B", "C"), FieldPath("B", "D")]))
+    {"A": {}, "B": {"C": {}, "D": {}}}
+    """
+    plan: ProjectionPlan = {}
+    for field_path in target_field_paths:
+        node = plan
+        for level in field_path.levels:
+            node = node.setdefault(level, {})
+    return plan
+
+
+def apply_projection_plan(plan: ProjectionPlan, row: Any) -> Any:
+    """Return the data in the row along the paths in the plan, with any empty dictionaries and
+    arrays removed.
+
+    This gives the same result as calling `select_and_save_field` with each of the plan's
+    FieldPaths followed by `remove_empty_containers`, without walking the row once per path:
+    arrays are entered without consuming a level of the plan, scalar values are kept wherever
+    a path reaches them, and objects only keep the keys the plan continues into.
+    """
+    if isinstance(row, dict):
+        projected_dict: Dict[Any, Any] = {}
+        for key, value in row.items():
+            if key not in plan:
+                continue
+            if isinstance(value, (dict, list)):
+                value = apply_projection_plan(plan[key], value)
+                if not value:
+                    continue
+            projected_dict[key] = value
+        return projected_dict
+
+    if isinstance(row, list):
+        projected_list: List[Any] = []
+        for elem in row:
+            if isinstance(elem, (dict, list)):
+                elem = apply_projection_plan(plan, elem)
+                if not elem:
+                    continue
+            projected_list.append(elem)
+        return projected_list
+
+    return row
+
+
 def select_and_save_field(saved: Any, row: Row, target_path: FieldPath) -> Dict:
     """Extract the data located along the given `target_path` from the row and add to the "saved" dictionary.
 
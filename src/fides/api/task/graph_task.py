@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 import copy
 import traceback
 from abc import ABC
@@ -9,6 +10,7 @@ import dask
 from dask import delayed  # type: ignore[attr-defined]
 from dask.core import getcycle
 from dask.threaded import get
+from fideslang.validation import FidesKey
 from loguru import logger
 from sqlalchemy.orm import Session
 
@@ -178,9 +180,7 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         super().__init__()
         self.traversal_node = traversal_node
         self.resources = resources
-        self.connector: BaseConnector = resources.get_connector(
-            self.traversal_node.node.dataset.connection_key  # ConnectionConfig.key
-        )
+        self.connection_key: FidesKey = self.traversal_node.node.dataset.connection_key
         self.data_uses: Set[str] = (
             System.get_data_uses(
                 [self.connector.configuration.system], include_parents=False
@@ -211,6 +211,11 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
     def __repr__(self) -> str:
         return f"{type(self)}:{self.key}"
 
+    @property
+    def connector(self) -> BaseConnector:
+        """The connector for this node, built in the session of the thread running it"""
+        return self.resources.get_connector(self.connection_key)
+
     @property
     def grouped_fields(self) -> Set[str]:
         """Convenience property - returns a set of fields that have been specified on the collection as dependent
@@ -539,12 +544,13 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
         formatted_input_data: NodeInput = self.pre_process_input_data(
             *inputs, group_dependent_fields=True
         )
-        output: List[Row] = self.connector.retrieve_data(
-            self.traversal_node,
-            self.resources.policy,
-            self.resources.request,
-            formatted_input_data,
-        )
+        with self.resources.connection_slot(self.connection_key):
+            output: List[Row] = self.connector.retrieve_data(
+                self.traversal_node,
+                self.resources.policy,
+                self.resources.request,
+                formatted_input_data,
+            )
         filtered_output: List[Row] = self.access_results_post_processing(
             self.pre_process_input_data(*inputs, group_dependent_fields=False), output
         )
@@ -595,13 +601,14 @@ class GraphTask(ABC):  # pylint: disable=too-many-instance-attributes
             *inputs, group_dependent_fields=True
         )
 
-        output = self.connector.mask_data(
-            self.traversal_node,
-            self.resources.policy,
-            self.resources.request,
-            retrieved_data,
-            formatted_input_data,
-        )
+        with self.resources.connection_slot(self.connection_key):
+            output = self.connector.mask_data(
+                self.traversal_node,
+                self.resources.policy,
+                self.resources.request,
+                retrieved_data,
+                formatted_input_data,
+            )
         self.log_end(ActionType.erasure)
         self.resources.cache_erasure(
             f"{self.key}", output
@@ -694,6 +701,18 @@ def _format_data_use_map_for_caching(
     return {collection.value: g_task.data_uses for collection, g_task in env.items()}
 
 
+def execute_graph(dsk: Dict[CollectionAddress, Any], num_workers: int = 1) -> Any:
+    """Execute the dask graph and return the output of the TERMINATOR_ADDRESS.
+
+    Dask's threaded scheduler runs any nodes whose dependencies have been satisfied
+    in parallel, up to `num_workers` at a time. Dependencies between nodes, including
+    the ordering added by `erase_after`, are encoded in the graph itself so they are
+    respected regardless of the number of workers.
+    """
+    v = delayed(get(dsk, TERMINATOR_ADDRESS, num_workers=max(num_workers, 1)))
+    return v.compute()
+
+
 def start_function(seed: List[Dict[str, Any]]) -> Callable[[], List[Dict[str, Any]]]:
     """Return a function for collections with no upstream dependencies, that just start
     with seed data.
@@ -761,8 +780,8 @@ async def run_access_request(
         # but we don't want those changes in our data use map.
         privacy_request.cache_data_use_map(_format_data_use_map_for_caching(env))
 
-        v = delayed(get(dsk, TERMINATOR_ADDRESS, num_workers=1))
-        return v.compute()
+        with resources.worker_sessions(CONFIG.execution.task_concurrency):
+            return execute_graph(dsk, CONFIG.execution.task_concurrency)
 
 
 def get_cached_data_for_erasures(
@@ -775,7 +794,7 @@ def get_cached_data_for_erasures(
     """
     cache = get_cache()
     value_dict = cache.get_encoded_objects_by_prefix(
-        f"PLACEHOLDER_RESULTS__{privacy_request_id}"
+        f"PLACEHOLDER_RESULTS__{privacy_request_id}", privacy_request_id
     )
     number_of_leading_strings_to_exclude = 3
     return {
@@ -874,8 +893,8 @@ async def run_erasure(  # pylint: disable = too-many-arguments
                 f"The values for the `erase_after` fields caused a cycle in the following collections {collection_cycle}"
             )
 
-        v = delayed(get(dsk, TERMINATOR_ADDRESS, num_workers=1))
-        return v.compute()
+        with resources.worker_sessions(CONFIG.execution.task_concurrency):
+            return execute_graph(dsk, CONFIG.execution.task_concurrency)
 
 
 def _evaluate_erasure_dependencies(
@@ -936,9 +955,9 @@ async def run_consent_request(  # pylint: disable = too-many-arguments
         # terminator function waits for all keys
         dsk[TERMINATOR_ADDRESS] = (termination_fn, *graph_keys)
 
-        v = delayed(get(dsk, TERMINATOR_ADDRESS, num_workers=1))
-
-        update_successes: Tuple[bool, ...] = v.compute()
+        # Consent connectors write consent reporting records through the shared
+        # session as part of the request itself, so these nodes are run sequentially.
+        update_successes: Tuple[bool, ...] = execute_graph(dsk)
         # we combine the output of the termination function with the input keys to provide
         # a map of {collection_name: whether consent request succeeded}:
         consent_update_map: Dict[str, bool] = dict(
@@ -1,10 +1,16 @@
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager
+from threading import BoundedSemaphore, Lock, get_ident, local
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 
 from fideslang.validation import FidesKey
 from loguru import logger
 from sqlalchemy.orm import Session
 
-from fides.api.common_exceptions import ConnectorNotFoundException
+from fides.api.common_exceptions import (
+    ConnectorNotFoundException,
+    PrivacyRequestNotFound,
+)
+from fides.api.db.session import get_db_session
 from fides.api.graph.config import CollectionAddress
 from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
 from fides.api.models.policy import Policy
@@ -33,6 +39,7 @@ from fides.api.service.connectors import (
 from fides.api.service.connectors.base_email_connector import BaseEmailConnector
 from fides.api.util.cache import get_cache
 from fides.api.util.collection_util import Row, extract_key_for_address
+from fides.config import CONFIG
 
 
 class Connections:
@@ -40,6 +47,7 @@ class Connections:
 
     def __init__(self) -> None:
         self.connections: Dict[str, Union[BaseConnector, BaseEmailConnector]] = {}
+        self._lock = Lock()
 
     def get_connector(
         self, connection_config: ConnectionConfig
@@ -47,10 +55,11 @@ class Connections:
         """Return the connector corresponding to this config. Will return the existing
         connector or create one if it does not yet exist."""
         key = connection_config.key
-        if key not in self.connections:
-            connector = Connections.build_connector(connection_config)
-            self.connections[key] = connector
-        return self.connections[key]
+        with self._lock:
+            if key not in self.connections:
+                connector = Connections.build_connector(connection_config)
+                self.connections[key] = connector
+            return self.connections[key]
 
     @staticmethod
     def build_connector(  # pylint: disable=R0911,R0912
@@ -95,6 +104,66 @@ class Connections:
                 connector.close()
 
 
+class SessionResources:
+    """The privacy request, policy and connection configs as loaded through one session,
+    along with the connectors built from those configs."""
+
+    def __init__(
+        self,
+        request: PrivacyRequest,
+        policy: Policy,
+        connection_configs: List[ConnectionConfig],
+        session: Session,
+    ):
+        self.request = request
+        self.policy = policy
+        self.connection_configs: Dict[str, ConnectionConfig] = {
+            c.key: c for c in connection_configs
+        }
+        self.connections = Connections()
+        self.session = session
+
+    @classmethod
+    def load(
+        cls,
+        session: Session,
+        request_id: str,
+        policy_id: str,
+        connection_config_ids: List[str],
+    ) -> "SessionResources":
+        """Load the privacy request, policy and connection configs through the given session"""
+        request = PrivacyRequest.get(db=session, object_id=request_id)
+        policy = Policy.get(db=session, object_id=policy_id)
+        if not request or not policy:
+            raise PrivacyRequestNotFound(
+                f"Privacy request {request_id} or policy {policy_id} could not be loaded"
+            )
+        connection_configs: List[ConnectionConfig] = (
+            session.query(ConnectionConfig)
+            .filter(ConnectionConfig.id.in_(connection_config_ids))
+            .all()
+        )
+        return cls(request, policy, connection_configs, session)
+
+    def close(self) -> None:
+        self.connections.close()
+
+
+class _LazyThreadResources(local):
+    """Resources for each thread, loaded the first time the thread uses them"""
+
+    def __init__(self, load: Callable[[], SessionResources]) -> None:
+        super().__init__()
+        self._load = load
+        self._resources: Optional[SessionResources] = None
+
+    @property
+    def resources(self) -> SessionResources:
+        if self._resources is None:
+            self._resources = self._load()
+        return self._resources
+
+
 class TaskResources:
     """Shared information and environment for all nodes of a given task.
     This includes
@@ -102,6 +171,10 @@ class TaskResources:
      - the policy
      - redis connection
      -  configurations to any outside resources the task will require to run
+
+    The session is not thread-safe, so while nodes are run on several threads at once
+    (see `worker_sessions`) each thread gets its own session, with its own copies of the
+    privacy request, policy, connection configs and connectors.
     """
 
     def __init__(
@@ -111,15 +184,82 @@ class TaskResources:
         connection_configs: List[ConnectionConfig],
         session: Session,
     ):
-        self.request = request
-        self.policy = policy
         self.cache = get_cache()
-        # tbd populate connection configurations.
-        self.connection_configs: Dict[str, ConnectionConfig] = {
-            c.key: c for c in connection_configs
-        }
-        self.connections = Connections()
-        self.session = session
+        self._resources = SessionResources(request, policy, connection_configs, session)
+        # The thread that enabled worker sessions, if they are enabled
+        self._owner_thread: Optional[int] = None
+        self._thread_resources: local = local()
+        self._worker_resources: List[SessionResources] = []
+        self._lock = Lock()
+        # Each connection gets its own cap on the number of nodes querying it concurrently
+        self._connection_semaphores: Dict[str, BoundedSemaphore] = {}
+
+    def _current(self) -> SessionResources:
+        """The resources loaded through the current thread's session"""
+        if self._owner_thread is None or self._owner_thread == get_ident():
+            return self._resources
+        return self._thread_resources.resources
+
+    @property
+    def request(self) -> PrivacyRequest:
+        return self._current().request
+
+    @property
+    def policy(self) -> Policy:
+        return self._current().policy
+
+    @property
+    def session(self) -> Session:
+        return self._current().session
+
+    @property
+    def connection_configs(self) -> Dict[str, ConnectionConfig]:
+        return self._current().connection_configs
+
+    @property
+    def connections(self) -> Connections:
+        return self._current().connections
+
+    @contextmanager
+    def worker_sessions(self, num_workers: int) -> Iterator[None]:
+        """Give every other thread that uses these resources its own session while in this
+        context, if the graph will be run on more than one worker thread.
+
+        The ids to load are read up front by the calling thread, so worker threads never
+        touch the calling thread's session."""
+        if num_workers <= 1:
+            yield
+            return
+
+        resources = self._resources
+        request_id: str = resources.request.id
+        policy_id: str = resources.policy.id
+        connection_config_ids: List[str] = [
+            config.id for config in resources.connection_configs.values()
+        ]
+        engine = resources.session.get_bind()
+
+        def load_resources() -> SessionResources:
+            session = get_db_session(CONFIG, engine=engine)()
+            worker_resources = SessionResources.load(
+                session, request_id, policy_id, connection_config_ids
+            )
+            with self._lock:
+                self._worker_resources.append(worker_resources)
+            return worker_resources
+
+        self._thread_resources = _LazyThreadResources(load_resources)
+        self._owner_thread = get_ident()
+        try:
+            yield
+        finally:
+            self._owner_thread = None
+            self._thread_resources = local()
+            with self._lock:
+                worker_resources, self._worker_resources = self._worker_resources, []
+            for loaded in worker_resources:
+                loaded.close()
+                loaded.session.close()
 
     def __enter__(self) -> "TaskResources":
         """Support 'with' usage for closing resources"""
@@ -134,17 +274,21 @@ class TaskResources:
         stored in redis under 'PLACEHOLDER_RESULTS__PRIVACY_REQUEST_ID__TYPE__COLLECTION_ADDRESS
         """
         self.cache.set_encoded_object(
-            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}", value
+            f"PLACEHOLDER_RESULTS__{self.request.id}__{key}",
+            value,
+            privacy_request_id=self.request.id,
         )
 
     def cache_object(self, key: str, value: Any) -> None:
         """Store in cache. Object will be stored in redis under 'REQUEST_ID__TYPE__ADDRESS'"""
-        self.cache.set_encoded_object(f"{self.request.id}__{key}", value)
+        self.cache.set_encoded_object(
+            f"{self.request.id}__{key}", value, privacy_request_id=self.request.id
+        )
 
     def get_all_cached_objects(self) -> Dict[str, Optional[List[Row]]]:
         """Retrieve the access results of all steps (cache_object)"""
         value_dict = self.cache.get_encoded_objects_by_prefix(
-            f"{self.request.id}__access_request"
+            f"{self.request.id}__access_request", self.request.id
         )
         # extract request id to return a map of address:value
         number_of_leading_strings_to_exclude = 2
@@ -158,13 +302,15 @@ class TaskResources:
         'REQUEST_ID__erasure_request__ADDRESS
         '"""
         self.cache.set_encoded_object(
-            f"{self.request.id}__erasure_request__{key}", value
+            f"{self.request.id}__erasure_request__{key}",
+            value,
+            privacy_request_id=self.request.id,
         )
 
     def get_all_cached_erasures(self) -> Dict[str, int]:
         """Retrieve which collections have been masked and their row counts(cache_erasure)"""
         value_dict = self.cache.get_encoded_objects_by_prefix(
-            f"{self.request.id}__erasure_request"
+            f"{self.request.id}__erasure_request", self.request.id
         )
         # extract request id to return a map of address:value
         number_of_leading_strings_to_exclude = 2
@@ -196,6 +342,20 @@ class TaskResources:
             },
         )
 
+    @contextmanager
+    def connection_slot(self, key: FidesKey) -> Iterator[None]:
+        """Block until the given connection has capacity for another concurrent node,
+        as configured by CONFIG.execution.task_concurrency_per_connection"""
+        with self._lock:
+            if key not in self._connection_semaphores:
+                self._connection_semaphores[key] = BoundedSemaphore(
+                    max(CONFIG.execution.task_concurrency_per_connection, 1)
+                )
+            semaphore = self._connection_semaphores[key]
+
+        with semaphore:
+            yield
+
     def get_connector(self, key: FidesKey) -> Any:
         """Create or return the client corresponding to the given ConnectionConfig key"""
         if key in self.connection_configs:
@@ -3,12 +3,28 @@ from __future__ import annotations
 import json
 import os
 import secrets
+import shutil
 import zipfile
-from io import BytesIO
-from typing import Any, Dict, Optional, Set, Union
+from base64 import b64encode
+from io import BufferedReader, BytesIO, RawIOBase
+from itertools import chain
+from typing import (
+    IO,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+    cast,
+)
 
 import pandas as pd
 from boto3 import Session
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError, ParamValidationError
 from loguru import logger
 
@@ -25,6 +41,7 @@ from fides.api.service.privacy_request.dsr_package.dsr_report_builder import (
 )
 from fides.api.util.cache import get_cache, get_encryption_cache_key
 from fides.api.util.encryption.aes_gcm_encryption_scheme import (
+    encrypt_stream_to_bytes_verify_secrets_length,
     encrypt_to_bytes_verify_secrets_length,
 )
 from fides.api.util.storage_authenticator import get_s3_session
@@ -34,23 +51,31 @@ from fides.config import CONFIG
 LOCAL_FIDES_UPLOAD_DIRECTORY = "fides_uploads"
 
 
-def encrypt_access_request_results(data: Union[str, bytes], request_id: str) -> str:
-    """Encrypt data with encryption key if provided, otherwise return unencrypted data"""
+PACKAGE_CHUNK_SIZE = 64 * 1024
+
+
+def get_access_request_encryption_key(request_id: str) -> Optional[bytes]:
+    """Returns the encryption key cached for the given privacy request, if any"""
     cache = get_cache()
     encryption_cache_key = get_encryption_cache_key(
         privacy_request_id=request_id,
         encryption_attr="key",
     )
+    encryption_key: str | None = cache.get(encryption_cache_key)
+    if not encryption_key:
+        return None
+    return encryption_key.encode(encoding=CONFIG.security.encoding)
+
+
+def encrypt_access_request_results(data: Union[str, bytes], request_id: str) -> str:
+    """Encrypt data with encryption key if provided, otherwise return unencrypted data"""
     if isinstance(data, bytes):
         data = data.decode(CONFIG.security.encoding)
 
-    encryption_key: str | None = cache.get(encryption_cache_key)
-    if not encryption_key:
+    bytes_encryption_key = get_access_request_encryption_key(request_id)
+    if not bytes_encryption_key:
         return data
 
-    bytes_encryption_key: bytes = encryption_key.encode(
-        encoding=CONFIG.security.encoding
-    )
     nonce: bytes = secrets.token_bytes(CONFIG.security.aes_gcm_nonce_length)
     # b64encode the entire nonce and the encrypted message together
     return bytes_to_b64_str(
@@ -59,43 +84,140 @@ def encrypt_access_request_results(data: Union[str, bytes], request_id: str) ->
     )
 
 
-def write_to_in_memory_buffer(
+def encrypt_access_request_results_stream(
+    chunks: Iterable[bytes], request_id: str
+) -> Iterator[bytes]:
+    """Streaming version of encrypt_access_request_results: encrypts the chunks with the
+    encryption key if provided, otherwise yields them unencrypted. The joined output is in
+    the same format, so it is decrypted the same way."""
+    bytes_encryption_key = get_access_request_encryption_key(request_id)
+    if not bytes_encryption_key:
+        yield from chunks
+        return
+
+    nonce: bytes = secrets.token_bytes(CONFIG.security.aes_gcm_nonce_length)
+    # b64encode the entire nonce and the encrypted message together, three bytes at a
+    # time so the encoded chunks can be joined
+    remainder = b""
+    for encrypted in chain(
+        [nonce],
+        encrypt_stream_to_bytes_verify_secrets_length(
+            chunks, bytes_encryption_key, nonce
+        ),
+    ):
+        encrypted = remainder + encrypted
+        cutoff = len(encrypted) - len(encrypted) % 3
+        remainder = encrypted[cutoff:]
+        if cutoff:
+            yield b64encode(encrypted[:cutoff])
+    yield b64encode(remainder)
+
+
+class ChunkedReader(RawIOBase):
+    """A read-only file-like object over an iterator of byte chunks, so a package
+    can be consumed as it is generated instead of being held in memory"""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self.chunks = chunks
+        self.buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self.buffer:
+            try:
+                self.buffer = memoryview(next(self.chunks))
+            except StopIteration:
+                return 0
+
+        size = min(len(buffer), len(self.buffer))
+        buffer[:size] = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        return size
+
+
+class ChunkWriter(RawIOBase):
+    """A write-only, unseekable stream that holds what is written to it until drained"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        return len(chunk)
+
+    def drain(self) -> List[bytes]:
+        """Returns and forgets the chunks written since the last drain"""
+        chunks, self.chunks = self.chunks, []
+        return chunks
+
+
+def _json_package_chunks(data: Dict[str, Any]) -> Iterator[bytes]:
+    """Serializes the data to indented JSON, in chunks of about PACKAGE_CHUNK_SIZE bytes"""
+    buffer: List[str] = []
+    size = 0
+    encoder = json.JSONEncoder(indent=2, default=storage_json_encoder)
+    for part in encoder.iterencode(data):
+        buffer.append(part)
+        size += len(part)
+        if size >= PACKAGE_CHUNK_SIZE:
+            yield "".join(buffer).encode(CONFIG.security.encoding)
+            buffer, size = [], 0
+    yield "".join(buffer).encode(CONFIG.security.encoding)
+
+
+def _csv_package_chunks(
+    data: Dict[str, Any], privacy_request: PrivacyRequest
+) -> Iterator[bytes]:
+    """Writes a zip file with a CSV per collection, one collection at a time,
+    yielding the zipped bytes as they are written"""
+    writer = ChunkWriter()
+    with zipfile.ZipFile(cast(IO[bytes], writer), "w") as f:
+        for key in data:
+            df = pd.json_normalize(data[key])
+            buffer = BytesIO()
+            df.to_csv(buffer, index=False, encoding=CONFIG.security.encoding)
+            csv = buffer.getbuffer()
+            with f.open(f"{key}.csv", "w", force_zip64=True) as csv_file:
+                for chunk in encrypt_access_request_results_stream(
+                    (
+                        csv[index : index + PACKAGE_CHUNK_SIZE]
+                        for index in range(0, len(csv), PACKAGE_CHUNK_SIZE)
+                    ),
+                    privacy_request.id,
+                ):
+                    csv_file.write(chunk)
+                    yield from writer.drain()
+
+    yield from writer.drain()
+
+
+def write_to_stream(
     resp_format: str, data: Dict[str, Any], privacy_request: PrivacyRequest
-) -> BytesIO:
-    """Write JSON/CSV data to in-memory file-like object to be passed to S3. Encrypt data if encryption key/nonce
-    has been cached for the given privacy request id
+) -> BinaryIO:
+    """Streaming version of write_to_in_memory_buffer. Returns a file-like object that
+    serializes and encrypts the data collection by collection as it is read, so the
+    whole package is never held in memory.
 
     :param resp_format: str, should be one of ResponseFormat
     :param data: Dict
-    :param request_id: str, The privacy request id
+    :param privacy_request: PrivacyRequest
     """
-    logger.info("Writing data to in-memory buffer")
-
     if resp_format == ResponseFormat.json.value:
-        json_str = json.dumps(data, indent=2, default=storage_json_encoder)
-        return BytesIO(
-            encrypt_access_request_results(json_str, privacy_request.id).encode(
-                CONFIG.security.encoding
-            )
+        chunks = encrypt_access_request_results_stream(
+            _json_package_chunks(data), privacy_request.id
         )
+        return BufferedReader(ChunkedReader(chunks), PACKAGE_CHUNK_SIZE)
 
     if resp_format == ResponseFormat.csv.value:
-        zipped_csvs = BytesIO()
-        with zipfile.ZipFile(zipped_csvs, "w") as f:
-            for key in data:
-                df = pd.json_normalize(data[key])
-                buffer = BytesIO()
-                df.to_csv(buffer, index=False, encoding=CONFIG.security.encoding)
-                buffer.seek(0)
-                f.writestr(
-                    f"{key}.csv",
-                    encrypt_access_request_results(
-                        buffer.getvalue(), privacy_request.id
-                    ),
-                )
-
-        zipped_csvs.seek(0)
-        return zipped_csvs
+        chunks = _csv_package_chunks(data, privacy_request)
+        return BufferedReader(ChunkedReader(chunks), PACKAGE_CHUNK_SIZE)
 
     if resp_format == ResponseFormat.html.value:
         return DsrReportBuilder(
@@ -106,6 +228,23 @@ def write_to_in_memory_buffer(
     raise NotImplementedError(f"No handling for response format {resp_format}.")
 
 
+def write_to_in_memory_buffer(
+    resp_format: str, data: Dict[str, Any], privacy_request: PrivacyRequest
+) -> BytesIO:
+    """Write JSON/CSV data to in-memory file-like object. Encrypt data if encryption key/nonce
+    has been cached for the given privacy request id
+
+    :param resp_format: str, should be one of ResponseFormat
+    :param data: Dict
+    :param request_id: str, The privacy request id
+    """
+    logger.info("Writing data to in-memory buffer")
+    stream = write_to_stream(resp_format, data, privacy_request)
+    if isinstance(stream, BytesIO):
+        return stream
+    return BytesIO(stream.read())
+
+
 def create_presigned_url_for_s3(
     s3_client: Session, bucket_name: str, file_key: str
 ) -> str:
@@ -144,12 +283,16 @@ def upload_to_s3(  # pylint: disable=R0913
         my_session = get_s3_session(auth_method, storage_secrets)
         s3_client = my_session.client("s3")
 
-        # handles file chunking
+        # streams the package through a multipart upload, one part at a time
         try:
             s3_client.upload_fileobj(
-                Fileobj=write_to_in_memory_buffer(resp_format, data, privacy_request),
+                Fileobj=write_to_stream(resp_format, data, privacy_request),
                 Bucket=bucket_name,
                 Key=file_key,
+                Config=TransferConfig(
+                    multipart_threshold=CONFIG.execution.s3_upload_part_size,
+                    multipart_chunksize=CONFIG.execution.s3_upload_part_size,
+                ),
             )
         except Exception as e:
             logger.error("Encountered error while uploading s3 object: {}", e)
@@ -182,9 +325,9 @@ def upload_to_local(
         os.makedirs(LOCAL_FIDES_UPLOAD_DIRECTORY)
 
     filename = f"{LOCAL_FIDES_UPLOAD_DIRECTORY}/{file_key}"
-    in_memory_file = write_to_in_memory_buffer(resp_format, data, privacy_request)
+    stream = write_to_stream(resp_format, data, privacy_request)
 
     with open(filename, "wb") as file:
-        file.write(in_memory_file.getvalue())
+        shutil.copyfileobj(stream, file)
 
     return "your local fides_uploads folder"
@@ -0,0 +1,155 @@
+"""
+Writes audit log resource records from a background thread, so the audit log middleware
+only has to queue a record instead of waiting on a database commit for every request.
+"""
+import queue
+from threading import Event, Lock, Thread
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from fides.api.api import deps
+from fides.api.models.sql_models import AuditLogResource  # type: ignore[attr-defined]
+from fides.config import CONFIG
+
+# How often an idle writer checks whether it has been asked to stop
+POLL_INTERVAL_SECONDS = 0.5
+
+
+def write_audit_log_resource_records(
+    db: Session, records: List[Dict[str, Any]]
+) -> None:
+    """Writes audit log resource records to the database with a single multi-row INSERT"""
+    try:
+        db.execute(insert(AuditLogResource.__table__), records)
+        db.commit()
+    except SQLAlchemyError as err:
+        db.rollback()
+        logger.warning(
+            "Unable to write {} audit log resource records: {}", len(records), err
+        )
+
+
+class AuditLogResourceWriter:
+    """
+    A bounded in-memory queue of audit log resource records, drained by a background thread
+    that writes them in batches of up to CONFIG.security.audit_log_resource_batch_size.
+
+    When the queue is full, CONFIG.security.audit_log_resource_overflow_policy decides whether
+    the request waits for space, or the newest or oldest record is dropped.
+    """
+
+    def __init__(self) -> None:
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[Thread] = None
+        self._stopping = Event()
+        self._lock = Lock()
+        self._dropped = 0
+
+    def start(self) -> None:
+        """Starts the background writer, if it isn't already running"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            if self._queue is None:
+                self._queue = queue.Queue(
+                    maxsize=CONFIG.security.audit_log_resource_queue_size
+                )
+            self._stopping.clear()
+            self._thread = Thread(
+                target=self._run, name="audit-log-resource-writer", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float = 10) -> None:
+        """Writes every queued record and stops the background writer"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if not thread:
+            return
+
+        self._stopping.set()
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(
+                "Timed out writing queued audit log resource records on shutdown"
+            )
+
+    async def enqueue(self, record: Dict[str, Any]) -> None:
+        """Queues a record to be written, applying the overflow policy if the queue is full"""
+        self.start()
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        overflow_policy: str = CONFIG.security.audit_log_resource_overflow_policy
+        if overflow_policy == "block":
+            # Wait for space off the event loop, so only this request is held up
+            await run_in_threadpool(self._queue.put, record)
+            return
+
+        if overflow_policy == "drop_oldest":
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                self._count_dropped()
+            try:
+                self._queue.put_nowait(record)
+                return
+            except queue.Full:
+                pass
+
+        self._count_dropped()
+
+    def _count_dropped(self) -> None:
+        with self._lock:
+            self._dropped += 1
+
+    def _take_dropped(self) -> int:
+        with self._lock:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+    def _run(self) -> None:
+        """Writes queued records in batches until asked to stop and the queue is empty"""
+        assert self._queue is not None
+        while True:
+            try:
+                records: List[Dict[str, Any]] = [
+                    self._queue.get(timeout=POLL_INTERVAL_SECONDS)
+                ]
+            except queue.Empty:
+                if self._stopping.is_set():
+                    return
+                continue
+
+            while len(records) < CONFIG.security.audit_log_resource_batch_size:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            db: Session = deps.get_api_session()
+            try:
+                write_audit_log_resource_records(db, records)
+            finally:
+                db.close()
+
+            dropped: int = self._take_dropped()
+            if dropped:
+                logger.warning(
+                    "Dropped {} audit log resource records because the queue was full",
+                    dropped,
+                )
+
+
+audit_log_resource_writer = AuditLogResourceWriter()
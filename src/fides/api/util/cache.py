@@ -1,13 +1,15 @@
 import json
+import zlib
+from base64 import b64decode, b64encode
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 from urllib.parse import quote, unquote_to_bytes
 
+import msgpack
 from bson.objectid import ObjectId
 from loguru import logger
 from redis import Redis
-from redis.client import Script  # type: ignore
 from redis.exceptions import ConnectionError as ConnectionErrorFromRedis
 
 from fides.api import common_exceptions
@@ -24,6 +26,15 @@ ENCODED_BYTES_PREFIX = "quote_encoded_"
 ENCODED_DATE_PREFIX = "date_encoded_"
 ENCODED_MONGO_OBJECT_ID_PREFIX = "encoded_object_id_"
 
+# Objects cached with the msgpack object encoding are stored as base64 text, since the
+# connection decodes responses, behind a versioned prefix that JSON can never start with
+ENCODED_MSGPACK_PREFIX = "msgpack_v1:"
+ENCODED_MSGPACK_COMPRESSED_PREFIX = "msgpack_v1_zlib:"
+
+MSGPACK_DATETIME_EXT = 1
+MSGPACK_DATE_EXT = 2
+MSGPACK_MONGO_OBJECT_ID_EXT = 3
+
 
 class CustomJSONEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any:  # pylint: disable=too-many-return-statements
@@ -63,6 +74,54 @@ def _custom_decoder(json_dict: Dict[str, Any]) -> Dict[str, Any]:
     return json_dict
 
 
+def _msgpack_default(o: Any) -> Any:
+    """Encode the types msgpack doesn't support natively as extension types, and
+    everything else the same way CustomJSONEncoder does"""
+    if isinstance(o, datetime):
+        return msgpack.ExtType(MSGPACK_DATETIME_EXT, o.isoformat().encode("utf-8"))
+    if isinstance(o, date):
+        return msgpack.ExtType(MSGPACK_DATE_EXT, o.isoformat().encode("utf-8"))
+    if isinstance(o, ObjectId):
+        return msgpack.ExtType(MSGPACK_MONGO_OBJECT_ID_EXT, o.binary)
+    return CustomJSONEncoder().default(o)
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == MSGPACK_DATETIME_EXT:
+        return datetime.fromisoformat(data.decode("utf-8"))
+    if code == MSGPACK_DATE_EXT:
+        return date.fromisoformat(data.decode("utf-8"))
+    if code == MSGPACK_MONGO_OBJECT_ID_EXT:
+        return ObjectId(data)
+    return msgpack.ExtType(code, data)
+
+
+def _encode_msgpack(obj: Any) -> str:
+    """Encode an object as msgpack, compressing it if it's at least
+    `redis.compression_threshold_bytes` and compression makes it smaller"""
+    packed: bytes = msgpack.packb(obj, default=_msgpack_default, use_bin_type=True)
+    if len(packed) >= CONFIG.redis.compression_threshold_bytes:
+        compressed = zlib.compress(packed)
+        if len(compressed) < len(packed):
+            return ENCODED_MSGPACK_COMPRESSED_PREFIX + b64encode(compressed).decode(
+                "ascii"
+            )
+    return ENCODED_MSGPACK_PREFIX + b64encode(packed).decode("ascii")
+
+
+def _decode_msgpack(encoded: str) -> Any:
+    """Decode an object encoded by _encode_msgpack"""
+    if encoded.startswith(ENCODED_MSGPACK_COMPRESSED_PREFIX):
+        packed = zlib.decompress(
+            b64decode(encoded[len(ENCODED_MSGPACK_COMPRESSED_PREFIX) :])
+        )
+    else:
+        packed = b64decode(encoded[len(ENCODED_MSGPACK_PREFIX) :])
+    return msgpack.unpackb(
+        packed, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False
+    )
+
+
 class FidesopsRedis(Redis):
     """
     An extension to Redis' python bindings to support auto expiring data input. This class
@@ -74,31 +133,95 @@ class FidesopsRedis(Redis):
         key: str,
         value: RedisValue,
         expire_time: int = CONFIG.redis.default_ttl_seconds,
+        privacy_request_id: Optional[str] = None,
     ) -> Optional[bool]:
-        """Call the connection class' default set method with ex= our default TTL"""
+        """Call the connection class' default set method with ex= our default TTL.
+
+        If a privacy_request_id is passed, the key is also added to that privacy request's
+        key index, see get_privacy_request_keys.
+        """
         if not expire_time:
             # We have to check this condition for the edge case where `None` is explicitly
             # passed to this method.
             expire_time = CONFIG.redis.default_ttl_seconds
-        return self.set(key, value, ex=expire_time)
+        if not privacy_request_id:
+            return self.set(key, value, ex=expire_time)
+
+        pipe = self.pipeline()
+        pipe.set(key, value, ex=expire_time)
+        self._add_to_key_index(pipe, privacy_request_id, [key], expire_time)
+        return pipe.execute()[0]
+
+    def add_privacy_request_keys(
+        self,
+        privacy_request_id: str,
+        keys: List[str],
+        expire_time: int = CONFIG.redis.default_ttl_seconds,
+    ) -> None:
+        """Add keys that were set without set_with_autoexpire to the privacy request's key index"""
+        pipe = self.pipeline()
+        self._add_to_key_index(pipe, privacy_request_id, keys, expire_time)
+        pipe.execute()
+
+    @staticmethod
+    def _add_to_key_index(
+        pipe: Any, privacy_request_id: str, keys: List[str], expire_time: int
+    ) -> None:
+        """Queue adding the keys to the privacy request's key index on the pipeline. The index
+        expires along with the last key added to it."""
+        index_key = get_privacy_request_key_index_cache_key(privacy_request_id)
+        pipe.sadd(index_key, *keys)
+        pipe.expire(index_key, expire_time)
+
+    def get_privacy_request_keys(
+        self, privacy_request_id: str, prefix: str = ""
+    ) -> List[str]:
+        """Retrieve the keys cached for a privacy request that start with the given prefix.
+
+        Keys are looked up in the privacy request's key index, so this is proportional to the
+        number of keys cached for the request rather than to the size of the keyspace. Privacy
+        requests cached before the key index was added don't have one, so their keys are
+        found by scanning instead if `redis.scan_unindexed_privacy_request_keys` is enabled.
+        """
+        indexed_keys: Set[str] = set(
+            self.smembers(get_privacy_request_key_index_cache_key(privacy_request_id))
+        )
+        if indexed_keys or not CONFIG.redis.scan_unindexed_privacy_request_keys:
+            return [key for key in indexed_keys if key.startswith(prefix)]
+
+        if prefix:
+            return self.get_keys_by_prefix(prefix)
+        return self.get_keys_by_prefix(
+            f"{privacy_request_id}-"
+        ) + self.get_keys_by_prefix(f"id-{privacy_request_id}-")
+
+    def delete_privacy_request_keys(
+        self, privacy_request_id: str, chunk_size: int = 1000
+    ) -> None:
+        """Delete every key cached for a privacy request, along with its key index"""
+        keys = self.get_privacy_request_keys(privacy_request_id)
+        keys.append(get_privacy_request_key_index_cache_key(privacy_request_id))
+        for i in range(0, len(keys), chunk_size):
+            self.delete(*keys[i : i + chunk_size])
 
     def get_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> List[str]:
         """Retrieve all keys that match a given prefix."""
-        cursor: Any = "0"
-        out = []
-        while cursor != 0:
-            cursor, keys = self.scan(
-                cursor=cursor, match=f"{prefix}*", count=chunk_size
-            )
-            out.extend(keys)
-        return out
+        return list(self.scan_iter(match=f"{prefix}*", count=chunk_size))
 
-    def delete_keys_by_prefix(self, prefix: str) -> None:
-        """Delete all keys starting with a given prefix"""
-        s: Script = self.register_script(
-            f"for _,k in ipairs(redis.call('keys','{prefix}*')) do redis.call('del',k) end"
-        )
-        s()
+    def delete_keys_by_prefix(self, prefix: str, chunk_size: int = 1000) -> None:
+        """Delete all keys starting with a given prefix.
+
+        The keys are found with SCAN rather than KEYS, so Redis isn't blocked while the
+        whole keyspace is searched.
+        """
+        keys: List[str] = []
+        for key in self.scan_iter(match=f"{prefix}*", count=chunk_size):
+            keys.append(key)
+            if len(keys) >= chunk_size:
+                self.delete(*keys)
+                keys = []
+        if keys:
+            self.delete(*keys)
 
     def get_values(self, keys: List[str]) -> Dict[str, Optional[Any]]:
         """Retrieve all values corresponding to the set of input keys and return them as a
@@ -107,38 +230,83 @@ class FidesopsRedis(Redis):
         values = self.mget(keys)
         return {x[0]: x[1] for x in zip(keys, values)}
 
-    def set_encoded_object(self, key: str, obj: Any) -> Optional[bool]:
+    def set_encoded_object(
+        self, key: str, obj: Any, privacy_request_id: Optional[str] = None
+    ) -> Optional[bool]:
         """Set an object in redis in an encoded form. This object should be retrieved via
-        get_objects_by_prefix or processed with decode_obj."""
-        return self.set_with_autoexpire(f"EN_{key}", FidesopsRedis.encode_obj(obj))
+        get_objects_by_prefix or processed with decode_obj.
+
+        Objects cached for a privacy request should pass its privacy_request_id, so they can
+        be retrieved through the request's key index."""
+        return self.set_with_autoexpire(
+            f"EN_{key}",
+            FidesopsRedis.encode_obj(obj),
+            privacy_request_id=privacy_request_id,
+        )
 
     def get_encoded_by_key(self, key: str) -> Optional[Any]:
         """Returns cached obj decoded from base64"""
         val = super().get(key)
         return self.decode_obj(val) if val else None
 
-    def get_encoded_objects_by_prefix(self, prefix: str) -> Dict[str, Optional[Any]]:
+    def get_encoded_objects_by_prefix(
+        self, prefix: str, privacy_request_id: Optional[str] = None
+    ) -> Dict[str, Optional[Any]]:
         """Return all objects stored under a given prefix. This method
-        assumes these objects have been stored encoded using set_object"""
-        keys = self.get_keys_by_prefix(f"EN_{prefix}")
+        assumes these objects have been stored encoded using set_object.
+
+        If a privacy_request_id is passed, the keys are looked up in that privacy request's
+        key index instead of scanning Redis."""
+        if privacy_request_id:
+            keys = self.get_privacy_request_keys(privacy_request_id, f"EN_{prefix}")
+        else:
+            keys = self.get_keys_by_prefix(f"EN_{prefix}")
         encoded_object_dict = self.get_values(keys)
+        # Skip keys that expired after they were indexed or scanned
         return {
             key: FidesopsRedis.decode_obj(value)
             for key, value in encoded_object_dict.items()
+            if value is not None
         }
 
     @staticmethod
     def encode_obj(obj: Any) -> bytes:
-        """Encode an object to a JSON string that can be stored in Redis"""
-        return json.dumps(obj, cls=CustomJSONEncoder)  # type: ignore
+        """Encode an object to a string that can be stored in Redis.
+
+        Objects are encoded as JSON, or as versioned msgpack if `redis.object_encoding`
+        is "msgpack" and the msgpack encoding is smaller. The msgpack encoding is stored as
+        base64, so small objects are often smaller as JSON."""
+        json_encoded: str = json.dumps(obj, cls=CustomJSONEncoder)
+        if CONFIG.redis.object_encoding == "msgpack":
+            msgpack_encoded: str = _encode_msgpack(obj)
+            json_size: int = len(json_encoded.encode("utf-8"))
+            if len(msgpack_encoded) < json_size:
+                logger.debug(
+                    "Cached object as {} bytes of msgpack instead of {} bytes of JSON, saving {} bytes",
+                    len(msgpack_encoded),
+                    json_size,
+                    json_size - len(msgpack_encoded),
+                )
+                return msgpack_encoded  # type: ignore
+        return json_encoded  # type: ignore
 
     @staticmethod
     def decode_obj(bs: Optional[str]) -> Optional[Dict[str, Any]]:
-        """Decode an object from its JSON.
+        """Decode an object from its JSON or msgpack encoding.
 
         Since Redis may not contain a value
         for a given key it's possible we may try to decode an empty object."""
         if bs:
+            if isinstance(bs, bytes):
+                bs = bs.decode(CONFIG.redis.charset)
+            if bs.startswith(ENCODED_MSGPACK_PREFIX) or bs.startswith(
+                ENCODED_MSGPACK_COMPRESSED_PREFIX
+            ):
+                try:
+                    return _decode_msgpack(bs)
+                except (ValueError, zlib.error):
+                    logger.info("Error decoding msgpack encoded cache value.")
+                    return None
             try:
                 result = json.loads(bs, object_hook=_custom_decoder)
             except json.decoder.JSONDecodeError:
@@ -230,12 +398,17 @@ def get_masking_secret_cache_key(
     )
 
 
+def get_privacy_request_key_index_cache_key(privacy_request_id: str) -> str:
+    """Return the key of the set indexing every key cached for this PrivacyRequest"""
+    return f"id-{privacy_request_id}-key-index"
+
+
 def get_all_cache_keys_for_privacy_request(privacy_request_id: str) -> List[Any]:
-    """Returns all cache keys related to this privacy request's cached identities"""
+    """Returns all cache keys related to this privacy request, including its key index"""
     cache: FidesopsRedis = get_cache()
-    return cache.keys(f"{privacy_request_id}-*") + cache.keys(
-        f"id-{privacy_request_id}-*"
-    )
+    return cache.get_privacy_request_keys(privacy_request_id) + [
+        get_privacy_request_key_index_cache_key(privacy_request_id)
+    ]
 
 
 def get_async_task_tracking_cache_key(privacy_request_id: str) -> str:
@@ -54,6 +54,8 @@ from fides.api.service.connectors.saas.connector_registry_service import (
     ConnectorRegistry,
     create_connection_config_from_template_no_save,
 )
+from fides.api.service.connectors.sql_connector import SQLConnector
+from fides.api.service.connectors.sql_engine_registry import sql_engine_registry
 from fides.api.service.privacy_request.request_runner_service import (
     queue_privacy_request,
 )
@@ -232,6 +234,7 @@ def patch_connection_configs(
             connection_config = ConnectionConfig.create_or_update(
                 db, data=config_dict, check_name=False
             )
+            sql_engine_registry.invalidate(connection_config.key)
             created_or_updated.append(
                 ConnectionConfigurationResponse(**connection_config.__dict__)
             )
@@ -311,6 +314,7 @@ def delete_connection_config(db: Session, connection_key: FidesKey) -> None:
             saas_dataset.delete(db)  # type: ignore[union-attr]
 
     connection_config.delete(db)
+    sql_engine_registry.invalidate(connection_key)
 
     # Access Manual Webhooks are cascade deleted if their ConnectionConfig is deleted,
     # so we queue any privacy requests that are no longer blocked by webhooks
@@ -341,6 +345,10 @@ def connection_status(
             test_status=ConnectionTestStatus.failed,
             failure_reason=str(exc),
         )
+    finally:
+        if isinstance(connector, SQLConnector):
+            # Release the engine, so shared engines can be evicted or replaced
+            connector.close()
 
     logger.info("Connection test {} on {}", status.value, connection_config.key)  # type: ignore
     connection_config.update_test_status(test_status=status, db=db)  # type: ignore
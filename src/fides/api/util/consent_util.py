@@ -38,6 +38,7 @@ from fides.api.schemas.privacy_experience import ExperienceConfigCreateWithId
 from fides.api.schemas.privacy_notice import PrivacyNoticeCreation, PrivacyNoticeWithId
 from fides.api.schemas.redis_cache import Identity
 from fides.api.util.endpoint_utils import transform_fields
+from fides.config import CONFIG
 from fides.config.helpers import load_file
 
 PRIVACY_NOTICE_ESCAPE_FIELDS = ["name", "description", "internal_description"]
@@ -234,10 +235,7 @@ def get_fides_user_device_id_provided_identity(
         db=db,
         conditions=(
             (ProvidedIdentity.field_name == ProvidedIdentityType.fides_user_device_id)
-            & (
-                ProvidedIdentity.hashed_value
-                == ProvidedIdentity.hash_value(fides_user_device_id)
-            )
+            & (ProvidedIdentity.matches_value(fides_user_device_id))
             & (ProvidedIdentity.privacy_request_id.is_(None))
         ),
     ).first()
@@ -266,7 +264,7 @@ def get_or_create_fides_user_device_id_provided_identity(
             data={
                 "privacy_request_id": None,
                 "field_name": ProvidedIdentityType.fides_user_device_id.value,
-                "hashed_value": ProvidedIdentity.hash_value(
+                "hashed_value": ProvidedIdentity.legacy_hash_value(
                     identity_data.fides_user_device_id
                 ),
                 "encrypted_value": {"value": identity_data.fides_user_device_id},
@@ -276,6 +274,63 @@ def get_or_create_fides_user_device_id_provided_identity(
     return identity  # type: ignore[return-value]
 
 
+def get_or_create_fides_user_device_id_provided_identities(
+    db: Session, fides_user_device_ids: List[str]
+) -> Dict[str, ProvidedIdentity]:
+    """Batched version of get_or_create_fides_user_device_id_provided_identity, keyed by fides user device id.
+
+    Existing provided identities are looked up together by their blind index, and any missing
+    ones are created in a single flush. Does not commit.
+    """
+    blind_indexes: Dict[str, str] = {
+        ProvidedIdentity.blind_index_value(fides_user_device_id): fides_user_device_id
+        for fides_user_device_id in set(fides_user_device_ids)
+    }
+    identities: Dict[str, ProvidedIdentity] = {
+        blind_indexes[identity.blind_index]: identity
+        for identity in ProvidedIdentity.filter(
+            db=db,
+            conditions=(
+                (
+                    ProvidedIdentity.field_name
+                    == ProvidedIdentityType.fides_user_device_id
+                )
+                & (ProvidedIdentity.blind_index.in_(blind_indexes))
+                & (ProvidedIdentity.privacy_request_id.is_(None))
+            ),
+        )
+    }
+
+    missing: List[str] = [
+        fides_user_device_id
+        for fides_user_device_id in blind_indexes.values()
+        if fides_user_device_id not in identities
+    ]
+    new_identities: List[ProvidedIdentity] = []
+    for fides_user_device_id in missing:
+        # Identities saved before the blind index can only be matched by their legacy hash
+        identity = (
+            get_fides_user_device_id_provided_identity(db, fides_user_device_id)
+            if CONFIG.security.identity_legacy_hash
+            else None
+        )
+        if not identity:
+            identity = ProvidedIdentity(
+                privacy_request_id=None,
+                field_name=ProvidedIdentityType.fides_user_device_id,
+                hashed_value=ProvidedIdentity.legacy_hash_value(fides_user_device_id),
+                encrypted_value={"value": fides_user_device_id},
+            )
+            new_identities.append(identity)
+        identities[fides_user_device_id] = identity
+
+    if new_identities:
+        db.add_all(new_identities)
+        db.flush()
+
+    return identities
+
+
 def validate_notice_data_uses(
     privacy_notices: List[Union[PrivacyNoticeWithId, PrivacyNoticeCreation]],
     db: Session,
@@ -1,6 +1,7 @@
 import base64
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from fides.api.cryptography.cryptographic_util import bytes_to_b64_str
@@ -28,6 +29,21 @@ def _encrypt_to_bytes(plain_value: Optional[str], key: bytes, nonce: bytes) -> b
     return encrypted_bytes
 
 
+def encrypt_stream_to_bytes_verify_secrets_length(
+    plain_chunks: Iterable[bytes], key: bytes, nonce: bytes
+) -> Iterator[bytes]:
+    """Encrypts a stream of bytes using the AES GCM Algorithm, one chunk at a time.
+    Joined together, the yielded chunks are identical to the output of
+    encrypt_to_bytes_verify_secrets_length for the joined plain chunks"""
+    verify_nonce(nonce)
+    verify_encryption_key(key)
+    encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
+    encryptor.authenticate_additional_data(nonce)
+    for chunk in plain_chunks:
+        yield encryptor.update(chunk)
+    yield encryptor.finalize() + encryptor.tag
+
+
 def encrypt_verify_secret_length(
     plain_value: Optional[str], key: bytes, nonce: bytes
 ) -> str:
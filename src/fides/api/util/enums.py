@@ -4,3 +4,8 @@ from enum import Enum
 class ColumnSort(str, Enum):
     DESC = "desc"
     ASC = "asc"
+
+
+class ReportExportFormat(str, Enum):
+    csv = "csv"
+    ndjson = "ndjson"
@@ -0,0 +1,79 @@
+"""
+In-process cache of the IP addresses that hosts resolve to, so outbound SaaS requests, such as
+every page of a paginated endpoint, don't each block on a DNS lookup.
+"""
+import socket
+from threading import Lock
+from typing import Dict, Union
+
+from loguru import logger
+
+from fides.api.util.lru_cache import LRUCache
+from fides.config import CONFIG
+
+MAX_CACHED_HOSTS = 1024
+
+
+class HostResolutionCache(LRUCache[str, str]):
+    """
+    A bounded cache of the IPv4 address each host resolves to, kept for
+    CONFIG.execution.saas_dns_cache_ttl seconds.
+
+    The standard library resolver doesn't expose the TTL of the DNS records it returns, so
+    entries expire after the configured TTL instead. Hits and misses are counted, and the hit
+    rate is logged whenever a host has to be resolved.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(
+            lambda: MAX_CACHED_HOSTS, lambda: CONFIG.execution.saas_dns_cache_ttl
+        )
+        self._stats_lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def resolve(self, host: str) -> str:
+        """
+        Returns the IP address the host resolves to, from the cache if it hasn't expired.
+
+        Raises a socket.gaierror if the host can't be resolved. Failures aren't cached.
+        """
+        cached_ip = self.get(host)
+        if cached_ip:
+            with self._stats_lock:
+                self._hits += 1
+            return cached_ip
+
+        # Resolved outside of any lock, so a slow lookup doesn't hold up other hosts
+        host_ip: str = socket.gethostbyname(host)
+        self.set(host, host_ip)
+        with self._stats_lock:
+            self._misses += 1
+
+        logger.debug(
+            "Resolved host '{}' to '{}', cache hit rate {:.1%}",
+            host,
+            host_ip,
+            self.stats()["hit_rate"],
+        )
+        return host_ip
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Returns the hits, misses, hit rate and number of hosts cached since the cache was last cleared"""
+        with self._stats_lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "size": len(self),
+            }
+
+    def clear(self) -> None:
+        super().clear()
+        with self._stats_lock:
+            self._hits = 0
+            self._misses = 0
+
+
+host_resolution_cache = HostResolutionCache()
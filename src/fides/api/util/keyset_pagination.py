@@ -0,0 +1,177 @@
+"""
+Keyset pagination and streaming exports for large reporting queries.
+
+Rather than skipping an ever-growing OFFSET of rows, each page is fetched by filtering
+to the rows sorted after the last (sort value, id) of the previous page, which an index
+on (sort column, id) can seek to directly.
+"""
+import csv
+import io
+import json
+from binascii import Error as BinasciiError
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple, Type
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi_pagination.cursor import CursorPage, CursorParams, decode_cursor
+from sqlalchemy import literal, tuple_
+from sqlalchemy.orm import Query
+from starlette.responses import StreamingResponse
+from starlette.status import HTTP_400_BAD_REQUEST
+
+from fides.api.schemas.base_class import FidesSchema
+from fides.api.util.enums import ColumnSort, ReportExportFormat
+
+EXPORT_BATCH_SIZE = 1000
+
+Keyset = Tuple[datetime, str]
+
+
+def _encode_keyset(keyset: Keyset) -> str:
+    return json.dumps([keyset[0].isoformat(), keyset[1]])
+
+
+def _decode_keyset(cursor: Optional[str]) -> Optional[Keyset]:
+    """Decodes the (sort value, id) from a cursor returned by a previous page"""
+    if not cursor:
+        return None
+    try:
+        sort_value, id_value = json.loads(decode_cursor(cursor))  # type: ignore[arg-type]
+        return datetime.fromisoformat(sort_value), str(id_value)
+    except (BinasciiError, TypeError, ValueError):
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _keyset_query(
+    query: Query,
+    sort_column: Any,
+    id_column: Any,
+    sort_direction: ColumnSort,
+    after: Optional[Keyset],
+) -> Query:
+    """Sorts the query by (sort column, id), starting after the given keyset"""
+    keyset = tuple_(sort_column, id_column)
+    if sort_direction == ColumnSort.DESC:
+        if after:
+            query = query.filter(keyset < tuple_(literal(after[0]), literal(after[1])))
+        return query.order_by(sort_column.desc(), id_column.desc())
+
+    if after:
+        query = query.filter(keyset > tuple_(literal(after[0]), literal(after[1])))
+    return query.order_by(sort_column.asc(), id_column.asc())
+
+
+def keyset_paginate(
+    query: Query,
+    params: CursorParams,
+    sort_column: Any,
+    id_column: Any,
+    sort_key: str,
+    sort_direction: ColumnSort,
+) -> CursorPage:
+    """
+    Returns the page of the query after params.cursor, sorted by (sort column, id).
+
+    `sort_key` is the attribute the sort column's value is returned under on each row.
+    """
+    rows: List[Any] = (
+        _keyset_query(
+            query,
+            sort_column,
+            id_column,
+            sort_direction,
+            _decode_keyset(params.cursor),
+        )
+        .limit(params.size + 1)  # One extra row to check for a further page
+        .all()
+    )
+    items = rows[: params.size]
+
+    next_keyset: Optional[str] = None
+    if len(rows) > params.size and items:
+        next_keyset = _encode_keyset((getattr(items[-1], sort_key), items[-1].id))
+
+    return CursorPage.create(items, params, next_=next_keyset)
+
+
+def iterate_in_batches(
+    query: Query,
+    sort_column: Any,
+    id_column: Any,
+    sort_key: str,
+    sort_direction: ColumnSort,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[List[Any]]:
+    """Yields every row of the query in batches, sorted by (sort column, id)"""
+    after: Optional[Keyset] = None
+    while True:
+        batch: List[Any] = (
+            _keyset_query(query, sort_column, id_column, sort_direction, after)
+            .limit(batch_size)
+            .all()
+        )
+        if batch:
+            yield batch
+        if len(batch) < batch_size:
+            return
+        after = (getattr(batch[-1], sort_key), batch[-1].id)
+
+
+def stream_report_export(
+    query: Query,
+    schema: Type[FidesSchema],
+    sort_column: Any,
+    id_column: Any,
+    sort_key: str,
+    sort_direction: ColumnSort,
+    export_format: ReportExportFormat,
+    file_name: str,
+) -> StreamingResponse:
+    """
+    Streams every row of the query as NDJSON or CSV, serialized with the given schema.
+
+    Rows are fetched in keyset-paginated batches and written out a batch at a time,
+    so the response starts right away and memory use doesn't grow with the report.
+    """
+
+    def generate_ndjson() -> Iterator[str]:
+        for batch in iterate_in_batches(
+            query, sort_column, id_column, sort_key, sort_direction
+        ):
+            yield "".join(f"{schema.from_orm(row).json()}\n" for row in batch)
+
+    def generate_csv() -> Iterator[str]:
+        f = io.StringIO()
+        csv_file = csv.writer(f)
+        field_names = list(schema.__fields__)
+        csv_file.writerow(field_names)
+        yield f.getvalue()
+
+        for batch in iterate_in_batches(
+            query, sort_column, id_column, sort_key, sort_direction
+        ):
+            f.seek(0)
+            f.truncate()
+            for row in batch:
+                data = jsonable_encoder(schema.from_orm(row))
+                csv_file.writerow(
+                    [
+                        json.dumps(data[field_name])
+                        if isinstance(data[field_name], (dict, list))
+                        else data[field_name]
+                        for field_name in field_names
+                    ]
+                )
+            yield f.getvalue()
+
+    if export_format == ReportExportFormat.csv:
+        response = StreamingResponse(generate_csv(), media_type="text/csv")
+    else:
+        response = StreamingResponse(
+            generate_ndjson(), media_type="application/x-ndjson"
+        )
+    response.headers[
+        "Content-Disposition"
+    ] = f"attachment; filename={file_name}_{datetime.today().strftime('%Y-%m-%d')}.{export_format.value}"
+    return response
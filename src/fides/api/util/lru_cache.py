@@ -0,0 +1,73 @@
+"""
+A bounded, least-recently-used in-process cache, for values that are expensive to build and
+safe to share between requests.
+"""
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+class LRUCache(Generic[KeyType, ValueType]):
+    """
+    A thread-safe cache holding up to max_size values, evicting the least recently used values
+    beyond that. If ttl_seconds is given, values also expire that many seconds after they're set.
+
+    The size and TTL are callables, typically reading from the config, so changes to the config
+    take effect without rebuilding the cache. Nothing is cached while either is zero or less.
+    """
+
+    def __init__(
+        self,
+        max_size: Callable[[], int],
+        ttl_seconds: Optional[Callable[[], int]] = None,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        # Values by key, along with when they expire, if they do
+        self._entries: OrderedDict[
+            KeyType, Tuple[Optional[float], ValueType]
+        ] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: KeyType) -> Optional[ValueType]:
+        """Returns the cached value, or None if it isn't cached or has expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: KeyType, value: ValueType) -> None:
+        """Caches the value, evicting the least recently used values beyond the cache size"""
+        max_size: int = self._max_size()
+        ttl_seconds: Optional[int] = self._ttl_seconds() if self._ttl_seconds else None
+        if max_size <= 0 or (ttl_seconds is not None and ttl_seconds <= 0):
+            return
+
+        expires_at = monotonic() + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: KeyType) -> None:
+        """Removes the value from the cache, if it's cached"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
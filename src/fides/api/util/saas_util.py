@@ -17,6 +17,7 @@ from fides.api.graph.config import Collection, CollectionAddress, Field, GraphDa
 from fides.api.models.privacy_request import PrivacyRequest
 from fides.api.schemas.saas.saas_config import SaaSRequest
 from fides.api.schemas.saas.shared_schemas import SaaSRequestParams
+from fides.api.util.host_resolution_cache import host_resolution_cache
 from fides.config import CONFIG
 from fides.config.helpers import load_file
 
@@ -27,24 +28,36 @@ ALL_OBJECT_FIELDS = "all_object_fields"
 CUSTOM_PRIVACY_REQUEST_FIELDS = "custom_privacy_request_fields"
 
 
-def deny_unsafe_hosts(host: str) -> str:
+def resolve_safe_host_ip(host: str) -> str:
     """
-    Verify that the provided host isn't a potentially unsafe one.
+    Resolve the provided host, through the host resolution cache, and verify that its IP address
+    isn't a potentially unsafe one. Returns the IP address, so that connections can be made to
+    exactly the address that was verified.
 
     WARNING: IPv6 is _not_ supported and will throw an exception!
     """
-    if CONFIG.dev_mode:
-        return host
-
     try:
         host_ip: Union[IPv4Address, IPv6Address] = ip_address(
-            socket.gethostbyname(host)
+            host_resolution_cache.resolve(host)
         )
     except socket.gaierror:
         raise ValueError(f"Failed to resolve hostname: {host}")
 
     if host_ip.is_link_local or host_ip.is_loopback:
         raise ValueError(f"Host '{host}' with IP Address '{host_ip}' is not safe!")
+    return str(host_ip)
+
+
+def deny_unsafe_hosts(host: str) -> str:
+    """
+    Verify that the provided host isn't a potentially unsafe one.
+
+    WARNING: IPv6 is _not_ supported and will throw an exception!
+    """
+    if CONFIG.dev_mode:
+        return host
+
+    resolve_safe_host_ip(host)
     return host
 
 
@@ -75,7 +75,7 @@ def validate_ac_string_format(ac_str: Optional[str]) -> None:
         raise DecodeFidesStringError("Unexpected AC String format")
 
 
-def _ac_str_to_universal_vendor_id_list(ac_str: Optional[str]) -> List[str]:
+def ac_str_to_universal_vendor_id_list(ac_str: Optional[str]) -> List[str]:
     """Helper to convert an AC string into a list of universal ac vendor ids
 
     Used when saving preferences from an AC string
@@ -112,10 +112,8 @@ def _convert_ac_strings_to_fides_preferences(
     Vendors in both strings are saved as an opt-in.  AC vendors in the datamap, but not in the supplied AC string,
     get persisted as an explicit opt-out.
     """
-    ac_string_vendor_ids: List[str] = _ac_str_to_universal_vendor_id_list(
-        current_ac_str
-    )
-    accept_all_ac_vendor_ids: List[str] = _ac_str_to_universal_vendor_id_list(
+    ac_string_vendor_ids: List[str] = ac_str_to_universal_vendor_id_list(current_ac_str)
+    accept_all_ac_vendor_ids: List[str] = ac_str_to_universal_vendor_id_list(
         accept_all_ac_str
     )
 
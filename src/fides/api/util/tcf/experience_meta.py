@@ -1,6 +1,7 @@
 import hashlib
 import json
-from typing import Dict, List, Union
+from copy import deepcopy
+from typing import Dict, List, Optional, Tuple, Union
 
 from pydantic import Extra, Field, root_validator
 
@@ -14,8 +15,13 @@ from fides.api.schemas.tcf import (
 )
 from fides.api.util.tcf.fides_string import build_fides_string
 from fides.api.util.tcf.tc_mobile_data import build_tc_data_for_mobile
-from fides.api.util.tcf.tc_model import TCModel, convert_tcf_contents_to_tc_model
+from fides.api.util.tcf.tc_model import (
+    TCModel,
+    convert_tcf_contents_to_tc_model,
+    get_epoch_time,
+)
 from fides.api.util.tcf.tcf_experience_contents import TCFExperienceContents
+from fides.api.util.tcf.tcf_string_cache import tcf_meta_cache
 
 
 class TCFVersionHash(FidesSchema):
@@ -140,8 +146,22 @@ def build_tcf_version_hash(tcf_contents: TCFExperienceContents) -> str:
     return hashed_val[:12]  # Shortening string for usability, collision risk is low
 
 
-def build_experience_tcf_meta(tcf_contents: TCFExperienceContents) -> Dict:
-    """Build TCF Meta information to supplement a TCF Privacy Experience at runtime"""
+def build_experience_tcf_meta(
+    tcf_contents: TCFExperienceContents, tcf_contents_version: Optional[str] = None
+) -> Dict:
+    """Build TCF Meta information to supplement a TCF Privacy Experience at runtime
+
+    Meta only depends on the TCF contents and the day the accept-all and reject-all strings are
+    created, so when the TCF contents version is supplied it's cached for that version and day, and
+    the version hash and strings are only built once a day.
+    """
+    cache_key: Optional[Tuple[str, int]] = (
+        (tcf_contents_version, get_epoch_time()) if tcf_contents_version else None
+    )
+    if cache_key:
+        cached_meta: Optional[Dict] = tcf_meta_cache.get(cache_key)
+        if cached_meta:
+            return deepcopy(cached_meta)
 
     accept_all_tc_model: TCModel = convert_tcf_contents_to_tc_model(
         tcf_contents, UserConsentPreference.opt_in
@@ -153,7 +173,7 @@ def build_experience_tcf_meta(tcf_contents: TCFExperienceContents) -> Dict:
     accept_all_mobile_data: TCMobileData = build_tc_data_for_mobile(accept_all_tc_model)
     reject_all_mobile_data: TCMobileData = build_tc_data_for_mobile(reject_all_tc_model)
 
-    return ExperienceMeta(
+    meta: Dict = ExperienceMeta(
         version_hash=build_tcf_version_hash(tcf_contents),
         accept_all_fides_string=build_fides_string(
             accept_all_mobile_data.IABTCF_TCString,
@@ -166,3 +186,7 @@ def build_experience_tcf_meta(tcf_contents: TCFExperienceContents) -> Dict:
         accept_all_fides_mobile_data=accept_all_mobile_data,
         reject_all_fides_mobile_data=reject_all_mobile_data,
     ).dict()
+
+    if cache_key:
+        tcf_meta_cache.set(cache_key, deepcopy(meta))
+    return meta
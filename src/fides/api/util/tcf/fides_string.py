@@ -1,7 +1,26 @@
-from typing import Optional, Tuple
+import string
+from typing import FrozenSet, Hashable, Optional, Tuple
 
 from fides.api.common_exceptions import DecodeFidesStringError
-from fides.api.util.tcf.ac_string import FIDES_SEPARATOR, validate_ac_string_format
+from fides.api.schemas.privacy_preference import FidesStringFidesPreferences
+from fides.api.util.tcf.ac_string import (
+    FIDES_SEPARATOR,
+    ac_str_to_universal_vendor_id_list,
+    decode_ac_string_to_preferences,
+    validate_ac_string_format,
+)
+from fides.api.util.tcf.tc_string import (
+    DecodedCoreString,
+    convert_decoded_core_string_to_preferences,
+    decode_core_string,
+)
+from fides.api.util.tcf.tcf_experience_contents import TCFExperienceContents
+from fides.api.util.tcf.tcf_string_cache import fides_string_preferences_cache
+
+# The core TC string starts with a 6 bit version then 36 bit created and last updated times, so in
+# base64 the times are exactly the 12 characters following the version
+TC_STRING_TIMESTAMP_CHARS = slice(1, 13)
+BASE64_URL_CHARS = frozenset(string.ascii_letters + string.digits + "-_")
 
 
 def build_fides_string(tc_str: Optional[str], ac_str: Optional[str]) -> str:
@@ -34,3 +53,86 @@ def split_fides_string(fides_str: Optional[str]) -> Tuple[Optional[str], Optiona
 
     validate_ac_string_format(ac_str)
     return tc_str, ac_str
+
+
+def decode_fides_string_to_preferences(
+    tc_str: Optional[str],
+    ac_str: Optional[str],
+    tcf_contents: TCFExperienceContents,
+    tcf_contents_version: Optional[str] = None,
+) -> FidesStringFidesPreferences:
+    """Decode the TC string and AC string sections of a Fides String into preferences that can be saved,
+    combining the vendor consent preferences from both.
+
+    Preferences only depend on the TCF contents and the choices encoded in the strings, so when the
+    TCF contents version is supplied they're cached under the version and those choices. Strings
+    created at different times with the same choices share an entry.
+
+    They're first looked up by the strings themselves, without the TC string's created and last
+    updated times, so repeats of a string skip decoding it. Otherwise they're looked up by the
+    decoded choices, which also matches the same choices encoded differently.
+    """
+    raw_cache_key: Optional[Hashable] = None
+    if tcf_contents_version:
+        raw_tc_str_key: Optional[str] = _tc_string_without_timestamps(tc_str)
+        if raw_tc_str_key is not None:
+            raw_cache_key = (tcf_contents_version, raw_tc_str_key, ac_str)
+            cached_preferences: Optional[
+                FidesStringFidesPreferences
+            ] = fides_string_preferences_cache.get(raw_cache_key)
+            if cached_preferences:
+                return cached_preferences.copy(deep=True)
+
+    decoded_tc_str: Optional[DecodedCoreString] = (
+        decode_core_string(tc_str) if tc_str else None
+    )
+    ac_vendor_ids: Optional[FrozenSet[str]] = (
+        frozenset(ac_str_to_universal_vendor_id_list(ac_str)) if ac_str else None
+    )
+    cache_key: Hashable = (tcf_contents_version, decoded_tc_str, ac_vendor_ids)
+
+    if tcf_contents_version:
+        cached_preferences = fides_string_preferences_cache.get(cache_key)
+        if cached_preferences:
+            if raw_cache_key:
+                fides_string_preferences_cache.set(raw_cache_key, cached_preferences)
+            return cached_preferences.copy(deep=True)
+
+    preferences: FidesStringFidesPreferences = (
+        convert_decoded_core_string_to_preferences(decoded_tc_str, tcf_contents)
+        if decoded_tc_str
+        else FidesStringFidesPreferences()
+    )
+    # We combine Vendor Consent Preferences from the TC String and AC String if applicable
+    preferences.vendor_consent_preferences = (
+        preferences.vendor_consent_preferences
+        + decode_ac_string_to_preferences(
+            ac_str, tcf_contents
+        ).vendor_consent_preferences
+    )
+
+    if tcf_contents_version:
+        cached_preferences = preferences.copy(deep=True)
+        fides_string_preferences_cache.set(cache_key, cached_preferences)
+        if raw_cache_key:
+            fides_string_preferences_cache.set(raw_cache_key, cached_preferences)
+    return preferences
+
+
+def _tc_string_without_timestamps(tc_str: Optional[str]) -> Optional[str]:
+    """Returns the core segment of the TC string without its created and last updated times, or
+    None if those characters aren't valid base64, so that the string is decoded and rejected.
+
+    Only the core segment is decoded into preferences, so the other segments are dropped too.
+    """
+    if not tc_str:
+        return ""
+    core_str: str = tc_str.split(".")[0]
+    if len(core_str) <= TC_STRING_TIMESTAMP_CHARS.stop:
+        return None
+    if not BASE64_URL_CHARS.issuperset(core_str[TC_STRING_TIMESTAMP_CHARS]):
+        return None
+    return (
+        core_str[: TC_STRING_TIMESTAMP_CHARS.start]
+        + core_str[TC_STRING_TIMESTAMP_CHARS.stop :]
+    )
@@ -0,0 +1,165 @@
+"""
+Bit-level writing and reading of TC string segments.
+
+Segments are packed straight into a bytearray as fields are written, rather than built up as a
+string of "0"s and "1"s, and vendor sections use whichever of the bitfield or range encodings
+is shorter.
+
+https://github.com/InteractiveAdvertisingBureau/GDPR-Transparency-and-Consent-Framework/blob/master/TCFv2/IAB%20Tech%20Lab%20-%20Consent%20string%20and%20vendor%20list%20formats%20v2.md#vendor-consent-section
+"""
+import base64
+from typing import Iterable, List, Set, Tuple
+
+# 6 bits (basis for base 64) and 8 bits (one byte)
+SEGMENT_PADDING_BITS = 24
+
+MAX_VENDOR_ID_BITS = 16
+NUM_ENTRIES_BITS = 12
+VENDOR_ID_BITS = 16
+
+
+def vendor_ranges(vendor_ids: Iterable[int]) -> List[Tuple[int, int]]:
+    """Collapse vendor ids into sorted (start, end) ranges of consecutive ids"""
+    ranges: List[Tuple[int, int]] = []
+    for vendor_id in sorted(set(vendor_ids)):
+        if ranges and ranges[-1][1] == vendor_id - 1:
+            ranges[-1] = (ranges[-1][0], vendor_id)
+        else:
+            ranges.append((vendor_id, vendor_id))
+    return ranges
+
+
+def _range_encoding_bits(ranges: List[Tuple[int, int]]) -> int:
+    """The number of bits the range entries take up, after the IsRangeEncoding bit"""
+    return NUM_ENTRIES_BITS + sum(
+        1 + VENDOR_ID_BITS + (VENDOR_ID_BITS if start != end else 0)
+        for start, end in ranges
+    )
+
+
+class BitWriter:
+    """Packs the fields of a TC string segment into bytes, most significant bit first"""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._length = 0
+
+    def __len__(self) -> int:
+        """The number of bits written so far"""
+        return self._length
+
+    def _extend(self, num_bits: int) -> int:
+        """Makes room for the next num_bits, returning the position they start at"""
+        position = self._length
+        self._length += num_bits
+        self._buffer.extend(bytes(-(-self._length // 8) - len(self._buffer)))
+        return position
+
+    def _set_bit(self, position: int) -> None:
+        self._buffer[position >> 3] |= 0x80 >> (position & 7)
+
+    def write_int(self, value: int, num_bits: int) -> None:
+        """Writes a non-negative integer using exactly num_bits bits"""
+        if value < 0 or value >> num_bits:
+            raise ValueError(f"{value} cannot be encoded in {num_bits} bits")
+        position = self._extend(num_bits)
+        for offset in range(num_bits):
+            if value >> (num_bits - 1 - offset) & 1:
+                self._set_bit(position + offset)
+
+    def write_bitfield(self, ids: Iterable[int], num_bits: int) -> None:
+        """Writes num_bits bits, where the bit for id n (starting from 1) is set if n is in ids.
+        Ids outside of 1..num_bits can't be represented and are skipped."""
+        position = self._extend(num_bits)
+        for identifier in ids:
+            identifier = int(identifier)
+            if 1 <= identifier <= num_bits:
+                self._set_bit(position + identifier - 1)
+
+    def write_vendors(self, vendor_ids: Iterable[int]) -> None:
+        """Writes a vendor section: MaxVendorId, IsRangeEncoding, then either the bitfield or
+        the range entries, whichever is shorter. Ties are written as a bitfield."""
+        ids: Set[int] = {int(vendor_id) for vendor_id in vendor_ids}
+        max_vendor_id: int = max(ids, default=0)
+        self.write_int(max_vendor_id, MAX_VENDOR_ID_BITS)
+
+        ranges = vendor_ranges(ids)
+        if _range_encoding_bits(ranges) >= max_vendor_id:
+            self.write_int(0, 1)
+            self.write_bitfield(ids, max_vendor_id)
+            return
+
+        self.write_int(1, 1)
+        self.write_int(len(ranges), NUM_ENTRIES_BITS)
+        for start, end in ranges:
+            is_range: bool = start != end
+            self.write_int(int(is_range), 1)
+            self.write_int(start, VENDOR_ID_BITS)
+            if is_range:
+                self.write_int(end, VENDOR_ID_BITS)
+
+    def to_bytes(self) -> bytes:
+        """The bits written, padded with zeros to both work with base64 and bit->byte conversion.
+
+        A segment that already fills a whole number of 24 bit blocks still gets another 24 bits
+        of padding, which strings built by earlier versions also have.
+        """
+        padded_length = (
+            self._length + SEGMENT_PADDING_BITS - (self._length % SEGMENT_PADDING_BITS)
+        )
+        return bytes(self._buffer) + bytes(padded_length // 8 - len(self._buffer))
+
+    def to_base64(self) -> str:
+        return base64.urlsafe_b64encode(self.to_bytes()).decode()
+
+
+class BitReader:
+    """Reads the fields of a TC string segment, most significant bit first.
+
+    Raises a ValueError for reads past the end of the segment, rather than reading zeros.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self._value = int.from_bytes(data, byteorder="big")
+        self._length = len(data) * 8
+        self._position = 0
+
+    @classmethod
+    def from_base64(cls, segment: str) -> "BitReader":
+        """Raises a binascii.Error if the segment isn't valid base64"""
+        padding = "=" * (-len(segment) % 4)
+        return cls(base64.urlsafe_b64decode(segment + padding))
+
+    def read_int(self, num_bits: int) -> int:
+        end = self._position + num_bits
+        if end > self._length:
+            raise ValueError("Read past the end of the TC string segment")
+        self._position = end
+        return (self._value >> (self._length - end)) & ((1 << num_bits) - 1)
+
+    def skip(self, num_bits: int) -> None:
+        self.read_int(num_bits)
+
+    def read_bitfield(self, num_bits: int) -> Set[int]:
+        """Reads num_bits bits, returning the ids (starting from 1) of the bits that are set"""
+        bits = self.read_int(num_bits)
+        ids: Set[int] = set()
+        while bits:
+            lowest_bit = bits & -bits
+            ids.add(num_bits - lowest_bit.bit_length() + 1)
+            bits ^= lowest_bit
+        return ids
+
+    def read_vendors(self) -> Set[int]:
+        """Reads a vendor section written with either the bitfield or range encoding"""
+        max_vendor_id = self.read_int(MAX_VENDOR_ID_BITS)
+        if not self.read_int(1):
+            return self.read_bitfield(max_vendor_id)
+
+        ids: Set[int] = set()
+        for _ in range(self.read_int(NUM_ENTRIES_BITS)):
+            is_range = self.read_int(1)
+            start = self.read_int(VENDOR_ID_BITS)
+            end = self.read_int(VENDOR_ID_BITS) if is_range else start
+            ids.update(range(start, end + 1))
+        return ids
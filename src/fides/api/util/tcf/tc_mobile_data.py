@@ -1,5 +1,5 @@
 import binascii
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from iab_tcf import ConsentV2, decode_v2  # type: ignore[import]
 
@@ -77,6 +77,20 @@ def _integer_dict_to_list(int_dict: Dict[int, bool]) -> List[int]:
     return [identifier for identifier, consented in int_dict.items() if consented]
 
 
+def _vendor_ranges_to_list(
+    max_vendor_id: int, vendor_ranges: List[Tuple[int, int]]
+) -> List[int]:
+    """Expands the (start, end) ranges of a range-encoded vendor section into a list of vendor ids.
+
+    The highest vendor id in the ranges has to be the section's max vendor id.
+    """
+    if not vendor_ranges or max(end for _, end in vendor_ranges) != max_vendor_id:
+        raise ValueError("Invalid range-encoded vendor section")
+    return [
+        vendor_id for start, end in vendor_ranges for vendor_id in range(start, end + 1)
+    ]
+
+
 def convert_fides_str_to_mobile_data(
     fides_str: Optional[str],
 ) -> Optional[TCMobileData]:
@@ -105,11 +119,22 @@ def convert_fides_str_to_mobile_data(
         )
 
     try:
-        vendor_consents: List[int] = _integer_dict_to_list(decoded.consented_vendors)
+        # Vendor sections may use either bitfield or range encoding
+        vendor_consents: List[int] = (
+            _vendor_ranges_to_list(
+                decoded.max_consent_vendor_id, decoded.consented_vendors_range
+            )
+            if decoded.is_consent_range_encoding
+            else _integer_dict_to_list(decoded.consented_vendors)
+        )
         max_vendor_consents: int = _get_max_vendor_id(vendor_consents)
 
-        vendor_legitimate_interests: List[int] = _integer_dict_to_list(
-            decoded.interests_vendors
+        vendor_legitimate_interests: List[int] = (
+            _vendor_ranges_to_list(
+                decoded.max_interests_vendor_id, decoded.interests_vendors_range
+            )
+            if decoded.is_interests_range_encoding
+            else _integer_dict_to_list(decoded.interests_vendors)
         )
         max_vendor_legitimate_interests: int = _get_max_vendor_id(
             vendor_legitimate_interests
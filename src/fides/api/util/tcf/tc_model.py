@@ -389,7 +389,7 @@ def _build_vendors_disclosed(tcf_contents: TCFExperienceContents) -> List[int]:
     return sorted(list(vendors_disclosed))
 
 
-def _get_epoch_time() -> int:
+def get_epoch_time() -> int:
     """Calculate the epoch time to be used for both created and updated_at
 
     Matches this: Math.round(Date.UTC(new Date().getUTCFullYear(), new Date().getUTCMonth(), new Date().getUTCDate())/100)
@@ -439,7 +439,7 @@ def convert_tcf_contents_to_tc_model(
         tcf_contents.tcf_special_features
     )
 
-    current_time: int = _get_epoch_time()
+    current_time: int = get_epoch_time()
 
     tc_model = TCModel(
         created=current_time,
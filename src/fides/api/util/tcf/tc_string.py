@@ -1,8 +1,7 @@
-import base64
 import binascii
-from typing import Any, Dict, List, Optional, Type, Union
+from dataclasses import dataclass
+from typing import AbstractSet, Any, FrozenSet, List, Optional, Set, Type, Union
 
-from iab_tcf import ConsentV2, decode_v2  # type: ignore[import]
 from pydantic import Field
 
 from fides.api.common_exceptions import DecodeFidesStringError
@@ -10,6 +9,7 @@ from fides.api.models.privacy_notice import UserConsentPreference
 from fides.api.schemas.base_class import FidesSchema
 from fides.api.schemas.privacy_preference import FidesStringFidesPreferences
 from fides.api.schemas.tcf import TCFPurposeSave, TCFSpecialFeatureSave, TCFVendorSave
+from fides.api.util.tcf.tc_bits import BitReader, BitWriter
 from fides.api.util.tcf.tc_model import TCModel, convert_tcf_contents_to_tc_model
 
 # Number of bits allowed for certain sections that are used in multiple places
@@ -58,9 +58,8 @@ def get_bits_for_section(fields: List[TCField], tc_model: TCModel) -> str:
         if isinstance(val, list):
             # List of integers expected.  Bitstring should be the length of the
             # maximum integer in the list
-            for i in range(1, num_bits + 1):
-                bit_components += "1" if i in val else "0"
-            return bit_components
+            ids: Set[int] = set(val)
+            return "".join("1" if i in ids else "0" for i in range(1, num_bits + 1))
 
         # Converts an integer to bits, padding to use the specified number of bits
         return format(val, f"0{num_bits}b")
@@ -89,18 +88,6 @@ def _convert_letter_to_number(letter: str) -> int:
     return ord(letter) - ord("A")
 
 
-def _convert_bitstring_to_bytes(bitstr: str) -> bytes:
-    """Convert a string of 0's and 1's to bytes, padded to both work with base64
-    and bit->byte conversion"""
-    least_common_multiple = 24  # 6 bits (basis for base 64) and 8 bits (one byte)
-    padding: int = len(bitstr) % least_common_multiple
-    new_bits: str = "0" * (least_common_multiple - padding)
-    bitstr += new_bits
-
-    integer_val: int = int(bitstr, 2)
-    return integer_val.to_bytes((len(bitstr)) // 8, byteorder="big")
-
-
 def _get_max_vendor_id(vendor_list: List[int]) -> int:
     """Get the maximum vendor id in the supplied list"""
     if not vendor_list:
@@ -109,6 +96,29 @@ def _get_max_vendor_id(vendor_list: List[int]) -> int:
     return max(int(vendor_id) for vendor_id in vendor_list)
 
 
+def write_section(writer: BitWriter, fields: List[TCField], tc_model: TCModel) -> None:
+    """Write the fields supplied for a given section to the BitWriter"""
+    for tc_field in fields:
+        # Either fetch the field of the same name off of the TCModel for encoding,
+        # or use the value override, if supplied.
+        field_value: Any = (
+            tc_field.value_override
+            if tc_field.value_override is not None
+            else getattr(tc_model, tc_field.name)
+        )
+
+        if isinstance(field_value, str):
+            # Letters are converted to numbers and get an equal share of the bits apiece
+            bit_allocation = int(tc_field.bits / len(field_value))
+            for char in field_value:
+                writer.write_int(_convert_letter_to_number(char), bit_allocation)
+        elif isinstance(field_value, list):
+            writer.write_bitfield(field_value, tc_field.bits)
+        else:
+            # Bools are written as 1 or 0
+            writer.write_int(int(field_value), tc_field.bits)
+
+
 def build_tc_string(model: TCModel) -> str:
     """Construct a TC String from the given TCModel
 
@@ -124,12 +134,12 @@ def build_core_string(model: TCModel) -> str:
     """
     Build the "core" TC String
 
+    Vendor sections use range encoding when it's shorter than a bitfield, for example when
+    only a few vendors with large ids are included.
+
     https://github.com/InteractiveAdvertisingBureau/GDPR-Transparency-and-Consent-Framework/blob/master/TCFv2/IAB%20Tech%20Lab%20-%20Consent%20string%20and%20vendor%20list%20formats%20v2.md#the-core-string
     """
-    max_vendor_consents: int = _get_max_vendor_id(model.vendor_consents)
-    max_vendor_li: int = _get_max_vendor_id(model.vendor_legitimate_interests)
-
-    # List of core fields.  Order is intentional!
+    # List of core fields before the vendor sections.  Order is intentional!
     core_fields: list = [
         TCField(name="version", bits=6),
         TCField(name="created", bits=36),
@@ -149,21 +159,14 @@ def build_core_string(model: TCModel) -> str:
         ),
         TCField(name="purpose_one_treatment", bits=1),
         TCField(name="publisher_country_code", bits=12),
-        TCField(name="max_vendor_consent", bits=16, value_override=max_vendor_consents),
-        TCField(
-            name="is_vendor_consent_range_encoding", bits=1, value_override=0
-        ),  # Using bitfield
-        TCField(name="vendor_consents", bits=max_vendor_consents),
-        TCField(name="max_vendor_li", bits=16, value_override=max_vendor_li),
-        TCField(
-            name="is_vendor_li_range_encoding", bits=1, value_override=0
-        ),  # Using bitfield
-        TCField(name="vendor_legitimate_interests", bits=max_vendor_li),
-        TCField(name="num_pub_restrictions", bits=12),
     ]
 
-    core_bits: str = get_bits_for_section(core_fields, model)
-    return base64.urlsafe_b64encode(_convert_bitstring_to_bytes(core_bits)).decode()
+    writer = BitWriter()
+    write_section(writer, core_fields, model)
+    writer.write_vendors(model.vendor_consents)
+    writer.write_vendors(model.vendor_legitimate_interests)
+    write_section(writer, [TCField(name="num_pub_restrictions", bits=12)], model)
+    return writer.to_base64()
 
 
 def build_disclosed_vendors_string(model: TCModel) -> str:
@@ -171,28 +174,57 @@ def build_disclosed_vendors_string(model: TCModel) -> str:
 
     https://github.com/InteractiveAdvertisingBureau/GDPR-Transparency-and-Consent-Framework/blob/master/TCFv2/IAB%20Tech%20Lab%20-%20Consent%20string%20and%20vendor%20list%20formats%20v2.md#disclosed-vendors
     """
-    max_vendor_id: int = _get_max_vendor_id(model.vendors_disclosed)
+    writer = BitWriter()
+    writer.write_int(1, 3)  # Segment type 1 for Disclosed Vendors section
+    writer.write_vendors(model.vendors_disclosed)
+    return writer.to_base64()
 
-    # List of disclosed vendor fields.  Order is intentional!
-    disclosed_vendor_fields: list = [
-        TCField(
-            name="segment_type", bits=3, value_override=1
-        ),  # 1 for Disclosed Vendors section
-        TCField(name="max_vendor_id", bits=16, value_override=max_vendor_id),
-        TCField(
-            name="is_range_encoding", bits=1, value_override=0
-        ),  # Using Bitfield encoding
-        TCField(
-            name="vendors_disclosed",
-            bits=max_vendor_id,
-            value_override=model.vendors_disclosed,
-        ),
-    ]
 
-    disclosed_vendor_bits: str = get_bits_for_section(disclosed_vendor_fields, model)
-    return base64.urlsafe_b64encode(
-        _convert_bitstring_to_bytes(disclosed_vendor_bits)
-    ).decode()
+@dataclass(frozen=True)
+class DecodedCoreString:
+    """The opt-ins encoded in the core TC string.  Strings with the same opt-ins decode to equal,
+    hashable values, regardless of when they were created."""
+
+    special_feature_optins: FrozenSet[int]
+    purpose_consents: FrozenSet[int]
+    purpose_legitimate_interests: FrozenSet[int]
+    vendor_consents: FrozenSet[int]
+    vendor_legitimate_interests: FrozenSet[int]
+
+
+def decode_core_string(tc_string: str) -> DecodedCoreString:
+    """Decode the opt-ins from the core segment of a TC string, skipping the fields that
+    aren't saved as preferences.
+
+    Raises a DecodeFidesStringError if the string isn't a valid version 2 TC string.
+    """
+    try:
+        reader = BitReader.from_base64(tc_string.split(".")[0])
+        if reader.read_int(6) != 2:
+            raise ValueError("Unsupported TC string version")
+        # Created through policy version, is service specific, and use non standard texts
+        reader.skip(
+            36 + 36 + 12 + 12 + 6 + 12 + 12 + 6 + 1 + USE_NON_STANDARD_TEXT_BITS
+        )
+        special_feature_optins = reader.read_bitfield(SPECIAL_FEATURE_BITS)
+        purpose_consents = reader.read_bitfield(PURPOSE_CONSENTS_BITS)
+        purpose_legitimate_interests = reader.read_bitfield(
+            PURPOSE_LEGITIMATE_INTERESTS_BITS
+        )
+        # Purpose one treatment and publisher country code
+        reader.skip(1 + 12)
+        vendor_consents = reader.read_vendors()
+        vendor_legitimate_interests = reader.read_vendors()
+    except (binascii.Error, ValueError):
+        raise DecodeFidesStringError("Invalid base64-encoded TC string")
+
+    return DecodedCoreString(
+        special_feature_optins=frozenset(special_feature_optins),
+        purpose_consents=frozenset(purpose_consents),
+        purpose_legitimate_interests=frozenset(purpose_legitimate_interests),
+        vendor_consents=frozenset(vendor_consents),
+        vendor_legitimate_interests=frozenset(vendor_legitimate_interests),
+    )
 
 
 def boolean_to_user_consent_preference(preference: bool) -> UserConsentPreference:
@@ -204,7 +236,7 @@ FidesPreferenceType = Union[TCFPurposeSave, TCFVendorSave, TCFSpecialFeatureSave
 
 def convert_to_fides_preference(
     datamap_options: List[int],
-    tc_string_preferences: Dict[int, bool],
+    tc_string_optins: AbstractSet[int],
     preference_class: Union[
         Type[TCFPurposeSave], Type[TCFVendorSave], Type[TCFSpecialFeatureSave]
     ],
@@ -217,7 +249,7 @@ def convert_to_fides_preference(
 
     for identifier in datamap_options:
         # Check if there's an opt_in encoded in the string.  Otherwise, we assume the user is opting out.
-        preference: bool = tc_string_preferences.get(identifier, False)
+        preference: bool = identifier in tc_string_optins
 
         if preference_class == TCFVendorSave:
             # Vendors are currently saved as strings in our db.
@@ -243,17 +275,16 @@ def decode_tc_string_to_preferences(
     preferences can be saved into the Fides database"""
     if not tc_string:
         return FidesStringFidesPreferences()
-    try:
-        # Decode the string and pull the user opt-ins off of the string
-        decoded: ConsentV2 = decode_v2(tc_string)
-        tc_str_p_c: Dict[int, bool] = decoded.purposes_consent
-        tc_str_p_li: Dict[int, bool] = decoded.purposes_legitimate_interests
-        tc_str_v_c: Dict[int, bool] = decoded.consented_vendors
-        tc_str_v_li: Dict[int, bool] = decoded.interests_vendors
-        tc_str_sf: Dict[int, bool] = decoded.special_features_optin
-    except (binascii.Error, AttributeError):
-        raise DecodeFidesStringError("Invalid base64-encoded TC string")
+    # Decode the string and pull the user opt-ins off of the string
+    return convert_decoded_core_string_to_preferences(
+        decode_core_string(tc_string), tcf_contents
+    )
 
+
+def convert_decoded_core_string_to_preferences(
+    decoded: DecodedCoreString, tcf_contents: TCFExperienceContents
+) -> FidesStringFidesPreferences:
+    """Convert the opt-ins decoded from a TC string into preferences for everything in the datamap"""
     # From our datamap, build all the possible options for the TC string, if the user
     # opted into everything
     all_options_tc_model: TCModel = convert_tcf_contents_to_tc_model(
@@ -270,18 +301,18 @@ def decode_tc_string_to_preferences(
     # it an opt-out preference.
     return FidesStringFidesPreferences(
         purpose_consent_preferences=convert_to_fides_preference(
-            datamap_p_c, tc_str_p_c, TCFPurposeSave
+            datamap_p_c, decoded.purpose_consents, TCFPurposeSave
         ),
         purpose_legitimate_interests_preferences=convert_to_fides_preference(
-            datamap_p_li, tc_str_p_li, TCFPurposeSave
+            datamap_p_li, decoded.purpose_legitimate_interests, TCFPurposeSave
         ),
         vendor_consent_preferences=convert_to_fides_preference(
-            datamap_v_c, tc_str_v_c, TCFVendorSave
+            datamap_v_c, decoded.vendor_consents, TCFVendorSave
         ),
         vendor_legitimate_interests_preferences=convert_to_fides_preference(
-            datamap_v_li, tc_str_v_li, TCFVendorSave
+            datamap_v_li, decoded.vendor_legitimate_interests, TCFVendorSave
         ),
         special_feature_preferences=convert_to_fides_preference(
-            datamap_sf, tc_str_sf, TCFSpecialFeatureSave
+            datamap_sf, decoded.special_feature_optins, TCFSpecialFeatureSave
         ),
     )
@@ -0,0 +1,131 @@
+"""
+Caching of the TCF experience contents, in-process and in Redis, under a version derived from
+the systems and privacy declarations they are built from.
+"""
+import hashlib
+import json
+from itertools import chain
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from loguru import logger
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+
+from fides.api.common_exceptions import RedisConnectionError
+from fides.api.models.sql_models import (  # type:ignore[attr-defined]
+    PrivacyDeclaration,
+    System,
+)
+from fides.api.schemas.base_class import FidesSchema
+from fides.api.util.cache import get_cache
+from fides.config import CONFIG
+
+TCF_CONTENTS_CACHE_KEY_PREFIX = "tcf_experience_contents"
+TCF_CONTENTS_GENERATION_KEY = "tcf_experience_contents_generation"
+TCF_CONTENTS_CHANGED = "tcf_contents_changed"
+
+TCFContentsType = TypeVar("TCFContentsType", bound=FidesSchema)
+
+# TCF contents for the latest version
+_tcf_contents_cache: Dict[str, FidesSchema] = {}
+
+
+def get_tcf_contents_version(db: Session) -> str:
+    """
+    Returns a version for the TCF overlay contents, derived from the systems and privacy
+    declarations the contents are built from. The version changes whenever a system or
+    privacy declaration is created, updated or deleted.
+    """
+    fingerprint = db.query(
+        db.query(func.count(System.id)).label("system_count"),
+        db.query(func.max(System.updated_at)).label("system_updated_at"),
+        db.query(func.count(PrivacyDeclaration.id)).label("declaration_count"),
+        db.query(func.max(PrivacyDeclaration.updated_at)).label(
+            "declaration_updated_at"
+        ),
+    ).one()
+
+    # Writes made through the ORM also bump a generation in Redis, which catches
+    # updates that don't change the fingerprint, such as those made within a
+    # transaction that began before the latest `updated_at`
+    generation: Optional[str] = None
+    try:
+        generation = get_cache().get(TCF_CONTENTS_GENERATION_KEY)
+    except RedisConnectionError:
+        pass
+
+    return hashlib.sha256(
+        json.dumps(
+            [*fingerprint, generation, CONFIG.consent.ac_enabled], default=str
+        ).encode(CONFIG.security.encoding)
+    ).hexdigest()
+
+
+def get_cached_tcf_contents(
+    version: str, schema: Type[TCFContentsType]
+) -> Optional[TCFContentsType]:
+    """Returns the TCF contents cached for the version, in-process or in Redis"""
+    tcf_contents: Optional[FidesSchema] = _tcf_contents_cache.get(version)
+    if tcf_contents:
+        return tcf_contents  # type: ignore[return-value]
+
+    try:
+        cached_tcf_contents: Optional[str] = get_cache().get(
+            f"{TCF_CONTENTS_CACHE_KEY_PREFIX}:{version}"
+        )
+    except RedisConnectionError:
+        logger.warning("Unable to connect to Redis to cache TCF contents")
+        return None
+
+    if not cached_tcf_contents:
+        return None
+
+    parsed_tcf_contents: TCFContentsType = schema.parse_raw(cached_tcf_contents)
+    _cache_in_process(version, parsed_tcf_contents)
+    return parsed_tcf_contents
+
+
+def cache_tcf_contents(version: str, tcf_contents: FidesSchema) -> None:
+    """Caches the TCF contents built for the version, in-process and in Redis"""
+    _cache_in_process(version, tcf_contents)
+    try:
+        get_cache().set_with_autoexpire(
+            f"{TCF_CONTENTS_CACHE_KEY_PREFIX}:{version}", tcf_contents.json()
+        )
+    except RedisConnectionError:
+        logger.warning("Unable to connect to Redis to cache TCF contents")
+
+
+def _cache_in_process(version: str, tcf_contents: FidesSchema) -> None:
+    # Only the latest version is kept in-process
+    _tcf_contents_cache.clear()
+    _tcf_contents_cache[version] = tcf_contents
+
+
+@event.listens_for(Session, "after_flush")
+def flag_tcf_contents_changes(session: Session, _: Any) -> None:
+    """Flag the session if a system or privacy declaration was written"""
+    if any(
+        isinstance(instance, (System, PrivacyDeclaration))
+        for instance in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info[TCF_CONTENTS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_tcf_contents(session: Session) -> None:
+    """Invalidate the cached TCF contents once a flagged session is committed"""
+    if not session.info.pop(TCF_CONTENTS_CHANGED, False):
+        return
+
+    _tcf_contents_cache.clear()
+    try:
+        get_cache().incr(TCF_CONTENTS_GENERATION_KEY)
+    except RedisConnectionError:
+        logger.warning("Unable to connect to Redis to invalidate cached TCF contents")
+
+
+@event.listens_for(Session, "after_rollback")
+def clear_tcf_contents_changes(session: Session) -> None:
+    """Writes that were rolled back don't affect the TCF contents"""
+    session.info.pop(TCF_CONTENTS_CHANGED, None)
@@ -40,6 +40,11 @@ from fides.api.schemas.tcf import (
     TCFVendorLegitimateInterestsRecord,
     TCFVendorRelationships,
 )
+from fides.api.util.tcf.tcf_contents_cache import (
+    cache_tcf_contents,
+    get_cached_tcf_contents,
+    get_tcf_contents_version,
+)
 from fides.config import CONFIG
 from fides.config.helpers import load_file
 
@@ -568,9 +573,35 @@ def populate_vendor_relationships_basic_attributes(
 
 def get_tcf_contents(
     db: Session,
+    version: Optional[str] = None,
+) -> TCFExperienceContents:
+    """
+    Returns the base contents of the TCF overlay, built by build_tcf_contents.
+
+    Contents are cached in-process and in Redis under a version derived from the systems and
+    privacy declarations, so they are only rebuilt after a system or privacy declaration changes.
+    Callers that already have the version from get_tcf_contents_version can pass it in.
+    Callers receive their own copy of the contents, which they are free to modify.
+    """
+    if not version:
+        version = get_tcf_contents_version(db)
+    tcf_contents: Optional[TCFExperienceContents] = get_cached_tcf_contents(
+        version, TCFExperienceContents
+    )
+
+    if not tcf_contents:
+        logger.debug("Building TCF contents for version {}", version)
+        tcf_contents = build_tcf_contents(db)
+        cache_tcf_contents(version, tcf_contents)
+
+    return tcf_contents.copy(deep=True)
+
+
+def build_tcf_contents(
+    db: Session,
 ) -> TCFExperienceContents:
     """
-    Returns the base contents of the TCF overlay.
+    Builds the base contents of the TCF overlay.
 
     Queries for systems/privacy declarations that have a relevant GVL data use and a legal basis of Consent or Legitimate interests,
     and builds the TCF Overlay from these systems and privacy declarations.
@@ -0,0 +1,26 @@
+"""
+In-process caches of TCF experience meta and decoded fides strings.
+
+Both only depend on the TCF contents and the choices a user made, and a handful of choices like
+accept all and reject all cover most traffic, so repeats can skip building and decoding TC and
+AC strings altogether.
+
+Keys are expected to start with the TCF contents version from get_tcf_contents_version, so a
+change to the contents switches to new entries, and entries for earlier versions are evicted
+as they fall out of use.
+"""
+from typing import Any, Dict, Hashable
+
+from fides.api.schemas.privacy_preference import FidesStringFidesPreferences
+from fides.api.util.lru_cache import LRUCache
+from fides.config import CONFIG
+
+# Experience meta by TCF contents version
+tcf_meta_cache: LRUCache[Hashable, Dict[str, Any]] = LRUCache(
+    lambda: CONFIG.consent.tcf_string_cache_size
+)
+
+# Preferences decoded from fides strings by TCF contents version and the choices encoded in the strings
+fides_string_preferences_cache: LRUCache[
+    Hashable, FidesStringFidesPreferences
+] = LRUCache(lambda: CONFIG.consent.tcf_string_cache_size)
@@ -171,6 +171,7 @@ PRIVACY_NOTICE_CREATE = f"{PRIVACY_NOTICE}:{CREATE}"
 PRIVACY_NOTICE_UPDATE = f"{PRIVACY_NOTICE}:{UPDATE}"
 PRIVACY_NOTICE_READ = f"{PRIVACY_NOTICE}:{READ}"
 
+PRIVACY_PREFERENCE_HISTORY_CREATE = f"{PRIVACY_PREFERENCE_HISTORY}:{CREATE}"
 PRIVACY_PREFERENCE_HISTORY_READ = f"{PRIVACY_PREFERENCE_HISTORY}:{READ}"
 
 PRIVACY_REQUEST_CALLBACK_RESUME = f"{PRIVACY_REQUEST}:{RESUME}"  # User has permission to restart a paused privacy request
@@ -314,6 +315,7 @@ SCOPE_DOCS = {
     PRIVACY_NOTICE_CREATE: "Create privacy notices",
     PRIVACY_NOTICE_UPDATE: "Update privacy notices",
     PRIVACY_NOTICE_READ: "View privacy notices",
+    PRIVACY_PREFERENCE_HISTORY_CREATE: "Import privacy preferences in bulk",
     PRIVACY_PREFERENCE_HISTORY_READ: "Read the history of all saved privacy preferences",
     PRIVACY_REQUEST_CREATE: "",
     PRIVACY_REQUEST_CALLBACK_RESUME: "Restart paused privacy requests",
@@ -29,11 +29,16 @@ CONSENT_REQUEST_PRIVACY_PREFERENCES_VERIFY = (
     "/consent-request/{consent_request_id}/verify-for-privacy-preferences"
 )
 PRIVACY_PREFERENCES = "/privacy-preferences"
+PRIVACY_PREFERENCES_BULK = "/privacy-preferences/bulk"
 NOTICES_SERVED = "/notices-served"
 
 # Reporting endpoints - have records for *all* users
 HISTORICAL_PRIVACY_PREFERENCES_REPORT = "/historical-privacy-preferences"
 CURRENT_PRIVACY_PREFERENCES_REPORT = "/current-privacy-preferences"
+HISTORICAL_PRIVACY_PREFERENCES_REPORT_CURSOR = "/historical-privacy-preferences/cursor"
+CURRENT_PRIVACY_PREFERENCES_REPORT_CURSOR = "/current-privacy-preferences/cursor"
+HISTORICAL_PRIVACY_PREFERENCES_REPORT_EXPORT = "/historical-privacy-preferences/export"
+CURRENT_PRIVACY_PREFERENCES_REPORT_EXPORT = "/current-privacy-preferences/export"
 
 
 # Oauth Client URLs
@@ -14,6 +14,11 @@ class ConsentSettings(FidesSettings):
     ac_enabled: bool = Field(
         default=False, description="Toggle whether Google AC Mode is enabled."
     )
+    tcf_string_cache_size: int = Field(
+        default=1000,
+        description="The maximum number of TCF experience meta and decoded fides strings to cache in-process, "
+        "keyed by the TCF contents version and the user's choices. Set to 0 to disable the cache.",
+    )
 
     class Config:
         env_prefix = "FIDES__CONSENT__"
@@ -34,6 +34,42 @@ class ExecutionSettings(FidesSettings):
     task_retry_delay: int = Field(
         default=1, description="The delays between retries in seconds."
     )
+    task_concurrency: int = Field(
+        default=1,
+        description="The maximum number of independent collections that can be queried in parallel while executing an access or erasure request. The default of 1 runs every collection sequentially.",
+    )
+    task_concurrency_per_connection: int = Field(
+        default=1,
+        description="The maximum number of collections belonging to the same connection that can be queried in parallel when task_concurrency is greater than 1.",
+    )
+    masking_batch_size: int = Field(
+        default=0,
+        description="When greater than 0, erasures against SQL databases update rows in batches of up to this many rows per statement, using a single connection and transaction per collection. The default of 0 issues one UPDATE per row.",
+    )
+    reuse_sql_engines: bool = Field(
+        default=False,
+        description="If set to True, SQL connectors share a connection pool (and SSH tunnel, if configured) per connection across privacy requests, instead of creating and disposing of them for every request.",
+    )
+    sql_engine_pool_size: int = Field(
+        default=5,
+        description="Number of connections kept open in each shared SQL connection pool when reuse_sql_engines is enabled.",
+    )
+    sql_engine_max_overflow: int = Field(
+        default=10,
+        description="Number of additional 'overflow' connections each shared SQL connection pool can open when reuse_sql_engines is enabled. These overflow connections are discarded afterwards and not maintained.",
+    )
+    sql_engine_idle_timeout: int = Field(
+        default=600,
+        description="The number of seconds a shared SQL connection pool can go unused before it is disposed of, when reuse_sql_engines is enabled.",
+    )
+    s3_upload_part_size: int = Field(
+        default=8 * 1024 * 1024,
+        description="Size in bytes of each part of the multipart upload used to stream access request packages to S3. Bounds the memory used by an upload, regardless of the size of the package. Must be at least 5 MiB.",
+    )
+    saas_dns_cache_ttl: int = Field(
+        default=60,
+        description="The number of seconds the IP address a SaaS connector's host resolves to is cached for. Requests to the host connect to that IP address once it has been checked as safe, rather than resolving the host again. Set to 0 to resolve the host for every request.",
+    )
     allow_custom_privacy_request_field_collection: bool = Field(
         default=False,
         description="Allows the collection of custom privacy request fields from incoming privacy requests.",
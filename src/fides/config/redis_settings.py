@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, Literal, Optional
 from urllib.parse import quote, quote_plus, urlencode
 
 from pydantic import Field, validator
@@ -15,6 +15,10 @@ class RedisSettings(FidesSettings):
         default="utf8",
         description="Character set to use for Redis, defaults to 'utf8'. Not recommended to change.",
     )
+    compression_threshold_bytes: int = Field(
+        default=1024,
+        description="When `object_encoding` is 'msgpack', objects whose encoded size is at least this many bytes are compressed before they are cached.",
+    )
     db_index: int = Field(
         default=0,
         description="The application will use this index in the Redis cache to cache data.",
@@ -39,6 +43,10 @@ class RedisSettings(FidesSettings):
         default=600,
         description="Sets TTL for cached identity verification code as part of subject requests.",
     )
+    object_encoding: Literal["json", "msgpack"] = Field(
+        default="json",
+        description="The format objects such as privacy request results are cached in. 'msgpack' caches them as versioned msgpack, compressed above `compression_threshold_bytes`, whenever that's smaller than their JSON, which uses less memory for large results. Objects cached in either format can always be read.",
+    )
     password: str = Field(
         default="testpassword",
         description="The password with which to login to the Redis cache.",
@@ -47,6 +55,10 @@ class RedisSettings(FidesSettings):
         default=6379,
         description="The port at which the application cache will be accessible.",
     )
+    scan_unindexed_privacy_request_keys: bool = Field(
+        default=False,
+        description="Whether to scan Redis for the keys of privacy requests that have no key index. Only privacy requests cached before the key index was added lack one, so enable this while upgrading, and disable it once `default_ttl_seconds` has passed since the upgrade.",
+    )
     ssl: bool = Field(
         default=False,
         description="Whether the application's connections to the cache should be encrypted using TLS.",
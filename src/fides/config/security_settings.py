@@ -7,7 +7,11 @@ import validators
 from pydantic import AnyUrl, Field, validator
 from slowapi.wrappers import parse_many  # type: ignore
 
-from fides.api.cryptography.cryptographic_util import generate_salt, hash_with_salt
+from fides.api.cryptography.cryptographic_util import (
+    generate_salt,
+    hash_with_hmac,
+    hash_with_salt,
+)
 from fides.api.oauth.roles import OWNER
 from fides.common.api.scope_registry import SCOPE_REGISTRY
 
@@ -49,6 +53,14 @@ class SecuritySettings(FidesSettings):
         default="dev",
         description="The default, `dev`, does not apply authentication to endpoints typically used by the CLI. The other option, `prod`, requires authentication for _all_ endpoints that may contain sensitive information.",
     )
+    identity_blind_index_key: Optional[str] = Field(
+        default=None,
+        description="The secret used to compute the HMAC-SHA256 blind index that provided identities and custom privacy request fields are searched by. Defaults to a key derived from the app_encryption_key. Existing identities are no longer found if this changes.",
+    )
+    identity_legacy_hash: bool = Field(
+        default=False,
+        description="If true, provided identities are also hashed with the legacy bcrypt hash when saved, and looked up by that hash when they have no blind index. Only needed while earlier versions of Fides share the database.",
+    )
     identity_verification_attempt_limit: int = Field(
         default=3,
         description="The number of times identity verification will be attempted before raising an error.",
@@ -77,6 +89,14 @@ class SecuritySettings(FidesSettings):
         default=16,
         description="Sets desired length in bytes of generated client secret used for oauth.",
     )
+    oauth_token_cache_size: int = Field(
+        default=1000,
+        description="The maximum number of verified API tokens each Fides process caches, so that authorizing a request doesn't decrypt the token and load its client every time. Set to 0 to disable the cache.",
+    )
+    oauth_token_cache_ttl_seconds: int = Field(
+        default=60,
+        description="The number of seconds a verified API token is cached for. Changes to clients, users and roles are applied right away by the process that made them, and by every other process within this time.",
+    )
     parent_server_password: Optional[str] = Field(
         default=None,
         description="When using a parent/child Fides deployment, this password will be used by the child server to access the parent server.",
@@ -122,6 +142,18 @@ class SecuritySettings(FidesSettings):
         default=False,
         description="Either enables the collection of audit log resource data or bypasses the middleware",
     )
+    audit_log_resource_batch_size: int = Field(
+        default=500,
+        description="The maximum number of audit log resource records written to the database at once.",
+    )
+    audit_log_resource_queue_size: int = Field(
+        default=10000,
+        description="The maximum number of audit log resource records held in memory while waiting to be written.",
+    )
+    audit_log_resource_overflow_policy: str = Field(
+        default="block",
+        description="What to do with a new audit log resource record when the queue is full: 'block' makes the request wait for space, 'drop_newest' discards the new record, and 'drop_oldest' discards the oldest queued record to make space.",
+    )
 
     bastion_server_host: Optional[str] = Field(
         default=None, description="An optional field to store the bastion server host"
@@ -160,6 +192,25 @@ class SecuritySettings(FidesSettings):
             )
         return v
 
+    @validator("identity_blind_index_key", always=True)
+    @classmethod
+    def assemble_identity_blind_index_key(
+        cls, v: Optional[str], values: Dict[str, str]
+    ) -> Optional[str]:
+        """Derive the identity blind index key from the app encryption key if it isn't set,
+        so the encryption key itself is never used as the HMAC key"""
+        if v:
+            return v
+
+        app_encryption_key = values.get("app_encryption_key")
+        if not app_encryption_key:
+            return None
+
+        encoding = values.get("encoding", "UTF-8")
+        return hash_with_hmac(
+            b"identity_blind_index", app_encryption_key.encode(encoding)
+        )
+
     @validator("cors_origins", pre=True)
     @classmethod
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
@@ -225,6 +276,18 @@ class SecuritySettings(FidesSettings):
             raise ValueError(message)
         return v
 
+    @validator("audit_log_resource_overflow_policy")
+    @classmethod
+    def validate_audit_log_resource_overflow_policy(
+        cls,
+        v: str,
+    ) -> str:
+        """Validate the `audit_log_resource_overflow_policy`"""
+        if v not in ["block", "drop_newest", "drop_oldest"]:
+            message = "Audit log resource overflow policy must be one of 'block', 'drop_newest' or 'drop_oldest'."
+            raise ValueError(message)
+        return v
+
     @validator("env")
     @classmethod
     def validate_env(
@@ -9,6 +9,7 @@ from fides.api.cryptography.cryptographic_util import (
     decode_password,
     generate_salt,
     generate_secure_random_string,
+    hash_with_hmac,
     hash_with_salt,
     str_to_b64_str,
 )
@@ -79,6 +80,15 @@ def test_hash_with_salt(encoding: str = "UTF-8") -> None:
     assert hashed == expected_hash
 
 
+def test_hash_with_hmac(encoding: str = "UTF-8") -> None:
+    plain_text = "test@email.com"
+
+    hashed = hash_with_hmac(plain_text.encode(encoding), b"first_key")
+    assert len(hashed) == 64
+    assert hashed == hash_with_hmac(plain_text.encode(encoding), b"first_key")
+    assert hashed != hash_with_hmac(plain_text.encode(encoding), b"second_key")
+
+
 def test_str_to_b64_str() -> None:
     orig_string = "https://www.google.com"
     b64_string = "aHR0cHM6Ly93d3cuZ29vZ2xlLmNvbQ=="
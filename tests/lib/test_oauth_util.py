@@ -1,12 +1,13 @@
 # pylint: disable=duplicate-code, missing-function-docstring, redefined-outer-name
 
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
+from unittest import mock
 
 import pytest
 from fastapi.security import SecurityScopes
 
-from fides.api.common_exceptions import AuthorizationError
+from fides.api.common_exceptions import AuthorizationError, RedisConnectionError
 from fides.api.cryptography.schemas.jwt import (
     JWE_ISSUED_AT,
     JWE_PAYLOAD_CLIENT_ID,
@@ -24,6 +25,10 @@ from fides.api.oauth.roles import (
     VIEWER_AND_APPROVER,
     not_contributor_scopes,
 )
+from fides.api.oauth.token_cache import (
+    OAUTH_CLIENTS_GENERATION_KEY,
+    verified_token_cache,
+)
 from fides.api.oauth.utils import (
     _has_direct_scopes,
     _has_scope_via_role,
@@ -34,6 +39,7 @@ from fides.api.oauth.utils import (
     is_token_expired,
     verify_oauth_client,
 )
+from fides.api.util.cache import get_cache
 from fides.common.api.scope_registry import (
     DATASET_CREATE_OR_UPDATE,
     PRIVACY_REQUEST_READ,
@@ -200,6 +206,162 @@ async def test_verify_oauth_client_wrong_client_scope(db, config, user):
         )
 
 
+class TestVerifiedTokenCache:
+    @pytest.fixture(autouse=True)
+    def clear_verified_tokens(self):
+        verified_token_cache.clear()
+        yield
+        verified_token_cache.clear()
+
+    async def test_verified_token_is_cached(self, db, config, user):
+        user.client.scopes = [USER_READ]
+        user.client.save(db)
+        payload = {
+            JWE_PAYLOAD_SCOPES: [USER_READ],
+            JWE_PAYLOAD_CLIENT_ID: user.client.id,
+            JWE_ISSUED_AT: datetime.now().isoformat(),
+        }
+        token = generate_jwe(
+            json.dumps(payload),
+            config.security.app_encryption_key,
+        )
+        client = await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+        assert client == user.client
+        assert len(verified_token_cache) == 1
+
+        # Cache hits don't decrypt the token
+        with mock.patch("fides.api.oauth.utils.extract_payload") as mock_extract:
+            client = await verify_oauth_client(
+                SecurityScopes([USER_READ]), token, db=db
+            )
+        assert not mock_extract.called
+        assert client == user.client
+        assert client.user == user
+
+    async def test_verified_tokens_cleared_on_client_change(self, db, config, user):
+        user.client.scopes = [USER_READ]
+        user.client.save(db)
+        payload = {
+            JWE_PAYLOAD_SCOPES: [USER_READ],
+            JWE_PAYLOAD_CLIENT_ID: user.client.id,
+            JWE_ISSUED_AT: datetime.now().isoformat(),
+        }
+        token = generate_jwe(
+            json.dumps(payload),
+            config.security.app_encryption_key,
+        )
+        await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+        assert len(verified_token_cache) == 1
+
+        user.client.update(db, data={"scopes": [USER_DELETE]})
+        assert len(verified_token_cache) == 0
+        with pytest.raises(AuthorizationError):
+            await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+
+    async def test_verified_tokens_invalidated_by_other_processes(
+        self, db, config, user
+    ):
+        user.client.scopes = [USER_READ]
+        user.client.save(db)
+        payload = {
+            JWE_PAYLOAD_SCOPES: [USER_READ],
+            JWE_PAYLOAD_CLIENT_ID: user.client.id,
+            JWE_ISSUED_AT: datetime.now().isoformat(),
+        }
+        token = generate_jwe(
+            json.dumps(payload),
+            config.security.app_encryption_key,
+        )
+        await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+        assert len(verified_token_cache) == 1
+
+        # Another process committing a change bumps the generation without touching this cache
+        get_cache().incr(OAUTH_CLIENTS_GENERATION_KEY)
+        with mock.patch(
+            "fides.api.oauth.utils.extract_payload", wraps=extract_payload
+        ) as mock_extract:
+            await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+        assert mock_extract.called
+
+    async def test_verified_tokens_cleared_on_bulk_client_change(
+        self, db, config, user
+    ):
+        user.client.scopes = [USER_READ]
+        user.client.save(db)
+        payload = {
+            JWE_PAYLOAD_SCOPES: [USER_READ],
+            JWE_PAYLOAD_CLIENT_ID: user.client.id,
+            JWE_ISSUED_AT: datetime.now().isoformat(),
+        }
+        token = generate_jwe(
+            json.dumps(payload),
+            config.security.app_encryption_key,
+        )
+        await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+        assert len(verified_token_cache) == 1
+
+        db.query(ClientDetail).filter(ClientDetail.id == user.client.id).update(
+            {"scopes": [USER_DELETE]}, synchronize_session=False
+        )
+        db.commit()
+        assert len(verified_token_cache) == 0
+        with pytest.raises(AuthorizationError):
+            await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+
+    async def test_verified_token_cache_skipped_without_redis(self, db, config, user):
+        user.client.scopes = [USER_READ]
+        user.client.save(db)
+        payload = {
+            JWE_PAYLOAD_SCOPES: [USER_READ],
+            JWE_PAYLOAD_CLIENT_ID: user.client.id,
+            JWE_ISSUED_AT: datetime.now().isoformat(),
+        }
+        token = generate_jwe(
+            json.dumps(payload),
+            config.security.app_encryption_key,
+        )
+        with mock.patch(
+            "fides.api.oauth.token_cache.get_cache",
+            side_effect=RedisConnectionError("Redis unavailable"),
+        ):
+            await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+        assert len(verified_token_cache) == 0
+
+    async def test_cached_token_expired(self, db, config, user):
+        user.client.scopes = [USER_READ]
+        user.client.save(db)
+        payload = {
+            JWE_PAYLOAD_SCOPES: [USER_READ],
+            JWE_PAYLOAD_CLIENT_ID: user.client.id,
+            JWE_ISSUED_AT: (datetime.now() - timedelta(minutes=5)).isoformat(),
+        }
+        token = generate_jwe(
+            json.dumps(payload),
+            config.security.app_encryption_key,
+        )
+        await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+
+        with mock.patch.object(CONFIG.security, "oauth_access_token_expire_minutes", 1):
+            with pytest.raises(AuthorizationError):
+                await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+
+    async def test_verified_token_cache_disabled(self, db, config, user):
+        user.client.scopes = [USER_READ]
+        user.client.save(db)
+        payload = {
+            JWE_PAYLOAD_SCOPES: [USER_READ],
+            JWE_PAYLOAD_CLIENT_ID: user.client.id,
+            JWE_ISSUED_AT: datetime.now().isoformat(),
+        }
+        token = generate_jwe(
+            json.dumps(payload),
+            config.security.app_encryption_key,
+        )
+        with mock.patch.object(CONFIG.security, "oauth_token_cache_size", 0):
+            await verify_oauth_client(SecurityScopes([USER_READ]), token, db=db)
+        assert len(verified_token_cache) == 0
+
+
 class TestVerifyOauthClientRoles:
     async def test_token_does_not_have_roles(self, db, config):
         """Test that roles aren't required to be on the token - scopes can still be assigned directly"""
@@ -329,8 +329,8 @@ class TestConsentRequest:
         provided_identity = ProvidedIdentity.filter(
             db=db,
             conditions=(
-                ProvidedIdentity.hashed_value
-                == ProvidedIdentity.hash_value("+235624563")
+                ProvidedIdentity.blind_index
+                == ProvidedIdentity.blind_index_value("+235624563")
             ),
         ).first()
         assert provided_identity
@@ -356,8 +356,8 @@ class TestConsentRequest:
         provided_identity = ProvidedIdentity.filter(
             db=db,
             conditions=(
-                ProvidedIdentity.hashed_value
-                == ProvidedIdentity.hash_value("testing_123@example.com")
+                ProvidedIdentity.blind_index
+                == ProvidedIdentity.blind_index_value("testing_123@example.com")
             ),
         ).first()
         assert provided_identity is not None
@@ -1,4 +1,7 @@
-from datetime import timedelta
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
@@ -26,14 +29,20 @@ from fides.api.util.tcf.tcf_experience_contents import ConsentRecordType
 from fides.common.api.scope_registry import (
     CONSENT_READ,
     CURRENT_PRIVACY_PREFERENCE_READ,
+    PRIVACY_PREFERENCE_HISTORY_CREATE,
     PRIVACY_PREFERENCE_HISTORY_READ,
 )
 from fides.common.api.v1.urn_registry import (
     CONSENT_REQUEST_PRIVACY_PREFERENCES_VERIFY,
     CONSENT_REQUEST_PRIVACY_PREFERENCES_WITH_ID,
     CURRENT_PRIVACY_PREFERENCES_REPORT,
+    CURRENT_PRIVACY_PREFERENCES_REPORT_CURSOR,
+    CURRENT_PRIVACY_PREFERENCES_REPORT_EXPORT,
     HISTORICAL_PRIVACY_PREFERENCES_REPORT,
+    HISTORICAL_PRIVACY_PREFERENCES_REPORT_CURSOR,
+    HISTORICAL_PRIVACY_PREFERENCES_REPORT_EXPORT,
     PRIVACY_PREFERENCES,
+    PRIVACY_PREFERENCES_BULK,
     V1_URL_PREFIX,
 )
 from fides.config import CONFIG
@@ -1032,7 +1041,7 @@ class TestSavePrivacyPreferencesPrivacyCenter:
         assert privacy_preference_history.fides_user_device == test_device_id
         assert (
             privacy_preference_history.hashed_fides_user_device
-            == ProvidedIdentity.hash_value(test_device_id)
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert (
             privacy_preference_history.fides_user_device_provided_identity_id
@@ -1050,8 +1059,8 @@ class TestSavePrivacyPreferencesPrivacyCenter:
             == test_device_id
         )
         assert (
-            fides_user_device_provided_identity.hashed_value
-            == ProvidedIdentity.hash_value(test_device_id)
+            fides_user_device_provided_identity.blind_index
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
 
         privacy_preference_history.delete(db=db)
@@ -1466,8 +1475,8 @@ class TestSavePrivacyPreferencesForFidesDeviceId:
             == fides_user_device_provided_identity
         )
         assert (
-            fides_user_device_provided_identity.hashed_value
-            == ProvidedIdentity.hash_value(test_device_id)
+            fides_user_device_provided_identity.blind_index
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert (
             fides_user_device_provided_identity.encrypted_value["value"]
@@ -1476,7 +1485,7 @@ class TestSavePrivacyPreferencesForFidesDeviceId:
         # Values also cached on the historical record for reporting
         assert (
             privacy_preference_history.hashed_fides_user_device
-            == ProvidedIdentity.hash_value(test_device_id)
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )  # Cached here for reporting
         assert (
             privacy_preference_history.fides_user_device == test_device_id
@@ -1745,8 +1754,8 @@ class TestSavePrivacyPreferencesForFidesDeviceId:
             == fides_user_device_provided_identity
         )
         assert (
-            fides_user_device_provided_identity.hashed_value
-            == ProvidedIdentity.hash_value(test_device_id)
+            fides_user_device_provided_identity.blind_index
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert (
             fides_user_device_provided_identity.encrypted_value["value"]
@@ -1754,7 +1763,7 @@ class TestSavePrivacyPreferencesForFidesDeviceId:
         )
         assert (
             purpose_privacy_preference_history.hashed_fides_user_device
-            == ProvidedIdentity.hash_value(test_device_id)
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert purpose_privacy_preference_history.fides_user_device == test_device_id
         assert (
@@ -1807,8 +1816,8 @@ class TestSavePrivacyPreferencesForFidesDeviceId:
             == fides_user_device_provided_identity
         )
         assert (
-            fides_user_device_provided_identity.hashed_value
-            == ProvidedIdentity.hash_value(test_device_id)
+            fides_user_device_provided_identity.blind_index
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert (
             fides_user_device_provided_identity.encrypted_value["value"]
@@ -1816,7 +1825,7 @@ class TestSavePrivacyPreferencesForFidesDeviceId:
         )
         assert (
             vendor_privacy_preference_history.hashed_fides_user_device
-            == ProvidedIdentity.hash_value(test_device_id)
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert vendor_privacy_preference_history.fides_user_device == test_device_id
         assert (
@@ -1971,8 +1980,8 @@ class TestSavePrivacyPreferencesForFidesDeviceId:
             == fides_user_device_provided_identity
         )
         assert (
-            fides_user_device_provided_identity.hashed_value
-            == ProvidedIdentity.hash_value(test_device_id)
+            fides_user_device_provided_identity.blind_index
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert (
             fides_user_device_provided_identity.encrypted_value["value"]
@@ -1980,7 +1989,7 @@ class TestSavePrivacyPreferencesForFidesDeviceId:
         )
         assert (
             vendor_privacy_preference_history.hashed_fides_user_device
-            == ProvidedIdentity.hash_value(test_device_id)
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert vendor_privacy_preference_history.fides_user_device == test_device_id
         assert (
@@ -2401,6 +2410,75 @@ class TestHistoricalPreferences:
         assert "Value specified for request_timestamp_lt" in response.json()["detail"]
         assert "must be after request_timestamp_gt" in response.json()["detail"]
 
+    def test_get_historical_preferences_by_cursor(
+        self,
+        api_client: TestClient,
+        url,
+        generate_auth_header,
+        privacy_preference_history,
+        privacy_preference_history_us_ca_provide,
+        privacy_preference_history_fr_provide_service_frontend_only,
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[PRIVACY_PREFERENCE_HISTORY_READ])
+        cursor_url = V1_URL_PREFIX + HISTORICAL_PRIVACY_PREFERENCES_REPORT_CURSOR
+
+        response = api_client.get(cursor_url + "?size=2", headers=auth_header)
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [
+            privacy_preference_history_fr_provide_service_frontend_only.id,
+            privacy_preference_history_us_ca_provide.id,
+        ]
+        assert response.json()["next_page"] is not None
+
+        response = api_client.get(
+            cursor_url + f"?size=2&cursor={response.json()['next_page']}",
+            headers=auth_header,
+        )
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [
+            privacy_preference_history.id
+        ]
+        assert response.json()["next_page"] is None
+
+        response = api_client.get(
+            cursor_url + "?cursor=not-a-cursor", headers=auth_header
+        )
+        assert response.status_code == 400
+
+    def test_export_historical_preferences(
+        self,
+        api_client: TestClient,
+        generate_auth_header,
+        privacy_preference_history,
+        privacy_preference_history_us_ca_provide,
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[PRIVACY_PREFERENCE_HISTORY_READ])
+        export_url = V1_URL_PREFIX + HISTORICAL_PRIVACY_PREFERENCES_REPORT_EXPORT
+
+        response = api_client.get(
+            export_url + "?sort_direction=asc", headers=auth_header
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.content.decode().splitlines()]
+        assert [row["id"] for row in rows] == [
+            privacy_preference_history.id,
+            privacy_preference_history_us_ca_provide.id,
+        ]
+        assert rows[0]["preference"] == "opt_out"
+
+        response = api_client.get(
+            export_url + "?sort_direction=asc&format=csv", headers=auth_header
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        csv_rows = list(csv.DictReader(io.StringIO(response.content.decode())))
+        assert [row["id"] for row in csv_rows] == [
+            privacy_preference_history.id,
+            privacy_preference_history_us_ca_provide.id,
+        ]
+        assert csv_rows[0]["preference"] == "opt_out"
+
 
 class TestCurrentPrivacyPreferences:
     @pytest.fixture(scope="function")
@@ -2596,6 +2674,194 @@ class TestCurrentPrivacyPreferences:
         assert "Value specified for updated_lt" in response.json()["detail"]
         assert "must be after updated_gt" in response.json()["detail"]
 
+    def test_get_current_preferences_by_cursor(
+        self,
+        api_client: TestClient,
+        url,
+        generate_auth_header,
+        privacy_preference_history,
+        privacy_preference_history_us_ca_provide,
+        privacy_preference_history_fr_provide_service_frontend_only,
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[CURRENT_PRIVACY_PREFERENCE_READ])
+        cursor_url = V1_URL_PREFIX + CURRENT_PRIVACY_PREFERENCES_REPORT_CURSOR
+
+        response = api_client.get(
+            cursor_url + "?size=2&sort_direction=asc", headers=auth_header
+        )
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [
+            privacy_preference_history.current_privacy_preference.id,
+            privacy_preference_history_us_ca_provide.current_privacy_preference.id,
+        ]
+        assert response.json()["next_page"] is not None
+
+        response = api_client.get(
+            cursor_url
+            + f"?size=2&sort_direction=asc&cursor={response.json()['next_page']}",
+            headers=auth_header,
+        )
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [
+            privacy_preference_history_fr_provide_service_frontend_only.current_privacy_preference.id
+        ]
+        assert response.json()["next_page"] is None
+
+    def test_export_current_preferences(
+        self,
+        api_client: TestClient,
+        generate_auth_header,
+        privacy_preference_history,
+        privacy_preference_history_us_ca_provide,
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[CURRENT_PRIVACY_PREFERENCE_READ])
+        response = api_client.get(
+            V1_URL_PREFIX + CURRENT_PRIVACY_PREFERENCES_REPORT_EXPORT + "?format=csv",
+            headers=auth_header,
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        csv_rows = list(csv.DictReader(io.StringIO(response.content.decode())))
+        assert [row["id"] for row in csv_rows] == [
+            privacy_preference_history_us_ca_provide.current_privacy_preference.id,
+            privacy_preference_history.current_privacy_preference.id,
+        ]
+
+
+class TestBulkImportPrivacyPreferences:
+    @pytest.fixture(scope="function")
+    def url(self) -> str:
+        return V1_URL_PREFIX + PRIVACY_PREFERENCES_BULK
+
+    def test_bulk_import_preferences_not_authenticated(
+        self, api_client: TestClient, url
+    ) -> None:
+        response = api_client.post(url, json={"preferences": []}, headers={})
+        assert 401 == response.status_code
+
+    def test_bulk_import_preferences_incorrect_scope(
+        self, api_client: TestClient, url, generate_auth_header
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[PRIVACY_PREFERENCE_HISTORY_READ])
+        response = api_client.post(url, json={"preferences": []}, headers=auth_header)
+        assert 403 == response.status_code
+
+    def test_bulk_import_preferences_bad_notice(
+        self, api_client: TestClient, url, generate_auth_header
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[PRIVACY_PREFERENCE_HISTORY_CREATE])
+        response = api_client.post(
+            url,
+            json={
+                "preferences": [
+                    {
+                        "fides_user_device_id": "051b219f-20e4-45df-82f7-5eb68a00889f",
+                        "preference": "opt_out",
+                        "privacy_notice_history_id": "bad_id",
+                    }
+                ]
+            },
+            headers=auth_header,
+        )
+        assert response.status_code == 400
+        assert (
+            response.json()["detail"]
+            == "Can't save consent against invalid privacy notice history 'bad_id'."
+        )
+
+    def test_bulk_import_preferences_saved_in_future(
+        self, api_client: TestClient, url, generate_auth_header
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[PRIVACY_PREFERENCE_HISTORY_CREATE])
+        response = api_client.post(
+            url,
+            json={
+                "preferences": [
+                    {
+                        "fides_user_device_id": "051b219f-20e4-45df-82f7-5eb68a00889f",
+                        "preference": "opt_out",
+                        "privacy_notice_history_id": "test_id",
+                        "created_at": "2999-01-01T00:00:00",
+                    }
+                ]
+            },
+            headers=auth_header,
+        )
+        assert response.status_code == 422
+        assert (
+            response.json()["detail"][0]["msg"]
+            == "Cannot import a preference saved in the future."
+        )
+
+    def test_bulk_import_preferences(
+        self,
+        api_client: TestClient,
+        url,
+        generate_auth_header,
+        db,
+        privacy_notice,
+    ) -> None:
+        auth_header = generate_auth_header(scopes=[PRIVACY_PREFERENCE_HISTORY_CREATE])
+        privacy_notice_history = privacy_notice.histories[0]
+        fides_user_device_ids = [
+            "051b219f-20e4-45df-82f7-5eb68a00889f",
+            "e4e573ba-d806-4e54-bdd8-3d2ff11d4f11",
+        ]
+        response = api_client.post(
+            url,
+            json={
+                "preferences": [
+                    {
+                        "fides_user_device_id": fides_user_device_id,
+                        "preference": "opt_out",
+                        "privacy_notice_history_id": privacy_notice_history.id,
+                        "method": "button",
+                        "request_origin": "overlay",
+                        "created_at": "2023-06-01T12:00:00",
+                    }
+                    for fides_user_device_id in fides_user_device_ids
+                ]
+            },
+            headers=auth_header,
+        )
+        assert response.status_code == 201
+        assert response.json() == {"imported": 2}
+
+        for fides_user_device_id in fides_user_device_ids:
+            fides_user_provided_identity = ProvidedIdentity.filter(
+                db=db,
+                conditions=(
+                    ProvidedIdentity.matches_value(fides_user_device_id)
+                    & (ProvidedIdentity.privacy_request_id.is_(None))
+                ),
+            ).first()
+            current_preference = (
+                db.query(CurrentPrivacyPreference)
+                .filter(
+                    CurrentPrivacyPreference.fides_user_device_provided_identity_id
+                    == fides_user_provided_identity.id
+                )
+                .first()
+            )
+            assert current_preference.preference == UserConsentPreference.opt_out
+            assert current_preference.privacy_notice_id == privacy_notice.id
+
+            privacy_preference_history = current_preference.privacy_preference_history
+            assert privacy_preference_history.fides_user_device == fides_user_device_id
+            assert privacy_preference_history.method == ConsentMethod.button
+            assert privacy_preference_history.request_origin == RequestOrigin.overlay
+            assert privacy_preference_history.privacy_request_id is None
+            # Saved at the imported time, in UTC as no timezone was given
+            assert privacy_preference_history.created_at == datetime(
+                2023, 6, 1, 12, tzinfo=timezone.utc
+            )
+            assert current_preference.updated_at == datetime(
+                2023, 6, 1, 12, tzinfo=timezone.utc
+            )
+
+            privacy_preference_history.delete(db)
+            fides_user_provided_identity.delete(db)
+
 
 class TestSavePrivacyPreferencesFidesStringOnly:
     @pytest.fixture(scope="function")
@@ -1423,6 +1423,32 @@ class TestGetPrivacyRequests:
 
         privacy_request.delete(db)
 
+    @mock.patch(
+        "fides.api.api.v1.endpoints.privacy_request_endpoints.CSV_DOWNLOAD_BATCH_SIZE",
+        2,
+    )
+    def test_get_privacy_requests_csv_in_batches(
+        self, db, generate_auth_header, api_client, url, privacy_requests
+    ):
+        """Requests are exported in sort order across batches, including those with a null sort field"""
+        privacy_requests[1].started_processing_at = None
+        privacy_requests[1].save(db)
+
+        auth_header = generate_auth_header(scopes=[PRIVACY_REQUEST_READ])
+        response = api_client.get(
+            url
+            + "?download_csv=True&sort_field=started_processing_at&sort_direction=asc",
+            headers=auth_header,
+        )
+        assert 200 == response.status_code
+
+        csv_file = csv.DictReader(io.StringIO(response.content.decode()))
+        assert [row["Request ID"] for row in csv_file] == [
+            privacy_requests[0].id,
+            privacy_requests[2].id,
+            privacy_requests[1].id,
+        ]
+
     def test_get_paused_access_privacy_request_resume_info(
         self, db, privacy_request, generate_auth_header, api_client, url
     ):
@@ -168,7 +168,7 @@ class TestSaveNoticesServedForFidesDeviceId:
         assert served_notice_history.hashed_email is None
         assert (
             served_notice_history.hashed_fides_user_device
-            == ProvidedIdentity.hash_value(test_device_id)
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )  # Cached here for reporting
         assert served_notice_history.hashed_phone_number is None
         assert served_notice_history.phone_number is None
@@ -192,8 +192,8 @@ class TestSaveNoticesServedForFidesDeviceId:
             == fides_user_device_provided_identity
         )
         assert (
-            fides_user_device_provided_identity.hashed_value
-            == ProvidedIdentity.hash_value(test_device_id)
+            fides_user_device_provided_identity.blind_index
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert (
             fides_user_device_provided_identity.encrypted_value["value"]
@@ -675,12 +675,12 @@ class TestSaveNoticesServedPrivacyCenter:
         assert (
             served_notice_history.fides_user_device == test_device_id
         )  # Cached here for reporting
-        assert served_notice_history.hashed_email == ProvidedIdentity.hash_value(
+        assert served_notice_history.hashed_email == ProvidedIdentity.blind_index_value(
             "test@email.com"
         )
         assert (
             served_notice_history.hashed_fides_user_device
-            == ProvidedIdentity.hash_value(test_device_id)
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )  # Cached here for reporting
         assert served_notice_history.hashed_phone_number is None
         assert served_notice_history.phone_number is None
@@ -706,8 +706,8 @@ class TestSaveNoticesServedPrivacyCenter:
             == fides_user_device_provided_identity
         )
         assert (
-            fides_user_device_provided_identity.hashed_value
-            == ProvidedIdentity.hash_value(test_device_id)
+            fides_user_device_provided_identity.blind_index
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert (
             fides_user_device_provided_identity.encrypted_value["value"]
@@ -843,7 +843,7 @@ class TestSaveNoticesServedPrivacyCenter:
         assert served_notice_history.hashed_email is None
         assert (
             served_notice_history.hashed_fides_user_device
-            == ProvidedIdentity.hash_value(test_device_id)
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )  # Cached here for reporting
         assert served_notice_history.hashed_phone_number is None
         assert served_notice_history.phone_number is None
@@ -870,8 +870,8 @@ class TestSaveNoticesServedPrivacyCenter:
             == fides_user_device_provided_identity
         )
         assert (
-            fides_user_device_provided_identity.hashed_value
-            == ProvidedIdentity.hash_value(test_device_id)
+            fides_user_device_provided_identity.blind_index
+            == ProvidedIdentity.blind_index_value(test_device_id)
         )
         assert (
             fides_user_device_provided_identity.encrypted_value["value"]
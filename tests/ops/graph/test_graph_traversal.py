@@ -1,8 +1,11 @@
+from unittest import mock
+
 import pytest
 
 from fides.api.graph.graph import *
 
 from .graph_test_util import *
+from .unindexed_traversal import traverse_unindexed
 
 #  -------------------------------------------
 #   graph object tests
@@ -151,6 +154,48 @@ def test_catch_unreachable_node_no_link() -> None:
         generate_traversal({"email": "a"}, *t)
 
 
+def test_traversal_verified_once_per_seed_keys() -> None:
+    t = generate_graph_resources(3)
+    field(t, "dr_1", "ds_1", "f1").references.append(
+        (FieldAddress("dr_2", "ds_2", "f1"), None)
+    )
+    field(t, "dr_2", "ds_2", "f1").references.append(
+        (FieldAddress("dr_3", "ds_3", "f1"), None)
+    )
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    field(t, "dr_3", "ds_3", "f1").identity = "phone_number"
+    graph = DatasetGraph(*t)
+
+    with mock.patch.object(
+        Traversal, "traverse", autospec=True, side_effect=Traversal.traverse
+    ) as mock_traverse:
+        Traversal(graph, {"email": "a"})
+        Traversal(graph, {"email": "b"})
+        assert mock_traverse.call_count == 1
+
+        Traversal(graph, {"email": "a", "phone_number": "1"})
+        assert mock_traverse.call_count == 2
+
+    assert graph.verified_seed_keys == {
+        frozenset({"email"}),
+        frozenset({"email", "phone_number"}),
+    }
+
+
+def test_failed_traversal_not_verified() -> None:
+    t = generate_graph_resources(3)
+    field(t, "dr_1", "ds_1", "f1").references.append(
+        (FieldAddress("dr_2", "ds_2", "f1"), None)
+    )
+    field(t, "dr_1", "ds_1", "f1").identity = "email"
+    graph = DatasetGraph(*t)
+
+    for _ in range(2):
+        with pytest.raises(TraversalError):
+            Traversal(graph, {"email": "a"})
+    assert not graph.verified_seed_keys
+
+
 def test_catch_invalid_reference_error() -> None:
     t = generate_graph_resources(3)
     field(t, "dr_1", "ds_1", "f1").references.append(
@@ -672,6 +717,35 @@ def test_after_dataresource() -> None:
     assert j1 != j2
 
 
+def test_traverse_matches_unindexed_traversal() -> None:
+    fully_connected = generate_fully_connected_resources(10)
+    field(fully_connected, "dr_1", "ds_1", "f1").identity = "email"
+    collection(fully_connected, CollectionAddress("dr_2", "ds_2")).after.add(
+        CollectionAddress("dr_5", "ds_5")
+    )
+    dataresource(fully_connected, "dr_3").after.add("dr_7")
+
+    tree = generate_binary_tree_resources(4, 3)
+    field(tree, "root", "ds", "f1").identity = "email"
+    field(tree, "root.0.1.0", "ds.0.1.0", "f1").identity = "email"
+
+    def traversal_dict_fn(tn: TraversalNode, data: Dict[str, Any]) -> None:
+        data[str(tn.address)] = tn.debug()
+
+    for resources in (fully_connected, tree):
+        graph = DatasetGraph(*resources)
+        # Verify the graph up front, so neither traversal below runs the verification
+        Traversal(graph, {"email": "X"})
+        results = []
+        for traverse in (Traversal.traverse, traverse_unindexed):
+            env: Dict[str, Any] = {}
+            end_nodes = traverse(
+                Traversal(graph, {"email": "X"}), env, traversal_dict_fn
+            )
+            results.append((env, set(end_nodes)))
+        assert results[0] == results[1]
+
+
 def test_different_seed_alters_traversal() -> None:
     t1 = generate_fully_connected_resources(5)
     field(t1, "dr_1", "ds_1", "f1").identity = "email"
@@ -0,0 +1,120 @@
+"""
+The original, unindexed graph traversal, kept as the reference `Traversal.traverse` is tested
+and benchmarked (in scripts/benchmark_traversal.py) against.
+"""
+from typing import Any, Callable, Dict, List, Set, cast
+
+import pydash.collections
+from loguru import logger
+
+from fides.api.common_exceptions import TraversalError
+from fides.api.graph.config import CollectionAddress
+from fides.api.graph.graph import Edge
+from fides.api.graph.traversal import Traversal, TraversalNode
+from fides.api.util.matching_queue import MatchingQueue
+
+
+def traverse_unindexed(  # pylint: disable=R0914
+    traversal: Traversal,
+    environment: Dict[CollectionAddress, Any],
+    node_run_fn: Callable[[TraversalNode, Dict[CollectionAddress, Any]], None],
+) -> List[CollectionAddress]:
+    """The original traversal that `Traversal.traverse` indexes, which re-scans every finished
+    node and remaining edge for each node it runs.
+
+    Both produce the same traversal, other than the order of nodes and edges that become ready
+    at the same time, which both leave to set iteration order."""
+    if environment:
+        logger.info(
+            "starting traversal",
+        )
+    remaining_node_keys: Set[CollectionAddress] = set(
+        traversal.traversal_node_dict.keys()
+    )
+    finished_nodes: dict[CollectionAddress, TraversalNode] = {}
+    running_node_queue: MatchingQueue[TraversalNode] = MatchingQueue(
+        traversal.root_node
+    )
+    remaining_edges: Set[Edge] = traversal.edges.copy()
+    while not running_node_queue.is_empty():
+        # this is to support the "run traversal_node A AFTER traversal_node B functionality:"
+        n = running_node_queue.pop_first_match(
+            lambda x: x.can_run_given(remaining_node_keys)
+        )
+
+        if n:
+            node_run_fn(n, environment)
+            # delete all edges between the traversal_node that's just run and any completed nodes
+            for finished_node_address, finished_node in finished_nodes.items():
+                completed_edges = Edge.delete_edges(
+                    remaining_edges,
+                    finished_node_address,
+                    cast(TraversalNode, n).address,  # type: ignore[redundant-cast]
+                )
+                # append edges that end in this traversal_node
+                for edge in filter(
+                    lambda _edge: _edge.ends_with_collection(
+                        cast(TraversalNode, n).address  # type: ignore[redundant-cast]
+                    ),
+                    completed_edges,
+                ):
+                    # note, this will not work for self-reference
+                    finished_node.add_child(n, edge)
+            # next edges = take all edges including n that are _not_ in edges_from_completed_nodes
+            # in the form (field_address_this, field_address_foreign)
+
+            edges_to_children = pydash.collections.filter_(
+                [
+                    e.split_by_address(cast(TraversalNode, n).address)  # type: ignore[redundant-cast]
+                    for e in remaining_edges
+                    if e.contains(n.address)
+                ]
+            )
+            if not edges_to_children:
+                n.is_terminal_node = True
+
+            # child traversal_node addresses are the address portion of the above
+            child_node_addresses = {
+                a[1].collection_address() for a in edges_to_children if a
+            }
+            for nxt_address in child_node_addresses:
+                # only add the next traversal_node to the queue if it is not already there (no duplicates)
+                running_node_queue.push_if_new(
+                    traversal.traversal_node_dict[nxt_address]
+                )
+            finished_nodes[n.address] = n
+            remaining_node_keys.difference_update({n.address})
+        else:
+            # traversal traversal_node dict diff finished nodes
+            logger.error(
+                "Node could not be reached given specified ordering [{}]",
+                ",".join([str(tn.address) for tn in running_node_queue.data]),
+            )
+            raise TraversalError(
+                f"""Node could not be reached given the specified ordering:
+                [{','.join([str(tn.address) for tn in running_node_queue.data])}]"""
+            )
+
+    # error if there are nodes that have not been visited
+    if remaining_node_keys:
+        logger.error(
+            "Some nodes were not reachable: {}",
+            ",".join([str(x) for x in remaining_node_keys]),
+        )
+        raise TraversalError(
+            f"Some nodes were not reachable: {','.join([str(x) for x in remaining_node_keys])}"
+        )
+    # error if there are edges that have not been visited
+    if remaining_edges:
+        logger.error(
+            "Some edges were not reachable: {}",
+            ",".join([str(x) for x in remaining_edges]),
+        )
+        raise TraversalError(
+            f"Some edges were not reachable: {','.join([str(x) for x in remaining_edges])}"
+        )
+
+    end_nodes = [tn.address for tn in finished_nodes.values() if tn.is_terminal_node]
+    if environment:
+        logger.debug("Found {} end nodes: {}", len(end_nodes), end_nodes)
+    return end_nodes
@@ -26,6 +26,7 @@ from fides.api.service.connectors.limiter.rate_limiter import (
     RateLimiterTimeoutException,
 )
 from fides.api.task import graph_task
+from fides.api.util.cache import get_cache
 from fides.api.util.saas_util import (
     load_config_with_replacement,
     load_dataset_with_replacement,
@@ -218,6 +219,55 @@ def test_limiter_times_out_when_bucket_full() -> None:
             time.sleep(0.002)
 
 
+@pytest.mark.integration
+def test_limiter_fails_fast_when_wait_exceeds_timeout() -> None:
+    """Verify the limiter does not sleep when the wait would exceed the timeout"""
+    limiter: RateLimiter = RateLimiter()
+    request = RateLimiterRequest(
+        key="my_test_key_3", rate_limit=1, period=RateLimiterPeriod.HOUR
+    )
+    limiter.limit(requests=[request])
+
+    start_time = time.time()
+    with pytest.raises(RateLimiterTimeoutException):
+        limiter.limit(requests=[request], timeout_seconds=10)
+    assert time.time() - start_time < 1
+
+
+@pytest.mark.integration
+def test_limiter_reserve_returns_wait_time() -> None:
+    """Verify a breached limit returns the time until a call can be reserved"""
+    limiter: RateLimiter = RateLimiter()
+    redis = get_cache()
+    request = RateLimiterRequest(
+        key="my_test_key_4", rate_limit=2, period=RateLimiterPeriod.MINUTE
+    )
+
+    assert limiter.reserve(redis, [request]) == 0
+    assert limiter.reserve(redis, [request]) == 0
+    wait_seconds = limiter.reserve(redis, [request])
+    assert 0 < wait_seconds <= 60
+
+
+@pytest.mark.integration
+def test_limiter_records_throttled_time() -> None:
+    """Verify time spent waiting on the limiter is recorded per key"""
+    limiter: RateLimiter = RateLimiter()
+    request = RateLimiterRequest(
+        key="my_test_key_5", rate_limit=1, period=RateLimiterPeriod.SECOND
+    )
+    previous = limiter.get_throttle_metrics().get(
+        "my_test_key_5", {"seconds": 0.0, "count": 0}
+    )
+
+    limiter.limit(requests=[request])
+    limiter.limit(requests=[request])
+
+    metrics = limiter.get_throttle_metrics()["my_test_key_5"]
+    assert metrics["count"] == previous["count"] + 1
+    assert metrics["seconds"] > previous["seconds"]
+
+
 @pytest.mark.integration_saas
 @pytest.mark.integration_zendesk
 @pytest.mark.asyncio
@@ -13,7 +13,7 @@ from fides.api.models.privacy_request import (
 from fides.api.schemas.redis_cache import Identity
 from fides.api.schemas.saas.shared_schemas import SaaSRequestParams
 from fides.api.service.connectors import get_connector
-from fides.api.service.privacy_request.request_runner_service import (
+from fides.api.service.privacy_request.dataset_graph_cache import (
     build_consent_dataset_graph,
 )
 from fides.api.task import graph_task
@@ -9,7 +9,9 @@ from fides.api.models.privacy_experience import (
     PrivacyExperience,
     PrivacyExperienceConfig,
     PrivacyExperienceConfigHistory,
+    SavedConsentRecords,
     cache_saved_and_served_on_consent_record,
+    get_privacy_notices_by_regions,
     upsert_privacy_experiences_after_config_update,
     upsert_privacy_experiences_after_notice_update,
 )
@@ -404,6 +406,96 @@ class TestPrivacyExperience:
         privacy_notice.histories[0].delete(db)
         privacy_notice.delete(db)
 
+    def test_get_related_privacy_notices_from_prefetched_notices(self, db, system):
+        """Notices loaded once for several regions are narrowed down in memory the same way
+        get_related_privacy_notices and get_should_show_banner would query for them"""
+        privacy_experience = PrivacyExperience.create(
+            db=db,
+            data={
+                "component": ComponentType.overlay,
+                "region": "it",
+            },
+        )
+        privacy_notice = PrivacyNotice.create(
+            db=db,
+            data={
+                "name": "Test privacy notice",
+                "notice_key": "test_privacy_notice",
+                "description": "a test sample privacy notice configuration",
+                "regions": [PrivacyNoticeRegion.fr, PrivacyNoticeRegion.it],
+                "consent_mechanism": ConsentMechanism.opt_in,
+                "data_uses": ["marketing.advertising", "third_party_sharing"],
+                "enforcement_level": EnforcementLevel.system_wide,
+                "displayed_in_overlay": True,
+                "displayed_in_api": True,
+                "displayed_in_privacy_center": False,
+                "disabled": True,
+            },
+        )
+        other_region_notice = PrivacyNotice.create(
+            db=db,
+            data={
+                "name": "Other privacy notice",
+                "notice_key": "other_privacy_notice",
+                "regions": [PrivacyNoticeRegion.us_ca],
+                "consent_mechanism": ConsentMechanism.opt_in,
+                "data_uses": ["marketing.advertising"],
+                "enforcement_level": EnforcementLevel.system_wide,
+                "displayed_in_overlay": True,
+            },
+        )
+
+        notices = get_privacy_notices_by_regions(
+            db, [PrivacyNoticeRegion.it, PrivacyNoticeRegion.it]
+        )
+        assert notices == [privacy_notice]
+        assert get_privacy_notices_by_regions(db, []) == []
+        assert (
+            get_privacy_notices_by_regions(
+                db, [PrivacyNoticeRegion.it], show_disabled=False
+            )
+            == []
+        )
+
+        assert privacy_experience.get_related_privacy_notices(
+            db, privacy_notices=notices
+        ) == privacy_experience.get_related_privacy_notices(db)
+        assert (
+            privacy_experience.get_related_privacy_notices(
+                db, show_disabled=False, privacy_notices=notices
+            )
+            == []
+        )
+        assert privacy_experience.get_related_privacy_notices(
+            db, systems_applicable=True, privacy_notices=notices
+        ) == [privacy_notice]
+        assert (
+            privacy_experience.get_related_privacy_notices(
+                db,
+                systems_applicable=True,
+                privacy_notices=notices,
+                data_uses={"functional"},
+            )
+            == []
+        )
+        assert privacy_experience.get_should_show_banner(db, privacy_notices=notices)
+        assert not privacy_experience.get_should_show_banner(
+            db, show_disabled=False, privacy_notices=notices
+        )
+
+        privacy_experience.component = ComponentType.privacy_center
+        privacy_experience.save(db)
+        # Privacy Notice is not displayed in the privacy center
+        assert (
+            privacy_experience.get_related_privacy_notices(db, privacy_notices=notices)
+            == []
+        )
+
+        for notice in [privacy_notice, other_region_notice]:
+            notice.histories[0].delete(db)
+            notice.delete(db)
+        privacy_experience.delete(db)
+
     def test_get_related_privacy_notices_for_a_tcf_overlay(
         self, db, privacy_experience_france_tcf_overlay
     ):
@@ -1312,6 +1404,65 @@ class TestCacheSavedAndServedOnConsentRecord:
         assert privacy_notice_us_ca_provide.current_served is True
         assert privacy_notice_us_ca_provide.outdated_served is None
 
+    @pytest.mark.usefixtures(
+        "served_notice_history_us_provide_for_fides_user",
+        "privacy_preference_history_us_ca_provide_for_fides_user",
+        "privacy_preference_history_for_tcf_purpose_consent",
+        "served_notice_history_for_tcf_purpose",
+    )
+    def test_cache_saved_and_served_from_saved_consent_records(
+        self,
+        db,
+        fides_user_provided_identity,
+        privacy_notice_us_ca_provide,
+        tcf_purpose_consent_record,
+        tcf_purpose_legitimate_interests_record,
+    ):
+        """Preferences and served records loaded once for the user are attached the same way
+        as when they are queried for each consent record"""
+        saved_consent_records = SavedConsentRecords.load(
+            db, fides_user_provided_identity
+        )
+
+        cache_saved_and_served_on_consent_record(
+            db=db,
+            consent_record=privacy_notice_us_ca_provide,
+            fides_user_provided_identity=fides_user_provided_identity,
+            record_type=ConsentRecordType.privacy_notice_id,
+            saved_consent_records=saved_consent_records,
+        )
+        assert (
+            privacy_notice_us_ca_provide.current_preference
+            == UserConsentPreference.opt_in
+        )
+        assert privacy_notice_us_ca_provide.outdated_preference is None
+        assert privacy_notice_us_ca_provide.current_served is True
+        assert privacy_notice_us_ca_provide.outdated_served is None
+
+        cache_saved_and_served_on_consent_record(
+            db,
+            tcf_purpose_consent_record,
+            fides_user_provided_identity,
+            record_type=ConsentRecordType.purpose_consent,
+            saved_consent_records=saved_consent_records,
+        )
+        assert (
+            tcf_purpose_consent_record.current_preference
+            == UserConsentPreference.opt_out
+        )
+        assert tcf_purpose_consent_record.current_served is True
+
+        # Nothing was saved or served for this purpose's legitimate interests
+        cache_saved_and_served_on_consent_record(
+            db,
+            tcf_purpose_legitimate_interests_record,
+            fides_user_provided_identity,
+            record_type=ConsentRecordType.purpose_legitimate_interests,
+            saved_consent_records=saved_consent_records,
+        )
+        assert tcf_purpose_legitimate_interests_record.current_preference is None
+        assert tcf_purpose_legitimate_interests_record.current_served is None
+
     def test_record_for_tcf_purpose_exists_for_older_version(
         self,
         db,
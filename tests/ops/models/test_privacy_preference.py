@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from sqlalchemy.exc import InvalidRequestError
 
@@ -30,6 +32,7 @@ from fides.api.models.privacy_request import (
     ProvidedIdentityType,
 )
 from fides.api.models.sql_models import PrivacyDeclaration
+from fides.config import CONFIG
 
 
 class TestPrivacyPreferenceHistory:
@@ -144,7 +147,7 @@ class TestPrivacyPreferenceHistory:
         assert preference_history_record.email == "test@email.com"
         assert (
             preference_history_record.hashed_email
-            == provided_identity.hashed_value
+            == provided_identity.blind_index
             is not None
         )
         assert (
@@ -165,7 +168,7 @@ class TestPrivacyPreferenceHistory:
         assert preference_history_record.email == "test@email.com"
         assert (
             preference_history_record.hashed_email
-            == provided_identity.hashed_value
+            == provided_identity.blind_index
             is not None
         )
 
@@ -672,6 +675,198 @@ class TestPrivacyPreferenceHistory:
 
         assert current_record == preference_history_record.current_privacy_preference
 
+    def test_bulk_create_history_and_upsert_current_preferences(
+        self, db, privacy_notice
+    ):
+        fides_user_provided_identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": "fides_user_device_id",
+                "hashed_value": ProvidedIdentity.hash_value(
+                    "FGHIJ_TEST_FIDES_USER_DEVICE"
+                ),
+                "encrypted_value": {"value": "FGHIJ_TEST_FIDES_USER_DEVICE"},
+            },
+        )
+        privacy_notice_history = privacy_notice.histories[0]
+        user_data = {
+            "fides_user_device": "FGHIJ_TEST_FIDES_USER_DEVICE",
+            "fides_user_device_provided_identity_id": fides_user_provided_identity.id,
+            "hashed_fides_user_device": fides_user_provided_identity.blind_index,
+            "request_origin": "overlay",
+        }
+
+        (
+            historical_preferences,
+            current_preferences,
+        ) = PrivacyPreferenceHistory.bulk_create_history_and_upsert_current_preferences(
+            db=db,
+            data=[
+                {
+                    **user_data,
+                    "preference": "opt_out",
+                    "privacy_notice_history_id": privacy_notice_history.id,
+                },
+                {**user_data, "preference": "opt_in", "purpose_consent": 8},
+                {
+                    **user_data,
+                    "preference": "opt_in",
+                    "privacy_notice_history_id": privacy_notice_history.id,
+                },
+            ],
+        )
+
+        assert len(historical_preferences) == 3
+        assert [history.preference for history in historical_preferences] == [
+            UserConsentPreference.opt_out,
+            UserConsentPreference.opt_in,
+            UserConsentPreference.opt_in,
+        ]
+        assert historical_preferences[0].privacy_notice_history == (
+            privacy_notice_history
+        )
+        assert historical_preferences[1].purpose_consent == 8
+        assert historical_preferences[1].tcf_version == CURRENT_TCF_VERSION
+        assert historical_preferences[0].id != historical_preferences[2].id
+
+        # The last preference saved for the notice is the current one
+        notice_preference = current_preferences[0]
+        assert current_preferences[2] == notice_preference
+        assert notice_preference.preference == UserConsentPreference.opt_in
+        assert notice_preference.privacy_notice_id == privacy_notice.id
+        assert (
+            notice_preference.privacy_preference_history_id
+            == historical_preferences[2].id
+        )
+        assert current_preferences[1].purpose_consent == 8
+        assert current_preferences[1].preference == UserConsentPreference.opt_in
+
+        # Saving again updates the existing current preference
+        (
+            historical_preferences,
+            updated_preferences,
+        ) = PrivacyPreferenceHistory.bulk_create_history_and_upsert_current_preferences(
+            db=db,
+            data=[
+                {
+                    **user_data,
+                    "preference": "opt_out",
+                    "privacy_notice_history_id": privacy_notice_history.id,
+                }
+            ],
+        )
+        assert updated_preferences[0].id == notice_preference.id
+        assert updated_preferences[0].preference == UserConsentPreference.opt_out
+        assert (
+            updated_preferences[0].privacy_preference_history_id
+            == historical_preferences[0].id
+        )
+        assert (
+            db.query(CurrentPrivacyPreference)
+            .filter(
+                CurrentPrivacyPreference.fides_user_device_provided_identity_id
+                == fides_user_provided_identity.id
+            )
+            .count()
+            == 2
+        )
+
+        for history in db.query(PrivacyPreferenceHistory).filter(
+            PrivacyPreferenceHistory.fides_user_device_provided_identity_id
+            == fides_user_provided_identity.id
+        ):
+            history.delete(db)
+        fides_user_provided_identity.delete(db)
+
+    def test_bulk_create_history_with_original_saved_time(self, db, privacy_notice):
+        fides_user_provided_identity = ProvidedIdentity.create(
+            db,
+            data={
+                "privacy_request_id": None,
+                "field_name": "fides_user_device_id",
+                "hashed_value": ProvidedIdentity.hash_value(
+                    "KLMNO_TEST_FIDES_USER_DEVICE"
+                ),
+                "encrypted_value": {"value": "KLMNO_TEST_FIDES_USER_DEVICE"},
+            },
+        )
+        user_data = {
+            "fides_user_device": "KLMNO_TEST_FIDES_USER_DEVICE",
+            "fides_user_device_provided_identity_id": fides_user_provided_identity.id,
+            "hashed_fides_user_device": fides_user_provided_identity.blind_index,
+            "privacy_notice_history_id": privacy_notice.histories[0].id,
+        }
+        last_year = datetime.now(timezone.utc) - timedelta(days=365)
+        two_years_ago = last_year - timedelta(days=365)
+
+        # The most recently saved preference is the current one, wherever it is in the data
+        (
+            historical_preferences,
+            current_preferences,
+        ) = PrivacyPreferenceHistory.bulk_create_history_and_upsert_current_preferences(
+            db=db,
+            data=[
+                {**user_data, "preference": "opt_out", "created_at": last_year},
+                {**user_data, "preference": "opt_in", "created_at": two_years_ago},
+            ],
+        )
+        assert [history.created_at for history in historical_preferences] == [
+            last_year,
+            two_years_ago,
+        ]
+        assert current_preferences[0] == current_preferences[1]
+        assert current_preferences[0].preference == UserConsentPreference.opt_out
+        assert current_preferences[0].created_at == last_year
+        assert current_preferences[0].updated_at == last_year
+
+        # Saving now replaces it
+        (
+            _,
+            current_preferences,
+        ) = PrivacyPreferenceHistory.bulk_create_history_and_upsert_current_preferences(
+            db=db, data=[{**user_data, "preference": "opt_in"}]
+        )
+        current_preference = current_preferences[0]
+        assert current_preference.preference == UserConsentPreference.opt_in
+        assert current_preference.updated_at > last_year
+
+        # An older import is saved to history, but doesn't replace the current preference
+        (
+            historical_preferences,
+            current_preferences,
+        ) = PrivacyPreferenceHistory.bulk_create_history_and_upsert_current_preferences(
+            db=db,
+            data=[{**user_data, "preference": "opt_out", "created_at": last_year}],
+        )
+        assert historical_preferences[0].preference == UserConsentPreference.opt_out
+        assert current_preferences[0].id == current_preference.id
+        assert current_preferences[0].preference == UserConsentPreference.opt_in
+        assert (
+            current_preferences[0].privacy_preference_history_id
+            != historical_preferences[0].id
+        )
+
+        for history in db.query(PrivacyPreferenceHistory).filter(
+            PrivacyPreferenceHistory.fides_user_device_provided_identity_id
+            == fides_user_provided_identity.id
+        ):
+            history.delete(db)
+        fides_user_provided_identity.delete(db)
+
+    def test_bulk_create_history_invalid_notice_history(self, db):
+        with pytest.raises(PrivacyNoticeHistoryNotFound):
+            PrivacyPreferenceHistory.bulk_create_history_and_upsert_current_preferences(
+                db=db,
+                data=[
+                    {
+                        "fides_user_device_provided_identity_id": "test_identity",
+                        "preference": "opt_out",
+                        "privacy_notice_history_id": "bad_id",
+                    }
+                ],
+            )
+
     def test_cache_system_status(self, privacy_preference_history, db):
         assert privacy_preference_history.affected_system_status == {}
 
@@ -1157,6 +1352,59 @@ class TestPrivacyPreferenceHistory:
             == ConsentRecordType.purpose_consent
         )
 
+    def test_matches_hashed_identity(
+        self, db, privacy_notice, fides_user_provided_identity
+    ):
+        privacy_notice_history = privacy_notice.histories[0]
+        preference_history_record = PrivacyPreferenceHistory.create(
+            db=db,
+            data={
+                "email": "blind@example.com",
+                "fides_user_device_provided_identity_id": fides_user_provided_identity.id,
+                "hashed_email": ProvidedIdentity.blind_index_value("blind@example.com"),
+                "preference": "opt_out",
+                "privacy_notice_history_id": privacy_notice_history.id,
+            },
+            check_name=False,
+        )
+        legacy_preference_history_record = PrivacyPreferenceHistory.create(
+            db=db,
+            data={
+                "email": "blind@example.com",
+                "fides_user_device_provided_identity_id": fides_user_provided_identity.id,
+                "hashed_email": ProvidedIdentity.hash_value("blind@example.com"),
+                "preference": "opt_in",
+                "privacy_notice_history_id": privacy_notice_history.id,
+            },
+            check_name=False,
+        )
+
+        def matching_ids():
+            return {
+                record.id
+                for record in db.query(PrivacyPreferenceHistory).filter(
+                    PrivacyPreferenceHistory.matches_hashed_identity(
+                        PrivacyPreferenceHistory.hashed_email, "blind@example.com"
+                    )
+                )
+            }
+
+        assert matching_ids() == {preference_history_record.id}
+
+        # Records saved with the legacy hash are only matched with identity_legacy_hash enabled
+        original_value = CONFIG.security.identity_legacy_hash
+        CONFIG.security.identity_legacy_hash = True
+        try:
+            assert matching_ids() == {
+                preference_history_record.id,
+                legacy_preference_history_record.id,
+            }
+        finally:
+            CONFIG.security.identity_legacy_hash = original_value
+
+        legacy_preference_history_record.delete(db)
+        preference_history_record.delete(db)
+
     def test_validate_before_saving_consent_history_helper(
         self, db, fides_user_provided_identity, privacy_notice, system
     ):
@@ -1933,7 +2181,7 @@ class TestServedNoticeHistory:
         assert served_notice_history_record.email == "ethyca@email.com"
         assert (
             served_notice_history_record.hashed_email
-            == provided_identity.hashed_value
+            == provided_identity.blind_index
             is not None
         )
         assert (
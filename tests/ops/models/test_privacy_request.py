@@ -50,6 +50,79 @@ def test_blank_provided_identity_to_identity(
     assert identity.email is None
 
 
+class TestProvidedIdentityBlindIndex:
+    @pytest.fixture(scope="function")
+    def identity_legacy_hash(self):
+        original_value = CONFIG.security.identity_legacy_hash
+        CONFIG.security.identity_legacy_hash = True
+        yield
+        CONFIG.security.identity_legacy_hash = original_value
+
+    def test_persist_identity_sets_blind_index(
+        self, db: Session, privacy_request: PrivacyRequest
+    ) -> None:
+        privacy_request.persist_identity(
+            db=db, identity=Identity(email="blind@example.com")
+        )
+        provided_identity = (
+            db.query(ProvidedIdentity)
+            .filter(
+                ProvidedIdentity.privacy_request_id == privacy_request.id,
+                ProvidedIdentity.matches_value("blind@example.com"),
+            )
+            .first()
+        )
+        assert provided_identity is not None
+        assert provided_identity.blind_index == ProvidedIdentity.blind_index_value(
+            "blind@example.com"
+        )
+        assert provided_identity.hashed_value is None
+
+    def test_blind_index_updated_with_value(
+        self, db: Session, privacy_request: PrivacyRequest
+    ) -> None:
+        privacy_request.persist_identity(
+            db=db, identity=Identity(email="blind@example.com")
+        )
+        provided_identity = (
+            db.query(ProvidedIdentity)
+            .filter(ProvidedIdentity.matches_value("blind@example.com"))
+            .first()
+        )
+        provided_identity.encrypted_value = {"value": "updated@example.com"}
+        provided_identity.save(db)
+
+        assert provided_identity.blind_index == ProvidedIdentity.blind_index_value(
+            "updated@example.com"
+        )
+
+    @pytest.mark.usefixtures("identity_legacy_hash")
+    def test_legacy_hash(self, db: Session, privacy_request: PrivacyRequest) -> None:
+        privacy_request.persist_identity(
+            db=db, identity=Identity(email="legacy@example.com")
+        )
+        provided_identity = (
+            db.query(ProvidedIdentity)
+            .filter(ProvidedIdentity.matches_value("legacy@example.com"))
+            .first()
+        )
+        assert provided_identity.hashed_value == ProvidedIdentity.hash_value(
+            "legacy@example.com"
+        )
+
+        # Identities saved before the blind index was backfilled are matched by their hashed_value
+        db.query(ProvidedIdentity).filter(
+            ProvidedIdentity.id == provided_identity.id
+        ).update({"blind_index": None})
+        assert (
+            db.query(ProvidedIdentity)
+            .filter(ProvidedIdentity.matches_value("legacy@example.com"))
+            .first()
+            .id
+            == provided_identity.id
+        )
+
+
 def test_privacy_request(
     db: Session,
     policy: Policy,
@@ -10,8 +10,10 @@ from fides.api.common_exceptions import ClientUnsuccessfulException, ConnectionE
 from fides.api.models.connectionconfig import ConnectionConfig, ConnectionType
 from fides.api.schemas.saas.saas_config import ClientConfig
 from fides.api.schemas.saas.shared_schemas import HTTPMethod, SaaSRequestParams
+from fides.api.service.connectors.saas import authenticated_client
 from fides.api.service.connectors.saas.authenticated_client import (
     AuthenticatedClient,
+    SafeHostAdapter,
     get_retry_after,
 )
 from fides.api.util.saas_util import load_config_with_replacement
@@ -89,6 +91,24 @@ class TestAuthenticatedClient:
         with pytest.raises(ConnectionException):
             test_authenticated_client.send(test_saas_request)
 
+    @pytest.mark.parametrize("scheme, port", [("http", 80), ("https", 443)])
+    def test_connections_pinned_to_verified_ip(
+        self, test_config_dev_mode_disabled, scheme, port
+    ):
+        """Connections are opened to the IP address the host was verified to resolve to"""
+        session = Session()
+        session.mount(f"{scheme}://", SafeHostAdapter())
+        with mock.patch.object(
+            authenticated_client, "resolve_safe_host_ip", return_value="93.184.216.34"
+        ) as resolve_safe_host_ip, mock.patch(
+            "urllib3.util.connection.create_connection", side_effect=OSError
+        ) as create_connection:
+            with pytest.raises(ConnectionError):
+                session.get(f"{scheme}://ethyca.com/test_path")
+
+        resolve_safe_host_ip.assert_called_once_with("ethyca.com")
+        assert create_connection.call_args[0][0] == ("93.184.216.34", port)
+
     @mock.patch.object(Session, "send")
     def test_client_retries_429_and_throws(
         self, send, test_authenticated_client, test_saas_request
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from typing import Any, Dict, Set
+from unittest import mock
 
 import pytest
 from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
@@ -352,6 +353,108 @@ class TestSQLQueryConfig:
             text_clause._bindparams["email"].value == "*****"
         )  # String rewrite masking strategy
 
+    def test_generate_batched_update_stmts(
+        self, erasure_policy, example_datasets, connection_config
+    ):
+        dataset = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        config = SQLQueryConfig(customer_node)
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": f"John Customer {i}",
+                "address_id": i,
+                "id": i,
+            }
+            for i in range(1, 6)
+        ]
+        # No primary key, so no update can be generated for this row
+        rows.append({"email": "customer-6@example.com", "name": "Jane Customer"})
+
+        batches = config.generate_batched_update_stmts(
+            rows, erasure_policy, privacy_request, batch_size=2
+        )
+        assert len(batches) == 3
+        for text_clause, _ in batches:
+            assert text_clause.text == "UPDATE customer SET name = :name WHERE id = :id"
+
+        assert [params for _, params in batches] == [
+            [{"name": None, "id": 1}, {"name": None, "id": 2}],
+            [{"name": None, "id": 3}, {"name": None, "id": 4}],
+            [{"name": None, "id": 5}],
+        ]
+
+    def test_update_value_maps_masks_each_field_once(
+        self, erasure_policy, example_datasets, connection_config
+    ):
+        dataset = Dataset(**example_datasets[0])
+        graph = convert_dataset_to_graph(dataset, connection_config.key)
+        dataset_graph = DatasetGraph(*[graph])
+        traversal = Traversal(dataset_graph, {"email": "customer-1@example.com"})
+
+        customer_node = traversal.traversal_node_dict[
+            CollectionAddress("postgres_example_test_dataset", "customer")
+        ]
+
+        config = SQLQueryConfig(customer_node)
+        rows = [
+            {
+                "email": f"customer-{i}@example.com",
+                "name": f"John Customer {i}",
+                "address_id": i,
+                "id": i,
+            }
+            for i in range(1, 6)
+        ]
+
+        # Make target more broad
+        rule = erasure_policy.rules[0]
+        target = rule.targets[0]
+        target.data_category = DataCategory("user").value
+
+        # Update rule masking strategy
+        rule.masking_strategy = {
+            "strategy": "hash",
+            "configuration": {"algorithm": "SHA-512"},
+        }
+        # cache secrets for hash strategy
+        secret = MaskingSecretCache[str](
+            secret="adobo",
+            masking_strategy=HashMaskingStrategy.name,
+            secret_type=SecretType.salt,
+        )
+        cache_secret(secret, privacy_request.id)
+
+        with mock.patch.object(
+            HashMaskingStrategy,
+            "mask",
+            side_effect=HashMaskingStrategy.mask,
+            autospec=True,
+        ) as mock_mask:
+            value_maps = config.update_value_maps(rows, erasure_policy, privacy_request)
+
+        # One call per masked field (email and name) rather than one per value
+        assert mock_mask.call_count == 2
+        assert value_maps == [
+            config.update_value_map(row, erasure_policy, privacy_request)
+            for row in rows
+        ]
+        # since length is set to 40 in dataset.yml, we expect only first 40 chars of masked val
+        assert (
+            value_maps[2]["name"]
+            == HashMaskingStrategy(HashMaskingConfiguration(algorithm="SHA-512")).mask(
+                ["John Customer 3"], request_id=privacy_request.id
+            )[0][0:40]
+        )
+        clear_cache_secrets(privacy_request.id)
+
 
 class TestMongoQueryConfig:
     @pytest.fixture(scope="function")
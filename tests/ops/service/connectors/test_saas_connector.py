@@ -1,5 +1,6 @@
 import json
 import random
+import time
 from typing import List
 from unittest import mock
 from unittest.mock import Mock
@@ -9,7 +10,7 @@ from requests import Response
 from sqlalchemy.orm import Session
 from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND
 
-from fides.api.common_exceptions import SkippingConsentPropagation
+from fides.api.common_exceptions import ConnectionException, SkippingConsentPropagation
 from fides.api.graph.graph import Node
 from fides.api.graph.traversal import TraversalNode
 from fides.api.models.policy import Policy
@@ -18,7 +19,12 @@ from fides.api.schemas.redis_cache import Identity
 from fides.api.schemas.saas.saas_config import ParamValue, SaaSConfig, SaaSRequest
 from fides.api.schemas.saas.shared_schemas import HTTPMethod
 from fides.api.service.connectors import get_connector
+from fides.api.service.connectors.saas.authenticated_client import (
+    RequestFailureResponseException,
+)
 from fides.api.service.connectors.saas_connector import SaaSConnector
+from fides.api.util import host_resolution_cache as host_resolution_cache_module
+from fides.api.util.host_resolution_cache import host_resolution_cache
 from tests.ops.graph.graph_test_util import generate_node
 
 
@@ -189,6 +195,318 @@ class TestSaasConnector:
             {"fidesops_grouped_inputs": [], "conversation_id": ["456"]},
         ) == [{"id": "123", "from_email": "test@example.com"}]
 
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_concurrent_read_requests(
+        self, mock_send: Mock, saas_example_config, saas_example_connection_config
+    ):
+        """
+        Verifies that multiple read requests for a collection can be sent concurrently
+        and that the rows are returned in the order of the read requests
+        """
+
+        def send(request_params, ignore_errors=False):
+            status = request_params.query_params["status"]
+            if status == "open":
+                # make the first read request finish last
+                time.sleep(0.1)
+            response = Response()
+            response.status_code = HTTP_200_OK
+            response._content = str.encode(
+                json.dumps([{"id": f"{status}_1"}, {"id": f"{status}_2"}])
+            )
+            return response
+
+        mock_send.side_effect = send
+
+        saas_example_config["concurrent_requests"] = 2
+        saas_example_connection_config.saas_config = saas_example_config
+        saas_config = SaaSConfig(**saas_example_config)
+        graph = saas_config.get_graph(saas_example_connection_config.secrets)
+        node = Node(
+            graph,
+            next(
+                collection
+                for collection in graph.collections
+                if collection.name == "tickets"
+            ),
+        )
+        traversal_node = TraversalNode(node)
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+
+        assert connector.retrieve_data(
+            traversal_node,
+            Policy(),
+            PrivacyRequest(id="123"),
+            {"fidesops_grouped_inputs": [], "customer_id": ["1"]},
+        ) == [
+            {"id": "open_1"},
+            {"id": "open_2"},
+            {"id": "closed_1"},
+            {"id": "closed_2"},
+        ]
+        assert mock_send.call_count == 2
+
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_concurrent_offset_pagination(
+        self, mock_send: Mock, saas_example_config, saas_example_connection_config
+    ):
+        """
+        Verifies that pages of an offset-paginated read request can be fetched
+        concurrently and that the rows are returned in page order
+        """
+
+        def send(request_params, ignore_errors=False):
+            offset = request_params.query_params["offset"]
+            conversations = (
+                [{"id": f"{offset}_1"}, {"id": f"{offset}_2"}] if offset < 3000 else []
+            )
+            response = Response()
+            response.status_code = HTTP_200_OK
+            response._content = str.encode(json.dumps({"conversations": conversations}))
+            return response
+
+        mock_send.side_effect = send
+
+        conversations_endpoint = next(
+            endpoint
+            for endpoint in saas_example_config["endpoints"]
+            if endpoint["name"] == "conversations"
+        )
+        conversations_endpoint["requests"]["read"]["pagination"] = {
+            "strategy": "offset",
+            "configuration": {
+                "incremental_param": "offset",
+                "increment_by": 1000,
+                "limit": 10000,
+            },
+        }
+        saas_example_config["concurrent_requests"] = 2
+        saas_example_connection_config.saas_config = saas_example_config
+        saas_config = SaaSConfig(**saas_example_config)
+        graph = saas_config.get_graph(saas_example_connection_config.secrets)
+        node = Node(
+            graph,
+            next(
+                collection
+                for collection in graph.collections
+                if collection.name == "conversations"
+            ),
+        )
+        traversal_node = TraversalNode(node)
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+
+        privacy_request = PrivacyRequest(id="123")
+        privacy_request.cache_identity(Identity(email="test@example.com"))
+
+        assert connector.retrieve_data(
+            traversal_node,
+            Policy(),
+            privacy_request,
+            {"email": ["test@example.com"]},
+        ) == [
+            {"id": "0_1"},
+            {"id": "0_2"},
+            {"id": "1000_1"},
+            {"id": "1000_2"},
+            {"id": "2000_1"},
+            {"id": "2000_2"},
+        ]
+        # pages are fetched two at a time, the last pair being past the end of the data
+        assert mock_send.call_count == 4
+
+    @mock.patch(
+        "fides.api.service.connectors.saas_connector.AuthenticatedClient.send",
+        autospec=True,
+    )
+    def test_concurrent_read_requests_with_own_client_config(
+        self, mock_send: Mock, saas_example_config, saas_example_connection_config
+    ):
+        """
+        Verifies that concurrent read requests are sent through a client built from
+        their own client config when they override the connector's
+        """
+        uris = {}
+
+        def send(client, request_params, ignore_errors=False):
+            status = request_params.query_params["status"]
+            uris[status] = client.uri
+            response = Response()
+            response.status_code = HTTP_200_OK
+            response._content = str.encode(json.dumps([{"id": f"{status}_1"}]))
+            return response
+
+        mock_send.side_effect = send
+
+        tickets_endpoint = next(
+            endpoint
+            for endpoint in saas_example_config["endpoints"]
+            if endpoint["name"] == "tickets"
+        )
+        tickets_endpoint["requests"]["read"][1]["client_config"] = {
+            "protocol": "https",
+            "host": "tickets.<domain>",
+        }
+        saas_example_config["concurrent_requests"] = 2
+        saas_example_connection_config.saas_config = saas_example_config
+        saas_config = SaaSConfig(**saas_example_config)
+        graph = saas_config.get_graph(saas_example_connection_config.secrets)
+        node = Node(
+            graph,
+            next(
+                collection
+                for collection in graph.collections
+                if collection.name == "tickets"
+            ),
+        )
+        traversal_node = TraversalNode(node)
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+
+        assert connector.retrieve_data(
+            traversal_node,
+            Policy(),
+            PrivacyRequest(id="123"),
+            {"fidesops_grouped_inputs": [], "customer_id": ["1"]},
+        ) == [{"id": "open_1"}, {"id": "closed_1"}]
+        assert uris == {
+            "open": "https://domain",
+            "closed": "https://tickets.domain",
+        }
+
+    @pytest.mark.parametrize(
+        "last_page_size, expected_rows",
+        [
+            (1, ["0_1", "0_2", "1000_1", "1000_2", "2000_1"]),
+            (2, None),
+        ],
+    )
+    @mock.patch("fides.api.service.connectors.saas_connector.AuthenticatedClient.send")
+    def test_concurrent_offset_pagination_failed_page(
+        self,
+        mock_send: Mock,
+        last_page_size,
+        expected_rows,
+        saas_example_config,
+        saas_example_connection_config,
+    ):
+        """
+        Verifies that a failed request for a page fetched ahead is treated as the end
+        of the data when it follows a page with fewer records than the ones before it,
+        and fails the request otherwise
+        """
+
+        def send(request_params, ignore_errors=False):
+            offset = request_params.query_params["offset"]
+            response = Response()
+            if offset >= 3000:
+                response.status_code = HTTP_404_NOT_FOUND
+                raise RequestFailureResponseException(response=response)
+            page_size = last_page_size if offset == 2000 else 2
+            conversations = [{"id": f"{offset}_{i + 1}"} for i in range(page_size)]
+            response.status_code = HTTP_200_OK
+            response._content = str.encode(json.dumps({"conversations": conversations}))
+            return response
+
+        mock_send.side_effect = send
+
+        conversations_endpoint = next(
+            endpoint
+            for endpoint in saas_example_config["endpoints"]
+            if endpoint["name"] == "conversations"
+        )
+        conversations_endpoint["requests"]["read"]["pagination"] = {
+            "strategy": "offset",
+            "configuration": {
+                "incremental_param": "offset",
+                "increment_by": 1000,
+                "limit": 10000,
+            },
+        }
+        saas_example_config["concurrent_requests"] = 2
+        saas_example_connection_config.saas_config = saas_example_config
+        saas_config = SaaSConfig(**saas_example_config)
+        graph = saas_config.get_graph(saas_example_connection_config.secrets)
+        node = Node(
+            graph,
+            next(
+                collection
+                for collection in graph.collections
+                if collection.name == "conversations"
+            ),
+        )
+        traversal_node = TraversalNode(node)
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+
+        privacy_request = PrivacyRequest(id="123")
+        privacy_request.cache_identity(Identity(email="test@example.com"))
+
+        if expected_rows is None:
+            with pytest.raises(RequestFailureResponseException):
+                connector.retrieve_data(
+                    traversal_node,
+                    Policy(),
+                    privacy_request,
+                    {"email": ["test@example.com"]},
+                )
+            return
+
+        assert [
+            row["id"]
+            for row in connector.retrieve_data(
+                traversal_node,
+                Policy(),
+                privacy_request,
+                {"email": ["test@example.com"]},
+            )
+        ] == expected_rows
+
+    def test_concurrent_read_requests_pinned_to_verified_ip(
+        self,
+        saas_example_config,
+        saas_example_connection_config,
+        test_config_dev_mode_disabled,
+    ):
+        """
+        Verifies that concurrent read requests connect to the IP address their host
+        was verified to resolve to
+        """
+        saas_example_config["concurrent_requests"] = 2
+        saas_example_connection_config.saas_config = saas_example_config
+        saas_config = SaaSConfig(**saas_example_config)
+        graph = saas_config.get_graph(saas_example_connection_config.secrets)
+        node = Node(
+            graph,
+            next(
+                collection
+                for collection in graph.collections
+                if collection.name == "tickets"
+            ),
+        )
+        traversal_node = TraversalNode(node)
+        connector: SaaSConnector = get_connector(saas_example_connection_config)
+
+        host_resolution_cache.clear()
+        with mock.patch.object(
+            host_resolution_cache_module.socket,
+            "gethostbyname",
+            return_value="93.184.216.34",
+        ) as gethostbyname, mock.patch(
+            "urllib3.util.connection.create_connection", side_effect=OSError
+        ) as create_connection:
+            with pytest.raises(ConnectionException):
+                connector.retrieve_data(
+                    traversal_node,
+                    Policy(),
+                    PrivacyRequest(id="123"),
+                    {"fidesops_grouped_inputs": [], "customer_id": ["1"]},
+                )
+        host_resolution_cache.clear()
+
+        gethostbyname.assert_called_with("domain")
+        assert create_connection.call_count == 2
+        assert {call[0][0] for call in create_connection.call_args_list} == {
+            ("93.184.216.34", 443)
+        }
+
     def test_missing_input_values(
         self, saas_example_config, saas_example_connection_config
     ):
@@ -0,0 +1,109 @@
+from unittest import mock
+
+import pytest
+
+from fides.api.models.connectionconfig import (
+    AccessLevel,
+    ConnectionConfig,
+    ConnectionType,
+)
+from fides.api.service.connectors.sql_connector import PostgreSQLConnector
+from fides.api.service.connectors.sql_engine_registry import SQLEngineRegistry
+from fides.config import CONFIG
+
+
+@pytest.fixture(scope="function")
+def reuse_sql_engines():
+    original_value = CONFIG.execution.reuse_sql_engines
+    CONFIG.execution.reuse_sql_engines = True
+    yield
+    CONFIG.execution.reuse_sql_engines = original_value
+
+
+@pytest.fixture(scope="function")
+def registry():
+    registry = SQLEngineRegistry()
+    with mock.patch(
+        "fides.api.service.connectors.sql_connector.sql_engine_registry", registry
+    ):
+        yield registry
+    registry.dispose_all()
+
+
+def postgres_config(password: str = "postgres") -> ConnectionConfig:
+    return ConnectionConfig(
+        key="my_postgres_db",
+        connection_type=ConnectionType.postgres,
+        access=AccessLevel.write,
+        secrets={
+            "host": "localhost",
+            "port": 5432,
+            "dbname": "postgres_example",
+            "username": "postgres",
+            "password": password,
+        },
+    )
+
+
+@pytest.mark.usefixtures("reuse_sql_engines")
+class TestSQLEngineRegistry:
+    def test_engine_reused_across_connectors(self, registry):
+        first = PostgreSQLConnector(postgres_config())
+        engine = first.client()
+        first.close()
+
+        second = PostgreSQLConnector(postgres_config())
+        assert second.client() is engine
+        assert engine.pool.size() == CONFIG.execution.sql_engine_pool_size
+        second.close()
+
+    def test_close_does_not_dispose_shared_engine(self, registry):
+        connector = PostgreSQLConnector(postgres_config())
+        engine = connector.client()
+        with mock.patch.object(engine, "dispose") as mock_dispose:
+            connector.close()
+            assert not mock_dispose.called
+        assert connector.db_client is None
+
+    def test_new_engine_when_secrets_change(self, registry):
+        connector = PostgreSQLConnector(postgres_config())
+        engine = connector.client()
+        connector.close()
+
+        updated = PostgreSQLConnector(postgres_config(password="new_password"))
+        with mock.patch.object(engine, "dispose") as mock_dispose:
+            assert updated.client() is not engine
+            # The engine built with the old secrets is no longer in use
+            assert mock_dispose.called
+        updated.close()
+
+    def test_invalidate_waits_until_released(self, registry):
+        connector = PostgreSQLConnector(postgres_config())
+        engine = connector.client()
+
+        with mock.patch.object(engine, "dispose") as mock_dispose:
+            registry.invalidate("my_postgres_db")
+            assert not mock_dispose.called
+
+            other = PostgreSQLConnector(postgres_config())
+            assert other.client() is not engine
+            other.close()
+
+            connector.close()
+            assert mock_dispose.called
+
+    def test_evict_idle(self, registry):
+        original_value = CONFIG.execution.sql_engine_idle_timeout
+        CONFIG.execution.sql_engine_idle_timeout = -1
+
+        connector = PostgreSQLConnector(postgres_config())
+        engine = connector.client()
+        with mock.patch.object(engine, "dispose") as mock_dispose:
+            registry.evict_idle()
+            assert not mock_dispose.called
+
+            connector.close()
+            registry.evict_idle()
+            assert mock_dispose.called
+
+        CONFIG.execution.sql_engine_idle_timeout = original_value
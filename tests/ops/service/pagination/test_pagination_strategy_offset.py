@@ -173,6 +173,34 @@ def test_offset_limit(response_with_body):
     assert next_request is None
 
 
+def test_offset_page_requests():
+    config = OffsetPaginationConfiguration(
+        incremental_param="page", increment_by=1, limit=10
+    )
+    request_params: SaaSRequestParams = SaaSRequestParams(
+        method=HTTPMethod.GET,
+        path="/conversations",
+        query_params={"page": 8, "per_page": 100},
+    )
+
+    paginator = OffsetPaginationStrategy(config)
+    page_requests = paginator.get_page_requests(request_params, {}, 3)
+    # stops at the limit and leaves the original request untouched
+    assert page_requests == [
+        SaaSRequestParams(
+            method=HTTPMethod.GET,
+            path="/conversations",
+            query_params={"page": 9, "per_page": 100},
+        ),
+        SaaSRequestParams(
+            method=HTTPMethod.GET,
+            path="/conversations",
+            query_params={"page": 10, "per_page": 100},
+        ),
+    ]
+    assert request_params.query_params == {"page": 8, "per_page": 100}
+
+
 def test_offset_increment_by_zero():
     with pytest.raises(ValueError) as exc:
         OffsetPaginationConfiguration(
@@ -0,0 +1,55 @@
+from fides.api.graph.config import CollectionAddress
+from fides.api.service.privacy_request.dataset_graph_cache import (
+    get_compiled_dataset_graph,
+    get_dataset_graph_version,
+)
+
+
+class TestCompiledDatasetGraph:
+    def test_compiled_graph_reused(self, db, postgres_example_test_dataset_config):
+        compiled = get_compiled_dataset_graph(db)
+        assert (
+            CollectionAddress("postgres_example_test_dataset", "customer")
+            in compiled.graph.nodes
+        )
+        assert get_compiled_dataset_graph(db) is compiled
+
+    def test_compiled_graph_invalidated_on_dataset_change(
+        self, db, postgres_example_test_dataset_config
+    ):
+        compiled = get_compiled_dataset_graph(db)
+
+        ctl_dataset = postgres_example_test_dataset_config.ctl_dataset
+        ctl_dataset.collections = [
+            collection
+            for collection in ctl_dataset.collections
+            if collection["name"] in {"address", "customer"}
+        ]
+        ctl_dataset.save(db)
+
+        updated = get_compiled_dataset_graph(db)
+        assert updated is not compiled
+        assert updated.version != compiled.version
+        assert set(updated.graph.nodes.keys()) == {
+            CollectionAddress("postgres_example_test_dataset", "address"),
+            CollectionAddress("postgres_example_test_dataset", "customer"),
+        }
+
+    def test_version_changes_on_connection_config_change(
+        self, db, postgres_example_test_dataset_config
+    ):
+        version = get_dataset_graph_version(db)
+
+        connection_config = postgres_example_test_dataset_config.connection_config
+        connection_config.secrets = {
+            **connection_config.secrets,
+            "password": "new_password",
+        }
+        connection_config.save(db)
+
+        assert get_dataset_graph_version(db) != version
+
+    def test_version_unchanged_without_writes(
+        self, db, postgres_example_test_dataset_config
+    ):
+        assert get_dataset_graph_version(db) == get_dataset_graph_version(db)
@@ -56,8 +56,10 @@ from fides.api.service.connectors.sql_connector import (
 )
 from fides.api.service.masking.strategy.masking_strategy import MaskingStrategy
 from fides.api.service.masking.strategy.masking_strategy_hmac import HmacMaskingStrategy
-from fides.api.service.privacy_request.request_runner_service import (
+from fides.api.service.privacy_request.dataset_graph_cache import (
     build_consent_dataset_graph,
+)
+from fides.api.service.privacy_request.request_runner_service import (
     needs_batch_email_send,
     run_webhooks_and_report_status,
 )
@@ -28,6 +28,7 @@ from fides.api.tasks.storage import (
     LOCAL_FIDES_UPLOAD_DIRECTORY,
     encrypt_access_request_results,
     write_to_in_memory_buffer,
+    write_to_stream,
 )
 from fides.api.util.encryption.aes_gcm_encryption_scheme import (
     decrypt_combined_nonce_and_message,
@@ -509,6 +510,57 @@ class TestWriteToInMemoryBuffer:
             ]
 
 
+class TestWriteToStream:
+    key = "test--encryption"
+
+    @pytest.fixture(scope="function")
+    def data(self) -> Dict[str, Any]:
+        return {
+            f"postgres_example:collection_{i}": [
+                {"id": j, "name": "Cañon City", "nested": {"x": j, "y": [1, 2]}}
+                for j in range(1000)
+            ]
+            for i in range(5)
+        }
+
+    def test_json_matches_in_memory_buffer(self, data, privacy_request):
+        stream = write_to_stream("json", data, privacy_request)
+        assert stream.read() == json.dumps(data, indent=2).encode(
+            CONFIG.security.encoding
+        )
+
+    def test_reads_are_filled(self, data, privacy_request):
+        stream = write_to_stream("json", data, privacy_request)
+        first = stream.read(100000)
+        second = stream.read(100000)
+        assert len(first) == 100000
+        assert len(second) == 100000
+
+    def test_encrypted_json(self, data, privacy_request):
+        privacy_request.cache_encryption(self.key)
+        stream = write_to_stream("json", data, privacy_request)
+        decrypted = decrypt_combined_nonce_and_message(
+            stream.read().decode(CONFIG.security.encoding),
+            self.key.encode(CONFIG.security.encoding),
+        )
+        assert json.loads(decrypted) == data
+
+    def test_encrypted_csv(self, data, privacy_request):
+        privacy_request.cache_encryption(self.key)
+        stream = write_to_stream("csv", data, privacy_request)
+
+        zipfile = ZipFile(BytesIO(stream.read()))
+        assert zipfile.namelist() == [f"{key}.csv" for key in data]
+        with zipfile.open("postgres_example:collection_4.csv", "r") as csv_file:
+            decrypted = decrypt_combined_nonce_and_message(
+                csv_file.read().decode(CONFIG.security.encoding),
+                self.key.encode(CONFIG.security.encoding),
+            )
+            df = pd.read_csv(BytesIO(decrypted.encode(CONFIG.security.encoding)))
+            assert list(df.columns) == ["id", "name", "nested.x", "nested.y"]
+            assert len(df) == 1000
+
+
 class TestEncryptResultsPackage:
     def test_no_encryption_keys_set(self):
         data = "test data"
@@ -6,6 +6,8 @@ from bson import ObjectId
 
 from fides.api.graph.config import CollectionAddress, FieldPath
 from fides.api.task.filter_results import (
+    apply_projection_plan,
+    compile_projection_plan,
     filter_data_categories,
     remove_empty_containers,
     select_and_save_field,
@@ -510,6 +512,42 @@ class TestFilterResults:
         remove_empty_containers(results)
         assert results == expected
 
+    def test_compile_projection_plan(self):
+        plan = compile_projection_plan(
+            frozenset(
+                [
+                    FieldPath("A"),
+                    FieldPath("B", "C"),
+                    FieldPath("B", "D", "E"),
+                    FieldPath("B", "D"),
+                ]
+            )
+        )
+        assert plan == {"A": {}, "B": {"C": {}, "D": {"E": {}}}}
+
+    @pytest.mark.parametrize(
+        "row",
+        [
+            {"A": 1, "B": {"C": 2, "D": {"E": 3, "F": 4}, "G": 5}, "H": 6},
+            {"A": [1, [2, 3], []], "B": [{"C": 2}, {"G": 5}, {"D": [{"E": 3}, {}]}]},
+            {"A": {"X": 1}, "B": 7},
+            {"A": "", "B": {"C": None, "D": []}},
+            {"H": 6},
+        ],
+    )
+    def test_apply_projection_plan_matches_select_and_save_field(self, row):
+        field_paths = [FieldPath("A"), FieldPath("B", "C"), FieldPath("B", "D", "E")]
+
+        expected = {}
+        for field_path in field_paths:
+            select_and_save_field(expected, row, field_path)
+        remove_empty_containers(expected)
+
+        original_row = copy.deepcopy(row)
+        plan = compile_projection_plan(frozenset(field_paths))
+        assert apply_projection_plan(plan, row) == expected
+        assert row == original_row
+
     def test_filter_data_categories(self):
         """Test different combinations of data categories to ensure the access_request_results are filtered properly"""
         access_request_results = {
@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Dict
 from unittest import mock
 from uuid import uuid4
@@ -35,6 +36,7 @@ from fides.api.task.graph_task import (
     _format_data_use_map_for_caching,
     build_affected_field_logs,
     collect_queries,
+    execute_graph,
     start_function,
     update_erasure_mapping_from_cache,
 )
@@ -679,6 +681,50 @@ class TestUpdateErasureMappingFromCache:
         assert dsk[CollectionAddress("dr_1", "ds_1")] == 1
 
 
+class TestExecuteGraph:
+    @pytest.fixture(scope="function")
+    def dsk(self) -> Dict[CollectionAddress, Any]:
+        """
+        ds_1 and ds_2 are independent of each other, ds_3 must wait for both of them
+        """
+        ds_1 = CollectionAddress("dr_1", "ds_1")
+        ds_2 = CollectionAddress("dr_1", "ds_2")
+        ds_3 = CollectionAddress("dr_1", "ds_3")
+
+        barrier = threading.Barrier(2, timeout=1)
+        order = []
+
+        def independent(name):
+            def run(*args):
+                # Only passes if both independent nodes are running at the same time
+                barrier.wait()
+                order.append(name)
+                return [name]
+
+            return run
+
+        def dependent(*args):
+            order.append("ds_3")
+            return order
+
+        return {
+            ROOT_COLLECTION_ADDRESS: (start_function([{"email": "a@example.com"}]),),
+            ds_1: (independent("ds_1"), ROOT_COLLECTION_ADDRESS),
+            ds_2: (independent("ds_2"), ROOT_COLLECTION_ADDRESS),
+            ds_3: (dependent, ds_1, ds_2),
+            TERMINATOR_ADDRESS: (lambda x: x, ds_3),
+        }
+
+    def test_execute_graph_runs_independent_nodes_concurrently(self, dsk):
+        order = execute_graph(dsk, num_workers=2)
+        assert sorted(order[:2]) == ["ds_1", "ds_2"]
+        assert order[2] == "ds_3"
+
+    def test_execute_graph_sequential(self, dsk):
+        with pytest.raises(threading.BrokenBarrierError):
+            execute_graph(dsk, num_workers=1)
+
+
 class TestFormatDataUseMapForCaching:
     def create_dataset(self, db, fides_key, connection_config):
         """
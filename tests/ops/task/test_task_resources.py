@@ -1,4 +1,7 @@
+import threading
+
 from fides.api.task.task_resources import TaskResources
+from fides.config import CONFIG
 
 
 class TestTaskResources:
@@ -49,3 +52,84 @@ class TestTaskResources:
             "manual_example:filing-cabinet": 2,
             "manual_example:storage-unit": 3,
         }
+
+    def test_connection_slot(
+        self, db, privacy_request, policy, integration_manual_config
+    ):
+        original_value = CONFIG.execution.task_concurrency_per_connection
+        CONFIG.execution.task_concurrency_per_connection = 1
+        resources = TaskResources(
+            privacy_request, policy, [integration_manual_config], db
+        )
+
+        acquired = []
+
+        def acquire_slot(key):
+            with resources.connection_slot(key):
+                acquired.append(key)
+
+        with resources.connection_slot("connection_a"):
+            # A different connection is not blocked
+            other = threading.Thread(target=acquire_slot, args=("connection_b",))
+            other.start()
+            other.join(timeout=5)
+            assert acquired == ["connection_b"]
+
+            # The same connection has to wait for the slot to be released
+            same = threading.Thread(target=acquire_slot, args=("connection_a",))
+            same.start()
+            same.join(timeout=0.1)
+            assert same.is_alive()
+
+        same.join(timeout=5)
+        assert acquired == ["connection_b", "connection_a"]
+        CONFIG.execution.task_concurrency_per_connection = original_value
+
+    def test_worker_sessions(
+        self, db, privacy_request, policy, integration_manual_config
+    ):
+        resources = TaskResources(
+            privacy_request, policy, [integration_manual_config], db
+        )
+        loaded = {}
+
+        def use_resources():
+            loaded["session"] = resources.session
+            loaded["request"] = resources.request
+            loaded["connector"] = resources.get_connector(integration_manual_config.key)
+
+        with resources.worker_sessions(2):
+            # The thread that enabled worker sessions keeps using its own session
+            assert resources.session is db
+            assert resources.request is privacy_request
+
+            worker = threading.Thread(target=use_resources)
+            worker.start()
+            worker.join(timeout=5)
+
+            worker_session = loaded["session"]
+            assert worker_session is not db
+            assert loaded["request"] is not privacy_request
+            assert loaded["request"].id == privacy_request.id
+            assert loaded["connector"].configuration in worker_session
+            assert loaded["connector"] is not resources.get_connector(
+                integration_manual_config.key
+            )
+
+        # Worker sessions are closed once the graph has been executed
+        assert loaded["request"] not in worker_session
+
+    def test_single_worker_shares_session(
+        self, db, privacy_request, policy, integration_manual_config
+    ):
+        resources = TaskResources(
+            privacy_request, policy, [integration_manual_config], db
+        )
+        sessions = []
+
+        with resources.worker_sessions(1):
+            worker = threading.Thread(target=lambda: sessions.append(resources.session))
+            worker.start()
+            worker.join(timeout=5)
+
+        assert sessions == [db]
@@ -3,6 +3,8 @@ import pytest
 from fides.api.cryptography import cryptographic_util
 from fides.api.util.encryption.aes_gcm_encryption_scheme import (
     decrypt,
+    encrypt_stream_to_bytes_verify_secrets_length,
+    encrypt_to_bytes_verify_secrets_length,
     encrypt_verify_secret_length,
 )
 
@@ -17,6 +19,15 @@ def test_encrypt_decrypt_standard():
     assert decrypted_text == plaintext
 
 
+def test_encrypt_stream_matches_encrypt():
+    plaintext = "Be sure to drink your Ovaltine"
+    chunks = [plaintext[i : i + 7].encode("utf-8") for i in range(0, 30, 7)]
+    encrypted = b"".join(
+        encrypt_stream_to_bytes_verify_secrets_length(chunks, KEY, NONCE)
+    )
+    assert encrypted == encrypt_to_bytes_verify_secrets_length(plaintext, KEY, NONCE)
+
+
 def test_encrypt_bad_nonce():
     with pytest.raises(ValueError):
         encrypt_verify_secret_length("anything", KEY, b"")
@@ -0,0 +1,93 @@
+from typing import Any, Dict, List
+from unittest import mock
+
+import pytest
+
+from fides.api.util import audit_log_writer
+from fides.api.util.audit_log_writer import AuditLogResourceWriter
+from fides.config import CONFIG
+
+
+def audit_log_record(request_path: str) -> Dict[str, Any]:
+    return {
+        "user_id": "test_user_id",
+        "request_path": request_path,
+        "request_type": "POST",
+        "fides_keys": [],
+        "extra_data": None,
+    }
+
+
+class TestAuditLogResourceWriter:
+    @pytest.fixture
+    def written_batches(self):
+        batches: List[List[Dict[str, Any]]] = []
+        with mock.patch.object(
+            audit_log_writer.deps, "get_api_session"
+        ), mock.patch.object(
+            audit_log_writer,
+            "write_audit_log_resource_records",
+            side_effect=lambda _, records: batches.append(records),
+        ):
+            yield batches
+
+    async def test_records_written_in_batches(self, written_batches):
+        writer = AuditLogResourceWriter()
+        with mock.patch.object(CONFIG.security, "audit_log_resource_batch_size", 2):
+            # Queue every record before the writer starts draining
+            with mock.patch.object(writer, "start"):
+                writer._queue = audit_log_writer.queue.Queue(maxsize=10)
+                for i in range(5):
+                    await writer.enqueue(audit_log_record(f"path/{i}"))
+
+            writer.start()
+            writer.stop()
+
+        assert [len(batch) for batch in written_batches] == [2, 2, 1]
+        assert [
+            record["request_path"] for batch in written_batches for record in batch
+        ] == [f"path/{i}" for i in range(5)]
+
+    @pytest.mark.parametrize(
+        "overflow_policy, expected_paths",
+        [
+            ("drop_newest", ["path/0", "path/1"]),
+            ("drop_oldest", ["path/2", "path/3"]),
+        ],
+    )
+    async def test_overflow_policy(
+        self, written_batches, overflow_policy, expected_paths
+    ):
+        writer = AuditLogResourceWriter()
+        with mock.patch.object(
+            CONFIG.security, "audit_log_resource_overflow_policy", overflow_policy
+        ):
+            with mock.patch.object(writer, "start"):
+                writer._queue = audit_log_writer.queue.Queue(maxsize=2)
+                for i in range(4):
+                    await writer.enqueue(audit_log_record(f"path/{i}"))
+            assert writer._dropped == 2
+
+            writer.start()
+            writer.stop()
+
+        assert [
+            record["request_path"] for batch in written_batches for record in batch
+        ] == expected_paths
+        assert writer._dropped == 0
+
+    async def test_stop_without_start(self, written_batches):
+        writer = AuditLogResourceWriter()
+        writer.stop()
+        assert written_batches == []
+
+    async def test_restarts_after_stop(self, written_batches):
+        writer = AuditLogResourceWriter()
+        await writer.enqueue(audit_log_record("path/0"))
+        writer.stop()
+        await writer.enqueue(audit_log_record("path/1"))
+        writer.stop()
+
+        assert [
+            record["request_path"] for batch in written_batches for record in batch
+        ] == ["path/0", "path/1"]
@@ -1,7 +1,8 @@
+import json
 import pickle
 import random
 from base64 import b64encode
-from datetime import datetime
+from datetime import date, datetime, timezone
 from enum import Enum
 from typing import Any, List
 
@@ -12,7 +13,12 @@ from fides.api.util.cache import (
     ENCODED_BYTES_PREFIX,
     ENCODED_DATE_PREFIX,
     ENCODED_MONGO_OBJECT_ID_PREFIX,
+    ENCODED_MSGPACK_COMPRESSED_PREFIX,
+    ENCODED_MSGPACK_PREFIX,
     FidesopsRedis,
+    _encode_msgpack,
+    get_identity_cache_key,
+    get_privacy_request_key_index_cache_key,
 )
 from fides.config import CONFIG
 from tests.fixtures.application_fixtures import faker
@@ -88,6 +94,126 @@ def test_scan(cache: FidesopsRedis) -> List:
     assert len(keys) == 0
 
 
+class TestPrivacyRequestKeyIndex:
+    @pytest.fixture
+    def privacy_request_id(self, cache: FidesopsRedis):
+        privacy_request_id = f"pri_{random.random()}"
+        yield privacy_request_id
+        cache.delete_privacy_request_keys(privacy_request_id)
+
+    def test_get_encoded_objects_from_key_index(
+        self, cache: FidesopsRedis, privacy_request_id: str
+    ) -> None:
+        cache.set_encoded_object(
+            f"{privacy_request_id}__access_request__dataset:collection",
+            [{"id": 1}],
+            privacy_request_id=privacy_request_id,
+        )
+        cache.set_encoded_object(
+            f"{privacy_request_id}__erasure_request__dataset:collection",
+            1,
+            privacy_request_id=privacy_request_id,
+        )
+
+        assert cache.get_encoded_objects_by_prefix(
+            f"{privacy_request_id}__access_request", privacy_request_id
+        ) == {
+            f"EN_{privacy_request_id}__access_request__dataset:collection": [{"id": 1}]
+        }
+        index_key = get_privacy_request_key_index_cache_key(privacy_request_id)
+        assert cache.smembers(index_key) == {
+            f"EN_{privacy_request_id}__access_request__dataset:collection",
+            f"EN_{privacy_request_id}__erasure_request__dataset:collection",
+        }
+        assert 0 < cache.ttl(index_key) <= CONFIG.redis.default_ttl_seconds
+
+    def test_expired_keys_skipped(
+        self, cache: FidesopsRedis, privacy_request_id: str
+    ) -> None:
+        cache.set_encoded_object(
+            f"{privacy_request_id}__access_request__dataset:collection",
+            [{"id": 1}],
+            privacy_request_id=privacy_request_id,
+        )
+        cache.delete(f"EN_{privacy_request_id}__access_request__dataset:collection")
+
+        assert (
+            cache.get_encoded_objects_by_prefix(
+                f"{privacy_request_id}__access_request", privacy_request_id
+            )
+            == {}
+        )
+
+    @pytest.fixture
+    def scan_unindexed_privacy_request_keys(self):
+        original_value = CONFIG.redis.scan_unindexed_privacy_request_keys
+        CONFIG.redis.scan_unindexed_privacy_request_keys = True
+        yield
+        CONFIG.redis.scan_unindexed_privacy_request_keys = original_value
+
+    def test_keys_without_index_not_scanned(
+        self, cache: FidesopsRedis, privacy_request_id: str
+    ) -> None:
+        cache.set_with_autoexpire(
+            get_identity_cache_key(privacy_request_id, "email"), "customer@example.com"
+        )
+
+        assert cache.get_privacy_request_keys(privacy_request_id) == []
+        cache.delete(get_identity_cache_key(privacy_request_id, "email"))
+
+    @pytest.mark.usefixtures("scan_unindexed_privacy_request_keys")
+    def test_keys_without_index_found_by_scan(
+        self, cache: FidesopsRedis, privacy_request_id: str
+    ) -> None:
+        cache.set_encoded_object(
+            f"{privacy_request_id}__access_request__dataset:collection", [{"id": 1}]
+        )
+        cache.set_with_autoexpire(
+            get_identity_cache_key(privacy_request_id, "email"), "customer@example.com"
+        )
+
+        assert cache.get_encoded_objects_by_prefix(
+            f"{privacy_request_id}__access_request", privacy_request_id
+        ) == {
+            f"EN_{privacy_request_id}__access_request__dataset:collection": [{"id": 1}]
+        }
+        assert cache.get_privacy_request_keys(privacy_request_id) == [
+            get_identity_cache_key(privacy_request_id, "email")
+        ]
+        cache.delete(f"EN_{privacy_request_id}__access_request__dataset:collection")
+
+    def test_delete_privacy_request_keys(
+        self, cache: FidesopsRedis, privacy_request_id: str
+    ) -> None:
+        identity_key = get_identity_cache_key(privacy_request_id, "email")
+        cache.set_with_autoexpire(
+            identity_key, "customer@example.com", privacy_request_id=privacy_request_id
+        )
+        cache.set_encoded_object(
+            f"{privacy_request_id}__access_request__dataset:collection",
+            [{"id": 1}],
+            privacy_request_id=privacy_request_id,
+        )
+        other_privacy_request_id = f"pri_{random.random()}"
+        cache.set_with_autoexpire(
+            get_identity_cache_key(other_privacy_request_id, "email"),
+            "other@example.com",
+            privacy_request_id=other_privacy_request_id,
+        )
+
+        cache.delete_privacy_request_keys(privacy_request_id)
+
+        assert not cache.exists(
+            identity_key,
+            f"EN_{privacy_request_id}__access_request__dataset:collection",
+            get_privacy_request_key_index_cache_key(privacy_request_id),
+        )
+        assert cache.get_privacy_request_keys(other_privacy_request_id) == [
+            get_identity_cache_key(other_privacy_request_id, "email")
+        ]
+        cache.delete_privacy_request_keys(other_privacy_request_id)
+
+
 class TestCustomJSONEncoder:
     def test_encode_enum_string(self):
         class TestEnum(Enum):
@@ -190,3 +316,76 @@ class TestCustomDecoder:
         value = b64encode(pickle.dumps(PickleObj()))
         cache = FidesopsRedis()
         assert cache.decode_obj(value) is None
+
+
+class TestMsgpackEncoding:
+    @pytest.fixture(autouse=True)
+    def msgpack_object_encoding(self):
+        original_value = CONFIG.redis.object_encoding
+        CONFIG.redis.object_encoding = "msgpack"
+        yield
+        CONFIG.redis.object_encoding = original_value
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"a": datetime(2023, 2, 14, 20, 58)},
+            {"a": datetime(2023, 2, 14, 20, 58, tzinfo=timezone.utc)},
+            {"a": date(2001, 11, 8)},
+            {"a": ObjectId("507f191e810c19729de860ea")},
+            {"a": {"b": [b"some value", None, 1.5]}},
+            {"birthday": "2001-11-08"},
+            [{"id": 1}, {"id": 2}],
+            "some value",
+            b"secret",
+            1,
+        ],
+    )
+    def test_encode_decode(self, value):
+        encoded = _encode_msgpack(value)
+        assert encoded.startswith(ENCODED_MSGPACK_PREFIX)
+        assert FidesopsRedis.decode_obj(encoded) == value
+
+    def test_small_objects_kept_as_json(self):
+        """The base64 msgpack encoding of small objects is larger than their JSON"""
+        value = {"id": 1, "email": "customer@example.com"}
+        assert len(_encode_msgpack(value)) > len(json.dumps(value))
+        assert FidesopsRedis.encode_obj(value) == json.dumps(value)
+
+    def test_large_objects_compressed(self):
+        value = [{"id": i, "email": f"customer-{i}@example.com"} for i in range(100)]
+        encoded = FidesopsRedis.encode_obj(value)
+
+        assert encoded.startswith(ENCODED_MSGPACK_COMPRESSED_PREFIX)
+        assert len(encoded) < len(json.dumps(value))
+        assert FidesopsRedis.decode_obj(encoded) == value
+
+    def test_encode_enum_and_object(self):
+        class TestEnum(Enum):
+            test = "test_value"
+
+        class SomeClass:
+            def __init__(self):
+                self.val = "some value"
+
+        encoded = FidesopsRedis.encode_obj({"a": TestEnum.test, "b": SomeClass()})
+        assert FidesopsRedis.decode_obj(encoded) == {
+            "a": "test_value",
+            "b": {"val": "some value"},
+        }
+
+    def test_decode_json_entries(self):
+        assert FidesopsRedis.decode_obj(
+            f'{{"a": "{ENCODED_DATE_PREFIX}{datetime(2023, 2, 17, 14, 5).isoformat()}"}}'
+        ) == {"a": datetime(2023, 2, 17, 14, 5)}
+
+    def test_decode_msgpack_with_json_encoding(self):
+        encoded = _encode_msgpack({"a": 1})
+        CONFIG.redis.object_encoding = "json"
+        assert FidesopsRedis.decode_obj(encoded) == {"a": 1}
+
+    def test_decode_corrupt_value_doesnt_break(self):
+        assert (
+            FidesopsRedis.decode_obj(f"{ENCODED_MSGPACK_COMPRESSED_PREFIX}bm90IHpsaWI=")
+            is None
+        )
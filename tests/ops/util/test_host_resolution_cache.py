@@ -0,0 +1,95 @@
+import socket
+from unittest import mock
+
+import pytest
+
+from fides.api.util import host_resolution_cache as host_resolution_cache_module
+from fides.api.util import lru_cache as lru_cache_module
+from fides.api.util.host_resolution_cache import HostResolutionCache
+from fides.api.util.saas_util import resolve_safe_host_ip
+from fides.config import CONFIG
+
+
+class TestHostResolutionCache:
+    @pytest.fixture
+    def gethostbyname(self):
+        with mock.patch.object(
+            host_resolution_cache_module.socket,
+            "gethostbyname",
+            return_value="93.184.216.34",
+        ) as gethostbyname:
+            yield gethostbyname
+
+    def test_cached_until_ttl_expires(self, gethostbyname):
+        cache = HostResolutionCache()
+        with mock.patch.object(
+            CONFIG.execution, "saas_dns_cache_ttl", 60
+        ), mock.patch.object(
+            lru_cache_module, "monotonic", return_value=1000
+        ) as monotonic:
+            assert cache.resolve("ethyca.com") == "93.184.216.34"
+            assert cache.resolve("ethyca.com") == "93.184.216.34"
+            assert gethostbyname.call_count == 1
+
+            monotonic.return_value = 1060
+            assert cache.resolve("ethyca.com") == "93.184.216.34"
+            assert gethostbyname.call_count == 2
+
+        assert cache.stats() == {"hits": 1, "misses": 2, "hit_rate": 1 / 3, "size": 1}
+
+    def test_disabled(self, gethostbyname):
+        cache = HostResolutionCache()
+        with mock.patch.object(CONFIG.execution, "saas_dns_cache_ttl", 0):
+            cache.resolve("ethyca.com")
+            cache.resolve("ethyca.com")
+
+        assert gethostbyname.call_count == 2
+        assert cache.stats()["size"] == 0
+
+    def test_failures_not_cached(self, gethostbyname):
+        cache = HostResolutionCache()
+        gethostbyname.side_effect = socket.gaierror
+        with pytest.raises(socket.gaierror):
+            cache.resolve("ethyca.com")
+
+        gethostbyname.side_effect = None
+        assert cache.resolve("ethyca.com") == "93.184.216.34"
+        assert gethostbyname.call_count == 2
+
+    def test_clear(self, gethostbyname):
+        cache = HostResolutionCache()
+        cache.resolve("ethyca.com")
+        cache.clear()
+
+        assert cache.stats() == {"hits": 0, "misses": 0, "hit_rate": 0.0, "size": 0}
+        cache.resolve("ethyca.com")
+        assert gethostbyname.call_count == 2
+
+
+class TestResolveSafeHostIp:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        host_resolution_cache_module.host_resolution_cache.clear()
+        yield
+        host_resolution_cache_module.host_resolution_cache.clear()
+
+    @pytest.mark.parametrize("host_ip", ["127.0.0.1", "169.254.169.254"])
+    def test_unsafe_cached_ip(self, host_ip):
+        """Cached addresses are verified every time they're used"""
+        with mock.patch.object(
+            host_resolution_cache_module.socket, "gethostbyname", return_value=host_ip
+        ) as gethostbyname:
+            for _ in range(2):
+                with pytest.raises(ValueError, match="is not safe"):
+                    resolve_safe_host_ip("ethyca.com")
+
+        assert gethostbyname.call_count == 1
+
+    def test_unresolvable_host(self):
+        with mock.patch.object(
+            host_resolution_cache_module.socket,
+            "gethostbyname",
+            side_effect=socket.gaierror,
+        ):
+            with pytest.raises(ValueError, match="Failed to resolve hostname"):
+                resolve_safe_host_ip("ethyca.com")
@@ -0,0 +1,64 @@
+from unittest import mock
+
+from fides.api.util import lru_cache as lru_cache_module
+from fides.api.util.lru_cache import LRUCache
+
+
+class TestLRUCache:
+    def test_least_recently_used_evicted(self):
+        cache = LRUCache(lambda: 2)
+        cache.set(("version", 1), "one")
+        cache.set(("version", 2), "two")
+        assert cache.get(("version", 1)) == "one"
+        cache.set(("version", 3), "three")
+
+        assert len(cache) == 2
+        assert cache.get(("version", 2)) is None
+        assert cache.get(("version", 1)) == "one"
+        assert cache.get(("version", 3)) == "three"
+
+    def test_size_read_on_set(self):
+        max_size = mock.Mock(return_value=2)
+        cache = LRUCache(max_size)
+        cache.set("one", 1)
+        cache.set("two", 2)
+
+        max_size.return_value = 1
+        cache.set("three", 3)
+        assert len(cache) == 1
+        assert cache.get("three") == 3
+
+    def test_disabled(self):
+        cache = LRUCache(lambda: 0)
+        cache.set("version", "meta")
+        assert cache.get("version") is None
+
+        cache = LRUCache(lambda: 10, lambda: 0)
+        cache.set("version", "meta")
+        assert cache.get("version") is None
+
+    def test_expired(self):
+        cache = LRUCache(lambda: 10, lambda: 60)
+        with mock.patch.object(
+            lru_cache_module, "monotonic", return_value=1000
+        ) as monotonic:
+            cache.set("host", "93.184.216.34")
+            monotonic.return_value = 1059
+            assert cache.get("host") == "93.184.216.34"
+
+            monotonic.return_value = 1060
+            assert cache.get("host") is None
+        assert len(cache) == 0
+
+    def test_pop_and_clear(self):
+        cache = LRUCache(lambda: 10)
+        cache.set("one", 1)
+        cache.set("two", 2)
+
+        cache.pop("one")
+        cache.pop("missing")
+        assert cache.get("one") is None
+        assert len(cache) == 1
+
+        cache.clear()
+        assert len(cache) == 0
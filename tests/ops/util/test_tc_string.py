@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime
 from typing import Optional
+from unittest import mock
 
 import pytest
 from iab_tcf import decode_v2
@@ -10,11 +11,16 @@ from fides.api.common_exceptions import DecodeFidesStringError
 from fides.api.models.privacy_notice import UserConsentPreference
 from fides.api.models.sql_models import PrivacyDeclaration, System
 from fides.api.schemas.privacy_preference import FidesStringFidesPreferences
+from fides.api.schemas.tcf import TCFPurposeSave
+from fides.api.util.tcf import experience_meta, fides_string, tc_model
 from fides.api.util.tcf.experience_meta import (
     TCFVersionHash,
     _build_tcf_version_hash_model,
+    build_experience_tcf_meta,
     build_tcf_version_hash,
 )
+from fides.api.util.tcf.fides_string import decode_fides_string_to_preferences
+from fides.api.util.tcf.tc_bits import BitReader, BitWriter, vendor_ranges
 from fides.api.util.tcf.tc_mobile_data import (
     build_tc_data_for_mobile,
     convert_fides_str_to_mobile_data,
@@ -27,9 +33,18 @@ from fides.api.util.tcf.tc_model import (
 from fides.api.util.tcf.tc_string import (
     TCModel,
     build_tc_string,
+    decode_core_string,
     decode_tc_string_to_preferences,
 )
-from fides.api.util.tcf.tcf_experience_contents import get_tcf_contents
+from fides.api.util.tcf.tcf_experience_contents import (
+    TCFExperienceContents,
+    get_tcf_contents,
+)
+from fides.api.util.tcf.tcf_string_cache import (
+    fides_string_preferences_cache,
+    tcf_meta_cache,
+)
+from fides.config import CONFIG
 
 
 class TestHashTCFExperience:
@@ -1737,6 +1752,254 @@ class TestDecodeTcString:
         )
         assert fides_tcf_preferences.special_feature_preferences[0].id == 2
 
+    @pytest.mark.parametrize(
+        "tc_str",
+        ["bad_string", "a", "CPzEX8APzEX8AAMABBENAUEEAPLAAAAA"],
+        ids=["wrong_version", "invalid_base64", "truncated"],
+    )
+    def test_decode_invalid_tc_string(self, tc_str):
+        with pytest.raises(DecodeFidesStringError):
+            decode_core_string(tc_str)
+
+    def test_decode_range_encoded_vendors(self):
+        """Vendor consents are 755, 1001, 1002, written with range encoding"""
+        decoded = decode_core_string(
+            "CPzSYhQPzSYhQGXABBENASEAAIAAAAAAAAAAH1QAgF5wPpA-oAAAAAAA.IH1QAgF5wPpA-oAA"
+        )
+        assert decoded.purpose_consents == {1}
+        assert decoded.vendor_consents == {755, 1001, 1002}
+        assert decoded.vendor_legitimate_interests == set()
+
+
+class TestTCFStringCache:
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        tcf_meta_cache.clear()
+        fides_string_preferences_cache.clear()
+        yield
+        tcf_meta_cache.clear()
+        fides_string_preferences_cache.clear()
+
+    def test_cache_size_from_config(self):
+        with mock.patch.object(CONFIG.consent, "tcf_string_cache_size", 1):
+            tcf_meta_cache.set("version_1", {})
+            tcf_meta_cache.set("version_2", {})
+            assert len(tcf_meta_cache) == 1
+
+        with mock.patch.object(CONFIG.consent, "tcf_string_cache_size", 0):
+            tcf_meta_cache.set("version_3", {})
+        assert tcf_meta_cache.get("version_3") is None
+
+    def test_meta_cached_by_version(self):
+        tcf_contents = TCFExperienceContents()
+        with mock.patch.object(
+            experience_meta,
+            "build_tcf_version_hash",
+            wraps=experience_meta.build_tcf_version_hash,
+        ) as build_version_hash:
+            meta = build_experience_tcf_meta(tcf_contents, "version_1")
+            meta["version_hash"] = "modified"
+            cached_meta = build_experience_tcf_meta(tcf_contents, "version_1")
+            assert build_version_hash.call_count == 1
+
+            build_experience_tcf_meta(tcf_contents, "version_2")
+            build_experience_tcf_meta(tcf_contents)
+            assert build_version_hash.call_count == 3
+
+        # Callers get their own copy of the cached meta
+        assert cached_meta["version_hash"] != "modified"
+        assert cached_meta["accept_all_fides_string"]
+
+    def test_meta_rebuilt_each_day(self):
+        """Cached accept-all and reject-all strings aren't served with an earlier day's timestamps"""
+        tcf_contents = TCFExperienceContents()
+        with mock.patch.object(tc_model, "datetime") as mock_datetime:
+            mock_datetime.utcnow.return_value = datetime(2023, 11, 1, 9)
+            meta = build_experience_tcf_meta(tcf_contents, "version_1")
+            mock_datetime.utcnow.return_value = datetime(2023, 11, 1, 23)
+            assert build_experience_tcf_meta(tcf_contents, "version_1") == meta
+
+            mock_datetime.utcnow.return_value = datetime(2023, 11, 2, 9)
+            next_day_meta = build_experience_tcf_meta(tcf_contents, "version_1")
+
+        assert next_day_meta["version_hash"] == meta["version_hash"]
+        assert (
+            next_day_meta["accept_all_fides_string"] != meta["accept_all_fides_string"]
+        )
+        decoded = decode_v2(next_day_meta["accept_all_fides_string"])
+        assert decoded.created.date() == datetime(2023, 11, 2).date()
+
+    def test_decoded_preferences_cached_by_choices(self):
+        """Strings created at different times with the same choices share a cache entry"""
+        tcf_contents = TCFExperienceContents()
+        accept_all_str = build_tc_string(
+            TCModel(created=1, last_updated=1, purpose_consents=[1, 2])
+        )
+        accept_all_later_str = build_tc_string(
+            TCModel(created=2, last_updated=2, purpose_consents=[1, 2])
+        )
+        reject_all_str = build_tc_string(TCModel(created=1, last_updated=1))
+        assert accept_all_str != accept_all_later_str
+
+        with mock.patch.object(
+            fides_string,
+            "convert_decoded_core_string_to_preferences",
+            wraps=fides_string.convert_decoded_core_string_to_preferences,
+        ) as convert:
+            preferences = decode_fides_string_to_preferences(
+                accept_all_str, None, tcf_contents, "version_1"
+            )
+            preferences.purpose_consent_preferences.append(
+                TCFPurposeSave(id=1, preference=UserConsentPreference.opt_in)
+            )
+            cached_preferences = decode_fides_string_to_preferences(
+                accept_all_later_str, None, tcf_contents, "version_1"
+            )
+            assert convert.call_count == 1
+
+            decode_fides_string_to_preferences(
+                accept_all_str, "1~", tcf_contents, "version_1"
+            )
+            decode_fides_string_to_preferences(
+                reject_all_str, None, tcf_contents, "version_1"
+            )
+            decode_fides_string_to_preferences(
+                accept_all_str, None, tcf_contents, "version_2"
+            )
+            decode_fides_string_to_preferences(accept_all_str, None, tcf_contents)
+            assert convert.call_count == 5
+
+        # Callers get their own copy of the cached preferences
+        assert cached_preferences == FidesStringFidesPreferences()
+        # Each combination of strings is cached by the raw strings and by the decoded choices
+        assert len(fides_string_preferences_cache) == 8
+
+    def test_decoded_preferences_cached_by_raw_strings(self):
+        """Repeats of a string, whatever its timestamps, skip decoding it"""
+        tcf_contents = TCFExperienceContents()
+        tc_str = build_tc_string(
+            TCModel(created=1, last_updated=1, purpose_consents=[1, 2])
+        )
+        later_tc_str = build_tc_string(
+            TCModel(created=2, last_updated=3, purpose_consents=[1, 2])
+        )
+        # The same choices, encoded with a different CMP
+        other_cmp_tc_str = build_tc_string(
+            TCModel(created=1, last_updated=1, cmp_id=1, purpose_consents=[1, 2])
+        )
+        assert tc_str[0] + tc_str[13:] == later_tc_str[0] + later_tc_str[13:]
+
+        with mock.patch.object(
+            fides_string, "decode_core_string", wraps=decode_core_string
+        ) as decode, mock.patch.object(
+            fides_string,
+            "convert_decoded_core_string_to_preferences",
+            wraps=fides_string.convert_decoded_core_string_to_preferences,
+        ) as convert:
+            preferences = decode_fides_string_to_preferences(
+                tc_str, "1~", tcf_contents, "version_1"
+            )
+            assert (
+                decode_fides_string_to_preferences(
+                    later_tc_str + ".IABE", "1~", tcf_contents, "version_1"
+                )
+                == preferences
+            )
+            assert decode.call_count == 1
+
+            assert (
+                decode_fides_string_to_preferences(
+                    other_cmp_tc_str, "1~", tcf_contents, "version_1"
+                )
+                == preferences
+            )
+            assert decode.call_count == 2
+            assert convert.call_count == 1
+
+    def test_invalid_timestamps_not_matched_by_raw_string(self):
+        tcf_contents = TCFExperienceContents()
+        tc_str = build_tc_string(TCModel(created=1, last_updated=1))
+        decode_fides_string_to_preferences(tc_str, None, tcf_contents, "version_1")
+
+        with pytest.raises(DecodeFidesStringError):
+            decode_fides_string_to_preferences(
+                tc_str[0] + "!" * 12 + tc_str[13:], None, tcf_contents, "version_1"
+            )
+
+
+class TestTCStringBits:
+    def test_vendor_ranges(self):
+        assert vendor_ranges([]) == []
+        assert vendor_ranges([5, 1, 2, 3, 8, 7, 2]) == [(1, 3), (5, 5), (7, 8)]
+
+    def test_write_int_overflow(self):
+        with pytest.raises(ValueError):
+            BitWriter().write_int(64, 6)
+
+    def test_read_past_end(self):
+        reader = BitReader(b"\xff")
+        assert reader.read_int(6) == 63
+        with pytest.raises(ValueError):
+            reader.read_int(3)
+
+    def test_bitfield_encoding_unchanged(self):
+        """Dense vendor sections are still written as bitfields, identical to the strings built by
+        earlier versions"""
+        m = TCModel(
+            created=16966584400,
+            last_updated=16966584400,
+            cmp_id=CMP_ID,
+            vendor_list_version=18,
+            purpose_consents=[1, 2, 3, 4, 7, 9, 10],
+            purpose_legitimate_interests=[2, 7, 8, 9, 10],
+            special_feature_optins=[2],
+            vendor_consents=[2, 8],
+            vendor_legitimate_interests=[8, 46],
+            vendors_disclosed=[2, 8, 46],
+        )
+        tc_str = build_tc_string(m)
+        assert (
+            tc_str
+            == "CPzSYhQPzSYhQGXABBENASEEAPLAAEPAAAAAAEEEALgCAAAAAAgAAAAA.IAXEEAAAAABA"
+        )
+
+        decoded = decode_v2(tc_str)
+        assert not decoded.is_consent_range_encoding
+        assert not decoded.is_interests_range_encoding
+
+    def test_sparse_vendors_use_range_encoding(self):
+        m = TCModel(
+            created=16966584400,
+            last_updated=16966584400,
+            cmp_id=CMP_ID,
+            vendor_list_version=18,
+            purpose_consents=[1],
+            vendor_consents=[755, 1001, 1002],
+            vendors_disclosed=[755, 1001, 1002],
+        )
+        tc_str = build_tc_string(m)
+        assert (
+            tc_str
+            == "CPzSYhQPzSYhQGXABBENASEAAIAAAAAAAAAAH1QAgF5wPpA-oAAAAAAA.IH1QAgF5wPpA-oAA"
+        )
+
+        decoded = decode_v2(tc_str)
+        assert decoded.is_consent_range_encoding
+        assert decoded.consented_vendors_range == [(755, 755), (1001, 1002)]
+        assert decoded.oob_disclosed_vendors == {755: True, 1001: True, 1002: True}
+
+        assert decode_core_string(tc_str).vendor_consents == {755, 1001, 1002}
+
+    def test_vendor_encoding_roundtrip(self):
+        vendor_sets = [[], [1], list(range(1, 1201)), [3, 500, 501, 502, 1199]]
+        writer = BitWriter()
+        for vendor_ids in vendor_sets:
+            writer.write_vendors(vendor_ids)
+
+        reader = BitReader(writer.to_bytes())
+        for vendor_ids in vendor_sets:
+            assert reader.read_vendors() == set(vendor_ids)
+
 
 class TestConvertTCStringtoMobile:
     def test_expected_response(self):
@@ -1883,6 +2146,21 @@ class TestConvertTCStringtoMobile:
         assert tc_mobile_data["IABTCF_VendorLegitimateInterests"] == ""
         assert tc_mobile_data["IABTCF_SpecialFeaturesOptIns"] == "000000000000"
 
+    def test_range_encoded_vendors(self):
+        """Vendor consents are 755, 1001, 1002, written with range encoding"""
+        tc_mobile_data = convert_fides_str_to_mobile_data(
+            "CPzSYhQPzSYhQGXABBENASEAAIAAAAAAAAAAH1QAgF5wPpA-oAAAAAAA.IH1QAgF5wPpA-oAA"
+        ).dict()
+
+        vendor_consents = tc_mobile_data["IABTCF_VendorConsents"]
+        assert len(vendor_consents) == 1002
+        assert [i + 1 for i, bit in enumerate(vendor_consents) if bit == "1"] == [
+            755,
+            1001,
+            1002,
+        ]
+        assert tc_mobile_data["IABTCF_VendorLegitimateInterests"] == ""
+
     def test_ac_str_but_no_tc_str_string_format(self):
         fides_str = ",~12.35.1452.3313"
 
@@ -1,3 +1,4 @@
+from unittest import mock
 from uuid import uuid4
 
 import pytest
@@ -6,7 +7,10 @@ from fideslang.models import LegalBasisForProcessingEnum
 
 from fides.api.models.sql_models import PrivacyDeclaration, System
 from fides.api.schemas.tcf import EmbeddedVendor
-from fides.api.util.tcf.tcf_experience_contents import get_tcf_contents
+from fides.api.util.tcf.tcf_experience_contents import (
+    build_tcf_contents,
+    get_tcf_contents,
+)
 
 
 def assert_length_of_tcf_sections(
@@ -1175,3 +1179,37 @@ class TestTCFContents:
             s_li_len=0,
             s_r_len=0,
         )
+
+
+class TestTCFContentsCache:
+    def test_contents_cached_until_system_changes(self, db, tcf_system):
+        with mock.patch(
+            "fides.api.util.tcf.tcf_experience_contents.build_tcf_contents",
+            wraps=build_tcf_contents,
+        ) as mock_build:
+            tcf_contents = get_tcf_contents(db)
+            assert get_tcf_contents(db) == tcf_contents
+            assert mock_build.call_count == 1
+
+            tcf_system.vendor_id = "gvl.8"
+            tcf_system.save(db)
+
+            tcf_contents = get_tcf_contents(db)
+            assert mock_build.call_count == 2
+            assert tcf_contents.tcf_vendor_consents[0].id == "gvl.8"
+
+    def test_contents_rebuilt_when_declaration_deleted(self, db, tcf_system):
+        tcf_contents = get_tcf_contents(db)
+        assert tcf_contents.tcf_purpose_consents
+
+        for declaration in tcf_system.privacy_declarations:
+            declaration.delete(db)
+
+        assert not get_tcf_contents(db).tcf_purpose_consents
+
+    @pytest.mark.usefixtures("tcf_system")
+    def test_cached_contents_are_copied(self, db):
+        tcf_contents = get_tcf_contents(db)
+        tcf_contents.tcf_purpose_consents[0].current_preference = "opt_in"
+
+        assert get_tcf_contents(db).tcf_purpose_consents[0].current_preference is None